@@ -24,11 +24,14 @@ from typing import Optional
 
 # Try to import Flask; suggest install if missing
 try:
-    from flask import Flask, jsonify, send_from_directory, request
+    from flask import Flask, Response, jsonify, send_from_directory, request
 except ImportError:
     print("Flask not found. Install with: pip install flask", file=sys.stderr)
     sys.exit(1)
 
+from memory_system import metrics
+from memory_system.frontmatter import FrontmatterError, parse, parse_lines
+
 # SmartAlerts for notification center
 try:
     sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -63,73 +66,23 @@ def _parse_args():
 
 def _parse_yaml_frontmatter(text: str) -> tuple[dict, str]:
     """Extract YAML frontmatter bounded by --- delimiters from a .md file."""
-    lines = text.splitlines()
-    meta = {}
-    body_start = 0
-
-    # Detect --- bounded frontmatter
-    if lines and lines[0].strip() == "---":
-        fm_end = None
-        for i in range(1, len(lines)):
-            if lines[i].strip() == "---":
-                fm_end = i
-                break
-        if fm_end is not None:
-            fm_lines = lines[1:fm_end]
-            body_start = fm_end + 1
+    try:
+        meta, body = parse(text)
+    except FrontmatterError:
+        lines = text.splitlines()
+        if lines and lines[0].strip() == "---":
+            # Unterminated block: no fields, rest is body
+            meta, body = {}, "\n".join(lines[1:]).strip()
         else:
-            fm_lines = []
-            body_start = 1
-    else:
-        # Fallback: plain key:value until empty line
-        fm_lines = []
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if not stripped:
-                body_start = i + 1
-                break
-            fm_lines.append(stripped)
-            body_start = i + 1
-
-    for line in fm_lines:
-        stripped = line.strip()
-        if not stripped or not ":" in stripped:
-            continue
-        key, _, val = stripped.partition(":")
-        val = val.strip()
-        # Strip surrounding quotes
-        if (val.startswith('"') and val.endswith('"')) or (
-            val.startswith("'") and val.endswith("'")
-        ):
-            val = val[1:-1]
-        # Try to parse JSON arrays/numbers
-        try:
-            parsed = json.loads(val)
-            meta[key.strip()] = parsed
-        except (json.JSONDecodeError, ValueError):
-            # Try single-quoted arrays (common in YAML: ['tag1', 'tag2'])
-            if val.startswith("[") and val.endswith("]"):
-                try:
-                    parsed = json.loads(val.replace("'", '"'))
-                    meta[key.strip()] = parsed
-                    continue
-                except (json.JSONDecodeError, ValueError):
-                    pass
-            if val.lower() == "null":
-                meta[key.strip()] = None
-            elif val.lower() == "true":
-                meta[key.strip()] = True
-            elif val.lower() == "false":
-                meta[key.strip()] = False
-            elif val == "":
-                meta[key.strip()] = None
-            else:
-                meta[key.strip()] = val
+            # Fallback: plain key:value until empty line
+            head, *rest = re.split(r"\n[ \t]*\n", text.strip(), maxsplit=1)
+            meta, body = parse_lines(head.splitlines()), "".join(rest).strip()
 
-    body = "\n".join(lines[body_start:]).strip()
-    return meta, body
+    # Dashboard treats empty values as missing
+    return {key: (None if value == "" else value) for key, value in meta.items()}, body
 
 
+@metrics.timed("dashboard.load_memories")
 def load_memories(memory_dir: Path) -> list[dict]:
     """Load all .md memory files from a directory into dicts."""
     memories = []
@@ -178,6 +131,7 @@ def load_memories(memory_dir: Path) -> list[dict]:
 # Session history
 # ---------------------------------------------------------------------------
 
+@metrics.timed("dashboard.load_sessions")
 def load_sessions(db_path: Path, limit: int = 500) -> list[dict]:
     """Load recent sessions from session-history.db."""
     if not db_path.exists():
@@ -225,6 +179,7 @@ def load_sessions(db_path: Path, limit: int = 500) -> list[dict]:
 # Stats computation
 # ---------------------------------------------------------------------------
 
+@metrics.timed("dashboard.compute_stats")
 def compute_stats(memories: list[dict], sessions: list[dict]) -> dict:
     """Compute summary statistics for the overview cards."""
     total = len(memories)
@@ -406,6 +361,12 @@ def index():
     return send_from_directory(str(DASHBOARD_DIR), "index.html")
 
 
+@app.route("/metrics")
+def prometheus_metrics():
+    """Stage timings and event counters from every process (hooks included), Prometheus text format."""
+    return Response(metrics.combined().render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
 @app.route("/api/refresh", methods=["POST"])
 def refresh():
     _cache.clear()
@@ -46,25 +46,27 @@ def export_memories(output_file: str, project_id: str = "LFI"):
 
 def import_memories(input_file: str, project_id: str = "LFI"):
     """Import memories from JSON."""
-    client = MemoryTSClient(project_id=project_id)
+    client = MemoryTSClient()
 
     with open(input_file) as f:
         memory_dicts = json.load(f)
 
-    imported = 0
+    items = []
     for mem_dict in memory_dicts:
-        try:
-            client.create(
-                content=mem_dict['content'],
-                project_id=mem_dict.get('project_id', project_id),
-                importance=mem_dict.get('importance', 0.7),
-                tags=mem_dict.get('tags', []),
-                scope=mem_dict.get('scope', 'project'),
-                session_id=mem_dict.get('session_id')
-            )
-            imported += 1
-        except Exception as e:
-            print(f"⚠️  Failed to import: {mem_dict.get('content', '')[:50]}... - {e}")
+        if not mem_dict.get('content'):
+            print(f"⚠️  Failed to import: {str(mem_dict)[:50]}... - missing content")
+            continue
+        items.append({
+            'content': mem_dict['content'],
+            'project_id': mem_dict.get('project_id', project_id),
+            'importance': mem_dict.get('importance', 0.7),
+            'tags': mem_dict.get('tags', []),
+            'scope': mem_dict.get('scope', 'project'),
+            'session_id': mem_dict.get('session_id'),
+        })
+
+    # One staged batch write instead of a create() per memory
+    imported = len(client.create_many(items))
 
     print(f"✅ Imported {imported}/{len(memory_dicts)} memories")
 
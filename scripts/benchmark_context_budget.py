@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark ContextBudgetOptimizer packing strategies.
+
+Times each strategy on synthetic candidate sets and reports how much of
+the best achievable total score it selects (relative to "exact" where
+that runs, otherwise "fptas").
+
+Usage:
+    python scripts/benchmark_context_budget.py
+    python scripts/benchmark_context_budget.py --candidates 5000 --budgets 500 2000 8000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from memory_system.context_budget import STRATEGIES, ContextBudgetOptimizer
+
+
+def make_candidates(count: int, seed: int = 0) -> list:
+    """Synthetic memory dicts with realistic field mixes and lengths."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    candidates = []
+    for i in range(count):
+        candidates.append({
+            "id": f"mem-{i}",
+            "content": "word " * max(1, int(rng.lognormvariate(3.5, 0.7))),
+            "importance": round(rng.betavariate(2, 3), 3),
+            "confidence_score": round(rng.uniform(0.5, 1.0), 3),
+            "access_count": rng.randint(0, 15),
+            "updated": (now - timedelta(days=rng.expovariate(1 / 30))).isoformat(),
+        })
+    return candidates
+
+
+def run(candidates: list, budget: int, repeats: int) -> list:
+    """Return (strategy, best ms, selected, tokens, total score) rows."""
+    optimizer = ContextBudgetOptimizer()
+    rows = []
+    for strategy in STRATEGIES:
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = optimizer.optimize(
+                candidates, budget, strategy=strategy, include_excluded=False
+            )
+            best = min(best, time.perf_counter() - start)
+        total = sum(m["score"] for m in result["selected"])
+        rows.append((strategy, best * 1000, len(result["selected"]), result["total_tokens"], total))
+    return rows
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--candidates", type=int, nargs="+", default=[500, 5000])
+    parser.add_argument("--budgets", type=int, nargs="+", default=[500, 2000, 8000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for count in args.candidates:
+        candidates = make_candidates(count, args.seed)
+        for budget in args.budgets:
+            rows = run(candidates, budget, args.repeats)
+            reference = max(total for *_, total in rows)
+            print(f"\n{count} candidates, budget {budget} tokens")
+            print(f"  {'strategy':<8} {'ms':>9} {'selected':>9} {'tokens':>7} {'score':>9} {'quality':>8}")
+            for strategy, ms, selected, tokens, total in rows:
+                quality = total / reference if reference else 1.0
+                print(f"  {strategy:<8} {ms:>9.2f} {selected:>9} {tokens:>7} {total:>9.3f} {quality:>8.2%}")
+
+
+if __name__ == "__main__":
+    main()
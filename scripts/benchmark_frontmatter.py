@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory file frontmatter parsing.
+
+Writes synthetic memory files to a temp directory and times three ways of
+reading them: the old split("---") + ast.literal_eval parser, a full
+frontmatter.parse, and the header-only frontmatter.read_header.
+
+Usage:
+    python scripts/benchmark_frontmatter.py
+    python scripts/benchmark_frontmatter.py --files 5000 --body-words 2000
+"""
+
+import argparse
+import ast
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from memory_system.frontmatter import dumps, parse, read_header
+
+
+def make_files(directory: Path, count: int, body_words: int, seed: int = 0) -> list:
+    """Write synthetic memory files shaped like MemoryTSClient output."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(count):
+        meta = {
+            "id": f"mem-{i}",
+            "created": 1700000000000 + i,
+            "updated": 1700000000000 + i,
+            "reasoning": "synthetic",
+            "importance_weight": round(rng.random(), 3),
+            "confidence_score": 0.9,
+            "context_type": "knowledge",
+            "temporal_relevance": "persistent",
+            "knowledge_domain": "learnings",
+            "status": "active",
+            "scope": "project",
+            "semantic_tags": [f"#tag{rng.randint(0, 50)}" for _ in range(rng.randint(1, 6))],
+            "project_id": "LFI",
+            "session_id": f"session-{i % 20}",
+            "schema_version": 2,
+        }
+        body = " ".join(f"word{rng.randint(0, 999)}" for _ in range(body_words))
+        path = directory / f"mem-{i}.md"
+        path.write_text(dumps(meta, body))
+        paths.append(path)
+    return paths
+
+
+def legacy_parse(path: Path) -> dict:
+    """The per-module parser this codec replaced."""
+    parts = path.read_text().split("---", 2)
+    meta = {}
+    for line in parts[1].strip().split("\n"):
+        if ":" in line:
+            key, value = line.split(":", 1)
+            value = value.strip()
+            if value.startswith("["):
+                try:
+                    value = ast.literal_eval(value)
+                except (ValueError, SyntaxError):
+                    pass
+            meta[key.strip()] = value
+    return meta
+
+
+def time_reader(paths: list, reader, repeats: int) -> float:
+    """Best wall time in ms to read every file once."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for path in paths:
+            reader(path)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--body-words", type=int, nargs="+", default=[50, 1000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    readers = [
+        ("legacy", legacy_parse),
+        ("parse", lambda path: parse(path.read_text())),
+        ("header", read_header),
+    ]
+
+    for words in args.body_words:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = make_files(Path(tmp), args.files, words, args.seed)
+            print(f"\n{args.files} files, {words} body words")
+            print(f"  {'reader':<8} {'ms':>9} {'ms/1000':>9}")
+            for name, reader in readers:
+                ms = time_reader(paths, reader, args.repeats)
+                print(f"  {name:<8} {ms:>9.1f} {ms * 1000 / args.files:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory system's hot paths on synthetic corpora.
+
+Generates a seeded corpus (memory files, session history, relationships,
+access logs) at each scale, times search, hybrid ranking, vector lookup,
+session consolidation and the dashboard endpoints, and writes JSON that
+can be diffed between commits. Runs fully offline: embeddings come from
+StubEmbedder and LLM calls are answered with "" (callers' fallbacks).
+
+Usage:
+    python scripts/benchmark_suite.py --output bench.json
+    python scripts/benchmark_suite.py --scales 1000 --benchmarks hybrid_search_bm25
+    python scripts/benchmark_suite.py --output new.json --compare bench.json
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Keep benchmark reads out of the real temporal-predictor database
+os.environ["ENABLE_TEMPORAL_LOGGING"] = "0"
+os.environ.setdefault("LLM_CACHE_ENABLED", "0")
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from memory_system import semantic_search
+from memory_system.hybrid_search import hybrid_search
+from memory_system.llm_executor import AsyncLLMExecutor, set_executor
+from memory_system.memory_ts_client import MemoryTSClient
+from memory_system.session_consolidator import SessionConsolidator
+from memory_system.synthetic_corpus import Corpus, StubEmbedder, generate_corpus, sample_queries
+
+
+class Skip(Exception):
+    """Benchmark cannot run in this environment (reason in the message)"""
+    pass
+
+
+# name -> setup(corpus, queries) returning op(i) to time
+BENCHMARKS: Dict[str, Callable[[Corpus, List[str]], Callable[[int], object]]] = {}
+
+
+def benchmark(name: str):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+async def _offline_llm(prompt: str, timeout: float) -> str:
+    return ""
+
+
+@benchmark("memory_ts_search_content")
+def _memory_ts_search_content(corpus, queries):
+    client = MemoryTSClient(memory_dir=corpus.memory_dir, enable_access_logging=False)
+    words = [q.split()[0] for q in queries]
+    return lambda i: client.search(content=words[i % len(words)])
+
+
+@benchmark("memory_ts_search_tags")
+def _memory_ts_search_tags(corpus, queries):
+    client = MemoryTSClient(memory_dir=corpus.memory_dir, enable_access_logging=False)
+    return lambda i: client.search(tags=["#bug"], project_id=corpus.project_id)
+
+
+@benchmark("hybrid_search_bm25")
+def _hybrid_search_bm25(corpus, queries):
+    return lambda i: hybrid_search(queries[i % len(queries)], corpus.memories, use_semantic=False)
+
+
+@benchmark("hybrid_search_embeddings")
+def _hybrid_search_embeddings(corpus, queries):
+    embedder = StubEmbedder()
+    semantic_search._model = embedder
+    contents = [m["content"] for m in corpus.memories]
+    embeddings = dict(zip((c[:100] for c in contents), embedder.encode(contents)))
+    return lambda i: hybrid_search(queries[i % len(queries)], corpus.memories, embeddings=embeddings)
+
+
+@benchmark("vector_store_find_similar")
+def _vector_store_find_similar(corpus, queries):
+    if importlib.util.find_spec("faiss") is None:
+        raise Skip("faiss-cpu not installed")
+    from memory_system.vector_store import VectorStore
+
+    embedder = StubEmbedder()
+    store = VectorStore(persist_dir=str(corpus.root / "vector_store"))
+    vectors = embedder.encode([m["content"] for m in corpus.memories])
+    store.batch_store([(m["id"], vec, None) for m, vec in zip(corpus.memories, vectors)])
+    query_vectors = embedder.encode(queries)
+    return lambda i: store.find_similar(query_vectors[i % len(queries)], top_k=10)
+
+
+@benchmark("consolidate_session")
+def _consolidate_session(corpus, queries):
+    files = corpus.session_files
+    if not files:
+        raise Skip("corpus has no session transcripts")
+    consolidator = SessionConsolidator(
+        session_dir=corpus.session_dir, memory_dir=corpus.memory_dir, project_id=corpus.project_id
+    )
+    return lambda i: consolidator.consolidate_session(files[i % len(files)], use_llm=False, skip_save=True)
+
+
+def _dashboard(corpus):
+    if importlib.util.find_spec("flask") is None:
+        raise Skip("flask not installed")
+    from dashboard import server
+
+    server.app.config.update(PROJECT=corpus.project_id, MEMORY_BASE=corpus.root, TESTING=True)
+    return server, server.app.test_client()
+
+
+@benchmark("dashboard_stats_cold")
+def _dashboard_stats_cold(corpus, queries):
+    server, client = _dashboard(corpus)
+
+    def op(i):
+        server._cache.clear()
+        return client.get("/api/stats")
+    return op
+
+
+@benchmark("dashboard_memories_search")
+def _dashboard_memories_search(corpus, queries):
+    server, client = _dashboard(corpus)
+    server._cache.clear()
+    client.get("/api/stats")  # warm the cache
+    return lambda i: client.get("/api/memories", query_string={"q": queries[i % len(queries)]})
+
+
+def time_op(op: Callable[[int], object], repeats: int) -> dict:
+    """Time repeats calls (after one untimed warm-up call)."""
+    op(0)
+    samples = []
+    for i in range(1, repeats + 1):
+        start = time.perf_counter()
+        op(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "runs": repeats,
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+    }
+
+
+def run_scale(scale: int, names: List[str], repeats: int, seed: int, workdir: Path) -> dict:
+    """Generate one corpus and run the selected benchmarks on it."""
+    target = workdir / f"corpus-{scale}-seed{seed}"
+    shutil.rmtree(target, ignore_errors=True)
+    start = time.perf_counter()
+    corpus = generate_corpus(target, memories=scale, seed=seed)
+    results = {"_generate_s": round(time.perf_counter() - start, 3)}
+    queries = sample_queries(corpus, count=max(repeats + 1, 20), seed=seed)
+
+    for name in names:
+        try:
+            results[name] = time_op(BENCHMARKS[name](corpus, queries), repeats)
+        except Skip as e:
+            results[name] = {"skipped": str(e)}
+        print(f"  {name:<28} {_describe(results[name])}", flush=True)
+    return results
+
+
+def _describe(result: dict) -> str:
+    if "skipped" in result:
+        return f"skipped ({result['skipped']})"
+    return f"{result['median_ms']:>10.2f} ms median  ({result['min_ms']:.2f} min, {result['runs']} runs)"
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> int:
+    """Print median ratios against a baseline run; return the number of regressions."""
+    regressions = 0
+    print(f"\nvs {baseline['meta'].get('commit') or 'baseline'} (regression if > {threshold:.2f}x)")
+    for scale, results in current["results"].items():
+        for name, result in results.items():
+            before = baseline["results"].get(scale, {}).get(name)
+            if name.startswith("_") or not isinstance(before, dict):
+                continue
+            if "median_ms" not in result or "median_ms" not in before:
+                continue
+            ratio = result["median_ms"] / before["median_ms"] if before["median_ms"] else 1.0
+            flag = "REGRESSION" if ratio > threshold else ""
+            regressions += bool(flag)
+            print(f"  {scale:>7} {name:<28} {before['median_ms']:>10.2f} -> {result['median_ms']:>10.2f} ms  {ratio:>5.2f}x {flag}")
+    return regressions
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--benchmarks", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", type=Path, help="Keep generated corpora here (default: temp dir)")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Median ratio counted as a regression")
+    args = parser.parse_args()
+
+    set_executor(AsyncLLMExecutor(runner=_offline_llm, use_gateway_cache=False))
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeats": args.repeats,
+        },
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or Path(tmp)
+        for scale in args.scales:
+            print(f"\n{scale} memories")
+            report["results"][str(scale)] = run_scale(scale, args.benchmarks, args.repeats, args.seed, workdir)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(baseline, report, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
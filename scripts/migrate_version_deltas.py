@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Convert memory version history to keyframes plus compressed deltas.
+
+Histories written before delta encoding store every version in full.
+This rewrites them in place; reads return the same content afterwards.
+Safe to re-run.
+
+Usage:
+    python scripts/migrate_version_deltas.py
+    python scripts/migrate_version_deltas.py --dry-run
+    python scripts/migrate_version_deltas.py --db-path /path/to/intelligence.db
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from memory_system.intelligence.database import IntelligenceDB
+from memory_system.intelligence.versioning import MemoryVersioning
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description="Delta-encode memory version history")
+    parser.add_argument("--db-path", default=None,
+                        help="Path to intelligence.db (default: package root)")
+    parser.add_argument("--memory-id", default=None,
+                        help="Only migrate this memory")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show what would be converted without writing")
+    args = parser.parse_args()
+
+    db_path = Path(args.db_path) if args.db_path else None
+    if db_path is not None and not db_path.exists():
+        print(f"{db_path} not found. Nothing to migrate.")
+        return
+
+    versioning = MemoryVersioning(db=IntelligenceDB(db_path=db_path))
+    stats = versioning.compact_history(memory_id=args.memory_id, dry_run=args.dry_run)
+
+    prefix = "Would convert" if args.dry_run else "Converted"
+    print(f"{prefix} {stats['converted']} versions across {stats['memories']} memories")
+    if stats['bytes_before']:
+        saved = 1 - stats['bytes_after'] / stats['bytes_before']
+        print(f"Content bytes: {stats['bytes_before']:,} -> {stats['bytes_after']:,} ({saved:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,200 +2,156 @@
 """
 Master Nightly Maintenance Script
 
-Runs all nightly jobs in correct order:
-1. Embedding pre-computation (semantic search optimization)
-2. Daily memory maintenance (decay, archival, stats)
-3. Database optimization (VACUUM, ANALYZE)
-4. Backup creation
-5. Health checks
+Runs all nightly jobs in one process on a dependency-aware scheduler:
+- Online database backups (first, so they capture the pre-maintenance state)
+- Daily memory maintenance (decay, archival, stats)
+- Embedding pre-computation (semantic search optimization)
+- Generational GC re-bucketing, PageRank, incremental clustering
+- Database optimization (incremental vacuum, ANALYZE)
+- Backup retention pruning
+- Health checks
+
+Jobs on different databases run in parallel; jobs that write the same
+database (or the memory files) take turns. Per-job durations and the
+total wall time go into logs/maintenance_YYYYMMDD.json.
 
 Designed to run at 3am via LaunchAgent.
 
 Performance Fixes:
 - P1: Pre-compute embeddings (fixes 500s search bottleneck)
-- P2: VACUUM + ANALYZE (prevents SQLite degradation)
+- P2: Incremental vacuum + ANALYZE (prevents SQLite degradation)
 - P1: SQLite backups (prevents data loss)
 
+Backups and compaction only take short, stepped locks (see
+sqlite_maintenance), so hooks firing during the run are not stalled.
+
 Usage:
     python3 nightly_maintenance_master.py
+    python3 nightly_maintenance_master.py --retention-days 14
+    python3 nightly_maintenance_master.py --workers 1                  # one job at a time
+    python3 nightly_maintenance_master.py --enable-incremental-vacuum  # one-time conversion
 """
 
-import subprocess
+import argparse
+import json
+import sys
 from pathlib import Path
 from datetime import datetime
 import sqlite3
-import shutil
 
-from memory_system.db_pool import get_connection
+from memory_system.maintenance_scheduler import JobResult, MaintenanceScheduler
+from memory_system.sqlite_maintenance import (
+    backup_database,
+    backup_path_for,
+    compact_database,
+    enable_incremental_vacuum,
+    prune_backups,
+)
 
 
 SCRIPTS_DIR = Path(__file__).parent
 ROOT_DIR = SCRIPTS_DIR.parent
+INTELLIGENCE_DB = ROOT_DIR / "intelligence.db"
+GC_DB = ROOT_DIR / "generational_gc.db"
 DB_PATHS = [
-    ROOT_DIR / "intelligence.db",
+    INTELLIGENCE_DB,
     ROOT_DIR / "fsrs.db",
     Path.home() / ".local/share/memory/LFI/session-history.db"
 ]
 BACKUP_DIR = Path.home() / ".local/share/memory/LFI/backups"
+BACKUP_RETENTION_DAYS = 7
+MEMORY_FILES = "memory_files"  # Scheduler resource for the memory-ts markdown store
 
 
-def run_script(script_name: str, description: str) -> bool:
-    """Run a Python script and return success status"""
-    print(f"\n{'='*60}")
-    print(f"🔄 {description}")
-    print(f"{'='*60}\n")
-
-    script_path = SCRIPTS_DIR / script_name
-
-    if not script_path.exists():
-        print(f"⚠️  Script not found: {script_path}")
-        return False
-
-    try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            capture_output=True,
-            text=True,
-            timeout=1800  # 30 minute timeout
-        )
-
-        print(result.stdout)
-
-        if result.stderr:
-            print(f"Stderr: {result.stderr}")
+def run_decay():
+    """Daily memory maintenance: decay, archival, stats"""
+    from memory_system.daily_memory_maintenance import run_daily_maintenance
 
-        if result.returncode != 0:
-            print(f"❌ Script failed with code {result.returncode}")
-            return False
+    result = run_daily_maintenance()
+    return {"decayed": result["decay_count"], "archived": result["archived_count"]}
 
-        print(f"✅ {description} complete")
-        return True
 
-    except subprocess.TimeoutExpired:
-        print(f"❌ Script timed out after 30 minutes")
-        return False
-    except Exception as e:
-        print(f"❌ Error running script: {e}")
-        return False
+def precompute_embeddings():
+    """Embed new/changed memories and drop embeddings unused for 90 days"""
+    from memory_system.embedding_manager import EmbeddingManager
 
+    manager = EmbeddingManager(db_path=str(INTELLIGENCE_DB))
+    manager.precompute_all_memories()
+    deleted = manager.cleanup_old_embeddings(days=90)
+    return {"total_embeddings": manager.get_stats()["total_embeddings"], "deleted": deleted}
 
-def backup_databases():
-    """Create backups of all databases (P1 Reliability Fix)"""
-    print(f"\n{'='*60}")
-    print(f"💾 Database Backups")
-    print(f"{'='*60}\n")
-
-    # Create backup directory
-    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
-
-    # Keep last 7 days of backups
-    timestamp = datetime.now().strftime('%Y%m%d')
-
-    success_count = 0
-
-    for db_path in DB_PATHS:
-        if not db_path.exists():
-            print(f"⏭️  Skipping {db_path.name} (not found)")
-            continue
 
-        backup_path = BACKUP_DIR / f"{db_path.stem}_{timestamp}.db"
+def run_generational_gc():
+    """Re-bucket every memory into its GC generation by age"""
+    from datetime import timezone
+    from memory_system.generational_gc import GenerationalGC
+    from memory_system.memory_ts_client import MemoryTSClient
 
+    def created_at(memory):
         try:
-            # Use SQLite backup API for consistency
-            source = sqlite3.connect(str(db_path))
-            dest = sqlite3.connect(str(backup_path))
-
-            source.backup(dest)
-
-            source.close()
-            dest.close()
-
-            size_mb = backup_path.stat().st_size / 1024 / 1024
-            print(f"✅ Backed up {db_path.name} ({size_mb:.2f} MB)")
-            success_count += 1
-
-        except Exception as e:
-            print(f"❌ Failed to backup {db_path.name}: {e}")
+            created = datetime.fromisoformat(memory.created.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return created.astimezone(timezone.utc)  # Naive timestamps are local time
 
-    # Cleanup old backups (keep last 7 days)
-    try:
-        cutoff_date = datetime.now().strftime('%Y%m%d')
-        cutoff_int = int(cutoff_date) - 7
+    memories = MemoryTSClient(enable_access_logging=False).list()
+    pairs = [(m.id, created_at(m)) for m in memories]
+    with GenerationalGC(db_path=GC_DB) as gc:
+        return gc.assign_generations((memory_id, created) for memory_id, created in pairs if created)
 
-        for backup_file in BACKUP_DIR.glob("*.db"):
-            # Extract date from filename (format: dbname_YYYYMMDD.db)
-            try:
-                date_str = backup_file.stem.split('_')[-1]
-                if len(date_str) == 8 and date_str.isdigit():
-                    if int(date_str) < cutoff_int:
-                        backup_file.unlink()
-                        print(f"🗑️  Deleted old backup: {backup_file.name}")
-            except Exception:
-                continue
 
-    except Exception as e:
-        print(f"⚠️  Warning: Backup cleanup failed: {e}")
+def run_pagerank():
+    """Recompute PageRank over the relationship graph"""
+    from memory_system.memory_pagerank import MemoryPageRank
 
-    print(f"\n✅ Backed up {success_count}/{len(DB_PATHS)} databases")
-    return success_count > 0
+    return {"nodes": len(MemoryPageRank(db_path=str(INTELLIGENCE_DB)).compute_from_db())}
 
 
-def optimize_databases():
-    """Run VACUUM and ANALYZE on all databases (P2 Performance Fix)"""
-    print(f"\n{'='*60}")
-    print(f"⚡ Database Optimization (VACUUM + ANALYZE)")
-    print(f"{'='*60}\n")
+def run_clustering():
+    """Fold new memories into the existing topic clusters"""
+    from memory_system.intelligence.clustering import MemoryClustering
 
-    success_count = 0
+    return {"clusters": len(MemoryClustering(db_path=INTELLIGENCE_DB).cluster_memories(incremental=True))}
 
-    for db_path in DB_PATHS:
-        if not db_path.exists():
-            print(f"⏭️  Skipping {db_path.name} (not found)")
-            continue
 
-        try:
-            # Get size before
-            size_before = db_path.stat().st_size / 1024 / 1024
+def backup_one(db_path: Path):
+    """Online backup of one database (P1 Reliability Fix)"""
+    # Online backup API: one read transaction under WAL, never blocks writers
+    result = backup_database(db_path, backup_path_for(db_path, BACKUP_DIR))
+    return {
+        "size_mb": round(result.size_bytes / 1024 / 1024, 2),
+        "steps": result.steps,
+        "restarts": result.restarts,
+    }
 
-            with get_connection(str(db_path)) as conn:
-                # VACUUM (defragment, reclaim space)
-            print(f"🔄 VACUUM {db_path.name}...")
-            conn.execute("VACUUM")
 
-            # ANALYZE (update query planner statistics)
-            print(f"🔄 ANALYZE {db_path.name}...")
-            conn.execute("ANALYZE")
-                    # Get size after
-            size_after = db_path.stat().st_size / 1024 / 1024
-            saved_mb = size_before - size_after
+def optimize_one(db_path: Path, convert: bool = False):
+    """Incremental vacuum + ANALYZE on one database (P2 Performance Fix)"""
+    converted = convert and enable_incremental_vacuum(db_path)
 
-            print(f"✅ Optimized {db_path.name}")
-            print(f"   Before: {size_before:.2f} MB")
-            print(f"   After: {size_after:.2f} MB")
-            if saved_mb > 0:
-                print(f"   Saved: {saved_mb:.2f} MB\n")
+    # Chunked incremental_vacuum in short write transactions, sampled ANALYZE
+    result = compact_database(db_path)
 
-            success_count += 1
+    summary = {"auto_vacuum": result.auto_vacuum, "reclaimed_mb": round(result.freed_bytes / 1024 / 1024, 2)}
+    if converted:
+        summary["converted"] = True
+    if result.auto_vacuum != "incremental" and result.free_pages:
+        summary["unreclaimed_pages"] = result.free_pages  # run with --enable-incremental-vacuum once
+    return summary
 
-        except Exception as e:
-            print(f"❌ Failed to optimize {db_path.name}: {e}\n")
 
-    print(f"✅ Optimized {success_count}/{len(DB_PATHS)} databases")
-    return success_count > 0
+def prune_old_backups(retention_days: int):
+    """Retention: drop backups older than retention_days, always keep the newest few"""
+    return {"deleted": [path.name for path in prune_backups(BACKUP_DIR, retention_days=retention_days)]}
 
 
 def health_check():
-    """Run health checks on all databases"""
-    print(f"\n{'='*60}")
-    print(f"🏥 Health Checks")
-    print(f"{'='*60}\n")
-
-    all_healthy = True
+    """Run integrity checks on all databases"""
+    status = {}
 
     for db_path in DB_PATHS:
         if not db_path.exists():
-            print(f"⚠️  {db_path.name}: NOT FOUND")
-            all_healthy = False
+            status[db_path.name] = "NOT FOUND"
             continue
 
         try:
@@ -203,73 +159,101 @@ def health_check():
 
             # Integrity check
             result = conn.execute("PRAGMA integrity_check").fetchone()
-
-            if result and result[0] == 'ok':
-                print(f"✅ {db_path.name}: Healthy")
-            else:
-                print(f"❌ {db_path.name}: CORRUPTION DETECTED - {result}")
-                all_healthy = False
+            status[db_path.name] = result[0] if result else "no result"
 
             conn.close()
 
         except Exception as e:
-            print(f"❌ {db_path.name}: Error - {e}")
-            all_healthy = False
+            status[db_path.name] = f"Error - {e}"
+
+    problems = {name: state for name, state in status.items() if state != "ok"}
+    if problems:
+        raise RuntimeError(f"Some databases have issues: {problems}")
+    return status
 
-    if all_healthy:
-        print(f"\n✅ All databases healthy")
-    else:
-        print(f"\n⚠️  Some databases have issues - check logs")
 
-    return all_healthy
+def build_schedule(args) -> MaintenanceScheduler:
+    """Declare the nightly jobs, their dependencies and the resources they touch"""
+    scheduler = MaintenanceScheduler(max_workers=args.workers, on_finish=print_job)
+    databases = [db_path for db_path in DB_PATHS if db_path.exists()]
+    for db_path in DB_PATHS:
+        if not db_path.exists():
+            print(f"⏭️  Skipping {db_path.name} (not found)")
+
+    # Backups first: a bad maintenance run can be rolled back to them
+    for db_path in databases:
+        scheduler.add(f"backup_{db_path.stem}", lambda db_path=db_path: backup_one(db_path),
+                      reads=[db_path.name])
+    intelligence_backup = [f"backup_{INTELLIGENCE_DB.stem}"] if INTELLIGENCE_DB in databases else []
+
+    scheduler.add("decay", run_decay, writes=[MEMORY_FILES])
+    scheduler.add("generational_gc", run_generational_gc, depends_on=["decay"],
+                  reads=[MEMORY_FILES], writes=[GC_DB.name])
+    scheduler.add("embedding_precompute", precompute_embeddings, depends_on=intelligence_backup,
+                  reads=[MEMORY_FILES], writes=[INTELLIGENCE_DB.name])
+    scheduler.add("pagerank", run_pagerank, depends_on=intelligence_backup,
+                  writes=[INTELLIGENCE_DB.name])
+    scheduler.add("clustering", run_clustering, depends_on=["embedding_precompute"],
+                  writes=[INTELLIGENCE_DB.name])
+
+    for db_path in databases:
+        scheduler.add(f"optimize_{db_path.stem}",
+                      lambda db_path=db_path: optimize_one(db_path, convert=args.enable_incremental_vacuum),
+                      depends_on=[f"backup_{db_path.stem}"], writes=[db_path.name])
+
+    scheduler.add("prune_backups", lambda: prune_old_backups(args.retention_days),
+                  depends_on=[f"backup_{db_path.stem}" for db_path in databases])
+    scheduler.add("health_check", health_check,
+                  depends_on=[f"optimize_{db_path.stem}" for db_path in databases],
+                  reads=[db_path.name for db_path in databases])
+    return scheduler
+
+
+def print_job(result: JobResult):
+    """Scheduler progress line for one finished job"""
+    if result.status == "ok":
+        print(f"✅ {result.name} ({result.duration_ms / 1000:.1f}s) {json.dumps(result.result, default=str)}", flush=True)
+    elif result.status == "failed":
+        print(f"❌ {result.name} failed after {result.duration_ms / 1000:.1f}s: {result.error}", flush=True)
+    else:
+        print(f"⏭️  {result.name} skipped ({result.error})", flush=True)
 
 
 def main():
     """Run all nightly maintenance jobs"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--retention-days", type=int, default=BACKUP_RETENTION_DAYS,
+                        help="Delete backups older than this (newest 3 per database are always kept)")
+    parser.add_argument("--enable-incremental-vacuum", action="store_true",
+                        help="Convert databases to auto_vacuum=INCREMENTAL (one full VACUUM each)")
+    parser.add_argument("--workers", type=int, default=4, help="Jobs run in parallel")
+    args = parser.parse_args()
+
     start_time = datetime.now()
 
     print(f"\n{'#'*60}")
     print(f"# 🌙 NIGHTLY MAINTENANCE MASTER")
     print(f"# Started: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'#'*60}")
-
-    results = {
-        'start_time': start_time.isoformat(),
-        'jobs': []
-    }
-
-    # Job 1: Embedding pre-computation (P1 Performance Fix)
-    success = run_script(
-        "nightly_embedding_precompute.py",
-        "Embedding Pre-computation"
-    )
-    results['jobs'].append({'name': 'embedding_precompute', 'success': success})
-
-    # Job 2: Database backups (P1 Reliability Fix)
-    success = backup_databases()
-    results['jobs'].append({'name': 'database_backups', 'success': success})
-
-    # Job 3: Database optimization (P2 Performance Fix)
-    success = optimize_databases()
-    results['jobs'].append({'name': 'database_optimization', 'success': success})
+    print(f"{'#'*60}\n")
 
-    # Job 4: Health checks
-    success = health_check()
-    results['jobs'].append({'name': 'health_check', 'success': success})
+    report = build_schedule(args).run()
 
     # Summary
     end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
-
-    results['end_time'] = end_time.isoformat()
-    results['duration_seconds'] = duration
+    results = {
+        'start_time': start_time.isoformat(),
+        'end_time': end_time.isoformat(),
+        'duration_seconds': report.wall_ms / 1000,
+        **report.to_dict(),
+    }
 
-    total_jobs = len(results['jobs'])
-    successful_jobs = sum(1 for job in results['jobs'] if job['success'])
+    total_jobs = len(report.jobs)
+    successful_jobs = sum(1 for job in report.jobs.values() if job.status == "ok")
 
     print(f"\n{'#'*60}")
     print(f"# 🌙 NIGHTLY MAINTENANCE COMPLETE")
-    print(f"# Duration: {duration:.1f} seconds")
+    print(f"# Duration: {report.wall_ms / 1000:.1f} seconds "
+          f"({report.serial_ms / 1000:.1f}s of job time)")
     print(f"# Success: {successful_jobs}/{total_jobs} jobs")
     print(f"# Finished: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'#'*60}\n")
@@ -278,14 +262,13 @@ def main():
     log_file = ROOT_DIR / "logs" / f"maintenance_{start_time.strftime('%Y%m%d')}.json"
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    import json
     with open(log_file, 'w') as f:
         json.dump(results, f, indent=2)
 
     print(f"📝 Log saved: {log_file}")
 
     # Return 0 if all jobs succeeded, 1 otherwise
-    return 0 if successful_jobs == total_jobs else 1
+    return 0 if report.succeeded else 1
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ Usage:
 
 import json
 import sys
+from pathlib import Path
 
 from memory_system.pattern_detector import PatternDetector
 from memory_system.fsrs_scheduler import FSRSScheduler
@@ -31,11 +32,12 @@ def main():
     memories = json.loads(memories_file.read_text())
 
     memory_dir = Path.home() / ".local/share/memory/LFI/memories"
-    fsrs_db = project_root / "fsrs.db"
 
+    # Token sets persist in memory_dir/.token_index.db, so only files
+    # changed since the last session end are re-read here
     detector = PatternDetector(
         memory_dir=memory_dir,
-        scheduler=FSRSScheduler(db_path=fsrs_db),
+        scheduler=FSRSScheduler(),
     )
 
     signals = detector.detect_reinforcements(
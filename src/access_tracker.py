@@ -4,6 +4,18 @@ Feature 23: Memory access pattern tracker.
 Tracks when and how memories are accessed, enabling frequency analysis,
 identification of never-accessed memories, and access history auditing.
 
+Writes are coalesced: log_access() appends to an in-process buffer and
+events are written with one executemany transaction once `flush_size`
+are pending, the oldest is `flush_interval` seconds old, or the
+interpreter exits.  By default a daemon thread does the flushing so
+log_access never waits on disk.  Row ids are reserved in blocks: the
+first block and a spare at construction (in the schema transaction), and
+later ones on the flusher thread as soon as the spare is taken.  The
+returned id is the event's final row id.  If a burst outruns both blocks
+before the flusher catches up, the event is buffered without an id
+(SQLite assigns one at flush) and log_access returns None rather than
+committing.  Reads on the tracker include buffered events.
+
 Usage:
     from memory_system.access_tracker import AccessTracker
 
@@ -11,16 +23,33 @@ Usage:
     access_id = tracker.log_access("mem-001", "search", query_context="deployment")
     freq = tracker.get_access_frequency("mem-001")
     stale = tracker.get_never_accessed(days=90)
+
+    # Write-through (one commit per event, as before buffering)
+    tracker = AccessTracker(db_path, flush_size=1)
 """
 
+import atexit
 import sqlite3
+import threading
+import time
+import weakref
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 VALID_ACCESS_TYPES = ["search", "direct", "briefing", "consolidation", "maintenance"]
 
+DEFAULT_FLUSH_SIZE = 100        # Events per write transaction
+DEFAULT_FLUSH_INTERVAL = 1.0    # Max seconds an event stays buffered
+_MAX_MERGED_EVENTS = 1000       # Larger buffers are flushed before a read
+
+
+def _flush_at_exit(tracker_ref):
+    tracker = tracker_ref()
+    if tracker is not None:
+        tracker.close()
+
 
 class AccessTracker:
     """
@@ -30,24 +59,56 @@ class AccessTracker:
     table.  All timestamps are stored as ISO-8601 UTC strings.
     """
 
-    def __init__(self, db_path: Optional[str | Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[str | Path] = None,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        background_flush: bool = True,
+    ):
         """
         Initialize the access tracker database.
 
         Args:
             db_path: Path to the SQLite database file.  Defaults to
                      ``intelligence.db`` in the package root.
+            flush_size: Write once this many events are buffered
+                        (1 = write-through, no buffering).
+            flush_interval: Max seconds an event stays buffered.
+            background_flush: Flush on a daemon thread; when False,
+                              log_access flushes inline once a trigger fires.
         """
         if db_path is None:
             db_path = Path(__file__).parent.parent / "intelligence.db"
         self.db_path = Path(db_path)
-        self.conn = sqlite3.connect(str(self.db_path))
+        self.flush_size = max(1, flush_size)
+        self.flush_interval = flush_interval
+        self.background_flush = background_flush
+
+        # Shared with the flusher thread; _io_lock serialises all use of it
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
-        self._init_schema()
+        self._io_lock = threading.RLock()
+
+        # Hot path: log_access only ever takes this lock
+        self._buffer_lock = threading.Condition(threading.Lock())
+        self._buffer: List[Tuple] = []
+        self._oldest = 0.0  # monotonic time of the oldest buffered event
+        self._id_lock = threading.Lock()
+        self._next_id = 0
+        self._id_limit = 0  # reserved ids are [_next_id, _id_limit)
+        self._spare_ids: Optional[Tuple[int, int]] = None
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+
+        self._init_schema(reserve=self.flush_size > 1)
+        if self.flush_size > 1:
+            atexit.register(_flush_at_exit, weakref.ref(self))
 
     # ── Schema ──────────────────────────────────────────────────────────
 
-    def _init_schema(self) -> None:
+    def _init_schema(self, reserve: bool = False) -> None:
+        """Create the table and indexes; with reserve, also claim the first id block and a spare."""
         cur = self.conn.cursor()
         cur.execute("""
             CREATE TABLE IF NOT EXISTS memory_access_log (
@@ -70,6 +131,10 @@ class AccessTracker:
             "CREATE INDEX IF NOT EXISTS idx_mal_access_type "
             "ON memory_access_log(access_type)"
         )
+        if reserve:
+            start, limit = self._claim_sequence(2 * self.flush_size)
+            self._next_id, self._id_limit = start, start + self.flush_size
+            self._spare_ids = (start + self.flush_size, limit)
         self.conn.commit()
 
     # ── Write ───────────────────────────────────────────────────────────
@@ -79,7 +144,7 @@ class AccessTracker:
         memory_id: str,
         access_type: str,
         query_context: Optional[str] = None,
-    ) -> int:
+    ) -> Optional[int]:
         """
         Record a memory access event.
 
@@ -90,7 +155,10 @@ class AccessTracker:
                            (e.g. the search query that surfaced this memory).
 
         Returns:
-            The row id of the new access log entry.
+            The row id of the new access log entry (reserved up front; the
+            row itself is written at the next flush unless flush_size=1),
+            or None when a burst has used up the reserved ids and the
+            background flusher has not yet claimed more.
 
         Raises:
             ValueError: If *access_type* is not in VALID_ACCESS_TYPES.
@@ -101,14 +169,176 @@ class AccessTracker:
                 f"Must be one of {VALID_ACCESS_TYPES}"
             )
         now = datetime.now(timezone.utc).isoformat()
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO memory_access_log (memory_id, accessed_at, access_type, query_context) "
-            "VALUES (?, ?, ?, ?)",
-            (memory_id, now, access_type, query_context),
+
+        if self.flush_size == 1:
+            with self._io_lock:
+                cur = self.conn.execute(
+                    "INSERT INTO memory_access_log (memory_id, accessed_at, access_type, query_context) "
+                    "VALUES (?, ?, ?, ?)",
+                    (memory_id, now, access_type, query_context),
+                )
+                self.conn.commit()
+            return cur.lastrowid  # type: ignore[return-value]
+
+        access_id = self._take_id()
+        with self._buffer_lock:
+            if not self._buffer:
+                self._oldest = time.monotonic()
+            self._buffer.append((access_id, memory_id, now, access_type, query_context))
+            due = self._flush_due()
+
+            if self.background_flush:
+                self._ensure_flusher()
+                if due or len(self._buffer) == 1 or self._spare_ids is None:
+                    self._buffer_lock.notify()  # flush now, start the age timer, or claim ids
+                return access_id
+
+        if due:
+            self.flush()
+        return access_id
+
+    def flush(self) -> int:
+        """
+        Write all buffered events in one transaction.
+
+        Returns:
+            Number of events written.
+        """
+        with self._io_lock:
+            with self._buffer_lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+            try:
+                self.conn.executemany(
+                    "INSERT INTO memory_access_log "
+                    "(id, memory_id, accessed_at, access_type, query_context) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    batch,
+                )
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                with self._buffer_lock:
+                    self._buffer[:0] = batch  # keep them for the next attempt
+                raise
+            return len(batch)
+
+    def _flush_due(self) -> bool:
+        """Size or age trigger reached (buffer lock held)."""
+        return bool(self._buffer) and (
+            len(self._buffer) >= self.flush_size
+            or time.monotonic() - self._oldest >= self.flush_interval
+        )
+
+    def _take_id(self) -> Optional[int]:
+        """
+        Next reserved row id, moving to the spare block when this one is used up.
+
+        With a background flusher, claiming ids is left to it, so when both
+        blocks are used up this returns None (the row gets its id at flush).
+        """
+        with self._id_lock:
+            if self._next_id >= self._id_limit:
+                if self._spare_ids is None:
+                    if self.background_flush:
+                        return None
+                    self._spare_ids = self._reserve_ids()
+                (self._next_id, self._id_limit), self._spare_ids = self._spare_ids, None
+            access_id = self._next_id
+            self._next_id += 1
+            return access_id
+
+    def _reserve_ids(self) -> Tuple[int, int]:
+        """Claim flush_size row ids in their own transaction, as a [start, limit) range."""
+        with self._io_lock:
+            try:
+                block = self._claim_sequence(self.flush_size)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        return block
+
+    def _claim_sequence(self, count: int) -> Tuple[int, int]:
+        """
+        Bump the table's AUTOINCREMENT counter by count (caller commits).
+
+        Ids claimed here are never reused by other writers, even in other
+        processes.
+
+        Returns:
+            The claimed ids as a [start, limit) range
+        """
+        cur = self.conn.execute(
+            "UPDATE sqlite_sequence SET seq = seq + ? WHERE name = 'memory_access_log'",
+            (count,),
+        )
+        if cur.rowcount == 0:
+            self.conn.execute(
+                "INSERT INTO sqlite_sequence (name, seq) "
+                "SELECT 'memory_access_log', COALESCE(MAX(id), 0) + ? FROM memory_access_log",
+                (count,),
+            )
+        seq = self.conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'memory_access_log'"
+        ).fetchone()[0]
+        return seq - count + 1, seq + 1
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="access-tracker-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        """Flush when a size or age trigger fires; claim a new spare id block once it is taken."""
+        while True:
+            with self._buffer_lock:
+                while not self._closed and not self._flush_due() and self._spare_ids is not None:
+                    if self._buffer:
+                        remaining = self.flush_interval - (time.monotonic() - self._oldest)
+                        self._buffer_lock.wait(timeout=max(remaining, 0.0))
+                    else:
+                        self._buffer_lock.wait()
+                if self._closed:
+                    return
+                due = self._flush_due()
+            try:
+                if due:
+                    self.flush()
+                # Claim the next id block here so log_access never has to
+                if self._spare_ids is None:
+                    block = self._reserve_ids()
+                    with self._id_lock:
+                        if self._spare_ids is None:
+                            self._spare_ids = block
+            except sqlite3.Error:
+                time.sleep(self.flush_interval)  # e.g. database locked; retry later
+
+    def _log_source(self) -> Tuple[str, list]:
+        """
+        FROM-clause source for reads: the table plus buffered events (io lock held).
+
+        Returns:
+            (SQL fragment, parameters)
+        """
+        with self._buffer_lock:
+            pending = list(self._buffer)
+        if len(pending) > _MAX_MERGED_EVENTS:
+            self.flush()
+            pending = []
+        if not pending:
+            return "memory_access_log", []
+
+        values = ", ".join(["(?, ?, ?, ?, ?)"] * len(pending))
+        params = [value for event in pending for value in event]
+        return (
+            "(SELECT id, memory_id, accessed_at, access_type, query_context "
+            f"FROM memory_access_log UNION ALL VALUES {values})",
+            params,
         )
-        self.conn.commit()
-        return cur.lastrowid  # type: ignore[return-value]
 
     # ── Read ────────────────────────────────────────────────────────────
 
@@ -121,27 +351,29 @@ class AccessTracker:
             or None), and ``by_type`` (dict mapping each access type to its
             count, defaulting to 0).
         """
-        cur = self.conn.cursor()
-
-        # Total + last accessed
-        cur.execute(
-            "SELECT COUNT(*) AS total, MAX(accessed_at) AS last "
-            "FROM memory_access_log WHERE memory_id = ?",
-            (memory_id,),
-        )
-        row = cur.fetchone()
-        total = row["total"]
-        last = row["last"]
-
-        # Per-type counts
-        cur.execute(
-            "SELECT access_type, COUNT(*) AS cnt "
-            "FROM memory_access_log WHERE memory_id = ? GROUP BY access_type",
-            (memory_id,),
-        )
-        by_type = {t: 0 for t in VALID_ACCESS_TYPES}
-        for r in cur.fetchall():
-            by_type[r["access_type"]] = r["cnt"]
+        with self._io_lock:
+            source, params = self._log_source()
+            cur = self.conn.cursor()
+
+            # Total + last accessed
+            cur.execute(
+                "SELECT COUNT(*) AS total, MAX(accessed_at) AS last "
+                f"FROM {source} WHERE memory_id = ?",
+                (*params, memory_id),
+            )
+            row = cur.fetchone()
+            total = row["total"]
+            last = row["last"]
+
+            # Per-type counts
+            cur.execute(
+                "SELECT access_type, COUNT(*) AS cnt "
+                f"FROM {source} WHERE memory_id = ? GROUP BY access_type",
+                (*params, memory_id),
+            )
+            by_type = {t: 0 for t in VALID_ACCESS_TYPES}
+            for r in cur.fetchall():
+                by_type[r["access_type"]] = r["cnt"]
 
         return {
             "total_accesses": total,
@@ -169,14 +401,16 @@ class AccessTracker:
             List of memory_id strings.
         """
         cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-        cur = self.conn.cursor()
-        cur.execute(
-            "SELECT memory_id FROM memory_access_log "
-            "GROUP BY memory_id "
-            "HAVING MAX(accessed_at) < ?",
-            (cutoff,),
-        )
-        return [r["memory_id"] for r in cur.fetchall()]
+        with self._io_lock:
+            source, params = self._log_source()
+            cur = self.conn.cursor()
+            cur.execute(
+                f"SELECT memory_id FROM {source} "
+                "GROUP BY memory_id "
+                "HAVING MAX(accessed_at) < ?",
+                (*params, cutoff),
+            )
+            return [r["memory_id"] for r in cur.fetchall()]
 
     def get_most_accessed(self, limit: int = 20) -> List[Dict]:
         """
@@ -186,17 +420,19 @@ class AccessTracker:
             List of dicts with ``memory_id``, ``total_accesses``, and
             ``last_accessed``.
         """
-        cur = self.conn.cursor()
-        cur.execute(
-            "SELECT memory_id, COUNT(*) AS total_accesses, "
-            "MAX(accessed_at) AS last_accessed "
-            "FROM memory_access_log "
-            "GROUP BY memory_id "
-            "ORDER BY total_accesses DESC "
-            "LIMIT ?",
-            (limit,),
-        )
-        return [dict(r) for r in cur.fetchall()]
+        with self._io_lock:
+            source, params = self._log_source()
+            cur = self.conn.cursor()
+            cur.execute(
+                "SELECT memory_id, COUNT(*) AS total_accesses, "
+                "MAX(accessed_at) AS last_accessed "
+                f"FROM {source} "
+                "GROUP BY memory_id "
+                "ORDER BY total_accesses DESC "
+                "LIMIT ?",
+                (*params, limit),
+            )
+            return [dict(r) for r in cur.fetchall()]
 
     def get_access_history(self, memory_id: str, limit: int = 50) -> List[Dict]:
         """
@@ -206,16 +442,18 @@ class AccessTracker:
             List of dicts with ``id``, ``memory_id``, ``accessed_at``,
             ``access_type``, and ``query_context``.
         """
-        cur = self.conn.cursor()
-        cur.execute(
-            "SELECT id, memory_id, accessed_at, access_type, query_context "
-            "FROM memory_access_log "
-            "WHERE memory_id = ? "
-            "ORDER BY accessed_at DESC "
-            "LIMIT ?",
-            (memory_id, limit),
-        )
-        return [dict(r) for r in cur.fetchall()]
+        with self._io_lock:
+            source, params = self._log_source()
+            cur = self.conn.cursor()
+            cur.execute(
+                "SELECT id, memory_id, accessed_at, access_type, query_context "
+                f"FROM {source} "
+                "WHERE memory_id = ? "
+                "ORDER BY accessed_at DESC "
+                "LIMIT ?",
+                (*params, memory_id, limit),
+            )
+            return [dict(r) for r in cur.fetchall()]
 
     def get_stats(self) -> Dict:
         """
@@ -225,21 +463,24 @@ class AccessTracker:
             Dict with ``total_accesses``, ``unique_memories_accessed``, and
             ``by_type`` (counts per access type).
         """
-        cur = self.conn.cursor()
+        with self._io_lock:
+            source, params = self._log_source()
+            cur = self.conn.cursor()
 
-        cur.execute("SELECT COUNT(*) AS total FROM memory_access_log")
-        total = cur.fetchone()["total"]
+            cur.execute(f"SELECT COUNT(*) AS total FROM {source}", params)
+            total = cur.fetchone()["total"]
 
-        cur.execute("SELECT COUNT(DISTINCT memory_id) AS uniq FROM memory_access_log")
-        unique = cur.fetchone()["uniq"]
+            cur.execute(f"SELECT COUNT(DISTINCT memory_id) AS uniq FROM {source}", params)
+            unique = cur.fetchone()["uniq"]
 
-        cur.execute(
-            "SELECT access_type, COUNT(*) AS cnt "
-            "FROM memory_access_log GROUP BY access_type"
-        )
-        by_type = {t: 0 for t in VALID_ACCESS_TYPES}
-        for r in cur.fetchall():
-            by_type[r["access_type"]] = r["cnt"]
+            cur.execute(
+                "SELECT access_type, COUNT(*) AS cnt "
+                f"FROM {source} GROUP BY access_type",
+                params,
+            )
+            by_type = {t: 0 for t in VALID_ACCESS_TYPES}
+            for r in cur.fetchall():
+                by_type[r["access_type"]] = r["cnt"]
 
         return {
             "total_accesses": total,
@@ -250,7 +491,16 @@ class AccessTracker:
     # ── Lifecycle ───────────────────────────────────────────────────────
 
     def close(self) -> None:
+        """Flush buffered events, stop the flusher and close the connection."""
+        with self._buffer_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._buffer_lock.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
         if self.conn:
+            self.flush()
             self.conn.close()
 
     def __enter__(self):
@@ -29,6 +29,7 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+from . import metrics
 from .memory_ts_client import MemoryTSClient, Memory
 from .config import cfg
 
@@ -194,6 +195,9 @@ class MemorySystem:
             - confidence_distribution: dict (from get_confidence_stats)
             - tag_counts: dict
             - project_counts: dict
+            - timings: per-stage latency histograms and event counters
+              from every process that has persisted them, plus this one
+              (see metrics.combined)
         """
         from .confidence_scoring import get_confidence_stats
 
@@ -206,6 +210,7 @@ class MemorySystem:
                 "confidence_distribution": get_confidence_stats([]),
                 "tag_counts": {},
                 "project_counts": {},
+                "timings": metrics.combined().snapshot(),
             }
 
         # Average importance
@@ -235,6 +240,7 @@ class MemorySystem:
             "confidence_distribution": confidence_dist,
             "tag_counts": tag_counts,
             "project_counts": project_counts,
+            "timings": metrics.combined().snapshot(),
         }
 
     def run_maintenance(self, dry_run: bool = False) -> Dict[str, Any]:
@@ -48,7 +48,7 @@ class ConsolidationQueue:
 
     def _init_db(self):
         """Create queue table"""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS consolidation_queue (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -80,7 +80,7 @@ class ConsolidationQueue:
             True if added, False if already queued
         """
         try:
-            with get_connection(self.db_path) as conn:
+            with get_connection(self.db_path, write=True) as conn:
                 conn.execute("""
                     INSERT INTO consolidation_queue
                     (session_id, session_path, status, added_at)
@@ -99,7 +99,7 @@ class ConsolidationQueue:
         Returns:
             Dict with session details or None if queue empty
         """
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.row_factory = sqlite3.Row
 
             # Get pending sessions or failed sessions ready for retry
@@ -129,7 +129,7 @@ class ConsolidationQueue:
 
     def mark_completed(self, session_id: str):
         """Mark session as successfully processed"""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 UPDATE consolidation_queue
                 SET status = 'completed', completed_at = ?
@@ -149,7 +149,7 @@ class ConsolidationQueue:
         next_retry = datetime.now().timestamp() + retry_in_seconds
         next_retry_iso = datetime.fromtimestamp(next_retry).isoformat()
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             # Increment retry count
             conn.execute("""
                 UPDATE consolidation_queue
@@ -190,7 +190,7 @@ class ConsolidationQueue:
         cutoff = (datetime.now().timestamp() - (days * 86400))
         cutoff_iso = datetime.fromtimestamp(cutoff).isoformat()
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             deleted = conn.execute("""
                 DELETE FROM consolidation_queue
                 WHERE status IN ('completed', 'failed')
@@ -115,7 +115,7 @@ class SmartAlerts:
 
     def _init_db(self):
         """Create alert tables."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS smart_alerts (
                     alert_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -187,7 +187,7 @@ class SmartAlerts:
         memory_ids_json = json.dumps(memory_ids or [])
         metadata_json = json.dumps(metadata or {})
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute("""
                 INSERT INTO smart_alerts
                 (alert_type, severity, title, message, memory_ids, created_at, metadata, action_taken)
@@ -340,7 +340,7 @@ class SmartAlerts:
         """Dismiss all unread alerts."""
         now = int(time.time())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 UPDATE smart_alerts
                 SET dismissed_at = ?
@@ -358,7 +358,7 @@ class SmartAlerts:
         """
         now = int(time.time())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 UPDATE smart_alerts
                 SET dismissed_at = ?
@@ -382,7 +382,7 @@ class SmartAlerts:
         """
         now = int(time.time())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 UPDATE smart_alerts
                 SET action_taken = TRUE
@@ -544,7 +544,7 @@ class SmartAlerts:
         """
         cutoff = int((datetime.now() - timedelta(days=days)).timestamp())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             # Delete log entries first (foreign key constraint)
             conn.execute("""
                 DELETE FROM alert_log
@@ -10,6 +10,11 @@ Capabilities:
 - Importance ranking
 - Combined multi-dimensional queries
 
+Filters are evaluated on a columnar index of the memory store (created
+epoch, importance, project codes, tag bitmaps) with NumPy masks; only the
+rows that survive filtering and sorting are loaded as Memory objects. The
+index is rebuilt when the store generation changes.
+
 Database: intelligence.db (search_history table for query analytics)
 """
 
@@ -21,8 +26,11 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+import numpy as np
+
 from memory_system.db_pool import get_connection
-from memory_system.memory_ts_client import MemoryTSClient, Memory
+from memory_system.frontmatter import read_header
+from memory_system.memory_ts_client import MemoryTSClient, Memory, generation_settled
 from memory_system.intelligence.search_optimizer import SearchOptimizer
 
 
@@ -49,6 +57,191 @@ class SearchResult:
     match_reason: str  # What caused this result to match
 
 
+def _created_epoch(created) -> float:
+    """Created timestamp (datetime or ISO string) as epoch seconds, NaN if unparseable"""
+    if isinstance(created, datetime):
+        return created.timestamp()
+    try:
+        return datetime.fromisoformat(str(created)).timestamp()
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class MemoryFilterIndex:
+    """
+    Columnar index over memory filter fields.
+
+    One row per memory, with parallel columns:
+    - created: epoch seconds (float64, NaN when unknown)
+    - importance: float64
+    - project_codes: int32 code into self.projects
+    - tag bitmaps: packed bit per row, one bitmap per tag
+
+    mask() evaluates a filter conjunction as NumPy boolean operations and
+    order() sorts matching rows by a column, so no Memory object is touched
+    until the caller hydrates the rows it actually returns.
+    """
+
+    def __init__(self, ids, created, importance, projects, tags, sources):
+        """
+        Args:
+            ids: Memory id per row
+            created: Created value per row (datetime or ISO string)
+            importance: Importance per row
+            projects: Project id per row
+            tags: Tag list per row
+            sources: Per-row hydration source (file path or Memory object)
+        """
+        self.ids = list(ids)
+        self.sources = list(sources)
+        n = len(self.ids)
+
+        self.created = np.array([_created_epoch(c) for c in created], dtype=np.float64)
+        self.importance = np.array(importance, dtype=np.float64)
+
+        self.projects: Dict[str, int] = {}
+        self.project_codes = np.array(
+            [self.projects.setdefault(p, len(self.projects)) for p in projects],
+            dtype=np.int32,
+        )
+
+        rows_by_tag: Dict[str, List[int]] = {}
+        for row, row_tags in enumerate(tags):
+            for tag in set(row_tags or ()):
+                rows_by_tag.setdefault(tag, []).append(row)
+        self._tag_bits = {}
+        for tag, rows in rows_by_tag.items():
+            bits = np.zeros(n, dtype=bool)
+            bits[rows] = True
+            self._tag_bits[tag] = np.packbits(bits)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_memories(cls, memories: List[Memory]) -> "MemoryFilterIndex":
+        """Index already-loaded Memory objects (hydration returns them as-is)."""
+        return cls(
+            ids=[m.id for m in memories],
+            created=[m.created for m in memories],
+            importance=[m.importance for m in memories],
+            projects=[m.project_id for m in memories],
+            tags=[m.tags for m in memories],
+            sources=memories,
+        )
+
+    @classmethod
+    def from_directory(cls, memory_dir: Path) -> "MemoryFilterIndex":
+        """
+        Index the active memories in memory_dir.
+
+        Reads only the frontmatter fields the filters need; content and the
+        remaining fields are parsed later, for returned rows only.
+        """
+        ids, created, importance, projects, tags, sources = [], [], [], [], [], []
+        for memory_file in Path(memory_dir).glob("*.md"):
+            try:
+                fields = cls._scan_frontmatter(memory_file)
+            except Exception:
+                continue
+            ids.append(fields.get("id", memory_file.stem))
+            created.append(fields.get("created", ""))
+            importance.append(fields.get("importance_weight", 0.5))
+            projects.append(fields.get("project_id", "LFI"))
+            tags.append(fields.get("semantic_tags", []))
+            sources.append(memory_file)
+        return cls(ids, created, importance, projects, tags, sources)
+
+    @staticmethod
+    def _scan_frontmatter(memory_file: Path) -> Dict:
+        """Parse just the header of a memory file, with indexed keys coerced."""
+        fields = read_header(memory_file)
+        tags = fields.get("semantic_tags")
+        if not isinstance(tags, list):
+            fields["semantic_tags"] = []
+        importance = fields.get("importance_weight", 0.5)
+        fields["importance_weight"] = float(importance) if importance is not None else 0.0
+        for key in ("id", "created", "project_id"):
+            value = fields.pop(key, None)
+            if value is not None:
+                fields[key] = str(value)
+        return fields
+
+    def mask(
+        self,
+        date_start: Optional[datetime] = None,
+        date_end: Optional[datetime] = None,
+        min_importance: Optional[float] = None,
+        max_importance: Optional[float] = None,
+        project_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        exclude_tags: Optional[List[str]] = None,
+    ) -> np.ndarray:
+        """Boolean row mask for the conjunction of the given filters."""
+        n = len(self.ids)
+        keep = np.ones(n, dtype=bool)
+
+        if date_start:
+            keep &= self.created >= date_start.timestamp()
+        if date_end:
+            keep &= self.created <= date_end.timestamp()
+        if min_importance is not None:
+            keep &= self.importance >= min_importance
+        if max_importance is not None:
+            keep &= self.importance <= max_importance
+        if project_id:
+            code = self.projects.get(project_id)
+            if code is None:
+                return np.zeros(n, dtype=bool)
+            keep &= self.project_codes == code
+        if tags:
+            keep &= self._any_tag(tags)
+        if exclude_tags:
+            keep &= ~self._any_tag(exclude_tags)
+
+        return keep
+
+    def _any_tag(self, tags: List[str]) -> np.ndarray:
+        n = len(self.ids)
+        bits = np.zeros((n + 7) // 8, dtype=np.uint8)
+        for tag in tags:
+            tag_bits = self._tag_bits.get(tag)
+            if tag_bits is not None:
+                bits |= tag_bits
+        return np.unpackbits(bits, count=n).astype(bool)
+
+    def order(self, keep: np.ndarray, order_by: str) -> np.ndarray:
+        """
+        Row numbers passing keep, sorted for order_by.
+
+        importance and recency sort descending on their column (stable, so
+        ties keep store order; unknown created dates sort last). Other
+        orders return rows in store order.
+        """
+        rows = np.flatnonzero(keep)
+        if order_by == "importance":
+            key = self.importance[rows]
+        elif order_by == "recency":
+            key = np.nan_to_num(self.created[rows], nan=-np.inf)
+        else:
+            return rows
+        return rows[np.argsort(-key, kind="stable")]
+
+    def hydrate(self, rows, client: MemoryTSClient) -> List[Memory]:
+        """Memory objects for the given rows (skips files that vanished)."""
+        memories = []
+        for row in rows:
+            source = self.sources[row]
+            if isinstance(source, Memory):
+                memories.append(source)
+                continue
+            try:
+                memories.append(client._read_memory(source))
+            except Exception:
+                continue
+        return memories
+
+
 class MemoryAwareSearch:
     """
     Multi-dimensional search over memories with natural language support.
@@ -98,11 +291,13 @@ class MemoryAwareSearch:
             db_path = Path(__file__).parent.parent / "intelligence.db"
         self.db_path = Path(db_path)
         self.optimizer = SearchOptimizer(db_path=str(self.db_path))
+        self._index: Optional[MemoryFilterIndex] = None
+        self._index_generation: Optional[int] = None
         self._init_db()
 
     def _init_db(self):
         """Create search history table."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS search_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -177,7 +372,7 @@ class MemoryAwareSearch:
         Returns:
             List of SearchResult objects
         """
-        # Start with base search or all memories — use cache when text query present
+        # Candidate rows: cached text search results, or the whole store index
         if text_query:
             def _search_fn(q: str) -> list:
                 return self.client.search(content=q)
@@ -185,34 +380,29 @@ class MemoryAwareSearch:
             memories = self.optimizer.search_with_cache(
                 text_query, _search_fn, project_id=project_id
             )
+            index = MemoryFilterIndex.from_memories(memories)
         else:
-            memories = self.client.search(content="", project_id=project_id)
-
-        filtered = []
-
-        for mem in memories:
-            # Apply filters
-            if date_start and mem.created < date_start:
-                continue
-
-            if date_end and mem.created > date_end:
-                continue
-
-            if min_importance is not None and mem.importance < min_importance:
-                continue
-
-            if max_importance is not None and mem.importance > max_importance:
-                continue
-
-            if project_id and mem.project_id != project_id:
-                continue
-
-            if tags and not any(tag in mem.tags for tag in tags):
-                continue
+            index = self._store_index()
+
+        keep = index.mask(
+            date_start=date_start,
+            date_end=date_end,
+            min_importance=min_importance,
+            max_importance=max_importance,
+            project_id=project_id,
+            tags=tags,
+            exclude_tags=exclude_tags,
+        )
+        rows = index.order(keep, order_by)
 
-            if exclude_tags and any(tag in mem.tags for tag in exclude_tags):
-                continue
+        if order_by == "relevance":
+            # Delegate to F28 optimizer for multi-factor ranking
+            matched = self.optimizer.rank_results(index.hydrate(rows, self.client), text_query)[:limit]
+        else:
+            matched = index.hydrate(rows[:limit], self.client)
 
+        filtered = []
+        for mem in matched:
             match_reasons = []
             if text_query:
                 match_reasons.append("Content match")
@@ -227,19 +417,6 @@ class MemoryAwareSearch:
                 match_reason="; ".join(match_reasons) if match_reasons else "Filter match"
             ))
 
-        # Sort by requested order
-        if order_by == "importance":
-            filtered.sort(key=lambda r: r.memory.importance, reverse=True)
-        elif order_by == "recency":
-            filtered.sort(key=lambda r: r.memory.created, reverse=True)
-        elif order_by == "relevance":
-            # Delegate to F28 optimizer for multi-factor ranking
-            ranked_memories = self.optimizer.rank_results(
-                [r.memory for r in filtered], text_query
-            )
-            memory_order = {mem.id: i for i, mem in enumerate(ranked_memories)}
-            filtered.sort(key=lambda r: memory_order.get(r.memory.id, len(filtered)))
-
         results = filtered[:limit]
 
         # Log search
@@ -386,17 +563,29 @@ class MemoryAwareSearch:
 
             return history
 
+    def _store_index(self) -> MemoryFilterIndex:
+        """Filter index for the client's store, rebuilt when the store generation changes (or is unsettled)."""
+        generation = self.client.generation()
+        if (self._index is None or self._index_generation != generation
+                or not generation_settled(self.client.memory_dir)):
+            self._index = MemoryFilterIndex.from_directory(self.client.memory_dir)
+            self._index_generation = generation
+        return self._index
+
     def _calculate_relevance(self, memory: Memory, query: Optional[str], order_by: str) -> float:
         """Calculate relevance score for sorting."""
+        created = _created_epoch(memory.created) if memory.created else float("nan")
+        if created != created:  # NaN: missing or unparseable
+            created = 0
         if order_by == "importance":
             return memory.importance
         elif order_by == "recency":
             # Convert datetime to score (higher = more recent)
-            return memory.created.timestamp() if memory.created else 0
+            return created
         elif order_by == "relevance":
             # Combined score
             importance_score = memory.importance * 0.6
-            recency_score = (memory.created.timestamp() / datetime.now().timestamp()) * 0.4 if memory.created else 0
+            recency_score = (created / datetime.now().timestamp()) * 0.4
             return importance_score + recency_score
         return 0.5
 
@@ -404,7 +593,7 @@ class MemoryAwareSearch:
         """Log search query for analytics."""
         now = int(time.time())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 INSERT INTO search_history (query_text, query_struct, results_count, timestamp)
                 VALUES (?, ?, ?, ?)
@@ -106,7 +106,7 @@ class MemoryTriggers:
 
     def _init_db(self):
         """Create trigger tables."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS memory_triggers (
                     trigger_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -166,7 +166,7 @@ class MemoryTriggers:
         """
         now = int(datetime.now().timestamp())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute("""
                 INSERT INTO memory_triggers
                 (name, condition_type, condition_value, action_type, action_config, enabled, created_at, trigger_count)
@@ -267,7 +267,7 @@ class MemoryTriggers:
 
     def enable_trigger(self, trigger_id: int, enabled: bool = True):
         """Enable/disable trigger."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 UPDATE memory_triggers
                 SET enabled = ?
@@ -278,7 +278,7 @@ class MemoryTriggers:
 
     def delete_trigger(self, trigger_id: int):
         """Delete trigger (keeps logs)."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("DELETE FROM memory_triggers WHERE trigger_id = ?", (trigger_id,))
             conn.commit()
 
@@ -354,7 +354,7 @@ class MemoryTriggers:
         """Log trigger execution."""
         now = int(datetime.now().timestamp())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 INSERT INTO trigger_log (trigger_id, memory_id, executed_at, success, error_message)
                 VALUES (?, ?, ?, ?, ?)
@@ -366,7 +366,7 @@ class MemoryTriggers:
         """Update trigger statistics."""
         now = int(datetime.now().timestamp())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 UPDATE memory_triggers
                 SET trigger_count = trigger_count + 1, last_triggered = ?
@@ -8,8 +8,12 @@ are unresponsive. Three states:
   OPEN      -- calls are rejected immediately (fallback or CircuitBreakerOpenError)
   HALF_OPEN -- one probe call is allowed; success closes, failure reopens
 
-State is persisted in SQLite (intelligence.db by default) so that breaker
-state survives process restarts.
+State lives in memory; the per-call path (state check, record_success while
+closed) never touches SQLite. With a db_path, the state row is written only
+when it changes (a failure, a transition, a reset), over one connection
+kept per breaker, so it survives process restarts. Other processes'
+transitions are picked up by re-reading the row at most every
+sync_interval seconds.
 
 Usage:
     from memory_system.circuit_breaker import get_breaker, CircuitBreakerOpenError
@@ -64,6 +68,8 @@ class CircuitBreaker:
         db_path: SQLite database path for persistence (None = in-memory only)
         failure_threshold: Consecutive failures before opening (default 5)
         recovery_timeout: Seconds to wait before probing in HALF_OPEN (default 600)
+        sync_interval: Seconds between re-reads of the persisted row to pick
+                       up other processes' transitions (None = never)
     """
 
     CLOSED = "closed"
@@ -76,11 +82,13 @@ class CircuitBreaker:
         db_path: Optional[str] = None,
         failure_threshold: int = 5,
         recovery_timeout: float = 600.0,
+        sync_interval: Optional[float] = 5.0,
     ):
         self.name = name
         self.db_path = db_path
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        self.sync_interval = sync_interval
 
         self._state = self.CLOSED
         self._failure_count = 0
@@ -88,6 +96,8 @@ class CircuitBreaker:
         self._opened_at: Optional[float] = None  # float for sub-second precision
         self._updated_at: int = _now_ts()
         self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last_sync = time.monotonic()
 
         # Initialise DB table and load persisted state
         if self.db_path:
@@ -97,40 +107,66 @@ class CircuitBreaker:
     # -- DB helpers -----------------------------------------------------------
 
     def _get_conn(self) -> sqlite3.Connection:
-        """Get a short-lived connection for a single operation."""
-        conn = sqlite3.connect(self.db_path, timeout=5.0)
-        conn.execute("PRAGMA journal_mode=WAL")
-        return conn
+        """Get this breaker's connection (opened once, reused for every write)."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        return self._conn
 
     def _init_db(self) -> None:
         """Ensure the circuit_breaker_state table exists."""
-        conn = self._get_conn()
-        try:
-            conn.executescript(_SCHEMA)
-        finally:
-            conn.close()
+        self._get_conn().executescript(_SCHEMA)
+
+    def _read_row(self) -> Optional[tuple]:
+        """Persisted (state, failure_count, last_failure_at, opened_at, updated_at)."""
+        return self._get_conn().execute(
+            "SELECT state, failure_count, last_failure_at, opened_at, updated_at "
+            "FROM circuit_breaker_state WHERE name = ?",
+            (self.name,),
+        ).fetchone()
+
+    def _apply_row(self, row: tuple) -> None:
+        self._state = row[0]
+        self._failure_count = row[1]
+        self._last_failure_at = row[2]
+        # Convert opened_at from int (DB) to float (memory) for timing
+        self._opened_at = float(row[3]) if row[3] is not None else None
+        self._updated_at = row[4]
 
     def _load_state(self) -> None:
         """Load persisted state from DB (if any row exists for this name)."""
-        conn = self._get_conn()
+        row = self._read_row()
+        if row:
+            self._apply_row(row)
+
+    def _sync_from_db(self) -> None:
+        """Adopt another process's newer state, at most every sync_interval seconds.
+
+        Must be called under self._lock.
+        """
+        if not self.db_path or self.sync_interval is None:
+            return
+        now = time.monotonic()
+        if now - self._last_sync < self.sync_interval:
+            return
+        self._last_sync = now
+
         try:
-            row = conn.execute(
-                "SELECT state, failure_count, last_failure_at, opened_at, updated_at "
-                "FROM circuit_breaker_state WHERE name = ?",
-                (self.name,),
-            ).fetchone()
-            if row:
-                self._state = row[0]
-                self._failure_count = row[1]
-                self._last_failure_at = row[2]
-                # Convert opened_at from int (DB) to float (memory) for timing
-                self._opened_at = float(row[3]) if row[3] is not None else None
-                self._updated_at = row[4]
-        finally:
-            conn.close()
+            row = self._read_row()
+        except sqlite3.Error:
+            return
+        if (
+            row
+            and row[4] >= self._updated_at
+            and (row[0], row[1]) != (self._state, self._failure_count)
+        ):
+            self._apply_row(row)
 
     def _persist_state(self) -> None:
-        """Write current in-memory state to DB."""
+        """Write current in-memory state to DB.
+
+        Only called when the state row changes. Must be called under self._lock.
+        """
         if not self.db_path:
             return
         conn = self._get_conn()
@@ -155,8 +191,9 @@ class CircuitBreaker:
                 ),
             )
             conn.commit()
-        finally:
-            conn.close()
+        except sqlite3.Error:
+            # Persistence is best-effort; in-memory state stays authoritative
+            conn.rollback()
 
     # -- Public API -----------------------------------------------------------
 
@@ -164,6 +201,7 @@ class CircuitBreaker:
     def state(self) -> str:
         """Current breaker state, accounting for recovery timeout."""
         with self._lock:
+            self._sync_from_db()
             self._check_recovery()
             return self._state
 
@@ -182,6 +220,7 @@ class CircuitBreaker:
     def get_stats(self) -> Dict[str, Any]:
         """Return a dict with state, failures, and timestamps."""
         with self._lock:
+            self._sync_from_db()
             self._check_recovery()
             return {
                 "name": self.name,
@@ -250,6 +289,13 @@ class CircuitBreaker:
             self._updated_at = _now_ts()
             self._persist_state()
 
+    def close(self) -> None:
+        """Close the persistence connection (reopened on next write)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     # -- internal helpers ----------------------------------------------------
 
     def _check_recovery(self) -> None:
@@ -277,6 +323,8 @@ class CircuitBreaker:
 
     def _on_success(self) -> None:
         with self._lock:
+            if self._state == self.CLOSED and self._failure_count == 0:
+                return  # Nothing changed - the common path stays off the DB
             self._failure_count = 0
             self._state = self.CLOSED
             self._opened_at = None
@@ -318,4 +366,6 @@ def get_breaker(
 def reset_all() -> None:
     """Clear the entire singleton registry (mainly for tests)."""
     with _registry_lock:
+        for breaker in _registry.values():
+            breaker.close()
         _registry.clear()
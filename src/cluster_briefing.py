@@ -27,6 +27,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from .frontmatter import strip_frontmatter
+
 MEMORY_DIR = Path.home() / ".local/share/memory/LFI/memories"
 INTELLIGENCE_DB = Path(__file__).parent / "intelligence.db"
 
@@ -227,13 +229,7 @@ def _build_cluster_summary(memory_dir: Path, memory_ids: list[str]) -> str:
         if not fpath.exists():
             continue
         try:
-            text = fpath.read_text()
-            # Extract body after frontmatter
-            parts = text.split("---", 2)
-            if len(parts) >= 3:
-                body = parts[2].strip()
-            else:
-                body = text.strip()
+            body = strip_frontmatter(fpath.read_text())
             preview = body[:100].replace("\n", " ").strip()
             if preview:
                 previews.append(preview)
@@ -102,6 +102,13 @@ class MemorySystemConfig:
             Path.home() / ".local/share/memory" / "clusters.db",
         )
 
+    @property
+    def metrics_db_path(self) -> Path:
+        return _path(
+            "MEMORY_SYSTEM_METRICS_DB",
+            Path.home() / ".local/share/memory" / "metrics.db",
+        )
+
     # ── Tunable constants ─────────────────────────────────────────────────
     max_pre_compaction_facts: int = field(
         default_factory=lambda: int(_env("MEMORY_SYSTEM_MAX_FACTS", "5"))
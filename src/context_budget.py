@@ -2,15 +2,34 @@
 Context budget optimizer for memory retrieval.
 
 Scores memories by a weighted composite of importance, recency,
-access frequency, and confidence, then greedily packs the highest-
-value memories into a fixed token budget.
+access frequency, and confidence, then packs the highest-value memories
+into a fixed token budget.
 
-No LLM calls. No external dependencies beyond the standard library.
+Packing strategies (``optimize(..., strategy=...)``):
+
+* ``"greedy"`` — score every memory, sort, pack in score order (default)
+* ``"fast"``   — greedy's selection (up to float rounding of recency),
+  but scores are computed on NumPy columns and only the top of the score distribution is sorted
+  (argpartition, widened until nothing outside it could still fit)
+* ``"exact"``  — 0/1 knapsack by dynamic programming over token
+  capacity; maximises total score. For small budgets
+* ``"fptas"``  — knapsack with scaled scores; total score within
+  (1 - epsilon) of optimal, cost independent of the budget
+
+Both knapsack strategies bound their DP table; with very many candidates
+they optimise over the best pool by score per token.
+
+scripts/benchmark_context_budget.py compares their latency and quality.
+
+No LLM calls. NumPy is the only dependency beyond the standard library.
 """
 
 import math
+import warnings
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
 
 # Composite score weights — must sum to 1.0
@@ -24,6 +43,14 @@ SCORE_WEIGHTS: Dict[str, float] = {
 # Recency window: memories older than this many days score 0 for recency.
 _RECENCY_WINDOW_DAYS = 90
 
+STRATEGIES = ("greedy", "fast", "exact", "fptas")
+
+# Knapsack DP tables stay under this many cells (bytes). Larger candidate
+# sets are cut to the best pool by score per token; "exact" hands budgets
+# too large for a useful pool over to "fptas".
+_KNAPSACK_MAX_CELLS = 20_000_000
+_EXACT_MIN_POOL = 256
+
 
 def _parse_datetime(value: Any) -> datetime | None:
     """Best-effort ISO datetime parse. Returns None on failure."""
@@ -37,6 +64,117 @@ def _parse_datetime(value: Any) -> datetime | None:
         return None
 
 
+def _greedy_take(order: np.ndarray, tokens: np.ndarray, budget: int) -> List[int]:
+    """Walk *order* and keep every item that still fits."""
+    taken = []
+    remaining = budget
+    for i in order.tolist():
+        if tokens[i] <= remaining:
+            taken.append(i)
+            remaining -= tokens[i]
+    return taken
+
+
+def _stable_desc(scores: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """*rows* sorted by score descending, ties in input order (like list.sort)."""
+    return rows[np.lexsort((rows, -scores[rows]))]
+
+
+def _knapsack_items(scores: np.ndarray, tokens: np.ndarray, budget: int, pool: int):
+    """
+    Split candidates for the knapsack DPs.
+
+    Returns (free, items): zero-token items (always taken) and the items
+    that could be worth packing. When there are more than *pool* of the
+    latter, only the *pool* best by score per token are kept, so the DP
+    table stays bounded; optimality then holds over that pool.
+    """
+    free = np.flatnonzero(tokens == 0)
+    items = np.flatnonzero((tokens > 0) & (tokens <= budget) & (scores > 0))
+    if len(items) > pool:
+        density = scores[items] / tokens[items]
+        items = np.sort(items[np.argpartition(-density, pool - 1)[:pool]])
+    return free, items
+
+
+def _knapsack_exact(scores: np.ndarray, tokens: np.ndarray, budget: int) -> List[int]:
+    """0/1 knapsack maximising total score within *budget* tokens (DP over capacity)."""
+    free, items = _knapsack_items(
+        scores, tokens, budget, max(1, _KNAPSACK_MAX_CELLS // (budget + 1))
+    )
+
+    best = np.zeros(budget + 1)
+    take = np.zeros((len(items), budget + 1), dtype=bool)
+    for row, i in enumerate(items.tolist()):
+        w = int(tokens[i])
+        candidate = best[:-w] + scores[i]
+        improved = candidate > best[w:]
+        take[row, w:] = improved
+        best[w:] = np.where(improved, candidate, best[w:])
+
+    chosen = []
+    capacity = budget
+    for row in range(len(items) - 1, -1, -1):
+        if take[row, capacity]:
+            i = int(items[row])
+            chosen.append(i)
+            capacity -= int(tokens[i])
+    return free.tolist() + chosen
+
+
+def _knapsack_fptas(
+    scores: np.ndarray, tokens: np.ndarray, budget: int, epsilon: float
+) -> List[int]:
+    """
+    0/1 knapsack within (1 - epsilon) of the optimal total score.
+
+    Scores are scaled to integers with K = epsilon * LB / n, where LB (the
+    better of greedy-by-density and the single best item) is at least
+    half the optimum. The DP runs over scaled profit up to 2 * LB / K =
+    2n / epsilon, tracking the fewest tokens per profit level, so its cost
+    does not depend on the budget.
+    """
+    pool = max(1, int(math.sqrt(_KNAPSACK_MAX_CELLS * epsilon / 2)))
+    free, items = _knapsack_items(scores, tokens, budget, pool)
+    if len(items) == 0:
+        return free.tolist()
+
+    values = scores[items]
+    weights = tokens[items].astype(np.int64)
+    by_density = np.argsort(-(values / weights), kind="stable")
+    lower = max(values[_greedy_take(by_density, weights, budget)].sum(), values.max())
+
+    scale = epsilon * lower / len(items)
+    profits = np.floor(values / scale).astype(np.int64)
+    cap = min(int(profits.sum()), int(math.ceil(2 * lower / scale)))
+
+    inf = np.iinfo(np.int64).max // 2
+    least = np.full(cap + 1, inf, dtype=np.int64)
+    least[0] = 0
+    take = np.zeros((len(items), cap + 1), dtype=bool)
+    for row in range(len(items)):
+        p = int(profits[row])
+        if p == 0 or p > cap:
+            continue
+        candidate = least[:-p] + weights[row]
+        improved = candidate < least[p:]
+        take[row, p:] = improved
+        least[p:] = np.where(improved, candidate, least[p:])
+
+    profit = int(np.flatnonzero(least <= budget).max())
+    chosen = []
+    for row in range(len(items) - 1, -1, -1):
+        if profit and take[row, profit]:
+            chosen.append(int(items[row]))
+            profit -= int(profits[row])
+
+    # Items scaled to zero profit still add score; fill leftover room greedily
+    remaining = budget - int(tokens[chosen].sum()) if chosen else budget
+    rest = np.setdiff1d(items, chosen)
+    chosen += _greedy_take(_stable_desc(scores, rest), tokens, remaining)
+    return free.tolist() + chosen
+
+
 class ContextBudgetOptimizer:
     """Pack the most valuable memories into a token budget."""
 
@@ -92,14 +230,58 @@ class ContextBudgetOptimizer:
         )
         return score
 
+    def score_memories(self, memories: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """Vectorized score_memory(): one score per memory, as a float array.
+
+        Each field is pulled out as one column and combined with array
+        arithmetic; values NumPy can't convert in bulk fall back to the
+        per-memory extractors.
+        """
+        importance = self._numeric_column(
+            memories, "importance", "importance_score", self._extract_importance
+        )
+        confidence = self._numeric_column(
+            memories, "confidence", "confidence_score", self._extract_confidence
+        )
+        access = self._numeric_column(
+            memories, "access_count", None, self._extract_access_frequency
+        )
+        if access is not None:
+            access = np.where(np.isnan(access), 0.5, np.minimum(access / 10.0, 1.0))
+        else:
+            access = np.array([self._extract_access_frequency(m) for m in memories])
+
+        recency = self._recency_column(memories)
+
+        return (
+            SCORE_WEIGHTS["importance"] * importance
+            + SCORE_WEIGHTS["recency"] * recency
+            + SCORE_WEIGHTS["access_frequency"] * access
+            + SCORE_WEIGHTS["confidence"] * confidence
+        )
+
     # ------------------------------------------------------------------
     # Optimization
     # ------------------------------------------------------------------
 
     def optimize(
-        self, memories: List[Dict[str, Any]], budget_tokens: int
+        self,
+        memories: List[Dict[str, Any]],
+        budget_tokens: int,
+        strategy: str = "greedy",
+        epsilon: float = 0.1,
+        include_excluded: bool = True,
     ) -> Dict[str, Any]:
-        """Greedy-pack *memories* into *budget_tokens*.
+        """Pack *memories* into *budget_tokens*.
+
+        Args:
+            memories: Candidate memory dicts
+            budget_tokens: Token budget
+            strategy: One of STRATEGIES (see module docstring)
+            epsilon: Approximation slack for ``"fptas"``
+            include_excluded: Build the ``excluded`` list. Hot paths that
+                only need the selection can pass False (column strategies
+                then copy just the selected dicts)
 
         Returns a dict with:
         * ``selected``         — memories that fit (score & tokens added)
@@ -107,7 +289,15 @@ class ContextBudgetOptimizer:
         * ``total_tokens``     — tokens consumed by selected memories
         * ``budget_used_pct``  — 0-100 float
         * ``explanation``      — human-readable summary
+
+        Raises:
+            ValueError: If *strategy* is not in STRATEGIES.
         """
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy '{strategy}'. Must be one of: {', '.join(STRATEGIES)}"
+            )
+
         # Edge: empty list
         if not memories:
             self._stats["optimizations"] += 1
@@ -139,6 +329,11 @@ class ContextBudgetOptimizer:
                 "explanation": "Budget is zero; all memories excluded.",
             }
 
+        if strategy != "greedy":
+            return self._optimize_columns(
+                memories, budget_tokens, strategy, epsilon, include_excluded
+            )
+
         # Score and estimate tokens for every memory
         scored: List[Dict[str, Any]] = []
         for mem in memories:
@@ -161,17 +356,105 @@ class ContextBudgetOptimizer:
             else:
                 excluded.append(entry)
 
+        if not include_excluded:
+            excluded = []
+        return self._result(
+            selected, excluded, total_tokens, budget_tokens, len(memories),
+            len(memories) - len(selected),
+        )
+
+    def _optimize_columns(
+        self,
+        memories: List[Dict[str, Any]],
+        budget_tokens: int,
+        strategy: str,
+        epsilon: float,
+        include_excluded: bool,
+    ) -> Dict[str, Any]:
+        """optimize() for the column-based strategies; copies only for output."""
+        scores = self.score_memories(memories)
+        # estimate_tokens() in bulk: whitespace-only content splits to 0 words
+        words = np.array([len((m.get("content") or "").split()) for m in memories])
+        tokens = np.ceil(words * 1.3).astype(np.int64)
+
+        if strategy == "fast":
+            chosen = self._top_greedy(scores, tokens, budget_tokens)
+        elif strategy == "exact" and (budget_tokens + 1) * _EXACT_MIN_POOL <= _KNAPSACK_MAX_CELLS:
+            chosen = _knapsack_exact(scores, tokens, budget_tokens)
+        else:
+            chosen = _knapsack_fptas(scores, tokens, budget_tokens, epsilon)
+
+        is_chosen = np.zeros(len(memories), dtype=bool)
+        is_chosen[chosen] = True
+        everything = _stable_desc(scores, np.arange(len(memories)))
+
+        def entry(i: int) -> Dict[str, Any]:
+            copied = dict(memories[i])
+            copied["score"] = float(scores[i])
+            copied["tokens"] = int(tokens[i])
+            return copied
+
+        selected = [entry(i) for i in everything[is_chosen[everything]].tolist()]
+        excluded = (
+            [entry(i) for i in everything[~is_chosen[everything]].tolist()]
+            if include_excluded else []
+        )
+        total_tokens = int(tokens[is_chosen].sum())
+
+        return self._result(
+            selected, excluded, total_tokens, budget_tokens, len(memories),
+            len(memories) - len(selected),
+        )
+
+    @staticmethod
+    def _top_greedy(scores: np.ndarray, tokens: np.ndarray, budget: int) -> List[int]:
+        """Greedy packing without sorting everything.
+
+        Sorts only the top-k scores (ties at the cut included) and packs
+        them. If the leftover budget could still fit something outside
+        that prefix, k doubles; otherwise the result equals a full-sort
+        greedy pass.
+        """
+        n = len(scores)
+        positive = tokens[tokens > 0]
+        typical = int(np.median(positive)) if len(positive) else 1
+        k = min(n, max(32, 2 * budget // max(typical, 1)))
+
+        while True:
+            if k >= n:
+                return _greedy_take(_stable_desc(scores, np.arange(n)), tokens, budget)
+
+            cut = np.partition(scores, n - k)[n - k]
+            prefix = np.flatnonzero(scores >= cut)
+            taken = _greedy_take(_stable_desc(scores, prefix), tokens, budget)
+
+            remaining = budget - int(tokens[taken].sum())
+            outside = np.ones(n, dtype=bool)
+            outside[prefix] = False
+            if not outside.any() or remaining < tokens[outside].min():
+                return taken
+            k *= 2
+
+    def _result(
+        self,
+        selected: List[Dict[str, Any]],
+        excluded: List[Dict[str, Any]],
+        total_tokens: int,
+        budget_tokens: int,
+        total_memories: int,
+        excluded_count: int,
+    ) -> Dict[str, Any]:
         # Update cumulative stats
         self._stats["optimizations"] += 1
         self._stats["total_selected"] += len(selected)
-        self._stats["total_excluded"] += len(excluded)
+        self._stats["total_excluded"] += excluded_count
 
         budget_used_pct = (
             (total_tokens / budget_tokens) * 100.0 if budget_tokens > 0 else 0.0
         )
 
         explanation = (
-            f"Selected {len(selected)} of {len(memories)} memories "
+            f"Selected {len(selected)} of {total_memories} memories "
             f"({total_tokens} tokens, {budget_used_pct:.1f}% of budget)."
         )
 
@@ -195,6 +478,51 @@ class ContextBudgetOptimizer:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _numeric_column(
+        memories: Sequence[Dict[str, Any]],
+        key: str,
+        alias: Optional[str],
+        extract,
+    ) -> Optional[np.ndarray]:
+        """Column of *key* (falling back to *alias*) as floats.
+
+        Missing values become the 0.5 default, except for access_count
+        (alias None) where they stay NaN for the caller to map. Returns
+        None for access_count when bulk conversion fails; other columns
+        fall back to *extract* per memory.
+        """
+        if alias is None:
+            raw = [m.get(key) for m in memories]
+        else:
+            raw = [m.get(key, m.get(alias)) for m in memories]
+        try:
+            column = np.array(raw, dtype=np.float64)
+        except (ValueError, TypeError):
+            if alias is None:
+                return None
+            return np.array([extract(m) for m in memories], dtype=np.float64)
+        if alias is None:
+            return column
+        return np.where(np.isnan(column), 0.5, column)
+
+    @classmethod
+    def _recency_column(cls, memories: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """_extract_recency() for every memory, parsing dates in bulk."""
+        raw = [m.get("updated", m.get("created")) for m in memories]
+        try:
+            with warnings.catch_warnings():
+                # Timezone-suffixed strings only parse with a warning; take the slow path
+                warnings.simplefilter("error")
+                stamps = np.array(raw, dtype="datetime64[us]")
+        except (ValueError, TypeError, DeprecationWarning, UserWarning):
+            return np.array([cls._extract_recency(m) for m in memories], dtype=np.float64)
+
+        now = np.datetime64(datetime.now(), "us")
+        days_ago = (now - stamps) / np.timedelta64(86400, "s")
+        recency = np.maximum(0.0, 1.0 - np.maximum(days_ago, 0.0) / _RECENCY_WINDOW_DAYS)
+        return np.where(np.isnat(stamps), 0.5, recency)
+
     @staticmethod
     def _extract_importance(memory: Dict[str, Any]) -> float:
         val = memory.get("importance", memory.get("importance_score"))
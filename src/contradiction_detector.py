@@ -15,6 +15,8 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass
 
 from .circuit_breaker import get_breaker, CircuitBreakerOpenError
+from .llm_executor import get_executor
+from .llm_gateway import get_gateway
 
 
 @dataclass
@@ -30,6 +32,8 @@ def ask_claude_quick(prompt: str, timeout: int = 10) -> str:
     Quick LLM query using Claude CLI.
 
     Protected by circuit breaker to fail fast when LLM is unavailable.
+    Goes through the shared LLM gateway, so re-checking the same pair of
+    facts is answered from cache.
 
     Args:
         prompt: Question for Claude
@@ -41,15 +45,7 @@ def ask_claude_quick(prompt: str, timeout: int = 10) -> str:
     breaker = get_breaker("llm_contradiction", failure_threshold=3, recovery_timeout=60.0)
 
     def _run_query():
-        result = subprocess.run(
-            ["claude", "-p", prompt],
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Claude CLI returned {result.returncode}")
-        return result.stdout.strip()
+        return get_gateway().complete(prompt, site="contradiction", timeout=timeout)
 
     try:
         return breaker.call(_run_query)
@@ -166,3 +162,56 @@ def check_contradictions(
             )
 
     return ContradictionResult(contradicts=False, action="save")
+
+
+def check_contradictions_many(
+    new_memories: List[str],
+    existing_per_memory: List[List[Dict]]
+) -> List[ContradictionResult]:
+    """
+    Batched check_contradictions for several new memories at once.
+
+    All (new, similar existing) pairs are packed into as few LLM prompts as
+    possible via the async executor instead of one CLI call per pair. Each
+    new memory is resolved like check_contradictions: the most similar
+    contradicted memory wins; pairs the LLM didn't answer count as compatible.
+
+    Args:
+        new_memories: New memory contents
+        existing_per_memory: Existing memory dicts to check, one list per new memory
+
+    Returns:
+        ContradictionResult per new memory, in input order
+    """
+    candidates = [
+        find_similar_memories(new_memory, existing, top_n=5)
+        for new_memory, existing in zip(new_memories, existing_per_memory)
+    ]
+
+    items = [
+        f"New: {new_memory}\nExisting: {existing_mem.get('content', '')}"
+        for new_memory, similar in zip(new_memories, candidates)
+        for existing_mem in similar
+    ]
+    answers = iter(get_executor().judge_sync(
+        items,
+        choices=["CONTRADICTS", "COMPATIBLE"],
+        instruction="For each pair, does the new fact CONTRADICT the existing fact?",
+        timeout=30,
+    ))
+
+    results = []
+    for similar in candidates:
+        verdicts = [next(answers) for _ in similar]
+        result = ContradictionResult(contradicts=False, action="save")
+        for existing_mem, verdict in zip(similar, verdicts):
+            if verdict == "CONTRADICTS":
+                result = ContradictionResult(
+                    contradicts=True,
+                    contradicted_memory=existing_mem,
+                    action="replace"
+                )
+                break
+        results.append(result)
+
+    return results
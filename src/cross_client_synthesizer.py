@@ -29,6 +29,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from .frontmatter import parse
+
 MEMORY_DIR = Path.home() / ".local/share/memory/LFI/memories"
 INTELLIGENCE_DB = Path(__file__).parent.parent / "intelligence.db"
 
@@ -98,8 +100,7 @@ def find_cross_project_memories(memory_dir: Optional[Path] = None) -> list[dict]
     results = []
     for fpath in mem_dir.glob("*.md"):
         try:
-            text = fpath.read_text()
-            meta = _parse_frontmatter(text)
+            meta, body = parse(fpath.read_text())
             if not meta:
                 continue
 
@@ -118,11 +119,8 @@ def find_cross_project_memories(memory_dir: Optional[Path] = None) -> list[dict]
             if not is_global and not has_consent_tag:
                 continue
 
-            # Extract body content
-            body = _extract_body(text)
-
             results.append({
-                "id": meta.get("id", fpath.stem),
+                "id": str(meta.get("id", fpath.stem)),
                 "project_id": meta.get("project_id", "unknown"),
                 "domain": meta.get("knowledge_domain", "general"),
                 "content": body,
@@ -255,31 +253,6 @@ def format_synthesis_report(report: CrossClientReport) -> str:
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _parse_frontmatter(text: str) -> Optional[dict]:
-    """Parse YAML-like frontmatter from a memory .md file."""
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return None
-
-    meta = {}
-    for line in parts[1].strip().split("\n"):
-        if ":" in line:
-            key, _, value = line.partition(":")
-            key = key.strip()
-            value = value.strip()
-            meta[key] = value
-
-    return meta
-
-
-def _extract_body(text: str) -> str:
-    """Extract body content after frontmatter."""
-    parts = text.split("---", 2)
-    if len(parts) >= 3:
-        return parts[2].strip()
-    return text.strip()
-
-
 def _load_prior_effectiveness(db_path: Optional[Path] = None) -> dict[str, float]:
     """Load average effectiveness ratings from prior pattern transfers.
 
@@ -32,7 +32,7 @@ class CrossProjectSharer:
 
     def _init_schema(self):
         """Create shared_insights and project_sharing_config tables if not exist."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute('''CREATE TABLE IF NOT EXISTS shared_insights (
                 id TEXT PRIMARY KEY,
                 source_project TEXT NOT NULL,
@@ -78,7 +78,7 @@ class CrossProjectSharer:
         now = int(time.time())
 
         try:
-            with get_connection(self.db_path) as conn:
+            with get_connection(self.db_path, write=True) as conn:
                 conn.execute(
                     '''INSERT INTO shared_insights
                        (id, source_project, target_project, memory_id, memory_content,
@@ -131,7 +131,7 @@ class CrossProjectSharer:
             enabled: True to enable sharing, False to disable.
         """
         now = int(time.time())
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute(
                 '''INSERT INTO project_sharing_config (project_id, share_enabled, updated_at)
                    VALUES (?, ?, ?)
@@ -7,6 +7,12 @@ Runs daily at 3 AM via LaunchAgent:
 - Collect stats for dashboard
 - Health checks (memory-ts accessible, corruption detection)
 
+MaintenanceRunner loads the store once and runs decay, archival and stats
+against that single in-memory snapshot. Decay is computed as one NumPy pass
+and only files whose importance actually changes are rewritten. The client
+is created with access logging disabled so the nightly scan doesn't show up
+as user accesses in the temporal predictor.
+
 Future enhancement: Memory clustering integration
 """
 
@@ -17,8 +23,11 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import time
 
-from .memory_ts_client import MemoryTSClient, MemoryTSError
-from .importance_engine import apply_decay
+import numpy as np
+
+from .frontmatter import parse
+from .memory_ts_client import Memory, MemoryTSClient, MemoryTSError
+from .importance_engine import apply_decay_array
 
 
 @dataclass
@@ -52,7 +61,7 @@ class MaintenanceRunner:
             decay_predictor: Optional DecayPredictor for stale memory detection
         """
         self.memory_dir = memory_dir
-        self.client = MemoryTSClient(memory_dir=memory_dir)
+        self.client = MemoryTSClient(memory_dir=memory_dir, enable_access_logging=False)
         self.decay_predictor = decay_predictor
 
     def run(self, dry_run: bool = False) -> Dict[str, Any]:
@@ -67,17 +76,23 @@ class MaintenanceRunner:
         """
         start_time = time.time()
 
+        # One snapshot shared by decay, archival and stats
+        memories = self.client.list()
+
         # Apply decay
-        decay_count = 0 if dry_run else apply_decay_to_all(self.memory_dir)
+        decay_count = 0 if dry_run else _decay_memories(self.client, memories)
 
         # Archive low importance and predicted-stale memories
-        archived_count = 0 if dry_run else archive_low_importance(
-            self.memory_dir,
+        archived_entries = [] if dry_run else _archive_memories(
+            self.client,
+            memories,
             decay_predictor=self.decay_predictor
         )
+        archived_count = len(archived_entries)
 
-        # Collect stats
-        stats = collect_stats(self.memory_dir)
+        # Collect stats over what is still active on disk
+        archived_ids = {entry["memory_id"] for entry in archived_entries}
+        stats = _compute_stats([m for m in memories if m.id not in archived_ids])
 
         # Health check
         health = health_check(self.memory_dir)
@@ -108,35 +123,58 @@ def apply_decay_to_all(memory_dir: Optional[Path] = None) -> int:
     Returns:
         Number of memories decayed
     """
-    client = MemoryTSClient(memory_dir=memory_dir)
-    memories = client.search()  # Get all memories
+    client = MemoryTSClient(memory_dir=memory_dir, enable_access_logging=False)
+    return _decay_memories(client, client.list())
+
+
+def _decay_memories(client: MemoryTSClient, memories: List[Memory]) -> int:
+    """
+    Decay a snapshot of memories in place and persist the changed ones
+
+    Importance for the whole snapshot is computed in one vectorized pass.
+    Only memories whose importance changes are written back, via
+    client.save() so nothing is re-read from disk.
+
+    Args:
+        client: Client used to write changed memories
+        memories: Snapshot from client.list(); importance is updated in place
+
+    Returns:
+        Number of memories decayed
+    """
+    if not memories:
+        return 0
 
-    decayed_count = 0
     now = datetime.now()
+    days_since = np.array(
+        [_days_since(memory.created, now) for memory in memories],
+        dtype=np.float64
+    )
+    importances = np.array([memory.importance for memory in memories], dtype=np.float64)
 
-    for memory in memories:
-        # Calculate days since created (using created as proxy for last access)
-        try:
-            created_dt = datetime.fromisoformat(memory.created)
-            days_since = (now - created_dt).days
-
-            if days_since > 0:
-                # Apply decay
-                new_importance = apply_decay(memory.importance, days_since)
-
-                if new_importance != memory.importance:
-                    client.update(
-                        memory.id,
-                        importance=new_importance
-                    )
-                    decayed_count += 1
-        except (ValueError, AttributeError):
-            # Skip memories with invalid timestamps
-            continue
+    # Calculate days since created (using created as proxy for last access);
+    # memories with invalid timestamps come back as NaN and are skipped
+    decayed = apply_decay_array(importances, np.nan_to_num(days_since))
+    changed = (days_since > 0) & (decayed != importances)
+
+    decayed_count = 0
+    for idx in np.flatnonzero(changed):
+        memory = memories[idx]
+        memory.importance = float(decayed[idx])
+        client.save(memory)
+        decayed_count += 1
 
     return decayed_count
 
 
+def _days_since(created: str, now: datetime) -> float:
+    """Whole days between an ISO timestamp and now, NaN if unparseable"""
+    try:
+        return float((now - datetime.fromisoformat(created)).days)
+    except (ValueError, TypeError, AttributeError):
+        return float("nan")
+
+
 def archive_low_importance(
     memory_dir: Optional[Path] = None,
     threshold: float = 0.2,
@@ -157,8 +195,35 @@ def archive_low_importance(
     Returns:
         Number of memories archived
     """
-    client = MemoryTSClient(memory_dir=memory_dir)
-    memories = client.list()
+    client = MemoryTSClient(memory_dir=memory_dir, enable_access_logging=False)
+    archived_entries = _archive_memories(
+        client,
+        client.list(),
+        threshold=threshold,
+        decay_predictor=decay_predictor
+    )
+    return len(archived_entries)
+
+
+def _archive_memories(
+    client: MemoryTSClient,
+    memories: List[Memory],
+    threshold: float = 0.2,
+    decay_predictor=None
+) -> List[Dict[str, Any]]:
+    """
+    Archive low-importance and predicted-stale memories from a snapshot
+
+    Args:
+        client: Client used to move files into archived/
+        memories: Snapshot from client.list()
+        threshold: Importance threshold
+        decay_predictor: Optional DecayPredictor instance
+
+    Returns:
+        Manifest entries (memory_id, reason, importance) for archived memories
+    """
+    by_id = {memory.id: memory for memory in memories}
 
     # Collect memories to archive: low importance
     to_archive = {}  # memory_id -> (reason, importance)
@@ -172,24 +237,19 @@ def archive_low_importance(
             stale_predictions = decay_predictor.get_memories_becoming_stale(days_ahead=0)
             for prediction in stale_predictions:
                 if prediction.memory_id not in to_archive:
-                    # Find the memory to get its importance
-                    try:
-                        mem = client.get(prediction.memory_id)
-                        if mem.status == "active":
-                            to_archive[prediction.memory_id] = ("predicted_stale", mem.importance)
-                    except Exception:
-                        continue
+                    # Look the memory up in the snapshot to get its importance
+                    mem = by_id.get(prediction.memory_id)
+                    if mem is not None and mem.status == "active":
+                        to_archive[prediction.memory_id] = ("predicted_stale", mem.importance)
         except Exception:
             pass  # DecayPredictor failure should not block archival
 
     # Archive each memory
-    archived_count = 0
     archived_entries = []
 
     for memory_id, (reason, importance) in to_archive.items():
         success = client.archive(memory_id, reason=reason)
         if success:
-            archived_count += 1
             archived_entries.append({
                 "memory_id": memory_id,
                 "reason": reason,
@@ -198,9 +258,9 @@ def archive_low_importance(
 
     # Write manifest if any memories were archived
     if archived_entries:
-        _write_archive_manifest(memory_dir or client.memory_dir, archived_entries)
+        _write_archive_manifest(client.memory_dir, archived_entries)
 
-    return archived_count
+    return archived_entries
 
 
 def _write_archive_manifest(
@@ -261,9 +321,12 @@ def collect_stats(memory_dir: Optional[Path] = None) -> Dict[str, Any]:
     Returns:
         Stats dictionary
     """
-    client = MemoryTSClient(memory_dir=memory_dir)
-    memories = client.search()
+    client = MemoryTSClient(memory_dir=memory_dir, enable_access_logging=False)
+    return _compute_stats(client.list())
 
+
+def _compute_stats(memories: List[Memory]) -> Dict[str, Any]:
+    """Stats dictionary for collect_stats, computed from a snapshot"""
     if len(memories) == 0:
         return {
             "total_memories": 0,
@@ -334,37 +397,22 @@ def health_check(memory_dir: Optional[Path] = None) -> Dict[str, Any]:
     file_count = len(memory_files)
 
     # Check for corrupted files
-    client = MemoryTSClient(memory_dir=memory_dir)
+    client = MemoryTSClient(memory_dir=memory_dir, enable_access_logging=False)
     corrupted_count = 0
 
     for memory_file in memory_files:
         try:
-            # Try to read and validate basic structure
-            content = memory_file.read_text()
-
-            # Must have frontmatter markers
-            if content.count("---") < 2:
-                corrupted_count += 1
-                continue
-
-            # Check for required frontmatter fields
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                corrupted_count += 1
-                continue
-
-            frontmatter = parts[1]
-
-            # Required fields that must be present
-            required_fields = ["id:", "created:", "project_id:"]
-            missing_fields = [field for field in required_fields if field not in frontmatter]
+            # One read and parse per file: a terminated frontmatter block
+            # with the required fields, which must build a valid Memory
+            metadata, content = parse(memory_file.read_text())
+            required_fields = ["id", "created", "project_id"]
+            missing_fields = [field for field in required_fields if field not in metadata]
 
             if missing_fields:
                 corrupted_count += 1
                 continue
 
-            # Try to parse
-            memory = client._read_memory(memory_file)
+            memory = client._memory_from_metadata(metadata, content, memory_file)
 
             # Validate required fields have valid values
             if not memory.id or not memory.content or not memory.project_id:
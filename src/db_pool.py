@@ -10,7 +10,10 @@ Problem:
 
 Solution:
 - Connection pool with configurable size
-- Automatic timeout + retry with exponential backoff
+- Waiters block on a condition variable and wake as soon as a connection is returned
+- Separate lanes: pool_size reader connections, one writer connection that
+  serializes writes (WAL lets the readers keep going meanwhile)
+- Per-connection prepared-statement cache (sqlite3 cached_statements)
 - Context manager for safe resource management
 
 Usage:
@@ -19,15 +22,24 @@ Usage:
     with get_connection(db_path) as conn:
         cursor = conn.execute("SELECT ...")
         # Connection automatically returned to pool
+
+    with get_connection(db_path, write=True) as conn:
+        conn.execute("INSERT ...")
+        conn.commit()
 """
 
 import sqlite3
 import threading
 import time
+from collections import deque
 from contextlib import contextmanager
-from typing import Optional
+from typing import Dict, Optional
 from pathlib import Path
-from queue import Queue, Empty
+
+from . import metrics
+
+
+DEFAULT_STATEMENT_CACHE_SIZE = 256  # sqlite3's own default is 128
 
 
 class PooledConnection:
@@ -69,42 +81,100 @@ class PooledConnection:
         return False
 
 
+class _Lane:
+    """Idle connections, capacity and wait statistics for one side of the pool."""
+
+    def __init__(self, name: str, size: int, lock: threading.Lock):
+        self.name = name
+        self.size = size
+        self.idle = deque()
+        self.created = 0
+        self.available = threading.Condition(lock)
+        self.members = set()  # every open connection in this lane
+        self.acquired = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait = 0.0
+        self.timeouts = 0
+
+    def record_wait(self, seconds: float):
+        self.waits += 1
+        self.wait_seconds += seconds
+        if seconds > self.max_wait:
+            self.max_wait = seconds
+
+    def stats(self) -> Dict:
+        return {
+            "size": self.size,
+            "created": self.created,
+            "idle": len(self.idle),
+            "in_use": self.created - len(self.idle),
+            "acquired": self.acquired,
+            "waits": self.waits,
+            "total_wait_ms": round(1000 * self.wait_seconds, 3),
+            "avg_wait_ms": round(1000 * self.wait_seconds / self.waits, 3) if self.waits else 0.0,
+            "max_wait_ms": round(1000 * self.max_wait, 3),
+            "timeouts": self.timeouts,
+        }
+
+
 class ConnectionPool:
     """
     Thread-safe SQLite connection pool.
 
     Features:
-    - Fixed pool size (default 5 connections)
-    - Automatic connection creation on demand
-    - Thread-safe borrowing/returning
-    - Timeout + exponential backoff retry
+    - Reader lane of pool_size connections (default 5), created on demand
+    - Writer lane with a single connection, so pooled writes never contend
+      with each other for the SQLite write lock
+    - Condition-variable waits: a returned connection wakes exactly one waiter
+    - Per-connection prepared-statement cache
+    - Wait-time statistics per lane (get_stats)
     - WAL mode enabled for better concurrency
+
+    Plain get_connection() hands out reader-lane connections. SQLite doesn't
+    stop them writing, but any block that runs INSERT/UPDATE/DELETE or DDL
+    should pass write=True so pooled writes serialize on the writer.
     """
 
-    def __init__(self, db_path: str, pool_size: int = 5, timeout: float = 30.0):
+    def __init__(
+        self,
+        db_path: str,
+        pool_size: int = 5,
+        timeout: float = 30.0,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ):
         """
         Initialize connection pool.
 
         Args:
             db_path: Path to SQLite database
-            pool_size: Maximum concurrent connections
+            pool_size: Maximum concurrent reader connections
             timeout: Max seconds to wait for connection
+            statement_cache_size: Compiled statements kept per connection
         """
         self.db_path = str(db_path)
         self.pool_size = pool_size
         self.timeout = timeout
-        self._pool = Queue(maxsize=pool_size)
+        self.statement_cache_size = statement_cache_size
         self._lock = threading.Lock()
-        self._created = 0
+        self._readers = _Lane("read", pool_size, self._lock)
+        self._writers = _Lane("write", 1, self._lock)
+        self._pool = self._readers.idle
+
+        # Connections are created lazily, on first get
 
-        # Pre-create connections (lazy: create on first get)
+    @property
+    def _created(self) -> int:
+        """Open reader-lane connections."""
+        return self._readers.created
 
     def _create_connection(self) -> sqlite3.Connection:
         """Create new SQLite connection with optimal settings."""
         conn = sqlite3.connect(
             self.db_path,
             timeout=self.timeout,
-            check_same_thread=False  # Allow cross-thread usage (pool manages safety)
+            check_same_thread=False,  # Allow cross-thread usage (pool manages safety)
+            cached_statements=self.statement_cache_size,
         )
 
         # Enable WAL mode for better concurrency
@@ -121,9 +191,12 @@ class ConnectionPool:
 
         return conn
 
-    def get_connection(self) -> sqlite3.Connection:
+    def get_connection(self, write: bool = False) -> PooledConnection:
         """
-        Get connection from pool (or create new if under pool_size).
+        Get connection from pool (or create new if under the lane's size).
+
+        Args:
+            write: Take the single writer connection instead of a reader
 
         Returns:
             SQLite connection
@@ -131,33 +204,53 @@ class ConnectionPool:
         Raises:
             TimeoutError: If no connection available within timeout
         """
-        start_time = time.time()
-        retry_delays = [0.1, 0.2, 0.5, 1.0, 2.0]  # Exponential backoff
-        retry_count = 0
-
-        while time.time() - start_time < self.timeout:
+        lane = self._writers if write else self._readers
+        started = None
+
+        with lane.available:
+            while True:
+                if lane.idle:
+                    conn = lane.idle.pop()
+                    break
+                if lane.created < lane.size:
+                    lane.created += 1
+                    conn = None
+                    break
+
+                now = time.monotonic()
+                if started is None:
+                    started = now
+                    metrics.inc("db_pool.exhausted")
+                remaining = self.timeout - (now - started)
+                if remaining <= 0:
+                    lane.timeouts += 1
+                    metrics.inc("db_pool.timeouts")
+                    raise TimeoutError(
+                        f"Could not get database connection after {self.timeout}s "
+                        f"({lane.created} connections in use)"
+                    )
+                lane.available.wait(remaining)
+
+            lane.acquired += 1
+            if started is not None:
+                waited = time.monotonic() - started
+                lane.record_wait(waited)
+                metrics.observe("db_pool.wait", waited)
+
+        if conn is None:
+            # Slot reserved above; connect outside the lock
             try:
-                # Try to get existing connection from pool
-                conn = self._pool.get(block=False)
-                return PooledConnection(conn, self)
-
-            except Empty:
-                # Pool empty - try to create new connection if under limit
-                with self._lock:
-                    if self._created < self.pool_size:
-                        conn = self._create_connection()
-                        self._created += 1
-                        return PooledConnection(conn, self)
-
-                # Pool full - wait and retry with exponential backoff
-                delay = retry_delays[min(retry_count, len(retry_delays) - 1)]
-                time.sleep(delay)
-                retry_count += 1
-
-        raise TimeoutError(
-            f"Could not get database connection after {self.timeout}s "
-            f"({self._created} connections in use)"
-        )
+                with metrics.timer("db_pool.connect"):
+                    conn = self._create_connection()
+            except BaseException:
+                with lane.available:
+                    lane.created -= 1
+                    lane.available.notify()
+                raise
+            with self._lock:
+                lane.members.add(conn)
+
+        return PooledConnection(conn, self)
 
     def return_connection(self, conn: sqlite3.Connection):
         """
@@ -166,46 +259,56 @@ class ConnectionPool:
         Args:
             conn: SQLite connection to return
         """
+        if isinstance(conn, PooledConnection):
+            conn.close()
+            return
+
         # Rollback any uncommitted transaction
         try:
             conn.rollback()
         except Exception:
             pass  # Ignore errors (connection might be closed)
 
-        # Return to pool
+        with self._lock:
+            if conn in self._writers.members:
+                lane = self._writers
+            elif conn in self._readers.members:
+                lane = self._readers
+            else:
+                lane = None  # Opened before close_all(); not ours any more
+            if lane is not None:
+                lane.idle.append(conn)
+                lane.available.notify()
+                return
+
         try:
-            self._pool.put(conn, block=False)
+            conn.close()
         except Exception:
-            # Pool full (shouldn't happen) - close connection
-            try:
-                conn.close()
-            except Exception:
-                pass
-            with self._lock:
-                self._created -= 1
+            pass
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-lane connection counts and wait-time statistics."""
+        with self._lock:
+            return {"read": self._readers.stats(), "write": self._writers.stats()}
 
     def close_all(self):
         """Close all connections in pool (for shutdown)."""
         connections = []
 
-        # Drain pool
-        while True:
-            try:
-                conn = self._pool.get(block=False)
-                connections.append(conn)
-            except Empty:
-                break
+        with self._lock:
+            for lane in (self._readers, self._writers):
+                connections.extend(lane.idle)
+                lane.idle.clear()
+                lane.members.clear()
+                lane.created = 0
+                lane.available.notify_all()
 
-        # Close all
         for conn in connections:
             try:
                 conn.close()
             except Exception:
                 pass
 
-        with self._lock:
-            self._created = 0
-
 
 # Global pools (one per database path)
 _pools = {}
@@ -218,7 +321,7 @@ def get_pool(db_path: str, pool_size: int = 5) -> ConnectionPool:
 
     Args:
         db_path: Path to SQLite database
-        pool_size: Maximum concurrent connections
+        pool_size: Maximum concurrent reader connections
 
     Returns:
         ConnectionPool instance
@@ -233,7 +336,7 @@ def get_pool(db_path: str, pool_size: int = 5) -> ConnectionPool:
 
 
 @contextmanager
-def get_connection(db_path: str, pool_size: int = 5):
+def get_connection(db_path: str, pool_size: int = 5, write: bool = False):
     """
     Context manager for getting pooled connection.
 
@@ -243,18 +346,27 @@ def get_connection(db_path: str, pool_size: int = 5):
 
     Args:
         db_path: Path to SQLite database
-        pool_size: Maximum concurrent connections
+        pool_size: Maximum concurrent reader connections
+        write: Use the database's single writer connection
 
     Yields:
         SQLite connection (auto-returned to pool on exit)
     """
     pool = get_pool(db_path, pool_size)
-    conn = pool.get_connection()
+    conn = pool.get_connection(write=write)
 
     try:
-        yield conn
+        with metrics.timer("db_pool.hold"):
+            yield conn
     finally:
-        pool.return_connection(conn)
+        conn.close()
+
+
+def get_pool_stats() -> Dict[str, Dict]:
+    """get_stats() of every open pool, keyed by database path."""
+    with _pools_lock:
+        pools = dict(_pools)
+    return {path: pool.get_stats() for path, pool in pools.items()}
 
 
 def close_all_pools():
@@ -11,8 +11,14 @@ Solution:
 Performance:
 - Before: 500s per search at 10K memories (embed all on every search)
 - After: <1s per search (pre-computed embeddings + indexed lookup)
+
+Quantization (MEMORY_EMBEDDING_QUANTIZATION=int8|binary, default off):
+- int8 and 1-bit codes are stored next to each float32 row
+- Search without FAISS loads only the codes for the candidate memories,
+  shortlists, and reads float32 rows for the shortlist alone
 """
 
+import os
 import sqlite3
 import numpy as np
 from typing import List, Dict, Optional, Tuple
@@ -22,6 +28,9 @@ import hashlib
 from datetime import datetime
 from collections import OrderedDict
 
+from . import metrics
+from .quantization import MODES, QuantizedIndex, binarize, normalize, quantize_int8
+
 
 class EmbeddingManager:
     """
@@ -32,15 +41,28 @@ class EmbeddingManager:
     - VectorStore: FAISS index for fast similarity search [dual-write]
     - Batch computation: Process all memories without embeddings
     - Cache in-memory for session lifetime
+    - Optional int8 / binary codes per row for two-stage search
     """
 
     _CACHE_MAX_SIZE = 1000  # LRU cache size limit
 
-    def __init__(self, db_path: str = None):
-        """Initialize embedding manager"""
+    def __init__(self, db_path: str = None, quantization: Optional[str] = None):
+        """
+        Initialize embedding manager
+
+        Args:
+            db_path: SQLite database (default: intelligence.db in the package root)
+            quantization: "int8" or "binary" to store codes and search in two
+                stages (default: MEMORY_EMBEDDING_QUANTIZATION, unset = off)
+        """
         if db_path is None:
             db_path = Path(__file__).parent.parent / "intelligence.db"
+        if quantization is None:
+            quantization = os.getenv("MEMORY_EMBEDDING_QUANTIZATION") or None
+        if quantization is not None and quantization not in MODES:
+            raise ValueError(f"Unknown quantization {quantization!r} (expected one of {MODES})")
         self.db_path = str(db_path)
+        self.quantization = quantization
         self._model = None
         self._session_cache = OrderedDict()  # LRU-bounded in-memory cache
         self._vector_store = None
@@ -51,7 +73,7 @@ class EmbeddingManager:
         """Try to initialize FAISS VectorStore for fast similarity search."""
         try:
             from memory_system.vector_store import VectorStore
-            self._vector_store = VectorStore()
+            self._vector_store = VectorStore(quantization=self.quantization)
         except (ImportError, Exception):
             self._vector_store = None
 
@@ -72,6 +94,32 @@ class EmbeddingManager:
                 CREATE INDEX IF NOT EXISTS idx_embeddings_accessed
                 ON embeddings(accessed_at DESC)
             """)
+            # Quantized codes (NULL until computed; see quantize_stored_embeddings)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(embeddings)")}
+            for column, kind in (("embedding_int8", "BLOB"), ("int8_scale", "REAL"), ("embedding_bits", "BLOB")):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE embeddings ADD COLUMN {column} {kind}")
+
+    def _codes(self, embedding: np.ndarray) -> Tuple[Optional[bytes], Optional[float], Optional[bytes]]:
+        """(int8 codes, int8 scale, packed sign bits) for a row, or NULLs when quantization is off"""
+        if not self.quantization:
+            return None, None, None
+        return self._quantize_row(embedding)
+
+    @staticmethod
+    def _quantize_row(embedding: np.ndarray) -> Tuple[bytes, float, bytes]:
+        """(int8 codes, int8 scale, packed sign bits) for a row"""
+        unit = normalize(embedding)
+        codes, scales = quantize_int8(unit)
+        return codes[0].tobytes(), float(scales[0]), binarize(unit)[0].tobytes()
+
+    def _write_codes(self, conn: sqlite3.Connection, rows: List[Tuple[str, bytes]]):
+        """Store codes for (content_hash, float32 blob) rows"""
+        conn.executemany(
+            "UPDATE embeddings SET embedding_int8 = ?, int8_scale = ?, embedding_bits = ? "
+            "WHERE content_hash = ?",
+            [(*self._quantize_row(np.frombuffer(blob, dtype=np.float32)), hash_val) for hash_val, blob in rows]
+        )
 
     def _get_model(self):
         """Lazy-load sentence-transformers model"""
@@ -107,11 +155,12 @@ class EmbeddingManager:
         if use_cache and content_hash in self._session_cache:
             # Move to end (mark as recently used)
             self._session_cache.move_to_end(content_hash)
+            metrics.inc("embedding.session_cache_hits")
             return self._session_cache[content_hash]
 
         # Check database
         if use_cache:
-            with sqlite3.connect(self.db_path) as conn:
+            with metrics.timer("embedding.db_read"), sqlite3.connect(self.db_path) as conn:
                 row = conn.execute(
                     "SELECT embedding FROM embeddings WHERE content_hash = ?",
                     (content_hash,)
@@ -126,6 +175,7 @@ class EmbeddingManager:
                     conn.commit()
 
                     # Deserialize embedding
+                    metrics.inc("embedding.db_hits")
                     embedding = np.frombuffer(row[0], dtype=np.float32)
                     # Add to cache with LRU eviction
                     self._session_cache[content_hash] = embedding
@@ -135,22 +185,26 @@ class EmbeddingManager:
 
         # Compute embedding
         model = self._get_model()
-        embedding = model.encode(content, convert_to_numpy=True).astype(np.float32)
+        with metrics.timer("embedding.encode"):
+            embedding = model.encode(content, convert_to_numpy=True).astype(np.float32)
+        metrics.inc("embedding.computed")
 
         # Save to database (SQLite — primary storage)
-        with sqlite3.connect(self.db_path) as conn:
+        with metrics.timer("embedding.db_write"), sqlite3.connect(self.db_path) as conn:
             now = datetime.now().isoformat()
             conn.execute("""
                 INSERT OR REPLACE INTO embeddings
-                (content_hash, embedding, dimension, model_name, created_at, accessed_at)
-                VALUES (?, ?, ?, ?, ?, ?)
+                (content_hash, embedding, dimension, model_name, created_at, accessed_at,
+                 embedding_int8, int8_scale, embedding_bits)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 content_hash,
                 embedding.tobytes(),
                 len(embedding),
                 'all-MiniLM-L6-v2',
                 now,
-                now
+                now,
+                *self._codes(embedding)
             ))
             conn.commit()
 
@@ -211,19 +265,22 @@ class EmbeddingManager:
         # Batch compute
         model = self._get_model()
         texts = [c[0] for c in to_compute]
-        embeddings = model.encode(
-            texts,
-            convert_to_numpy=True,
-            show_progress_bar=show_progress
-        ).astype(np.float32)
+        with metrics.timer("embedding.batch_encode"):
+            embeddings = model.encode(
+                texts,
+                convert_to_numpy=True,
+                show_progress_bar=show_progress
+            ).astype(np.float32)
+        metrics.inc("embedding.computed", len(texts))
 
         # Save to database (batch insert)
         now = datetime.now().isoformat()
         with sqlite3.connect(self.db_path) as conn:
             conn.executemany("""
                 INSERT OR REPLACE INTO embeddings
-                (content_hash, embedding, dimension, model_name, created_at, accessed_at)
-                VALUES (?, ?, ?, ?, ?, ?)
+                (content_hash, embedding, dimension, model_name, created_at, accessed_at,
+                 embedding_int8, int8_scale, embedding_bits)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, [
                 (
                     hash_val,
@@ -231,7 +288,8 @@ class EmbeddingManager:
                     len(embedding),
                     'all-MiniLM-L6-v2',
                     now,
-                    now
+                    now,
+                    *self._codes(embedding)
                 )
                 for (_, hash_val), embedding in zip(to_compute, embeddings)
             ])
@@ -249,6 +307,45 @@ class EmbeddingManager:
         print(f"✅ Computed and saved {len(result)} embeddings")
         return result
 
+    def get_embeddings(self, contents: List[str]) -> np.ndarray:
+        """
+        Get embeddings for many contents at once (stored where possible).
+
+        Stored embeddings are loaded with one chunked query; only contents
+        without a stored embedding go through the model, as a single batch.
+        Unlike get_embedding(), this does not touch accessed_at.
+
+        Args:
+            contents: Texts to embed
+
+        Returns:
+            (len(contents), dim) float32 matrix, rows in input order
+        """
+        if not contents:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        content_hashes = [self._hash_content(c) for c in contents]
+        found = {}
+        unique_hashes = list(dict.fromkeys(content_hashes))
+
+        with sqlite3.connect(self.db_path) as conn:
+            for start in range(0, len(unique_hashes), 500):
+                chunk = unique_hashes[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT content_hash, embedding FROM embeddings "
+                    f"WHERE content_hash IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for hash_val, blob in rows:
+                    found[hash_val] = np.frombuffer(blob, dtype=np.float32)
+
+        missing = {h: c for c, h in zip(contents, content_hashes) if h not in found}
+        if missing:
+            found.update(self.batch_compute_embeddings(list(missing.values()), show_progress=False))
+
+        return np.vstack([found[h] for h in content_hashes]).astype(np.float32, copy=False)
+
     def precompute_all_memories(self):
         """
         Pre-compute embeddings for all memories in memory-ts.
@@ -268,9 +365,35 @@ class EmbeddingManager:
 
         contents = [m.content for m in memories if m.content]
         self.batch_compute_embeddings(contents, show_progress=True)
+        if self.quantization:
+            self.quantize_stored_embeddings()
 
         print(f"✅ Pre-computation complete for {len(contents)} memories")
 
+    def quantize_stored_embeddings(self, batch_size: int = 1000) -> int:
+        """
+        Fill in int8 / binary codes for rows stored without them.
+
+        Codes are computed whatever self.quantization is, so this can
+        backfill a table before quantized search is switched on.
+
+        Returns:
+            Number of rows updated
+        """
+        updated = 0
+        with sqlite3.connect(self.db_path) as conn:
+            while True:
+                rows = conn.execute(
+                    "SELECT content_hash, embedding FROM embeddings WHERE embedding_bits IS NULL LIMIT ?",
+                    (batch_size,)
+                ).fetchall()
+                if not rows:
+                    break
+                self._write_codes(conn, rows)
+                conn.commit()
+                updated += len(rows)
+        return updated
+
     def semantic_search(
         self,
         query: str,
@@ -320,6 +443,10 @@ class EmbeddingManager:
             except Exception:
                 pass
 
+        # Two-stage search over stored codes
+        if self.quantization:
+            return self._quantized_search(query_embedding, memories, top_k, threshold)
+
         # Fallback: brute-force cosine similarity
         scored = []
 
@@ -345,6 +472,105 @@ class EmbeddingManager:
 
         return scored[:top_k]
 
+    def _quantized_search(
+        self,
+        query_embedding: np.ndarray,
+        memories: List[Dict],
+        top_k: int,
+        threshold: float
+    ) -> List[Tuple[Dict, float]]:
+        """Shortlist on stored codes, rescore the shortlist with float32 rows"""
+        by_hash: Dict[str, List[Dict]] = {}
+        contents = {}
+        for memory in memories:
+            content = memory.get('content', '')
+            if content:
+                h = self._hash_content(content)
+                by_hash.setdefault(h, []).append(memory)
+                contents[h] = content
+        if not by_hash:
+            return []
+
+        hashes = list(by_hash)
+        codes = self._load_codes(hashes)
+        missing = [h for h in hashes if h not in codes]
+        if missing:
+            # Stores any new embeddings (with codes); older rows get codes here
+            self.get_embeddings([contents[h] for h in missing])
+            self._quantize_hashes(missing)
+            codes.update(self._load_codes(missing))
+
+        hashes = [h for h in hashes if h in codes]
+        if self.quantization == "int8":
+            index = QuantizedIndex.from_codes(
+                np.vstack([np.frombuffer(codes[h][0], dtype=np.int8) for h in hashes]),
+                np.array([codes[h][1] for h in hashes], dtype=np.float32),
+                mode="int8", dimension=len(query_embedding)
+            )
+        else:
+            index = QuantizedIndex.from_codes(
+                np.vstack([np.frombuffer(codes[h][2], dtype=np.uint8) for h in hashes]),
+                mode="binary", dimension=len(query_embedding)
+            )
+
+        def fetch(ids: np.ndarray) -> np.ndarray:
+            selected = [hashes[i] for i in ids]
+            vectors = self._load_vectors(selected)
+            return np.vstack([vectors[h] for h in selected])
+
+        with metrics.timer("embedding.quantized_search"):
+            ids, scores = index.search(query_embedding, top_k=top_k, fetch=fetch)
+
+        scored = []
+        for i, score in zip(ids, scores):
+            if score >= threshold:
+                scored.extend((memory, float(score)) for memory in by_hash[hashes[i]])
+        return scored[:top_k]
+
+    def _quantize_hashes(self, hashes: List[str]):
+        """Fill in codes for just these rows, where they are still missing"""
+        with sqlite3.connect(self.db_path) as conn:
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT content_hash, embedding FROM embeddings "
+                    f"WHERE content_hash IN ({placeholders}) AND embedding_bits IS NULL",
+                    chunk
+                ).fetchall()
+                if rows:
+                    self._write_codes(conn, rows)
+            conn.commit()
+
+    def _load_codes(self, hashes: List[str]) -> Dict[str, Tuple[bytes, float, bytes]]:
+        """content_hash -> (int8 codes, scale, sign bits) for rows that have codes"""
+        found = {}
+        with sqlite3.connect(self.db_path) as conn:
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for hash_val, int8_codes, scale, bits in conn.execute(
+                    f"SELECT content_hash, embedding_int8, int8_scale, embedding_bits FROM embeddings "
+                    f"WHERE content_hash IN ({placeholders}) AND embedding_bits IS NOT NULL",
+                    chunk
+                ):
+                    found[hash_val] = (int8_codes, scale, bits)
+        return found
+
+    def _load_vectors(self, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """content_hash -> float32 embedding"""
+        found = {}
+        with sqlite3.connect(self.db_path) as conn:
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for hash_val, blob in conn.execute(
+                    f"SELECT content_hash, embedding FROM embeddings WHERE content_hash IN ({placeholders})",
+                    chunk
+                ):
+                    found[hash_val] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
     def clear_session_cache(self):
         """Clear the in-memory session cache (useful for testing or memory management)."""
         self._session_cache = OrderedDict()
@@ -388,8 +614,14 @@ class EmbeddingManager:
                 "SELECT MAX(created_at) FROM embeddings"
             ).fetchone()[0]
 
+            quantized = conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE embedding_bits IS NOT NULL"
+            ).fetchone()[0]
+
         return {
             'total_embeddings': total,
+            'quantized_embeddings': quantized,
+            'quantization': self.quantization,
             'size_mb': round(size_mb, 2),
             'oldest': oldest,
             'newest': newest,
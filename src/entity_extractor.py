@@ -5,15 +5,21 @@ Extracts persons, tools, and projects from memory text.
 Links entities to memory IDs via a junction table.
 Supports aliases and case-insensitive lookups.
 
+Known names (PROJECT_PATTERNS, TOOL_PATTERNS and stored aliases) are
+matched by an EntityMatcher: one alternation regex per tier, compiled
+once and shared. Overlap checks use a sorted span index.
+
 No LLM calls — pure regex / pattern matching.
 """
 
 import json
 import re
 import sqlite3
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +80,79 @@ _RE_PROPER_NOUN = re.compile(
 )
 
 
+class _SpanIndex:
+    """Non-overlapping (start, end) spans kept sorted for O(log n) overlap tests."""
+
+    def __init__(self) -> None:
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+
+    def overlaps(self, start: int, end: int) -> bool:
+        i = bisect_right(self._starts, start)
+        if i > 0 and self._ends[i - 1] > start:
+            return True
+        return i < len(self._starts) and self._starts[i] < end
+
+    def add(self, start: int, end: int) -> None:
+        i = bisect_right(self._starts, start)
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+
+
+class EntityMatcher:
+    """
+    Precompiled matcher for known entity names.
+
+    Names are grouped into tiers, highest priority first:
+    projects (substring match), then aliases and tools (word-boundary
+    match). Each tier is a single case-insensitive alternation, longest
+    names first, so at any position the longest known name wins.
+
+    Args:
+        projects: Canonical project names
+        tools: Canonical tool names
+        aliases: (alias, canonical name, entity type) triples
+    """
+
+    def __init__(
+        self,
+        projects: Iterable[str],
+        tools: Iterable[str],
+        aliases: Iterable[Tuple[str, str, str]] = (),
+    ):
+        self._tiers = []
+        self._add_tier([(p, p, "project") for p in projects], word_boundary=False)
+        self._add_tier(list(aliases), word_boundary=True)
+        self._add_tier([(t, t, "tool") for t in tools], word_boundary=True)
+
+    def _add_tier(self, entries: List[Tuple[str, str, str]], word_boundary: bool) -> None:
+        lookup: Dict[str, Tuple[str, str]] = {}
+        for text, name, etype in entries:
+            lookup.setdefault(text.lower(), (name, etype))
+        if not lookup:
+            return
+
+        alternation = "|".join(
+            re.escape(text) for text in sorted(lookup, key=len, reverse=True)
+        )
+        if word_boundary:
+            alternation = rf"\b(?:{alternation})\b"
+        self._tiers.append((re.compile(alternation, re.IGNORECASE), lookup))
+
+    def finditer(self, text: str):
+        """Yield (name, type, mention_text, position) for every tier, in priority order."""
+        for pattern, lookup in self._tiers:
+            for m in pattern.finditer(text):
+                name, etype = lookup[m.group().lower()]
+                yield name, etype, m.group(), m.start()
+
+
+@lru_cache(maxsize=32)
+def _build_matcher(aliases: Tuple[Tuple[str, str, str], ...]) -> EntityMatcher:
+    """Matcher for the pattern lists plus *aliases* (cached per alias set)."""
+    return EntityMatcher(PROJECT_PATTERNS, TOOL_PATTERNS, aliases)
+
+
 class EntityExtractor:
     """
     Extract and link named entities from memory text.
@@ -89,6 +168,7 @@ class EntityExtractor:
         self.db_path = db_path
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
+        self._matcher: Optional[EntityMatcher] = None
         self._init_schema()
 
     # ------------------------------------------------------------------
@@ -151,38 +231,23 @@ class EntityExtractor:
             return []
 
         results: List[Dict] = []
-        seen_spans: List[tuple] = []  # (start, end) to avoid overlaps
-
-        def _overlaps(start: int, end: int) -> bool:
-            for s, e in seen_spans:
-                if start < e and end > s:
-                    return True
-            return False
+        seen_spans = _SpanIndex()  # to avoid overlaps
 
         def _add(name: str, etype: str, mention: str, pos: int) -> None:
             end = pos + len(mention)
-            if not _overlaps(pos, end):
+            if not seen_spans.overlaps(pos, end):
                 results.append({
                     "name": name,
                     "type": etype,
                     "mention_text": mention,
                     "position": pos,
                 })
-                seen_spans.append((pos, end))
-
-        # 1. Projects (multi-word, match first to avoid partial person matches)
-        for proj in PROJECT_PATTERNS:
-            pattern = re.compile(re.escape(proj), re.IGNORECASE)
-            for m in pattern.finditer(text):
-                _add(proj, "project", m.group(), m.start())
+                seen_spans.add(pos, end)
 
-        # 2. Tools (word-boundary, case-insensitive)
-        for tool in TOOL_PATTERNS:
-            pattern = re.compile(
-                r"\b" + re.escape(tool) + r"\b", re.IGNORECASE
-            )
-            for m in pattern.finditer(text):
-                _add(tool, "tool", m.group(), m.start())
+        # 1-2. Projects first (multi-word, avoids partial person matches),
+        # then aliases and tools (word-boundary, case-insensitive)
+        for name, etype, mention, pos in self._get_matcher().finditer(text):
+            _add(name, etype, mention, pos)
 
         # 3. @mentions -> person
         for m in _RE_AT_MENTION.finditer(text):
@@ -195,14 +260,25 @@ class EntityExtractor:
             words = candidate.split()
             if any(w.lower() in _COMMON_WORDS for w in words):
                 continue
-            # Skip if already captured as tool or project
-            if not _overlaps(m.start(), m.end()):
-                _add(candidate, "person", candidate, m.start())
+            # Skip if already captured as tool or project (_add checks overlap)
+            _add(candidate, "person", candidate, m.start())
 
         # Sort by position for deterministic output
         results.sort(key=lambda e: e["position"])
         return results
 
+    def _get_matcher(self) -> EntityMatcher:
+        """Matcher for the pattern lists plus this database's aliases (built lazily)."""
+        if self._matcher is None:
+            aliases = []
+            for row in self.conn.execute(
+                "SELECT name, type, aliases_json FROM entities WHERE aliases_json != '[]'"
+            ):
+                for alias in json.loads(row["aliases_json"]):
+                    aliases.append((alias, row["name"], row["type"]))
+            self._matcher = _build_matcher(tuple(sorted(aliases)))
+        return self._matcher
+
     # ------------------------------------------------------------------
     # Linking
     # ------------------------------------------------------------------
@@ -213,57 +289,68 @@ class EntityExtractor:
 
         Returns the number of distinct entities linked.
         """
-        entities = self.extract_entities(content)
-        if not entities:
-            return 0
+        return self.link_memories([(memory_id, content)])[memory_id]
 
-        now = datetime.now().isoformat()
-        linked = 0
+    def link_memories(self, batch: Iterable[Tuple[str, str]]) -> Dict[str, int]:
+        """
+        Extract and link entities for many memories in one transaction.
 
-        for ent in entities:
-            # Upsert entity
-            entity_id = self._upsert_entity(
-                ent["name"], ent["type"], now
-            )
+        Entities are upserted with one statement per distinct name and
+        junction rows are inserted with a single executemany.
 
-            # Insert junction (ignore duplicate)
-            try:
-                self.conn.execute(
-                    "INSERT OR IGNORE INTO memory_entities "
-                    "(memory_id, entity_id, mention_text, position) "
-                    "VALUES (?, ?, ?, ?)",
-                    (memory_id, entity_id, ent["mention_text"], ent["position"]),
-                )
-                linked += 1
-            except sqlite3.IntegrityError:
-                pass
+        Args:
+            batch: (memory_id, content) pairs
 
-        self.conn.commit()
-        return linked
+        Returns:
+            memory_id -> number of entities linked (as link_memory)
+        """
+        extracted = [(memory_id, self.extract_entities(content)) for memory_id, content in batch]
+        counts = {memory_id: len(entities) for memory_id, entities in extracted}
 
-    def _upsert_entity(self, name: str, etype: str, now: str) -> int:
-        """Insert or update entity, return its id."""
-        cur = self.conn.cursor()
+        # First spelling seen wins for new entities, as with one-by-one inserts
+        names: Dict[str, Tuple[str, str]] = {}
+        for _, entities in extracted:
+            for ent in entities:
+                names.setdefault(ent["name"].lower(), (ent["name"], ent["type"]))
+        if not names:
+            return counts
 
-        # Try insert
+        now = datetime.now().isoformat()
         try:
-            cur.execute(
+            self.conn.executemany(
                 "INSERT INTO entities (name, type, aliases_json, first_seen, last_seen) "
-                "VALUES (?, ?, '[]', ?, ?)",
-                (name, etype, now, now),
+                "VALUES (?, ?, '[]', ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET last_seen = excluded.last_seen",
+                [(name, etype, now, now) for name, etype in names.values()],
             )
-            return cur.lastrowid
-        except sqlite3.IntegrityError:
-            # Already exists — update last_seen
-            cur.execute(
-                "UPDATE entities SET last_seen = ? WHERE name = ? COLLATE NOCASE",
-                (now, name),
+
+            ids: Dict[str, int] = {}
+            keys = list(names)
+            for i in range(0, len(keys), 500):
+                chunk = [names[k][0] for k in keys[i:i + 500]]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self.conn.execute(
+                    f"SELECT id, name FROM entities WHERE name IN ({placeholders})",
+                    chunk,
+                ):
+                    ids[row["name"].lower()] = row["id"]
+
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO memory_entities "
+                "(memory_id, entity_id, mention_text, position) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (memory_id, ids[ent["name"].lower()], ent["mention_text"], ent["position"])
+                    for memory_id, entities in extracted
+                    for ent in entities
+                ],
             )
-            row = cur.execute(
-                "SELECT id FROM entities WHERE name = ? COLLATE NOCASE",
-                (name,),
-            ).fetchone()
-            return row["id"]
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        return counts
 
     # ------------------------------------------------------------------
     # Queries
@@ -328,6 +415,7 @@ class EntityExtractor:
                 (json.dumps(aliases), row["id"]),
             )
             self.conn.commit()
+            self._matcher = None
         return True
 
     def get_entity(self, name: str) -> Optional[Dict]:
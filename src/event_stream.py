@@ -2,16 +2,42 @@
 Memory event stream — pub/sub for memory system events.
 
 Feature 22: Provides a publish/subscribe event bus backed by SQLite.
-Events are persisted to the `memory_events` table for audit and replay,
-and delivered synchronously to in-process subscribers.
+Events are persisted to the append-only `memory_events` table for audit
+and replay.
+
+Publishing is cheap: publish() only buffers the row in memory. Buffered
+rows are group-committed, each batch's INSERTs and COMMIT in one short
+transaction (every `batch_size` events or `commit_interval` seconds after
+the first pending event, whichever comes first), so the database write
+lock is never held while events accumulate. The id publish() returns is
+provisional: it is the id the row will get unless another process writes
+events in between; subscribers and readers always see the committed id.
+Once a batch is committed it is handed to a dispatcher thread, which fans its
+events out to per-subscriber bounded queues drained by a thread pool, so a
+slow callback only delays itself. When a subscriber's queue is full the
+dispatcher (never a publisher) waits up to `backpressure_timeout` per batch
+and then drops events for that subscriber (counted in get_delivery_stats()).
+
+Out-of-process consumers tail the table by id with durable cursors:
+
+    stream = EventStream()
+    for event in stream.read_since(stream.get_cursor("indexer")):
+        handle(event)
+        stream.commit_cursor("indexer", event["id"])
 """
 
+import atexit
 import json
+import queue
 import sqlite3
+import threading
+import time
+import weakref
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 EVENT_TYPES = [
@@ -24,24 +50,115 @@ EVENT_TYPES = [
 ]
 
 
+class _Subscription:
+    """One callback with its own bounded delivery queue."""
+
+    def __init__(self, callback: Callable, max_queue: int):
+        self.callback = callback
+        self.queue: "queue.Queue[dict]" = queue.Queue(maxsize=max_queue)
+        self.delivered = 0
+        self.failed = 0
+        self.dropped = 0
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+    def offer(self, event: dict, pool: ThreadPoolExecutor, timeout: float) -> None:
+        """Queue event (waiting up to timeout for room) and make sure a drain is scheduled."""
+        try:
+            self.queue.put(event, timeout=timeout)
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        with self._lock:
+            if not self._scheduled:
+                self._scheduled = True
+                pool.submit(self._drain)
+
+    def _drain(self) -> None:
+        """Deliver queued events in order; at most one drain runs per subscription."""
+        while True:
+            try:
+                event = self.queue.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    if self.queue.empty():
+                        self._scheduled = False
+                        return
+                continue
+
+            try:
+                self.callback(event)
+                self.delivered += 1
+            except Exception:
+                self.failed += 1  # isolate subscriber failures
+            finally:
+                self.queue.task_done()
+
+
+def _flush_at_exit(stream_ref):
+    stream = stream_ref()
+    if stream is not None:
+        stream.close()
+
+
 class EventStream:
     """
     Persistent event bus for the memory system.
 
-    Events are stored in SQLite and dispatched synchronously to
-    registered callbacks.  Subscriber errors are caught so one
-    failing callback never blocks the rest.
+    Events are stored in SQLite and dispatched asynchronously to
+    registered callbacks after their batch commits.  Subscriber errors
+    are caught so one failing callback never blocks the rest.
+
+    Args:
+        db_path: SQLite database (defaults to intelligence.db)
+        batch_size: Commit once this many events are pending
+        commit_interval: Max seconds an event waits before its commit
+        dispatch_workers: Threads delivering to subscribers
+        max_queue: Per-subscriber queue bound
+        backpressure_timeout: Seconds the dispatcher waits per batch for
+            room in full subscriber queues before dropping events
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        batch_size: int = 64,
+        commit_interval: float = 0.05,
+        dispatch_workers: int = 4,
+        max_queue: int = 1000,
+        backpressure_timeout: float = 1.0,
+    ):
         if db_path is None:
             db_path = Path(__file__).parent.parent / "intelligence.db"
 
         self.db_path = Path(db_path)
-        self.conn = sqlite3.connect(str(self.db_path))
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self.max_queue = max_queue
+        self.backpressure_timeout = backpressure_timeout
+
+        # One connection shared by publishers and the flusher thread
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
-        self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self._lock = threading.Condition(threading.RLock())
+        # Buffered (event, payload_json) pairs; nothing is written until commit
+        self._uncommitted: List[Tuple[dict, str]] = []
+        self._next_id = 1  # Provisional id for the next buffered event
+        self._batch_started = 0.0  # monotonic time the pending batch began
+        self._closed = False
+
+        self._subscribers: Dict[str, List[_Subscription]] = defaultdict(list)
+        self._pool = ThreadPoolExecutor(
+            max_workers=dispatch_workers, thread_name_prefix="event-dispatch"
+        )
+        self._flusher: Optional[threading.Thread] = None
+        # Committed batches, in commit order, awaiting fan-out (None = stop)
+        self._batches: "queue.Queue[Optional[List[dict]]]" = queue.Queue()
+        self._dispatcher: Optional[threading.Thread] = None
+
         self._init_schema()
+        atexit.register(_flush_at_exit, weakref.ref(self))
 
     # ── Schema ─────────────────────────────────────────────────────────────
 
@@ -61,20 +178,35 @@ class EventStream:
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_events_created ON memory_events(created_at)"
         )
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS event_cursors (
+                consumer TEXT PRIMARY KEY,
+                last_event_id INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
         self.conn.commit()
+        self._sync_next_id()
+
+    def _sync_next_id(self):
+        """Continue provisional ids after the last id AUTOINCREMENT handed out."""
+        row = self.conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'memory_events'"
+        ).fetchone()
+        self._next_id = (row["seq"] if row else 0) + 1
 
     # ── Pub/Sub ────────────────────────────────────────────────────────────
 
     def publish(self, event_type: str, payload: Optional[dict] = None) -> int:
         """
-        Persist an event and notify subscribers synchronously.
+        Append an event; subscribers are notified once its batch commits.
 
         Args:
             event_type: One of EVENT_TYPES.
             payload: Arbitrary JSON-serialisable dict (default {}).
 
         Returns:
-            The auto-generated event id.
+            The event's provisional id (see the module docstring).
 
         Raises:
             ValueError: If *event_type* is not in EVENT_TYPES.
@@ -91,54 +223,215 @@ class EventStream:
         now = datetime.now(timezone.utc).isoformat()
         payload_json = json.dumps(payload)
 
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT INTO memory_events (event_type, payload_json, created_at) "
-            "VALUES (?, ?, ?)",
-            (event_type, payload_json, now),
-        )
-        self.conn.commit()
-        event_id = cursor.lastrowid
-
-        # Build the event dict delivered to callbacks
-        event = {
-            "id": event_id,
-            "event_type": event_type,
-            "payload": payload,
-            "created_at": now,
-        }
+        with self._lock:
+            event_id = self._next_id + len(self._uncommitted)
+
+            # Build the event dict delivered to callbacks
+            self._uncommitted.append(({
+                "id": event_id,
+                "event_type": event_type,
+                "payload": payload,
+                "created_at": now,
+            }, payload_json))
+
+            if len(self._uncommitted) >= self.batch_size:
+                self._commit_locked()
+            elif len(self._uncommitted) == 1:
+                # A new batch: start its commit_interval clock
+                self._batch_started = time.monotonic()
+                self._ensure_flusher()
+                self._lock.notify_all()
 
-        # Notify type-specific subscribers, then wildcard subscribers.
-        for cb in list(self._subscribers.get(event_type, [])):
-            try:
-                cb(event)
-            except Exception:
-                pass  # isolate subscriber failures
+        return event_id
 
-        for cb in list(self._subscribers.get("*", [])):
+    def _ensure_flusher(self):
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="event-stream-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _flush_loop(self):
+        """Commit pending events commit_interval after the first one arrives."""
+        with self._lock:
+            while not self._closed:
+                if not self._uncommitted:
+                    self._lock.wait()
+                    continue
+                remaining = self._batch_started + self.commit_interval - time.monotonic()
+                if remaining > 0:
+                    # Woken early (close, or a size-triggered commit): re-check
+                    self._lock.wait(timeout=remaining)
+                    continue
+                self._commit_locked()
+
+    def _commit_locked(self):
+        """Insert and commit the pending batch, then queue it for dispatch (lock held)."""
+        if not self._uncommitted:
+            return
+        pending, self._uncommitted = self._uncommitted, []
+        try:
+            with self.conn:
+                for event, payload_json in pending:
+                    event["id"] = self.conn.execute(
+                        "INSERT INTO memory_events (event_type, payload_json, created_at) "
+                        "VALUES (?, ?, ?)",
+                        (event["event_type"], payload_json, event["created_at"]),
+                    ).lastrowid
+        except Exception:
+            self._uncommitted = pending + self._uncommitted
+            raise
+        batch = [event for event, _ in pending]
+        self._next_id = batch[-1]["id"] + 1
+
+        # Subscriber lists are resolved now, under the lock, so a batch goes
+        # to the subscribers registered when it committed; queued in id order
+        routed = [
+            (event, self._subscribers.get(event["event_type"], []) + self._subscribers.get("*", []))
+            for event in batch
+        ]
+        if not any(subscriptions for _, subscriptions in routed):
+            return
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop, name="event-stream-dispatcher", daemon=True
+            )
+            self._dispatcher.start()
+        self._batches.put(routed)
+
+    def _dispatch_loop(self):
+        """Fan committed batches out to subscriber queues, off the publish path."""
+        while True:
+            batch = self._batches.get()
             try:
-                cb(event)
-            except Exception:
-                pass
+                if batch is None:
+                    return
+                deadline = time.monotonic() + self.backpressure_timeout
+                for event, subscriptions in batch:
+                    for subscription in subscriptions:
+                        subscription.offer(event, self._pool, max(0.0, deadline - time.monotonic()))
+            finally:
+                self._batches.task_done()
+
+    def flush(self, wait: bool = True) -> None:
+        """
+        Commit pending events now.
 
-        return event_id
+        Args:
+            wait: Also block until every subscriber has processed
+                  everything queued so far.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._commit_locked()
+            subscriptions = [s for subs in self._subscribers.values() for s in subs]
+
+        if wait:
+            self._batches.join()
+            for subscription in subscriptions:
+                subscription.queue.join()
 
     def subscribe(self, event_type: str, callback: Callable) -> None:
         """
         Register *callback* for events of *event_type*.
 
         Use ``'*'`` to receive every event regardless of type.
+        Callbacks run on dispatcher threads, in event order per callback.
         """
-        self._subscribers[event_type].append(callback)
+        with self._lock:
+            self._subscribers[event_type].append(_Subscription(callback, self.max_queue))
 
     def unsubscribe(self, event_type: str, callback: Callable) -> None:
         """Remove a previously registered callback."""
-        subs = self._subscribers.get(event_type, [])
-        if callback in subs:
-            subs.remove(callback)
+        with self._lock:
+            subs = self._subscribers.get(event_type, [])
+            for subscription in subs:
+                if subscription.callback == callback:
+                    subs.remove(subscription)
+                    break
+
+    def get_delivery_stats(self) -> List[Dict]:
+        """Per-subscriber delivery counters (queued, delivered, failed, dropped)."""
+        with self._lock:
+            return [
+                {
+                    "event_type": event_type,
+                    "callback": getattr(s.callback, "__name__", repr(s.callback)),
+                    "queued": s.queue.qsize(),
+                    "delivered": s.delivered,
+                    "failed": s.failed,
+                    "dropped": s.dropped,
+                }
+                for event_type, subs in self._subscribers.items()
+                for s in subs
+            ]
+
+    # ── Durable cursors ────────────────────────────────────────────────────
+
+    def read_since(
+        self,
+        after_id: int = 0,
+        event_type: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict]:
+        """
+        Return committed events with id > *after_id*, oldest first.
+
+        Walks the primary key, so tailing stays cheap however large the
+        table grows.
+        """
+        with self._lock:
+            self._commit_locked()
+            if event_type:
+                rows = self.conn.execute(
+                    "SELECT id, event_type, payload_json, created_at "
+                    "FROM memory_events WHERE id > ? AND event_type = ? "
+                    "ORDER BY id LIMIT ?",
+                    (after_id, event_type, limit),
+                ).fetchall()
+            else:
+                rows = self.conn.execute(
+                    "SELECT id, event_type, payload_json, created_at "
+                    "FROM memory_events WHERE id > ? ORDER BY id LIMIT ?",
+                    (after_id, limit),
+                ).fetchall()
+        return [self._row_to_event(row) for row in rows]
+
+    def get_cursor(self, consumer: str) -> int:
+        """Last event id *consumer* has committed (0 if it never has)."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT last_event_id FROM event_cursors WHERE consumer = ?",
+                (consumer,),
+            ).fetchone()
+        return row["last_event_id"] if row else 0
+
+    def commit_cursor(self, consumer: str, event_id: int) -> None:
+        """Record that *consumer* has processed everything up to *event_id*."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._commit_locked()
+            self.conn.execute(
+                "INSERT INTO event_cursors (consumer, last_event_id, updated_at) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT(consumer) DO UPDATE SET "
+                "last_event_id = excluded.last_event_id, updated_at = excluded.updated_at",
+                (consumer, event_id, now),
+            )
+            self.conn.commit()
 
     # ── Query helpers ──────────────────────────────────────────────────────
 
+    @staticmethod
+    def _row_to_event(row) -> Dict:
+        return {
+            "id": row["id"],
+            "event_type": row["event_type"],
+            "payload": json.loads(row["payload_json"]),
+            "created_at": row["created_at"],
+        }
+
     def get_recent(
         self, event_type: Optional[str] = None, limit: int = 50
     ) -> List[Dict]:
@@ -149,44 +442,49 @@ class EventStream:
             event_type: Filter to a single type, or ``None`` for all.
             limit: Maximum rows to return.
         """
-        cursor = self.conn.cursor()
-        if event_type:
-            cursor.execute(
-                "SELECT id, event_type, payload_json, created_at "
-                "FROM memory_events WHERE event_type = ? "
-                "ORDER BY created_at DESC LIMIT ?",
-                (event_type, limit),
-            )
-        else:
-            cursor.execute(
-                "SELECT id, event_type, payload_json, created_at "
-                "FROM memory_events ORDER BY created_at DESC LIMIT ?",
-                (limit,),
-            )
-
-        rows = cursor.fetchall()
-        return [
-            {
-                "id": row["id"],
-                "event_type": row["event_type"],
-                "payload": json.loads(row["payload_json"]),
-                "created_at": row["created_at"],
-            }
-            for row in rows
-        ]
+        with self._lock:
+            self._commit_locked()
+            if event_type:
+                rows = self.conn.execute(
+                    "SELECT id, event_type, payload_json, created_at "
+                    "FROM memory_events WHERE event_type = ? "
+                    "ORDER BY id DESC LIMIT ?",
+                    (event_type, limit),
+                ).fetchall()
+            else:
+                rows = self.conn.execute(
+                    "SELECT id, event_type, payload_json, created_at "
+                    "FROM memory_events ORDER BY id DESC LIMIT ?",
+                    (limit,),
+                ).fetchall()
+
+        return [self._row_to_event(row) for row in rows]
 
     def get_stats(self) -> Dict[str, int]:
         """Return event counts keyed by event type."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT event_type, COUNT(*) as cnt "
-            "FROM memory_events GROUP BY event_type"
-        )
-        return {row["event_type"]: row["cnt"] for row in cursor.fetchall()}
+        with self._lock:
+            self._commit_locked()
+            rows = self.conn.execute(
+                "SELECT event_type, COUNT(*) as cnt "
+                "FROM memory_events GROUP BY event_type"
+            ).fetchall()
+        return {row["event_type"]: row["cnt"] for row in rows}
 
     # ── Lifecycle ──────────────────────────────────────────────────────────
 
     def close(self):
+        """Commit pending events, finish deliveries and close the connection."""
+        with self._lock:
+            if self._closed:
+                return
+            self._commit_locked()
+            self._closed = True
+            self._lock.notify_all()
+
+        if self._dispatcher is not None:
+            self._batches.put(None)
+            self._dispatcher.join()
+        self._pool.shutdown(wait=True)
         if self.conn:
             self.conn.close()
 
@@ -0,0 +1,273 @@
+"""
+Frontmatter codec for memory markdown files
+
+Memory files are a `---` delimited header of `key: value` lines followed
+by a markdown body:
+
+    ---
+    id: mem-123
+    importance_weight: 0.8
+    semantic_tags: ['#learning', 'python']
+    ---
+
+    Body text
+
+Values are decoded in one pass without ast.literal_eval or a YAML
+library: null/true/false, ints, floats, JSON or single-quoted strings,
+and flow lists (both JSON and Python-repr style, as written by older
+versions of MemoryTSClient).  Anything else stays a plain string.
+
+Round-trip guarantee: for a header of str/int/float/bool/None values and
+lists of those, parse(dumps(meta, body)) == (meta, body.strip()).
+dumps only quotes strings that would otherwise decode differently, so
+ordinary files are written exactly as before.
+
+Usage:
+    from memory_system.frontmatter import dumps, parse, read_header
+
+    meta, body = parse(path.read_text())
+    meta = read_header(path)   # stops reading at the closing ---
+    text = dumps(meta, body)
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+DELIMITER = "---"
+
+_NUMBER_RE = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+
+_CONSTANTS = {
+    "null": None, "Null": None, "NULL": None, "~": None,
+    "true": True, "True": True, "TRUE": True,
+    "false": False, "False": False, "FALSE": False,
+}
+
+
+class FrontmatterError(ValueError):
+    """Text has no (terminated) frontmatter block"""
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Values
+# ---------------------------------------------------------------------------
+
+def decode_value(raw: str) -> Any:
+    """
+    Decode one header value (already stripped)
+
+    Returns:
+        None, bool, int, float, str or list
+    """
+    if not raw:
+        return ""
+
+    first = raw[0]
+    if first == "[":
+        try:
+            return _decode_list(raw)
+        except (ValueError, IndexError):
+            return raw
+    if first == '"':
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return raw
+        return value if isinstance(value, str) else raw
+    if first == "'":
+        if len(raw) >= 2 and raw[-1] == "'":
+            return raw[1:-1].replace("''", "'")
+        return raw
+
+    if raw in _CONSTANTS:
+        return _CONSTANTS[raw]
+    if first in "-0123456789":
+        match = _NUMBER_RE.fullmatch(raw)
+        if match:
+            return float(raw) if match.group(1) or match.group(2) else int(raw)
+    return raw
+
+
+def _unescape(text: str, quote: str) -> str:
+    """Undo backslash escapes in a quoted list item (JSON or Python repr)"""
+    if "\\" not in text:
+        return text
+    if quote == '"':
+        try:
+            return json.loads(f'"{text}"')
+        except ValueError:
+            pass
+    return text.encode("latin-1", "backslashreplace").decode("unicode_escape")
+
+
+def _decode_list(raw: str) -> List[Any]:
+    """
+    Decode a flow list: [a, 'b', "c", 1, null]
+
+    Raises:
+        ValueError / IndexError: not a well-formed list
+    """
+    items: List[Any] = []
+    n = len(raw)
+    i = 1
+    while True:
+        while raw[i] == " ":
+            i += 1
+        if raw[i] == "]":
+            i += 1
+            break
+
+        quote = raw[i]
+        if quote in "'\"":
+            j = i + 1
+            while raw[j] != quote:
+                j += 2 if raw[j] == "\\" else 1
+            items.append(_unescape(raw[i + 1:j], quote))
+            i = j + 1
+        else:
+            j = i
+            while raw[j] not in ",]":
+                j += 1
+            items.append(decode_value(raw[i:j].strip()))
+            i = j
+
+        while raw[i] == " ":
+            i += 1
+        if raw[i] == ",":
+            i += 1
+        elif raw[i] == "]":
+            i += 1
+            break
+        else:
+            raise ValueError(f"Unexpected {raw[i]!r} in list")
+
+    if i < n and raw[i:].strip():
+        raise ValueError("Trailing text after list")
+    return items
+
+
+def encode_value(value: Any) -> str:
+    """
+    Encode one header value
+
+    Strings are written bare unless they would decode as something else
+    (or have surrounding whitespace / line breaks), then JSON-quoted.
+    Lists use Python-repr quoting for string items, matching older files.
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(
+            repr(item) if isinstance(item, str) else encode_value(item) for item in value
+        ) + "]"
+
+    text = str(value)
+    if text and (
+        text != text.strip()
+        or "\n" in text
+        or "\r" in text
+        or decode_value(text) != text
+        or not isinstance(decode_value(text), str)
+    ):
+        return json.dumps(text, ensure_ascii=False)
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Documents
+# ---------------------------------------------------------------------------
+
+def parse_lines(lines: Iterable[str]) -> Dict[str, Any]:
+    """Decode `key: value` lines; blank lines and lines without ':' are skipped"""
+    meta: Dict[str, Any] = {}
+    for line in lines:
+        key, sep, value = line.partition(":")
+        key = key.strip()
+        if sep and key:
+            meta[key] = decode_value(value.strip())
+    return meta
+
+
+def _is_delimiter(line: str) -> bool:
+    return line.rstrip() == DELIMITER
+
+
+def parse(text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Split a memory file into header fields and body
+
+    Returns:
+        (fields, body) - body is stripped
+
+    Raises:
+        FrontmatterError: text does not start with a terminated --- block
+    """
+    if text.startswith("\ufeff"):
+        text = text[1:]
+
+    first_end = text.find("\n")
+    if first_end == -1 or not _is_delimiter(text[:first_end]):
+        raise FrontmatterError("Missing opening ---")
+
+    pos = first_end
+    while True:
+        close = text.find("\n" + DELIMITER, pos)
+        if close == -1:
+            raise FrontmatterError("Missing closing ---")
+        line_end = text.find("\n", close + 1)
+        if line_end == -1:
+            line_end = len(text)
+        if _is_delimiter(text[close + 1:line_end]):
+            break
+        pos = close + 1
+
+    header = text[first_end + 1:close]
+    return parse_lines(header.split("\n")), text[line_end + 1:].strip()
+
+
+def read_header(path: Path) -> Dict[str, Any]:
+    """
+    Parse only the header of a memory file
+
+    Reads line by line and stops at the closing ---, so the body is never
+    read or decoded.
+
+    Raises:
+        FrontmatterError: file does not start with a terminated --- block
+        OSError: file cannot be read
+        UnicodeDecodeError: header is not UTF-8
+    """
+    with open(path, "rb") as f:
+        if not _is_delimiter(f.readline().decode("utf-8-sig")):
+            raise FrontmatterError(f"Missing opening --- in {path}")
+        lines = []
+        for line in f:
+            line = line.decode("utf-8")
+            if _is_delimiter(line):
+                return parse_lines(lines)
+            lines.append(line)
+    raise FrontmatterError(f"Missing closing --- in {path}")
+
+
+def strip_frontmatter(text: str) -> str:
+    """Body of a memory file (the whole text, stripped, if it has no header)"""
+    try:
+        return parse(text)[1]
+    except FrontmatterError:
+        return text.strip()
+
+
+def dumps(meta: Dict[str, Any], body: str) -> str:
+    """Render header fields and body as a memory file"""
+    lines = [DELIMITER]
+    lines.extend(f"{key}: {encode_value(value)}" for key, value in meta.items())
+    lines.append(DELIMITER)
+    return "\n".join(lines) + f"\n\n{body}\n"
@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import IntEnum
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from memory_system.config import cfg
 from memory_system.db_pool import get_connection
@@ -64,6 +64,13 @@ MIN_PROJECTS_FOR_PROMOTION = 2
 DEEP_STABILITY_FOR_PROMOTION = 4.0
 DEEP_REVIEWS_FOR_PROMOTION = 5
 
+_STATE_COLUMNS = """memory_id, stability, difficulty, due_date,
+                      review_count, last_review, projects_validated,
+                      promoted, promoted_date"""
+
+# Stay under SQLite's default bound-variable limit for IN (...) lookups
+_SQL_VARIABLE_CHUNK = 500
+
 
 class FSRSScheduler:
     """
@@ -85,59 +92,71 @@ class FSRSScheduler:
         self.db_path = Path(db_path)
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
+    def _connect(self, write: bool = False) -> sqlite3.Connection:
         """Get pooled database connection
 
         Note: Returns connection from pool. Caller must close() when done.
         TODO: Refactor to use context manager pattern for auto-return to pool.
+
+        Args:
+            write: Take the database's writer connection (for INSERT/UPDATE)
         """
         from memory_system.db_pool import get_pool
         pool = get_pool(self.db_path)
-        return pool.get_connection()
+        return pool.get_connection(write=write)
 
     def _init_db(self):
         """Create database tables if they don't exist"""
-        conn = self._connect()
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS memory_reviews (
-                memory_id TEXT PRIMARY KEY,
-                stability REAL DEFAULT 1.0,
-                difficulty REAL DEFAULT 0.5,
-                due_date TEXT,
-                review_count INTEGER DEFAULT 0,
-                last_review TEXT,
-                projects_validated TEXT DEFAULT '[]',
-                promoted BOOLEAN DEFAULT FALSE,
-                promoted_date TEXT
-            )
-        """)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS review_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                memory_id TEXT,
-                review_date TEXT,
-                grade INTEGER,
-                new_stability REAL,
-                new_interval_days REAL,
-                source_session TEXT,
-                source_project TEXT
-            )
-        """)
-        # Indexes for common query patterns
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_reviews_due
-            ON memory_reviews(due_date, promoted)
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_reviews_promotion
-            ON memory_reviews(promoted, stability, review_count)
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_review_log_memory
-            ON review_log(memory_id, review_date)
-        """)
-        conn.commit()
-        conn.close()
+        conn = self._connect(write=True)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS memory_reviews (
+                    memory_id TEXT PRIMARY KEY,
+                    stability REAL DEFAULT 1.0,
+                    difficulty REAL DEFAULT 0.5,
+                    due_date TEXT,
+                    review_count INTEGER DEFAULT 0,
+                    last_review TEXT,
+                    projects_validated TEXT DEFAULT '[]',
+                    promoted BOOLEAN DEFAULT FALSE,
+                    promoted_date TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS review_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    memory_id TEXT,
+                    review_date TEXT,
+                    grade INTEGER,
+                    new_stability REAL,
+                    new_interval_days REAL,
+                    source_session TEXT,
+                    source_project TEXT
+                )
+            """)
+            # Indexes for common query patterns
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_reviews_due
+                ON memory_reviews(due_date, promoted)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_reviews_promotion
+                ON memory_reviews(promoted, stability, review_count)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_review_log_memory
+                ON review_log(memory_id, review_date)
+            """)
+            # Partial index over unpromoted rows only, ordered by due date.
+            # Promoted memories never come due again, so this acts as a
+            # maintained priority queue: due lookups touch O(due) rows.
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_reviews_due_pending
+                ON memory_reviews(due_date) WHERE promoted = FALSE
+            """)
+            conn.commit()
+        finally:
+            conn.close()
 
     def register_memory(self, memory_id: str, project_id: str = "LFI"):
         """
@@ -152,16 +171,52 @@ class FSRSScheduler:
         due_date = (datetime.now() + timedelta(days=INITIAL_INTERVAL_DAYS)).isoformat()
         projects = json.dumps([project_id])
 
-        conn = self._connect()
-        conn.execute(
-            """INSERT OR IGNORE INTO memory_reviews
-            (memory_id, stability, difficulty, due_date, review_count,
-             projects_validated, promoted)
-            VALUES (?, ?, ?, ?, 0, ?, FALSE)""",
-            (memory_id, INITIAL_STABILITY, INITIAL_DIFFICULTY, due_date, projects)
-        )
-        conn.commit()
-        conn.close()
+        conn = self._connect(write=True)
+        try:
+            conn.execute(
+                """INSERT OR IGNORE INTO memory_reviews
+                (memory_id, stability, difficulty, due_date, review_count,
+                 projects_validated, promoted)
+                VALUES (?, ?, ?, ?, 0, ?, FALSE)""",
+                (memory_id, INITIAL_STABILITY, INITIAL_DIFFICULTY, due_date, projects)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def register_memories(self, registrations: Dict[str, str]):
+        """
+        Register many memories for FSRS tracking in one transaction
+
+        Idempotent like register_memory.
+
+        Args:
+            registrations: Mapping of memory_id -> source project
+        """
+        if not registrations:
+            return
+
+        due_date = (datetime.now() + timedelta(days=INITIAL_INTERVAL_DAYS)).isoformat()
+
+        conn = self._connect(write=True)
+        try:
+            conn.executemany(
+                """INSERT OR IGNORE INTO memory_reviews
+                (memory_id, stability, difficulty, due_date, review_count,
+                 projects_validated, promoted)
+                VALUES (?, ?, ?, ?, 0, ?, FALSE)""",
+                [
+                    (memory_id, INITIAL_STABILITY, INITIAL_DIFFICULTY, due_date,
+                     json.dumps([project_id]))
+                    for memory_id, project_id in registrations.items()
+                ]
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
 
     def get_state(self, memory_id: str) -> Optional[MemoryReviewState]:
         """
@@ -175,9 +230,7 @@ class FSRSScheduler:
         """
         conn = self._connect()
         cursor = conn.execute(
-            """SELECT memory_id, stability, difficulty, due_date,
-                      review_count, last_review, projects_validated,
-                      promoted, promoted_date
+            f"""SELECT {_STATE_COLUMNS}
                FROM memory_reviews WHERE memory_id = ?""",
             (memory_id,)
         )
@@ -187,17 +240,7 @@ class FSRSScheduler:
         if row is None:
             return None
 
-        return MemoryReviewState(
-            memory_id=row[0],
-            stability=row[1],
-            difficulty=row[2],
-            due_date=row[3],
-            review_count=row[4],
-            last_review=row[5],
-            projects_validated=row[6],
-            promoted=bool(row[7]),
-            promoted_date=row[8],
-        )
+        return _row_to_state(row)
 
     def record_review(
         self,
@@ -215,53 +258,102 @@ class FSRSScheduler:
             project_id: Project that validated this memory
             session_id: Session that triggered the review
         """
-        state = self.get_state(memory_id)
-        if state is None:
-            return
-
-        # Calculate new stability
-        multiplier = STABILITY_MULTIPLIERS[grade]
-        new_stability = max(0.1, min(10.0, state.stability * multiplier))
+        self.record_reviews([{
+            "memory_id": memory_id,
+            "grade": grade,
+            "project_id": project_id,
+            "session_id": session_id,
+        }])
+
+    def record_reviews(self, reviews: Iterable[Dict[str, Any]]) -> int:
+        """
+        Record many review events in a single transaction
 
-        # Update difficulty based on grade
-        # Easy reviews lower difficulty, hard reviews raise it
-        difficulty_delta = (3 - grade) * 0.1  # EASY=-0.1, GOOD=0, HARD=0.1, FAIL=0.2
-        new_difficulty = max(0.0, min(1.0, state.difficulty + difficulty_delta))
+        States are loaded with one SELECT, updated in memory (reviews of the
+        same memory apply in order, exactly as repeated record_review calls
+        would), then written with executemany. Unregistered memories are
+        skipped, as in record_review.
 
-        # Calculate new interval
-        interval_days = new_stability * (1 + (grade - 2) * 0.5)
-        interval_days = max(0.5, interval_days)  # Minimum half day
-        new_due_date = (datetime.now() + timedelta(days=interval_days)).isoformat()
+        Args:
+            reviews: Dicts with memory_id and grade, plus optional
+                     project_id (default "LFI") and session_id
 
-        # Update project list
-        projects = json.loads(state.projects_validated)
-        if project_id not in projects:
-            projects.append(project_id)
+        Returns:
+            Number of reviews recorded
+        """
+        reviews = list(reviews)
+        if not reviews:
+            return 0
 
-        # Update database (transactional - both succeed or both rollback)
-        conn = self._connect()
+        conn = self._connect(write=True)
         try:
-            conn.execute(
+            states = self._load_states(conn, {r["memory_id"] for r in reviews})
+
+            updates = {}
+            log_rows = []
+            for review in reviews:
+                memory_id = review["memory_id"]
+                state = states.get(memory_id)
+                if state is None:
+                    continue
+
+                grade = ReviewGrade(review["grade"])
+                project_id = review.get("project_id", "LFI")
+                now = datetime.now()
+
+                # Calculate new stability
+                multiplier = STABILITY_MULTIPLIERS[grade]
+                state.stability = max(0.1, min(10.0, state.stability * multiplier))
+
+                # Update difficulty based on grade
+                # Easy reviews lower difficulty, hard reviews raise it
+                difficulty_delta = (3 - grade) * 0.1  # EASY=-0.1, GOOD=0, HARD=0.1, FAIL=0.2
+                state.difficulty = max(0.0, min(1.0, state.difficulty + difficulty_delta))
+
+                # Calculate new interval
+                interval_days = state.stability * (1 + (grade - 2) * 0.5)
+                interval_days = max(0.5, interval_days)  # Minimum half day
+                state.due_date = (now + timedelta(days=interval_days)).isoformat()
+
+                # Update project list
+                projects = json.loads(state.projects_validated)
+                if project_id not in projects:
+                    projects.append(project_id)
+                state.projects_validated = json.dumps(projects)
+
+                state.review_count += 1
+                state.last_review = now.isoformat()
+                updates[memory_id] = state
+
+                log_rows.append(
+                    (memory_id, now.isoformat(), int(grade), state.stability,
+                     interval_days, review.get("session_id"), project_id)
+                )
+
+            # Update database (transactional - all succeed or all rollback)
+            conn.executemany(
                 """UPDATE memory_reviews SET
                     stability = ?,
                     difficulty = ?,
                     due_date = ?,
-                    review_count = review_count + 1,
+                    review_count = ?,
                     last_review = ?,
                     projects_validated = ?
                 WHERE memory_id = ?""",
-                (new_stability, new_difficulty, new_due_date,
-                 datetime.now().isoformat(), json.dumps(projects), memory_id)
+                [
+                    (st.stability, st.difficulty, st.due_date, st.review_count,
+                     st.last_review, st.projects_validated, memory_id)
+                    for memory_id, st in updates.items()
+                ]
             )
 
-            # Log the review event
-            conn.execute(
+            # Log the review events
+            conn.executemany(
                 """INSERT INTO review_log
                 (memory_id, review_date, grade, new_stability,
                  new_interval_days, source_session, source_project)
                 VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (memory_id, datetime.now().isoformat(), int(grade),
-                 new_stability, interval_days, session_id, project_id)
+                log_rows
             )
 
             conn.commit()
@@ -271,6 +363,24 @@ class FSRSScheduler:
         finally:
             conn.close()
 
+        return len(log_rows)
+
+    def _load_states(self, conn, memory_ids) -> Dict[str, MemoryReviewState]:
+        """Fetch review states for many memories, chunked under SQLite's variable limit"""
+        memory_ids = list(memory_ids)
+        states = {}
+        for start in range(0, len(memory_ids), _SQL_VARIABLE_CHUNK):
+            chunk = memory_ids[start:start + _SQL_VARIABLE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"""SELECT {_STATE_COLUMNS}
+                   FROM memory_reviews WHERE memory_id IN ({placeholders})""",
+                chunk
+            )
+            for row in cursor.fetchall():
+                states[row[0]] = _row_to_state(row)
+        return states
+
     def is_promotion_ready(self, memory_id: str) -> bool:
         """
         Check if a memory meets promotion criteria via either path.
@@ -317,11 +427,10 @@ class FSRSScheduler:
             List of MemoryReviewState objects that meet promotion criteria
         """
         conn = self._connect()
-        # Broad SQL filter — catches both paths, then refine in Python
+        # Broad SQL filter — catches both paths, then refine in Python.
+        # Served by idx_reviews_promotion (promoted=FALSE, stability range).
         cursor = conn.execute(
-            """SELECT memory_id, stability, difficulty, due_date,
-                      review_count, last_review, projects_validated,
-                      promoted, promoted_date
+            f"""SELECT {_STATE_COLUMNS}
                FROM memory_reviews
                WHERE promoted = FALSE
                  AND stability >= ?
@@ -331,17 +440,7 @@ class FSRSScheduler:
 
         candidates = []
         for row in cursor.fetchall():
-            state = MemoryReviewState(
-                memory_id=row[0],
-                stability=row[1],
-                difficulty=row[2],
-                due_date=row[3],
-                review_count=row[4],
-                last_review=row[5],
-                projects_validated=row[6],
-                promoted=bool(row[7]),
-                promoted_date=row[8],
-            )
+            state = _row_to_state(row)
             projects = json.loads(state.projects_validated)
 
             # Path A: cross-project
@@ -366,16 +465,18 @@ class FSRSScheduler:
         Args:
             memory_id: Memory identifier
         """
-        conn = self._connect()
-        conn.execute(
-            """UPDATE memory_reviews SET
-                promoted = TRUE,
-                promoted_date = ?
-            WHERE memory_id = ?""",
-            (datetime.now().isoformat(), memory_id)
-        )
-        conn.commit()
-        conn.close()
+        conn = self._connect(write=True)
+        try:
+            conn.execute(
+                """UPDATE memory_reviews SET
+                    promoted = TRUE,
+                    promoted_date = ?
+                WHERE memory_id = ?""",
+                (datetime.now().isoformat(), memory_id)
+            )
+            conn.commit()
+        finally:
+            conn.close()
 
     def get_promoted_ids(self) -> set:
         """
@@ -392,37 +493,47 @@ class FSRSScheduler:
         conn.close()
         return promoted
 
-    def get_due_reviews(self) -> List[MemoryReviewState]:
+    def get_due_reviews(self, limit: Optional[int] = None) -> List[MemoryReviewState]:
         """
         Get memories whose review is due (due_date <= now)
 
+        Walks idx_reviews_due_pending in due order, so cost is proportional
+        to the number of due memories rather than the table size.
+
+        Args:
+            limit: Return at most this many (most overdue first)
+
         Returns:
-            List of memories due for review
+            List of memories due for review, most overdue first
         """
         conn = self._connect()
         now = datetime.now().isoformat()
-        cursor = conn.execute(
-            """SELECT memory_id, stability, difficulty, due_date,
-                      review_count, last_review, projects_validated,
-                      promoted, promoted_date
-               FROM memory_reviews
-               WHERE due_date <= ? AND promoted = FALSE""",
-            (now,)
-        )
-
-        due = []
-        for row in cursor.fetchall():
-            due.append(MemoryReviewState(
-                memory_id=row[0],
-                stability=row[1],
-                difficulty=row[2],
-                due_date=row[3],
-                review_count=row[4],
-                last_review=row[5],
-                projects_validated=row[6],
-                promoted=bool(row[7]),
-                promoted_date=row[8],
-            ))
+        sql = f"""SELECT {_STATE_COLUMNS}
+               FROM memory_reviews INDEXED BY idx_reviews_due_pending
+               WHERE due_date <= ? AND promoted = FALSE
+               ORDER BY due_date"""
+        params = [now]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        cursor = conn.execute(sql, params)
+
+        due = [_row_to_state(row) for row in cursor.fetchall()]
 
         conn.close()
         return due
+
+
+def _row_to_state(row) -> MemoryReviewState:
+    """Convert a memory_reviews row (_STATE_COLUMNS order) to a MemoryReviewState"""
+    return MemoryReviewState(
+        memory_id=row[0],
+        stability=row[1],
+        difficulty=row[2],
+        due_date=row[3],
+        review_count=row[4],
+        last_review=row[5],
+        projects_validated=row[6],
+        promoted=bool(row[7]),
+        promoted_date=row[8],
+    )
@@ -23,12 +23,15 @@ Usage:
     result = gc.run_weekly()  # Collects gen-0 and gen-1
     result = gc.run_monthly() # Collects all generations
     stats  = gc.get_generation_stats()
+
+    # Nightly re-bucketing of the whole store in one transaction
+    counts = gc.assign_generations((m["id"], m["created_at"]) for m in memories)
 """
 
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 # ── Generation boundaries (days) ─────────────────────────────────────────────
 
@@ -48,6 +51,28 @@ GEN_2_MAX_IMPORTANCE = 0.15       # importance must be < 0.15
 GEN_2_ACCESS_STALE_DAYS = 60      # no accesses in 60 days
 # AND no relationship links
 
+# Collection predicate per generation, evaluated in SQL against mock_memories
+# (alias m).  NULL (no metadata, unparseable last_accessed) means keep.
+_COLLECT_SQL = {
+    0: "m.access_count = 0",
+    1: f"m.access_count < {GEN_1_MIN_ACCESS} AND m.importance <= {GEN_1_MIN_IMPORTANCE}",
+    2: (
+        f"m.importance < {GEN_2_MAX_IMPORTANCE} AND NOT m.has_links AND "
+        f"(m.last_accessed IS NULL OR "
+        f"julianday('now') - julianday(m.last_accessed) >= {GEN_2_ACCESS_STALE_DAYS})"
+    ),
+}
+
+
+def _generation_for(created_at: datetime, now: datetime) -> int:
+    """Generation (0, 1 or 2) for a memory created at *created_at*."""
+    age_days = (now - created_at).total_seconds() / 86400
+    if age_days < GEN_0_MAX_DAYS:
+        return 0
+    if age_days < GEN_1_MAX_DAYS:
+        return 1
+    return 2
+
 
 class GenerationalGC:
     """
@@ -124,25 +149,44 @@ class GenerationalGC:
         Returns:
             The generation number (0, 1, or 2).
         """
-        now = datetime.now(timezone.utc)
-        age_days = (now - created_at).total_seconds() / 86400
+        return self._store_generations([(memory_id, created_at)])[0]
+
+    def assign_generations(self, memories: Iterable[Tuple[str, datetime]]) -> dict:
+        """
+        Assign many memories to generations in a single transaction.
 
-        if age_days < GEN_0_MAX_DAYS:
-            gen = 0
-        elif age_days < GEN_1_MAX_DAYS:
-            gen = 1
-        else:
-            gen = 2
+        Memories already tracked are moved to the generation matching their
+        age (promoted or demoted as needed).
 
-        cur = self.conn.cursor()
-        cur.execute("""
-            INSERT INTO memory_generations (memory_id, generation, created_at)
-            VALUES (?, ?, ?)
-            ON CONFLICT(memory_id) DO UPDATE SET generation = excluded.generation
-        """, (memory_id, gen, created_at.isoformat()))
-        self.conn.commit()
+        Args:
+            memories: (memory_id, created_at) pairs, created_at timezone-aware UTC.
+
+        Returns:
+            Dict with gen_0, gen_1 and gen_2 counts of memories assigned.
+        """
+        counts = {"gen_0": 0, "gen_1": 0, "gen_2": 0}
+        for gen in self._store_generations(memories):
+            counts[f"gen_{gen}"] += 1
+        return counts
 
-        return gen
+    def _store_generations(self, memories: Iterable[Tuple[str, datetime]]) -> list[int]:
+        """Upsert generation rows with one executemany and commit; return generations."""
+        now = datetime.now(timezone.utc)
+        rows = [
+            (memory_id, _generation_for(created_at, now), created_at.isoformat())
+            for memory_id, created_at in memories
+        ]
+        try:
+            self.conn.executemany("""
+                INSERT INTO memory_generations (memory_id, generation, created_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(memory_id) DO UPDATE SET generation = excluded.generation
+            """, rows)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return [gen for _, gen, _ in rows]
 
     # ── Promotion ─────────────────────────────────────────────────────────
 
@@ -204,92 +248,22 @@ class GenerationalGC:
         if generation not in (0, 1, 2):
             raise ValueError(f"Invalid generation {generation}. Must be 0, 1, or 2.")
 
-        cur = self.conn.cursor()
-
-        # Get all memories in this generation
-        cur.execute(
-            "SELECT memory_id FROM memory_generations WHERE generation = ?",
-            (generation,)
-        )
-        gen_members = [row["memory_id"] for row in cur.fetchall()]
-        total_in_gen = len(gen_members)
+        # One pass: every member joined to its signals, with the collection
+        # predicate evaluated in SQL.  Members without metadata are kept.
+        rows = self.conn.execute(f"""
+            SELECT g.memory_id, COALESCE({_COLLECT_SQL[generation]}, 0) AS collect
+            FROM memory_generations g
+            LEFT JOIN mock_memories m ON m.memory_id = g.memory_id
+            WHERE g.generation = ?
+            ORDER BY g.rowid
+        """, (generation,)).fetchall()
 
-        if total_in_gen == 0:
-            self._record_gc_event(generation, 0, 0, 0)
-            return []
+        collected = [row["memory_id"] for row in rows if row["collect"]]
+        promoted_count = len(rows) - len(collected)
 
-        collected: list[str] = []
-        promoted: list[str] = []
-
-        for mid in gen_members:
-            # Fetch mock memory signals
-            cur.execute(
-                "SELECT importance, access_count, last_accessed, has_links "
-                "FROM mock_memories WHERE memory_id = ?",
-                (mid,)
-            )
-            mem_row = cur.fetchone()
-            if mem_row is None:
-                # No metadata available — keep it (safe default)
-                promoted.append(mid)
-                continue
-
-            importance = mem_row["importance"]
-            access_count = mem_row["access_count"]
-            last_accessed = mem_row["last_accessed"]
-            has_links = bool(mem_row["has_links"])
-
-            should_collect = self._should_collect(
-                generation, importance, access_count, last_accessed, has_links
-            )
-
-            if should_collect:
-                collected.append(mid)
-            else:
-                promoted.append(mid)
-
-        self._record_gc_event(generation, len(collected), len(promoted), total_in_gen)
+        self._record_gc_event(generation, len(collected), promoted_count, len(rows))
         return collected
 
-    def _should_collect(
-        self,
-        generation: int,
-        importance: float,
-        access_count: int,
-        last_accessed: str | None,
-        has_links: bool,
-    ) -> bool:
-        """Determine if a memory should be collected based on generation rules."""
-        if generation == 0:
-            # Nursery: collected if never accessed or reinforced
-            return access_count == 0
-
-        elif generation == 1:
-            # Young: must have >=2 accesses OR importance >0.5 to survive
-            survives = access_count >= GEN_1_MIN_ACCESS or importance > GEN_1_MIN_IMPORTANCE
-            return not survives
-
-        elif generation == 2:
-            # Tenured: only collected if ALL three conditions met
-            if importance >= GEN_2_MAX_IMPORTANCE:
-                return False
-            if has_links:
-                return False
-            # Check access recency
-            if last_accessed is not None:
-                now = datetime.now(timezone.utc)
-                last_dt = datetime.fromisoformat(last_accessed)
-                # Make timezone-aware if needed
-                if last_dt.tzinfo is None:
-                    last_dt = last_dt.replace(tzinfo=timezone.utc)
-                days_since = (now - last_dt).total_seconds() / 86400
-                if days_since < GEN_2_ACCESS_STALE_DAYS:
-                    return False
-            # All three conditions met
-            return True
-
-        return False
-
     def _record_gc_event(
         self,
         generation: int,
@@ -12,6 +12,12 @@ import re
 from datetime import datetime
 from typing import List, Dict, Any
 
+import numpy as np
+
+
+# Daily multiplicative decay applied to importance
+DECAY_RATE = 0.99
+
 
 # Trigger words that boost importance
 TRIGGER_WORDS = {
@@ -106,13 +112,31 @@ def apply_decay(importance: float, days_since: int) -> float:
     if days_since < 0:
         days_since = 0
 
-    decay_rate = 0.99
-    multiplier = decay_rate ** days_since
+    multiplier = DECAY_RATE ** days_since
     decayed = importance * multiplier
 
     return max(0.0, decayed)
 
 
+def apply_decay_array(importances: np.ndarray, days_since: np.ndarray) -> np.ndarray:
+    """
+    Vectorized apply_decay over whole columns of memories
+
+    Same formula and clamping as apply_decay, evaluated in one NumPy pass
+    so maintenance jobs can decay a full snapshot without a Python loop.
+
+    Args:
+        importances: Current importance scores
+        days_since: Days since last access (negative values treated as 0)
+
+    Returns:
+        Array of decayed importance scores (>= 0)
+    """
+    importances = np.asarray(importances, dtype=np.float64)
+    days = np.maximum(np.asarray(days_since, dtype=np.float64), 0.0)
+    return np.maximum(importances * np.power(DECAY_RATE, days), 0.0)
+
+
 def apply_reinforcement(importance: float) -> float:
     """
     Apply reinforcement: +15% with headroom (cap at 0.95)
@@ -4,6 +4,13 @@ Feature 24: Memory Clustering & Topic Detection
 Auto-groups related memories by semantic similarity using K-means clustering.
 LLM generates human-readable topic labels for each cluster.
 
+Embeddings come from EmbeddingManager's stored table (computed in one batch
+only for memories that lack one). K is chosen with MiniBatchKMeans and a
+sampled silhouette score, and each cluster's centroid and member count are
+persisted. That makes incremental updates possible: new memories are
+assigned to their nearest centroid and the centroids absorb them with the
+mini-batch k-means running-mean update, without refitting the whole store.
+
 Database: intelligence.db (memory_clusters, cluster_memberships tables)
 """
 
@@ -15,17 +22,23 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.metrics import silhouette_score
 
 from memory_system.db_pool import get_connection
-from memory_system import semantic_search
+
+
+# Points sampled for silhouette scoring during K selection (O(sample²))
+SILHOUETTE_SAMPLE_SIZE = 2000
+
+# Mini-batch size for K selection fits
+MINIBATCH_SIZE = 1024
 
 # Import ask_claude dynamically to avoid relative import issues
 def _ask_claude(prompt: str, timeout: int = 30) -> str:
     """Wrapper for ask_claude import."""
     from memory_system import llm_extractor
-    return llm_extractor.ask_claude(prompt, timeout)
+    return llm_extractor.ask_claude(prompt, timeout, site="cluster_labels")
 
 
 @dataclass
@@ -66,6 +79,9 @@ class MemoryClustering:
         for c in clusters:
             print(f"{c.topic_label} ({c.member_count} memories)")
 
+        # Nightly: fold only new memories into the existing clusters
+        clusters = clustering.cluster_memories(incremental=True)
+
         # Get memories in a cluster
         members = clustering.get_cluster_members(cluster_id=1)
 
@@ -73,21 +89,23 @@ class MemoryClustering:
         cluster = clustering.get_memory_cluster("mem_001")
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, embedding_manager=None):
         """
         Initialize clustering system.
 
         Args:
             db_path: Path to intelligence.db (default: intelligence.db in module parent)
+            embedding_manager: Source of stored embeddings (default: EmbeddingManager())
         """
         if db_path is None:
             db_path = Path(__file__).parent.parent / "intelligence.db"
         self.db_path = Path(db_path)
+        self._embedding_manager = embedding_manager
         self._init_db()
 
     def _init_db(self):
         """Create clustering tables if they don't exist."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS memory_clusters (
                     cluster_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -122,13 +140,19 @@ class MemoryClustering:
                 ON cluster_memberships(memory_id)
             """)
 
+            # Centroid (float32 blob) for incremental assignment
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(memory_clusters)")}
+            if "centroid" not in columns:
+                conn.execute("ALTER TABLE memory_clusters ADD COLUMN centroid BLOB")
+
             conn.commit()
 
     def cluster_memories(
         self,
         min_clusters: int = 3,
         max_clusters: int = 15,
-        min_memories: int = 10
+        min_memories: int = 10,
+        incremental: bool = False
     ) -> List[Cluster]:
         """
         Cluster all memories using K-means with automatic cluster count selection.
@@ -137,37 +161,44 @@ class MemoryClustering:
             min_clusters: Minimum number of clusters to try
             max_clusters: Maximum number of clusters to try
             min_memories: Minimum memories needed for clustering
+            incremental: Keep existing clusters and only assign memories that
+                         aren't clustered yet. Falls back to a full run when
+                         there are no stored centroids to build on.
 
         Returns:
-            List of created clusters with topic labels
+            List of clusters with topic labels (all clusters when incremental)
 
         Algorithm:
-            1. Get embeddings for all memories
-            2. Find optimal K using elbow method + silhouette score
-            3. Run K-means clustering
-            4. LLM generates topic label for each cluster
-            5. Store clusters and memberships
+            1. Get stored embeddings for all memories
+            2. Find optimal K with MiniBatchKMeans + sampled silhouette score
+            3. LLM generates topic label for each cluster
+            4. Store clusters, centroids and memberships (bulk insert)
         """
-        # Get all memories with embeddings
-        memories = self._get_all_memories_with_embeddings()
+        memories = self._list_memories()
+
+        if incremental and self._load_centroids():
+            current_ids = {m["id"] for m in memories}
+            self._drop_memberships_not_in(current_ids)
+            clustered = self._clustered_memory_ids()
+            new_memories = [m for m in memories if m["id"] not in clustered]
+            if self.add_memories(new_memories) is not None:
+                return self.get_all_clusters()
 
         if len(memories) < min_memories:
             return []
 
         # Extract embeddings and IDs
         memory_ids = [m["id"] for m in memories]
-        embeddings = np.array([m["embedding"] for m in memories])
+        embeddings = self._embed([m["content"] for m in memories])
 
-        # Find optimal number of clusters
-        optimal_k = self._find_optimal_clusters(
+        # Find optimal number of clusters (keeping the winning fit)
+        model = self._fit_best_model(
             embeddings,
             min_k=min_clusters,
             max_k=min(max_clusters, len(memories) // 3)  # At least 3 memories per cluster
         )
-
-        # Run K-means
-        kmeans = KMeans(n_clusters=optimal_k, random_state=42, n_init=10)
-        labels = kmeans.fit_predict(embeddings)
+        labels = model.labels_
+        centroids = model.cluster_centers_
 
         # Clear existing clusters
         self._clear_existing_clusters()
@@ -175,11 +206,14 @@ class MemoryClustering:
         # Create clusters and assign memories
         clusters = []
         now = int(datetime.now().timestamp())
+        similarities = self._cosine_to_centroids(embeddings, centroids[labels])
+        membership_rows = []
 
-        for cluster_idx in range(optimal_k):
+        for cluster_idx in range(model.n_clusters):
             # Get members of this cluster
             member_indices = np.where(labels == cluster_idx)[0]
-            member_ids = [memory_ids[i] for i in member_indices]
+            if len(member_indices) == 0:
+                continue
             member_contents = [memories[i]["content"] for i in member_indices]
 
             # Generate topic label via LLM
@@ -190,29 +224,92 @@ class MemoryClustering:
                 topic_label=topic_label,
                 keywords=keywords,
                 created_at=now,
-                member_count=len(member_ids)
+                member_count=len(member_indices),
+                centroid=centroids[cluster_idx]
             )
 
-            # Assign memberships
-            centroid = kmeans.cluster_centers_[cluster_idx]
-            for idx, memory_id in zip(member_indices, member_ids):
-                # Calculate similarity to centroid (cosine similarity)
-                similarity = self._cosine_similarity(
-                    embeddings[idx],
-                    centroid
-                )
-
-                self._add_membership(
-                    memory_id=memory_id,
-                    cluster_id=cluster.cluster_id,
-                    similarity_score=similarity,
-                    added_at=now
-                )
-
+            membership_rows.extend(
+                (memory_ids[i], cluster.cluster_id, float(similarities[i]), now)
+                for i in member_indices
+            )
             clusters.append(cluster)
 
+        self._add_memberships(membership_rows)
+
         return clusters
 
+    def add_memories(self, memories: List[Dict]) -> Optional[int]:
+        """
+        Assign memories to their nearest existing cluster immediately.
+
+        Each memory joins the cluster with the nearest centroid; centroids
+        then move by the mini-batch k-means update (running mean weighted by
+        the stored member counts), so clusters keep tracking their members
+        without a full re-cluster.
+
+        Args:
+            memories: List of {id, content} dicts
+
+        Returns:
+            Number of memories assigned, or None if there are no stored
+            centroids (or their dimension no longer matches) and a full
+            cluster_memories() run is needed instead.
+        """
+        state = self._load_centroids()
+        if not state:
+            return None
+        if not memories:
+            return 0
+
+        cluster_ids = list(state)
+        centroids = np.vstack([state[cid][0] for cid in cluster_ids]).astype(np.float64)
+        counts = np.array([state[cid][1] for cid in cluster_ids], dtype=np.float64)
+
+        embeddings = self._embed([m["content"] for m in memories]).astype(np.float64)
+        if embeddings.shape[1] != centroids.shape[1]:
+            return None
+
+        # Nearest centroid by squared Euclidean distance (the K-means objective)
+        distances = (
+            (embeddings ** 2).sum(axis=1)[:, None]
+            - 2 * embeddings @ centroids.T
+            + (centroids ** 2).sum(axis=1)[None, :]
+        )
+        labels = distances.argmin(axis=1)
+
+        # Mini-batch update: c_j += (sum(x) - n_j * c_j) / (count_j + n_j)
+        for j in np.unique(labels):
+            points = embeddings[labels == j]
+            counts[j] += len(points)
+            centroids[j] += (points.sum(axis=0) - len(points) * centroids[j]) / counts[j]
+
+        similarities = self._cosine_to_centroids(embeddings, centroids[labels])
+        now = int(datetime.now().timestamp())
+
+        with get_connection(self.db_path, write=True) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO cluster_memberships
+                (memory_id, cluster_id, similarity_score, added_at)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (m["id"], cluster_ids[label], float(sim), now)
+                for m, label, sim in zip(memories, labels, similarities)
+            ])
+            conn.executemany("""
+                UPDATE memory_clusters
+                SET centroid = ?,
+                    member_count = (SELECT COUNT(*) FROM cluster_memberships
+                                    WHERE cluster_id = memory_clusters.cluster_id),
+                    last_updated = ?
+                WHERE cluster_id = ?
+            """, [
+                (centroids[j].astype(np.float32).tobytes(), now, cluster_ids[j])
+                for j in np.unique(labels)
+            ])
+            conn.commit()
+
+        return len(memories)
+
     def get_cluster(self, cluster_id: int) -> Optional[Cluster]:
         """
         Get cluster by ID.
@@ -337,31 +434,78 @@ class MemoryClustering:
 
     # === Private helper methods ===
 
-    def _get_all_memories_with_embeddings(self) -> List[Dict]:
+    def _list_memories(self) -> List[Dict]:
         """
-        Get all memories with their embeddings.
+        Get all memories as {id, content} dicts.
 
-        Returns:
-            List of {id, content, embedding} dicts
+        Uses list() rather than search() so the scan isn't logged as
+        user access.
         """
-        # Use semantic search to get embeddings
-        # This leverages the existing embedding manager
         from memory_system.memory_ts_client import MemoryTSClient
 
-        client = MemoryTSClient()
-        all_memories = client.search()  # Get all memories
+        client = MemoryTSClient(enable_access_logging=False)
+        return [{"id": m.id, "content": m.content} for m in client.list()]
 
-        memories_with_embeddings = []
-        for mem in all_memories:
-            # Get embedding using semantic_search module
-            embedding = semantic_search.embed_text(mem.content)
-            memories_with_embeddings.append({
-                "id": mem.id,
-                "content": mem.content,
-                "embedding": embedding
-            })
+    def _embed(self, contents: List[str]) -> np.ndarray:
+        """Stored embeddings for contents (batch-computing any missing)."""
+        if self._embedding_manager is None:
+            from memory_system.embedding_manager import EmbeddingManager
+            self._embedding_manager = EmbeddingManager()
+        return np.asarray(self._embedding_manager.get_embeddings(contents))
 
-        return memories_with_embeddings
+    def _fit_best_model(
+        self,
+        embeddings: np.ndarray,
+        min_k: int = 3,
+        max_k: int = 15
+    ) -> MiniBatchKMeans:
+        """
+        Fit MiniBatchKMeans for each K and keep the best by silhouette score.
+
+        Silhouette is computed on a fixed random sample of at most
+        SILHOUETTE_SAMPLE_SIZE points, so selection cost stays bounded as
+        the store grows.
+
+        Args:
+            embeddings: Memory embeddings (N x D matrix)
+            min_k: Minimum clusters to try
+            max_k: Maximum clusters to try
+
+        Returns:
+            Fitted model with the best silhouette score
+        """
+        n = len(embeddings)
+        k_range = range(min_k, min(max_k + 1, n // 3))
+        if len(k_range) == 0:
+            k_range = range(max(1, min(min_k, n)), max(1, min(min_k, n)) + 1)
+
+        sample_size = SILHOUETTE_SAMPLE_SIZE if n > SILHOUETTE_SAMPLE_SIZE else None
+
+        best_model = None
+        best_score = -np.inf
+        for k in k_range:
+            model = MiniBatchKMeans(
+                n_clusters=k,
+                random_state=42,
+                n_init=3,
+                batch_size=MINIBATCH_SIZE
+            )
+            labels = model.fit_predict(embeddings)
+
+            # Silhouette score (only valid for 2 <= distinct labels < n)
+            if 2 <= len(np.unique(labels)) < n:
+                score = silhouette_score(
+                    embeddings, labels, sample_size=sample_size, random_state=42
+                )
+            else:
+                score = 0.0
+
+            # Simple heuristic: choose K with best silhouette score
+            if score > best_score:
+                best_score = score
+                best_model = model
+
+        return best_model
 
     def _find_optimal_clusters(
         self,
@@ -370,7 +514,7 @@ class MemoryClustering:
         max_k: int = 15
     ) -> int:
         """
-        Find optimal number of clusters using elbow method + silhouette score.
+        Find optimal number of clusters using sampled silhouette score.
 
         Args:
             embeddings: Memory embeddings (N x D matrix)
@@ -380,26 +524,43 @@ class MemoryClustering:
         Returns:
             Optimal K value
         """
-        inertias = []
-        silhouette_scores = []
-        k_range = range(min_k, min(max_k + 1, len(embeddings) // 3))
+        return self._fit_best_model(embeddings, min_k=min_k, max_k=max_k).n_clusters
 
-        for k in k_range:
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-            labels = kmeans.fit_predict(embeddings)
-            inertias.append(kmeans.inertia_)
-
-            # Silhouette score (only valid for k >= 2)
-            if k >= 2:
-                score = silhouette_score(embeddings, labels)
-                silhouette_scores.append(score)
-            else:
-                silhouette_scores.append(0.0)
-
-        # Simple heuristic: choose K with best silhouette score
-        # (more sophisticated: elbow detection algorithm)
-        best_idx = np.argmax(silhouette_scores)
-        return list(k_range)[best_idx]
+    def _load_centroids(self) -> Dict[int, Tuple[np.ndarray, int]]:
+        """Stored centroids as {cluster_id: (centroid, member_count)}; empty if any is missing."""
+        with get_connection(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT cluster_id, centroid, member_count FROM memory_clusters"
+            ).fetchall()
+
+        if not rows or any(row[1] is None for row in rows):
+            return {}
+        return {
+            row[0]: (np.frombuffer(row[1], dtype=np.float32), row[2])
+            for row in rows
+        }
+
+    def _clustered_memory_ids(self) -> set:
+        """IDs of memories that already have a cluster."""
+        with get_connection(self.db_path) as conn:
+            return {row[0] for row in conn.execute("SELECT memory_id FROM cluster_memberships")}
+
+    def _drop_memberships_not_in(self, memory_ids: set):
+        """Remove memberships of deleted/archived memories and refresh counts."""
+        stale = self._clustered_memory_ids() - memory_ids
+        if not stale:
+            return
+        with get_connection(self.db_path, write=True) as conn:
+            conn.executemany(
+                "DELETE FROM cluster_memberships WHERE memory_id = ?",
+                [(memory_id,) for memory_id in stale]
+            )
+            conn.execute("""
+                UPDATE memory_clusters
+                SET member_count = (SELECT COUNT(*) FROM cluster_memberships
+                                    WHERE cluster_id = memory_clusters.cluster_id)
+            """)
+            conn.commit()
 
     def _generate_topic_label(self, contents: List[str]) -> Tuple[str, List[str]]:
         """
@@ -446,9 +607,16 @@ Respond in JSON:
 
         return float(dot_product / (norm1 * norm2))
 
+    @staticmethod
+    def _cosine_to_centroids(embeddings: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Row-wise cosine similarity between each embedding and its centroid."""
+        dots = np.einsum("ij,ij->i", embeddings, centroids)
+        norms = np.linalg.norm(embeddings, axis=1) * np.linalg.norm(centroids, axis=1)
+        return np.divide(dots, norms, out=np.zeros_like(dots, dtype=np.float64), where=norms != 0)
+
     def _clear_existing_clusters(self):
         """Delete all existing clusters and memberships."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("DELETE FROM cluster_memberships")
             conn.execute("DELETE FROM memory_clusters")
             conn.commit()
@@ -458,15 +626,18 @@ Respond in JSON:
         topic_label: str,
         keywords: List[str],
         created_at: int,
-        member_count: int
+        member_count: int,
+        centroid: Optional[np.ndarray] = None
     ) -> Cluster:
         """Create a new cluster."""
-        with get_connection(self.db_path) as conn:
+        centroid_blob = None if centroid is None else np.asarray(centroid, dtype=np.float32).tobytes()
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute("""
                 INSERT INTO memory_clusters
-                (topic_label, keywords, created_at, last_updated, member_count)
-                VALUES (?, ?, ?, ?, ?)
-            """, (topic_label, json.dumps(keywords), created_at, created_at, member_count))
+                (topic_label, keywords, created_at, last_updated, member_count, centroid)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (topic_label, json.dumps(keywords), created_at, created_at, member_count,
+                  centroid_blob))
 
             cluster_id = cursor.lastrowid
             conn.commit()
@@ -488,7 +659,7 @@ Respond in JSON:
         added_at: int
     ):
         """Add memory to cluster."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO cluster_memberships
                 (memory_id, cluster_id, similarity_score, added_at)
@@ -496,3 +667,16 @@ Respond in JSON:
             """, (memory_id, cluster_id, similarity_score, added_at))
 
             conn.commit()
+
+    def _add_memberships(self, rows: List[Tuple[str, int, float, int]]):
+        """Add many (memory_id, cluster_id, similarity_score, added_at) rows in one transaction."""
+        if not rows:
+            return
+        with get_connection(self.db_path, write=True) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO cluster_memberships
+                (memory_id, cluster_id, similarity_score, added_at)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+
+            conn.commit()
@@ -60,9 +60,17 @@ class IntelligenceDB:
                     changed_by TEXT DEFAULT 'user',
                     change_reason TEXT,
                     timestamp INTEGER NOT NULL,
+                    delta BLOB,
+                    base_version INTEGER,
                     UNIQUE(memory_id, version)
                 )
             """)
+            # Delta columns for databases created before delta encoding
+            for column, col_type in (("delta", "BLOB"), ("base_version", "INTEGER")):
+                try:
+                    conn.execute(f"ALTER TABLE memory_versions ADD COLUMN {column} {col_type}")
+                except sqlite3.OperationalError:
+                    pass  # Column already exists
         conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_versions_memory
             ON memory_versions(memory_id, timestamp DESC)
@@ -79,7 +79,7 @@ class ReinforcementScheduler:
 
     def _init_schema(self):
         """Create review schedule tables"""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS review_schedule (
                     id TEXT PRIMARY KEY,
@@ -149,7 +149,7 @@ class ReinforcementScheduler:
         schedule_id = hashlib.md5(f"{memory_id}-schedule".encode()).hexdigest()[:16]
 
         # Check if already scheduled
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             existing = conn.execute(
                 "SELECT id FROM review_schedule WHERE memory_id = ?",
                 (memory_id,)
@@ -276,7 +276,7 @@ class ReinforcementScheduler:
 
         grade = grade.upper()
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             # Get current schedule
             row = conn.execute(
                 "SELECT id, due_at, review_count, difficulty, stability, next_interval_days FROM review_schedule WHERE memory_id = ?",
@@ -390,7 +390,7 @@ class ReinforcementScheduler:
         Raises:
             ValueError: If memory not scheduled
         """
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             # Check if scheduled
             row = conn.execute(
                 "SELECT id FROM review_schedule WHERE memory_id = ?",
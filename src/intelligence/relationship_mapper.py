@@ -59,7 +59,7 @@ class RelationshipMapper:
 
     def _init_schema(self):
         """Create relationship tables"""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS memory_relationships (
                     id TEXT PRIMARY KEY,
@@ -129,7 +129,7 @@ class RelationshipMapper:
         rel_id = hashlib.md5(id_source.encode()).hexdigest()[:16]
 
         # Insert (or ignore if duplicate)
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 INSERT OR IGNORE INTO memory_relationships
                 (id, from_memory_id, to_memory_id, relationship_type, strength, evidence, created_at)
@@ -294,7 +294,7 @@ class RelationshipMapper:
         Returns:
             True if relationship existed and was removed, False if didn't exist
         """
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute(
                 "DELETE FROM memory_relationships WHERE id = ?",
                 (rel_id,)
@@ -316,7 +316,7 @@ class RelationshipMapper:
         if not 0.0 <= new_strength <= 1.0:
             raise ValueError(f"Strength must be 0.0-1.0, got {new_strength}")
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute(
                 "UPDATE memory_relationships SET strength = ? WHERE id = ?",
                 (new_strength, rel_id)
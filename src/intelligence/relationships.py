@@ -86,7 +86,7 @@ class MemoryRelationships:
 
     def _init_db(self):
         """Create relationships table if it doesn't exist."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS memory_relationships (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -143,7 +143,7 @@ class MemoryRelationships:
         """
         now = int(datetime.now().timestamp())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute("""
                 INSERT INTO memory_relationships
                 (from_memory_id, to_memory_id, relationship_type, weight, created_at, auto_detected)
@@ -360,7 +360,7 @@ class MemoryRelationships:
         Returns:
             True if removed, False if not found
         """
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute("""
                 DELETE FROM memory_relationships
                 WHERE id = ?
@@ -4,7 +4,13 @@ Feature 28: Memory Search Optimization
 Optimizes memory search with caching and improved ranking.
 
 Features:
-- Query result caching with 24h TTL
+- Two-tier query result cache with 24h TTL: an in-process LRU of hydrated
+  results in front of the SQLite table of result IDs. Entries are tagged
+  with the memory store generation (a write counter bumped by every
+  MemoryTSClient create/update/archive, plus memory_dir's mtime), so
+  those writes make them misses instead of stale hits. Callers get their
+  own copies of cached Memory objects
+- Hit counters buffered in memory and written in batches (and at exit)
 - Improved ranking: semantic + keyword + recency + importance
 - Query analytics (foundation for future CTR learning)
 
@@ -18,9 +24,15 @@ Integration:
 - Works with Memory dataclass from memory_ts_client
 """
 
+import atexit
+import copy
 import sqlite3
 import hashlib
 import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -28,6 +40,33 @@ from typing import List, Optional, Dict
 
 from memory_system.config import cfg
 from memory_system.db_pool import get_connection
+from memory_system.memory_ts_client import generation_settled, store_generation
+
+CACHE_TTL_SECONDS = 86400        # 24 hours
+MEMORY_CACHE_SIZE = 256          # Hydrated result lists kept in-process
+HIT_FLUSH_BATCH = 100            # Flush buffered hit counts after this many hits
+HIT_FLUSH_INTERVAL = 30.0        # ...or after this many seconds
+
+
+def _flush_at_exit(optimizer_ref):
+    optimizer = optimizer_ref()
+    if optimizer is not None:
+        try:
+            optimizer.flush_hits()
+        except Exception:
+            pass  # Best effort: the counts are analytics only
+
+
+def _detach(results: List) -> List:
+    """Copies of results (list-valued fields too) that share no mutable state with the cache"""
+    copies = []
+    for item in results:
+        item = copy.copy(item)
+        for name, value in getattr(item, '__dict__', {}).items():
+            if isinstance(value, (list, dict, set)):
+                setattr(item, name, copy.copy(value))
+        copies.append(item)
+    return copies
 
 
 class SearchOptimizer:
@@ -41,17 +80,36 @@ class SearchOptimizer:
     - get_search_analytics(): Query statistics
     """
 
-    def __init__(self, db_path: str = None):
-        """Initialize optimizer with database"""
+    def __init__(self, db_path: str = None, memory_dir: Optional[Path] = None):
+        """
+        Initialize optimizer with database
+
+        Args:
+            db_path: intelligence.db path (defaults to cfg.intelligence_db_path)
+            memory_dir: Memory store that cached results come from (used for
+                        the store generation and hydration; defaults to the
+                        MemoryTSClient default)
+        """
         if db_path is None:
             db_path = cfg.intelligence_db_path
 
         self.db_path = str(db_path)
+        self.memory_dir = memory_dir
+
+        # query_hash -> (generation, expires_at, hydrated results)
+        self._memory_cache = OrderedDict()
+        # query_hash -> [hit count, last hit] not yet written to search_cache
+        self._pending_hits: Dict[str, list] = {}
+        self._pending_total = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
         self._init_schema()
+        atexit.register(_flush_at_exit, weakref.ref(self))
 
     def _init_schema(self):
         """Create search optimization tables"""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             # Cache table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS search_cache (
@@ -65,6 +123,11 @@ class SearchOptimizer:
                 )
             """)
 
+            # Store generation the cached IDs were computed at
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(search_cache)")}
+            if 'generation' not in columns:
+                conn.execute("ALTER TABLE search_cache ADD COLUMN generation INTEGER")
+
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_cache_hits
                 ON search_cache(hits DESC)
@@ -109,6 +172,10 @@ class SearchOptimizer:
         """
         Cache-aware search wrapper.
 
+        Lookups try the in-process LRU first, then the SQLite tier (whose
+        result IDs are hydrated once and promoted into the LRU). Both tiers
+        only answer for the current store generation.
+
         Args:
             query: Search query
             search_fn: Function to call for actual search (takes query)
@@ -122,73 +189,135 @@ class SearchOptimizer:
             return search_fn(query)
 
         # Generate cache key (include project_id for scoped caching)
-        cache_key = f"{query}|{project_id or 'global'}"
+        cache_key = self._cache_key(query, project_id)
         query_hash = hashlib.md5(cache_key.encode()).hexdigest()
 
-        # Check cache
+        generation = store_generation(self.memory_dir)
+        now = int(datetime.now().timestamp())
+
+        # Tier 1: hydrated results in this process
+        with self._lock:
+            entry = self._memory_cache.get(query_hash)
+            if entry is not None:
+                if entry[0] == generation and entry[1] > now:
+                    self._memory_cache.move_to_end(query_hash)
+                    self._record_hit(query_hash, now)
+                    results = _detach(entry[2])
+                else:
+                    del self._memory_cache[query_hash]
+                    results = None
+            else:
+                results = None
+        if results is not None:
+            self._maybe_flush_hits()
+            return results
+
+        # Tier 2: result IDs in SQLite
         with get_connection(self.db_path) as conn:
             row = conn.execute(
-                "SELECT results, expires_at FROM search_cache WHERE query_hash = ?",
+                "SELECT results, expires_at, generation FROM search_cache WHERE query_hash = ?",
                 (query_hash,)
             ).fetchone()
 
-            now = int(datetime.now().timestamp())
-
-            if row:
-                expires_at = row[1]
-
-                if expires_at > now:
-                    # Cache hit!
-                    conn.execute(
-                        "UPDATE search_cache SET hits = hits + 1, last_hit = ? WHERE query_hash = ?",
-                        (now, query_hash)
-                    )
-                    conn.commit()
-
-                    # Hydrate cached result IDs to Memory objects
-                    result_ids = json.loads(row[0])
-
-                    # Import MemoryTSClient for hydration
-                    try:
-                        from memory_system.memory_ts_client import MemoryTSClient
-                        client = MemoryTSClient()
-
-                        # Hydrate each ID, skip deleted memories
-                        hydrated_results = []
-                        for memory_id in result_ids:
-                            try:
-                                memory = client.get(memory_id)
-                                if memory:
-                                    hydrated_results.append(memory)
-                            except (FileNotFoundError, Exception):
-                                # Memory was deleted or doesn't exist, skip it
-                                continue
-
-                        return hydrated_results
-                    except ImportError:
-                        # Fallback for tests without actual memory storage
-                        # Return empty list (cache invalidated for missing memories)
-                        return []
+        if row and row[1] > now and row[2] == generation:
+            results = self._hydrate(json.loads(row[0]))
+            with self._lock:
+                self._remember(query_hash, generation, row[1], _detach(results))
+                self._record_hit(query_hash, now)
+            self._maybe_flush_hits()
+            return results
 
         # Cache miss - perform search
         results = search_fn(query)
 
-        # Cache if worthwhile (3-100 results)
-        if 3 <= len(results) <= 100:
+        # Cache if worthwhile (3-100 results) and no rename by another
+        # writer can still hide behind memory_dir's mtime
+        if 3 <= len(results) <= 100 and generation_settled(self.memory_dir):
             result_ids = [getattr(r, 'id', str(r)) for r in results]
             results_json = json.dumps(result_ids)
-            expires_at = now + 86400  # 24 hours
+            expires_at = now + CACHE_TTL_SECONDS
 
-            with get_connection(self.db_path) as conn:
+            with get_connection(self.db_path, write=True) as conn:
                 conn.execute("""
                     INSERT OR REPLACE INTO search_cache
-                    (query_hash, query, results, hits, last_hit, created_at, expires_at)
-                    VALUES (?, ?, ?, 1, ?, ?, ?)
-                """, (query_hash, cache_key, results_json, now, now, expires_at))
+                    (query_hash, query, results, hits, last_hit, created_at, expires_at, generation)
+                    VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+                """, (query_hash, cache_key, results_json, now, now, expires_at, generation))
                 conn.commit()
 
+            with self._lock:
+                # The new row starts at hits = 1; drop counts for the row it replaced
+                self._pending_hits.pop(query_hash, None)
+                self._remember(query_hash, generation, expires_at, _detach(results))
+
         return results
 
+    @staticmethod
+    def _cache_key(query: str, project_id: Optional[str]) -> str:
+        return f"{query}|{project_id or 'global'}"
+
+    def _hydrate(self, result_ids: List[str]) -> List:
+        """Load cached result IDs as Memory objects, skipping deleted ones"""
+        try:
+            from memory_system.memory_ts_client import MemoryTSClient
+        except ImportError:
+            # Fallback for tests without actual memory storage
+            return []
+
+        # Cache hits are not user accesses; don't log each hydrated read
+        client = MemoryTSClient(memory_dir=self.memory_dir, enable_access_logging=False)
+
+        hydrated_results = []
+        for memory_id in result_ids:
+            try:
+                memory = client.get(memory_id)
+                if memory:
+                    hydrated_results.append(memory)
+            except Exception:
+                # Memory was deleted or doesn't exist, skip it
+                continue
+        return hydrated_results
+
+    def _remember(self, query_hash: str, generation: int, expires_at: int, results: List):
+        """Put hydrated results in the LRU (caller holds self._lock)"""
+        self._memory_cache[query_hash] = (generation, expires_at, results)
+        self._memory_cache.move_to_end(query_hash)
+        while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+
+    def _record_hit(self, query_hash: str, now: int):
+        """Buffer one hit for query_hash (caller holds self._lock)"""
+        pending = self._pending_hits.get(query_hash)
+        if pending is None:
+            self._pending_hits[query_hash] = [1, now]
+        else:
+            pending[0] += 1
+            pending[1] = now
+        self._pending_total += 1
+
+    def _maybe_flush_hits(self):
+        if (self._pending_total >= HIT_FLUSH_BATCH
+                or time.monotonic() - self._last_flush >= HIT_FLUSH_INTERVAL):
+            self.flush_hits()
+
+    def flush_hits(self):
+        """Write buffered hit counts to search_cache in one transaction"""
+        with self._lock:
+            pending, self._pending_hits = self._pending_hits, {}
+            self._pending_total = 0
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return
+
+        with get_connection(self.db_path, write=True) as conn:
+            conn.executemany(
+                "UPDATE search_cache SET hits = hits + ?, last_hit = MAX(COALESCE(last_hit, 0), ?) "
+                "WHERE query_hash = ?",
+                [(count, last_hit, query_hash) for query_hash, (count, last_hit) in pending.items()]
+            )
+            conn.commit()
+
     def rank_results(
         self,
         results: List,
@@ -266,7 +395,7 @@ class SearchOptimizer:
 
         now = int(datetime.now().timestamp())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 INSERT INTO search_analytics
                 (id, query, result_count, selected_memory_id, position, created_at)
@@ -285,6 +414,7 @@ class SearchOptimizer:
             dict with total_searches, avg_results, cache_hit_rate, top_queries
         """
         cutoff = int((datetime.now() - timedelta(days=days)).timestamp())
+        self.flush_hits()
 
         with get_connection(self.db_path) as conn:
             # Total searches
@@ -340,11 +470,15 @@ class SearchOptimizer:
             query: Specific query to invalidate (if None, clears expired)
             project_id: Optional project filter (must match cache key format)
         """
-        with get_connection(self.db_path) as conn:
+        self.flush_hits()
+
+        with get_connection(self.db_path, write=True) as conn:
             if query:
                 # Invalidate specific query (use same composite key as storage)
-                cache_key = f"{query}|{project_id or 'global'}"
+                cache_key = self._cache_key(query, project_id)
                 query_hash = hashlib.md5(cache_key.encode()).hexdigest()
+                with self._lock:
+                    self._memory_cache.pop(query_hash, None)
                 conn.execute(
                     "DELETE FROM search_cache WHERE query_hash = ?",
                     (query_hash,)
@@ -352,6 +486,9 @@ class SearchOptimizer:
             else:
                 # Clean up expired entries
                 now = int(datetime.now().timestamp())
+                with self._lock:
+                    for key in [k for k, v in self._memory_cache.items() if v[1] < now]:
+                        del self._memory_cache[key]
                 conn.execute(
                     "DELETE FROM search_cache WHERE expires_at < ?",
                     (now,)
@@ -366,6 +503,8 @@ class SearchOptimizer:
         Returns:
             dict with total_entries, total_hits, hit_rate, most_popular
         """
+        self.flush_hits()
+
         with get_connection(self.db_path) as conn:
             total_entries = conn.execute(
                 "SELECT COUNT(*) FROM search_cache"
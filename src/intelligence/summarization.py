@@ -33,7 +33,7 @@ from memory_system.memory_ts_client import Memory, MemoryTSClient
 def _ask_claude(prompt: str, model: str = "sonnet", temperature: float = 0.3, timeout: int = 30) -> str:
     """Wrapper for LLM calls."""
     from memory_system import llm_extractor
-    return llm_extractor.ask_claude(prompt, timeout=timeout)
+    return llm_extractor.ask_claude(prompt, timeout=timeout, site="summarization")
 
 
 # ── Data classes ──────────────────────────────────────────────────────────────
@@ -91,7 +91,7 @@ class MemorySummarizer:
 
     def _init_topic_table(self):
         """Ensure topic summaries table exists."""
-        with get_connection(self.intel_db.db_path) as conn:
+        with get_connection(self.intel_db.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS summaries (
                     summary_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -332,7 +332,7 @@ class MemorySummarizer:
 
     def delete_summary(self, summary_id: str) -> bool:
         """Delete a cluster/project/period summary."""
-        with get_connection(self.intel_db.db_path) as conn:
+        with get_connection(self.intel_db.db_path, write=True) as conn:
             cursor = conn.execute(
                 "DELETE FROM memory_summaries WHERE id = ?", (summary_id,)
             )
@@ -536,7 +536,7 @@ Format as JSON:
         summary_id = str(uuid.uuid4())
         now = int(datetime.now().timestamp())
 
-        with get_connection(self.intel_db.db_path) as conn:
+        with get_connection(self.intel_db.db_path, write=True) as conn:
             conn.execute(
                 """INSERT INTO memory_summaries
                    (id, summary_type, target_id, period_start, period_end, summary, memory_count, created_at)
@@ -577,7 +577,7 @@ Format as JSON:
     def _save_topic_summary(self, summary: TopicSummary) -> TopicSummary:
         """Persist a topic summary and return it with assigned ID."""
         now = int(time.time())
-        with get_connection(self.intel_db.db_path) as conn:
+        with get_connection(self.intel_db.db_path, write=True) as conn:
             cursor = conn.execute(
                 """INSERT INTO summaries
                    (topic, narrative, timeline, key_insights, memory_count, memory_ids, created_at)
@@ -3,6 +3,12 @@ Memory versioning - Track memory evolution over time (Feature 23)
 
 Store edit history for each memory, enable rollback, diff view, and
 "why did this change?" queries.
+
+The newest version of each memory and every KEYFRAME_INTERVAL-th version
+are stored in full; the rest store a compressed delta (content = '')
+against their nearest earlier full row, so get_version() is at most two
+row reads and get_latest_version() stays one.  compact_history() converts
+histories written before delta encoding.
 """
 
 import time
@@ -10,9 +16,17 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+from memory_system.memory_versioning import KEYFRAME_INTERVAL, apply_delta, make_delta
+
 from .database import IntelligenceDB
 
 
+_COLUMNS = (
+    "version, memory_id, content, importance, changed_by, change_reason, "
+    "timestamp, delta, base_version"
+)
+
+
 @dataclass
 class MemoryVersion:
     """A specific version of a memory"""
@@ -68,24 +82,28 @@ class MemoryVersioning:
         """
         timestamp = int(time.time())
 
-        # Get next version number
         conn = self.db._connect()
-        cursor = conn.execute(
-            "SELECT MAX(version) FROM memory_versions WHERE memory_id = ?",
-            (memory_id,)
-        )
-        max_version = cursor.fetchone()[0]
-        version = (max_version or 0) + 1
-
-        # Insert new version
-        conn.execute(
-            """INSERT INTO memory_versions
-               (memory_id, version, content, importance, changed_by, change_reason, timestamp)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (memory_id, version, content, importance, changed_by, change_reason, timestamp)
-        )
-        conn.commit()
-        conn.close()
+        try:
+            # Current head (always stored in full) gives the next version number
+            head = conn.execute(
+                "SELECT version, content FROM memory_versions "
+                "WHERE memory_id = ? ORDER BY version DESC LIMIT 1",
+                (memory_id,)
+            ).fetchone()
+            version = (head[0] if head else 0) + 1
+
+            # Insert new version
+            conn.execute(
+                """INSERT INTO memory_versions
+                   (memory_id, version, content, importance, changed_by, change_reason, timestamp)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (memory_id, version, content, importance, changed_by, change_reason, timestamp)
+            )
+            if head:
+                self._compact_version(conn, memory_id, head[0], head[1])
+            conn.commit()
+        finally:
+            conn.close()
 
         return MemoryVersion(
             version=version,
@@ -97,43 +115,148 @@ class MemoryVersioning:
             timestamp=timestamp
         )
 
-    def get_version_history(self, memory_id: str) -> List[MemoryVersion]:
+    def _compact_version(self, conn, memory_id: str, version: int, content: str) -> bool:
         """
-        Get all versions of a memory, sorted oldest to newest
+        Re-encode a full row as a delta against the nearest earlier full row.
 
-        Args:
-            memory_id: Memory identifier
+        The row stays full (becoming a keyframe) when it is the first
+        version, KEYFRAME_INTERVAL or more versions from that row, or when
+        the delta would not be smaller.
 
         Returns:
-            List of MemoryVersion objects
+            True if the row was converted
         """
-        conn = self.db._connect()
-        cursor = conn.execute(
-            """SELECT version, memory_id, content, importance, changed_by, change_reason, timestamp
-               FROM memory_versions
-               WHERE memory_id = ?
-               ORDER BY version ASC""",
-            (memory_id,)
+        base = conn.execute(
+            """SELECT version, content FROM memory_versions
+               WHERE memory_id = ? AND version < ? AND delta IS NULL
+               ORDER BY version DESC LIMIT 1""",
+            (memory_id, version)
+        ).fetchone()
+        if base is None or version - base[0] >= KEYFRAME_INTERVAL:
+            return False
+
+        delta = make_delta(base[1], content)
+        if len(delta) >= len(content.encode()):
+            return False
+
+        conn.execute(
+            "UPDATE memory_versions SET content = '', delta = ?, base_version = ? "
+            "WHERE memory_id = ? AND version = ?",
+            (delta, base[0], memory_id, version)
         )
-        versions = [
-            MemoryVersion(
+        return True
+
+    def _materialize(self, conn, rows) -> List[MemoryVersion]:
+        """Build MemoryVersion objects from _COLUMNS rows, decoding deltas."""
+        full = {(row[1], row[0]): row[2] for row in rows if row[7] is None}
+        versions = []
+        for row in rows:
+            content = row[2]
+            if row[7] is not None:
+                key = (row[1], row[8])
+                if key not in full:
+                    full[key] = conn.execute(
+                        "SELECT content FROM memory_versions WHERE memory_id = ? AND version = ?",
+                        key
+                    ).fetchone()[0]
+                content = apply_delta(full[key], row[7])
+            versions.append(MemoryVersion(
                 version=row[0],
                 memory_id=row[1],
-                content=row[2],
+                content=content,
                 importance=row[3],
                 changed_by=row[4],
                 change_reason=row[5],
                 timestamp=row[6]
-            )
-            for row in cursor.fetchall()
-        ]
-        conn.close()
+            ))
         return versions
 
+    def compact_history(self, memory_id: Optional[str] = None, dry_run: bool = False) -> Dict:
+        """
+        Convert full-content histories to keyframes plus deltas.
+
+        Migration for histories written before delta encoding; safe to
+        re-run.  Rows that are already deltas, or that deltas are based on,
+        are left alone.
+
+        Args:
+            memory_id: Compact one memory (default: all)
+            dry_run: Report what would change without writing
+
+        Returns:
+            Dict with memories, converted, bytes_before and bytes_after
+        """
+        stats = {'memories': 0, 'converted': 0, 'bytes_before': 0, 'bytes_after': 0}
+        conn = self.db._connect()
+        try:
+            if memory_id is None:
+                memory_ids = [row[0] for row in conn.execute(
+                    "SELECT DISTINCT memory_id FROM memory_versions"
+                )]
+            else:
+                memory_ids = [memory_id]
+
+            for mid in memory_ids:
+                rows = conn.execute(
+                    """SELECT version, content, delta, base_version FROM memory_versions
+                       WHERE memory_id = ? ORDER BY version ASC""",
+                    (mid,)
+                ).fetchall()
+                if not rows:
+                    continue
+                stats['memories'] += 1
+                bases = {row[3] for row in rows if row[2] is not None}
+
+                for version, content, delta, _ in rows[:-1]:  # head stays full
+                    if delta is not None or version in bases:
+                        continue
+                    size = len(content.encode())
+                    stats['bytes_before'] += size
+                    if self._compact_version(conn, mid, version, content):
+                        stats['converted'] += 1
+                        size = len(conn.execute(
+                            "SELECT delta FROM memory_versions WHERE memory_id = ? AND version = ?",
+                            (mid, version)
+                        ).fetchone()[0])
+                    stats['bytes_after'] += size
+
+                if dry_run:
+                    conn.rollback()
+                else:
+                    conn.commit()
+        finally:
+            conn.close()
+        return stats
+
+    def get_version_history(self, memory_id: str) -> List[MemoryVersion]:
+        """
+        Get all versions of a memory, sorted oldest to newest
+
+        Args:
+            memory_id: Memory identifier
+
+        Returns:
+            List of MemoryVersion objects
+        """
+        conn = self.db._connect()
+        try:
+            rows = conn.execute(
+                f"""SELECT {_COLUMNS}
+                   FROM memory_versions
+                   WHERE memory_id = ?
+                   ORDER BY version ASC""",
+                (memory_id,)
+            ).fetchall()
+            return self._materialize(conn, rows)
+        finally:
+            conn.close()
+
     def get_version(self, memory_id: str, version_number: int) -> Optional[MemoryVersion]:
         """
         Get a specific version of a memory
 
+        Delta rows are rebuilt from their keyframe.
+
         Args:
             memory_id: Memory identifier
             version_number: Version to retrieve
@@ -142,27 +265,18 @@ class MemoryVersioning:
             MemoryVersion object or None if not found
         """
         conn = self.db._connect()
-        cursor = conn.execute(
-            """SELECT version, memory_id, content, importance, changed_by, change_reason, timestamp
-               FROM memory_versions
-               WHERE memory_id = ? AND version = ?""",
-            (memory_id, version_number)
-        )
-        row = cursor.fetchone()
-        conn.close()
-
-        if row is None:
-            return None
-
-        return MemoryVersion(
-            version=row[0],
-            memory_id=row[1],
-            content=row[2],
-            importance=row[3],
-            changed_by=row[4],
-            change_reason=row[5],
-            timestamp=row[6]
-        )
+        try:
+            rows = conn.execute(
+                f"""SELECT {_COLUMNS}
+                   FROM memory_versions
+                   WHERE memory_id = ? AND version = ?""",
+                (memory_id, version_number)
+            ).fetchall()
+            versions = self._materialize(conn, rows)
+        finally:
+            conn.close()
+
+        return versions[0] if versions else None
 
     def get_latest_version(self, memory_id: str) -> Optional[MemoryVersion]:
         """
@@ -175,29 +289,20 @@ class MemoryVersioning:
             MemoryVersion object or None if no versions exist
         """
         conn = self.db._connect()
-        cursor = conn.execute(
-            """SELECT version, memory_id, content, importance, changed_by, change_reason, timestamp
-               FROM memory_versions
-               WHERE memory_id = ?
-               ORDER BY version DESC
-               LIMIT 1""",
-            (memory_id,)
-        )
-        row = cursor.fetchone()
-        conn.close()
-
-        if row is None:
-            return None
-
-        return MemoryVersion(
-            version=row[0],
-            memory_id=row[1],
-            content=row[2],
-            importance=row[3],
-            changed_by=row[4],
-            change_reason=row[5],
-            timestamp=row[6]
-        )
+        try:
+            rows = conn.execute(
+                f"""SELECT {_COLUMNS}
+                   FROM memory_versions
+                   WHERE memory_id = ?
+                   ORDER BY version DESC
+                   LIMIT 1""",
+                (memory_id,)
+            ).fetchall()
+            versions = self._materialize(conn, rows)
+        finally:
+            conn.close()
+
+        return versions[0] if versions else None
 
     def diff_versions(
         self,
@@ -318,24 +423,14 @@ class MemoryVersioning:
             List of MemoryVersion objects, most recent first
         """
         conn = self.db._connect()
-        cursor = conn.execute(
-            """SELECT version, memory_id, content, importance, changed_by, change_reason, timestamp
-               FROM memory_versions
-               ORDER BY timestamp DESC
-               LIMIT ?""",
-            (limit,)
-        )
-        versions = [
-            MemoryVersion(
-                version=row[0],
-                memory_id=row[1],
-                content=row[2],
-                importance=row[3],
-                changed_by=row[4],
-                change_reason=row[5],
-                timestamp=row[6]
-            )
-            for row in cursor.fetchall()
-        ]
-        conn.close()
-        return versions
+        try:
+            rows = conn.execute(
+                f"""SELECT {_COLUMNS}
+                   FROM memory_versions
+                   ORDER BY timestamp DESC
+                   LIMIT ?""",
+                (limit,)
+            ).fetchall()
+            return self._materialize(conn, rows)
+        finally:
+            conn.close()
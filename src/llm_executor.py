@@ -0,0 +1,383 @@
+"""
+Bounded-concurrency async LLM executor
+
+Runs `claude -p` calls with asyncio.create_subprocess_exec instead of
+blocking subprocess.run, with at most max_concurrency subprocesses in
+flight. Every call goes through a circuit breaker (fails fast while the
+LLM is down) and, when the shared LLM gateway has a response cache, reads
+and writes that cache.
+
+Many small yes/no style judgments (DUPLICATE/UPDATE/NEW,
+CONTRADICTS/COMPATIBLE) can be packed into one numbered prompt. The answers
+are parsed back out per item, so 30 consolidation decisions cost one or two
+CLI calls instead of 30 sequential ones.
+
+Usage:
+    from memory_system.llm_executor import get_executor
+
+    executor = get_executor()
+    answers = executor.judge_sync(
+        items=["New: A\nExisting: B", ...],
+        choices=["CONTRADICTS", "COMPATIBLE"],
+        instruction="For each pair, does the new fact contradict the existing one?",
+    )
+
+    # From async code
+    responses = await executor.run_many(prompts)
+    batcher = JudgmentBatcher(executor, instruction, choices)
+    answer = await batcher.ask(item)  # batched with other concurrent asks
+
+Failures never raise: run() returns "" and judgments come back as None, so
+callers apply their own fallback (same contract as ask_claude).
+"""
+
+import asyncio
+import json
+import re
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Optional, Sequence, Set, Tuple
+
+from . import metrics
+from .circuit_breaker import get_breaker
+from .llm_gateway import LLMCallError, cache_key, get_gateway
+
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_BATCH_SIZE = 20  # Judgments per packed prompt
+
+
+async def _run_claude_cli(prompt: str, timeout: float) -> str:
+    """
+    Run `claude -p <prompt>` as an asyncio subprocess.
+
+    Raises:
+        LLMCallError: CLI exited non-zero
+        asyncio.TimeoutError: CLI exceeded timeout (process is killed)
+        FileNotFoundError: CLI not installed
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "claude", "-p", prompt,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    if proc.returncode != 0:
+        raise LLMCallError(f"Claude CLI returned {proc.returncode}")
+    return stdout.decode(errors="replace").strip()
+
+
+def build_judgment_prompt(instruction: str, items: Sequence[str], choices: Sequence[str]) -> str:
+    """
+    Pack numbered items into one prompt asking for a JSON object of answers.
+
+    Args:
+        instruction: What to decide for each item
+        items: Item texts (may be multi-line)
+        choices: Allowed answers (e.g. ["DUPLICATE", "UPDATE", "NEW"])
+
+    Returns:
+        Prompt string ready for claude -p
+    """
+    allowed = ", ".join(choices)
+    numbered = "\n\n".join(f"[{i}]\n{item}" for i, item in enumerate(items, 1))
+    example = ", ".join(f'"{i}": "{choices[0]}"' for i in range(1, min(len(items), 2) + 1))
+
+    return f"""{instruction}
+
+Answer each numbered item with exactly one of: {allowed}
+
+{numbered}
+
+Return ONLY a JSON object mapping every item number to its answer:
+{{{example}}}"""
+
+
+def parse_judgments(response: str, count: int, choices: Sequence[str]) -> List[Optional[str]]:
+    """
+    Parse answers for a packed judgment prompt.
+
+    Accepts a JSON object ({"1": "NEW", ...}), optionally in a ```json fence,
+    or one "1: NEW" / "[1] NEW" answer per line. An answer whose leading
+    word is a choice takes that choice ("NEW, not a DUPLICATE" -> NEW);
+    otherwise it must name exactly one choice as a whole word, so
+    "INCOMPATIBLE" never reads as COMPATIBLE and hedged answers are dropped.
+
+    Returns:
+        Answer per item (None where missing or unrecognised)
+    """
+    answers: List[Optional[str]] = [None] * count
+    if not response or not response.strip():
+        return answers
+
+    text = response.strip()
+    if text.startswith("```"):
+        text = re.sub(r'^```(?:json)?\s*\n?', '', text)
+        text = re.sub(r'\n?```\s*$', '', text)
+
+    raw = {}
+    try:
+        data = json.loads(text)
+        if isinstance(data, dict):
+            raw = {str(k): str(v) for k, v in data.items()}
+        elif isinstance(data, list):
+            raw = {str(i): str(v) for i, v in enumerate(data, 1)}
+    except json.JSONDecodeError:
+        for match in re.finditer(r'^\s*\[?(\d+)\]?\s*[.:)\-]?\s*(.+)$', text, re.MULTILINE):
+            raw.setdefault(match.group(1), match.group(2))
+
+    for number, value in raw.items():
+        if not number.isdigit() or not 1 <= int(number) <= count:
+            continue
+        answers[int(number) - 1] = _match_choice(value, choices)
+
+    return answers
+
+
+def _match_choice(value: str, choices: Sequence[str]) -> Optional[str]:
+    """The choice an answer names (see parse_judgments), or None"""
+    upper = value.upper()
+    leading = re.match(r'\W*(\w+)', upper)
+    for choice in choices:
+        if leading and leading.group(1) == choice.upper():
+            return choice
+
+    named = [
+        choice for choice in choices
+        if re.search(rf'(?<!\w){re.escape(choice.upper())}(?!\w)', upper)
+    ]
+    return named[0] if len(named) == 1 else None
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run, or a worker thread when this thread already has a
+    running event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+class AsyncLLMExecutor:
+    """
+    Runs LLM prompts concurrently with a bounded number of subprocesses.
+
+    Args:
+        max_concurrency: Maximum CLI subprocesses in flight
+        breaker_name: Circuit breaker guarding these calls
+        runner: async (prompt, timeout) -> str; defaults to the claude CLI
+                (inject a fake for offline tests)
+        use_gateway_cache: Read/write the shared gateway's response cache
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        breaker_name: str = "llm_async",
+        runner: Optional[Callable[[str, float], Awaitable[str]]] = None,
+        use_gateway_cache: bool = True,
+    ):
+        self.max_concurrency = max_concurrency
+        self.breaker = get_breaker(breaker_name, failure_threshold=3, recovery_timeout=60.0)
+        self.runner = runner if runner is not None else _run_claude_cli
+        self.use_gateway_cache = use_gateway_cache
+
+        # asyncio primitives bind to one event loop; keep a semaphore per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(self, prompt: str, timeout: float = 30) -> str:
+        """
+        Run one prompt.
+
+        Returns:
+            Response text (empty string on failure or while the breaker is open)
+        """
+        cache = get_gateway().cache if self.use_gateway_cache else None
+        key = cache_key(prompt)
+
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.breaker.is_open:
+            return ""
+
+        async with self._semaphore():
+            try:
+                with metrics.timer("llm.async_backend"):
+                    response = await self.runner(prompt, timeout)
+            except FileNotFoundError:
+                # CLI not installed - install issue, don't trip breaker
+                return ""
+            except Exception:
+                self.breaker.record_failure()
+                return ""
+
+        self.breaker.record_success()
+        if cache is not None and response:
+            cache.put(key, None, response)
+        return response
+
+    async def run_many(self, prompts: Sequence[str], timeout: float = 30) -> List[str]:
+        """Run prompts concurrently (bounded by max_concurrency), results in input order."""
+        return list(await asyncio.gather(*(self.run(p, timeout) for p in prompts)))
+
+    async def judge(
+        self,
+        items: Sequence[str],
+        choices: Sequence[str],
+        instruction: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        timeout: float = 60,
+    ) -> List[Optional[str]]:
+        """
+        Decide many items with packed prompts (batch_size items per prompt).
+
+        Batches run concurrently. Returns one answer per item, in input
+        order; None where the LLM failed or gave no recognisable answer.
+        """
+        batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+        responses = await self.run_many(
+            [build_judgment_prompt(instruction, batch, choices) for batch in batches],
+            timeout=timeout,
+        )
+
+        answers: List[Optional[str]] = []
+        for batch, response in zip(batches, responses):
+            answers.extend(parse_judgments(response, len(batch), choices))
+        return answers
+
+    def run_many_sync(self, prompts: Sequence[str], timeout: float = 30) -> List[str]:
+        """Blocking run_many for synchronous callers."""
+        return _run_sync(self.run_many(prompts, timeout))
+
+    def judge_sync(
+        self,
+        items: Sequence[str],
+        choices: Sequence[str],
+        instruction: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        timeout: float = 60,
+    ) -> List[Optional[str]]:
+        """Blocking judge for synchronous callers."""
+        if not items:
+            return []
+        return _run_sync(self.judge(items, choices, instruction, batch_size, timeout))
+
+
+class JudgmentBatcher:
+    """
+    Collects concurrent single-item judgments into packed prompts.
+
+    Each ask() waits until max_batch items are pending or max_wait seconds
+    pass, then the whole batch goes out as one prompt and each caller gets
+    its own answer back.
+
+    Args:
+        executor: AsyncLLMExecutor to run batches on
+        instruction: What to decide for each item
+        choices: Allowed answers
+        max_batch: Items per packed prompt
+        max_wait: Seconds to wait for more items before flushing
+        timeout: CLI timeout per batch
+    """
+
+    def __init__(
+        self,
+        executor: AsyncLLMExecutor,
+        instruction: str,
+        choices: Sequence[str],
+        max_batch: int = DEFAULT_BATCH_SIZE,
+        max_wait: float = 0.05,
+        timeout: float = 60,
+    ):
+        self.executor = executor
+        self.instruction = instruction
+        self.choices = list(choices)
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.timeout = timeout
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # The loop only holds weak references to tasks; keep in-flight batches alive
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def ask(self, item: str) -> Optional[str]:
+        """Queue one item and wait for its answer (None on failure)."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: List[Tuple[str, asyncio.Future]]):
+        items = [item for item, _ in batch]
+        try:
+            answers = await self.executor.judge(
+                items, self.choices, self.instruction,
+                batch_size=len(items), timeout=self.timeout,
+            )
+        except Exception:
+            answers = [None] * len(items)
+        for (_, future), answer in zip(batch, answers):
+            if not future.done():
+                future.set_result(answer)
+
+
+# ---------------------------------------------------------------------------
+# Module-level default executor
+# ---------------------------------------------------------------------------
+
+_executor: Optional[AsyncLLMExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> AsyncLLMExecutor:
+    """Get the shared executor (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = AsyncLLMExecutor()
+        return _executor
+
+
+def set_executor(executor: Optional[AsyncLLMExecutor]):
+    """Replace the shared executor (None = recreate default on next use)."""
+    global _executor
+    with _executor_lock:
+        _executor = executor
@@ -12,7 +12,9 @@ import re
 import subprocess
 from typing import List, Optional
 
+from . import metrics
 from .circuit_breaker import get_breaker, CircuitBreakerOpenError
+from .llm_gateway import get_gateway, LLMCallError
 from .session_consolidator import SessionMemory
 
 
@@ -130,7 +132,8 @@ def extract_with_llm(
     """
     Extract memories using Claude Code CLI
 
-    Generates prompt, calls claude -p, parses response.
+    Generates prompt, calls claude -p (through the shared LLM gateway, so an
+    identical conversation is answered from cache), parses response.
     Falls back to empty list on any failure.
 
     Args:
@@ -145,15 +148,8 @@ def extract_with_llm(
     breaker = get_breaker("llm_extraction", failure_threshold=3, recovery_timeout=60.0)
 
     def _run_extraction():
-        result = subprocess.run(
-            ["claude", "-p", prompt],
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Claude CLI returned {result.returncode}")
-        return parse_llm_response(result.stdout, project_id=project_id)
+        response = get_gateway().complete(prompt, site="llm_extraction", timeout=timeout)
+        return parse_llm_response(response, project_id=project_id)
 
     try:
         return breaker.call(_run_extraction)
@@ -168,7 +164,8 @@ def extract_with_llm(
         return []
 
 
-def ask_claude(prompt: str, timeout: int = 30, max_retries: int = 3) -> str:
+@metrics.timed("llm.ask_claude")
+def ask_claude(prompt: str, timeout: int = 30, max_retries: int = 3, site: str = "ask_claude") -> str:
     """
     Simple helper to ask Claude CLI a question and get a text response.
 
@@ -178,12 +175,15 @@ def ask_claude(prompt: str, timeout: int = 30, max_retries: int = 3) -> str:
     - Timeout increases with each retry: initial timeout, then +10s, then +20s
     - Circuit breaker: Fails fast when LLM is consistently unavailable
 
-    Used for daily summaries, synthesis, ad-hoc LLM queries.
+    Used for daily summaries, synthesis, ad-hoc LLM queries. Calls go through
+    the shared LLM gateway, so repeated prompts are served from its cache and
+    identical concurrent prompts share one CLI call.
 
     Args:
         prompt: Question or task for Claude
         timeout: Initial CLI timeout in seconds (increases with retries)
         max_retries: Maximum retry attempts (default: 3)
+        site: Call site name for gateway metrics
 
     Returns:
         Claude's response text (empty string on all failures)
@@ -203,17 +203,11 @@ def ask_claude(prompt: str, timeout: int = 30, max_retries: int = 3) -> str:
         current_timeout = timeout + timeout_increases[min(attempt, len(timeout_increases) - 1)]
 
         try:
-            result = subprocess.run(
-                ["claude", "-p", prompt],
-                capture_output=True,
-                text=True,
-                timeout=current_timeout
-            )
-
-            if result.returncode == 0:
-                breaker.record_success()
-                return result.stdout.strip()
+            response = get_gateway().complete(prompt, site=site, timeout=current_timeout)
+            breaker.record_success()
+            return response
 
+        except LLMCallError:
             # Non-zero return code
             if attempt < max_retries - 1:
                 delay = retry_delays[min(attempt, len(retry_delays) - 1)]
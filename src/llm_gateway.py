@@ -0,0 +1,451 @@
+"""
+Shared gateway for LLM calls (claude -p)
+
+Every LLM call site (ask_claude, ask_claude_quick, extract_with_llm,
+clustering topic labels, summarization) goes through one gateway that adds:
+
+  - Response cache: content-addressed (sha256 of model + prompt), with a TTL
+    and a size bound, persisted in SQLite so re-running consolidation, dedup
+    or contradiction checks on identical prompts is instant
+  - Request coalescing: identical prompts in flight at the same time share
+    a single backend call instead of spawning one subprocess each
+  - Per-call-site metrics: hits, misses, coalesced waits, errors, latency
+
+The backend is pluggable. ClaudeCLIBackend runs `claude -p`; FakeBackend
+answers from a dict or callable so the whole layer is testable offline.
+
+Errors from the backend propagate unchanged, so call sites keep their own
+retry and circuit breaker handling. Failures and empty responses are never
+cached.
+
+Usage:
+    from memory_system.llm_gateway import get_gateway
+
+    response = get_gateway().complete(prompt, site="contradiction", timeout=10)
+
+    # Tests
+    from memory_system.llm_gateway import LLMGateway, FakeBackend, set_gateway
+    set_gateway(LLMGateway(backend=FakeBackend({"prompt": "answer"}), cache_db_path=tmp))
+"""
+
+import hashlib
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from memory_system import metrics
+from memory_system.db_pool import get_connection
+
+
+DEFAULT_TTL_SECONDS = 7 * 86400  # Cached responses live a week
+DEFAULT_MAX_ENTRIES = 5000  # Least recently used entries evicted beyond this
+HIT_FLUSH_SIZE = 64  # Buffered cache hits written back in one transaction
+
+
+class LLMCallError(RuntimeError):
+    """Raised by a backend when the LLM call completes unsuccessfully."""
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+class ClaudeCLIBackend:
+    """Runs prompts through the Claude Code CLI in non-interactive mode."""
+
+    def complete(self, prompt: str, model: Optional[str] = None, timeout: float = 30) -> str:
+        """
+        Run `claude -p <prompt>` and return stripped stdout.
+
+        Raises:
+            LLMCallError: CLI exited non-zero
+            subprocess.TimeoutExpired: CLI exceeded timeout
+            FileNotFoundError: CLI not installed
+        """
+        cmd = ["claude", "-p", prompt]
+        if model:
+            cmd.extend(["--model", model])
+
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        if result.returncode != 0:
+            raise LLMCallError(f"Claude CLI returned {result.returncode}")
+        return result.stdout.strip()
+
+
+class FakeBackend:
+    """
+    Offline backend for tests.
+
+    Args:
+        responses: Dict of prompt -> response, or callable(prompt) -> response.
+                   A response that is an Exception instance is raised.
+        default: Response for prompts missing from the dict
+        delay: Seconds to sleep per call (to exercise coalescing)
+    """
+
+    def __init__(
+        self,
+        responses: Union[Dict[str, Union[str, Exception]], Callable[[str], str], None] = None,
+        default: str = "",
+        delay: float = 0.0,
+    ):
+        self.responses = responses if responses is not None else {}
+        self.default = default
+        self.delay = delay
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+
+    def complete(self, prompt: str, model: Optional[str] = None, timeout: float = 30) -> str:
+        with self._lock:
+            self.calls.append(prompt)
+        if self.delay:
+            time.sleep(self.delay)
+
+        if callable(self.responses):
+            response = self.responses(prompt)
+        else:
+            response = self.responses.get(prompt, self.default)
+
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    cache_key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used
+    ON llm_response_cache(last_used_at);
+"""
+
+
+def cache_key(prompt: str, model: Optional[str] = None) -> str:
+    """Content address of a prompt for a given model."""
+    return hashlib.sha256(f"{model or 'default'}\0{prompt}".encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Size-bounded SQLite cache of LLM responses.
+
+    Lookups only read. Hits are buffered in memory and their last_used_at /
+    hit_count written back on the writer connection in batches (before
+    eviction in put, or once HIT_FLUSH_SIZE keys are pending).
+
+    Args:
+        db_path: SQLite database path
+        max_entries: Entries kept; least recently used are evicted beyond this
+        ttl_seconds: Default lifetime of an entry
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        self.db_path = str(db_path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._hits: Dict[str, tuple] = {}
+        self._hits_lock = threading.Lock()
+
+        with get_connection(self.db_path, write=True) as conn:
+            conn.executescript(_SCHEMA)
+            conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for key, or None if missing or expired."""
+        now = time.time()
+        with get_connection(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT response, expires_at FROM llm_response_cache WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        if row[1] <= now:
+            with get_connection(self.db_path, write=True) as conn:
+                conn.execute(
+                    "DELETE FROM llm_response_cache WHERE cache_key = ? AND expires_at <= ?",
+                    (key, now)
+                )
+                conn.commit()
+            return None
+
+        with self._hits_lock:
+            _, count = self._hits.get(key, (now, 0))
+            self._hits[key] = (now, count + 1)
+            full = len(self._hits) >= HIT_FLUSH_SIZE
+        if full:
+            self.flush_hits()
+        return row[0]
+
+    def flush_hits(self):
+        """Write buffered hit counts and last-used times to the database."""
+        with get_connection(self.db_path, write=True) as conn:
+            self._write_hits(conn)
+            conn.commit()
+
+    def _write_hits(self, conn):
+        with self._hits_lock:
+            hits, self._hits = self._hits, {}
+        if hits:
+            conn.executemany("""
+                UPDATE llm_response_cache
+                SET last_used_at = MAX(last_used_at, ?), hit_count = hit_count + ?
+                WHERE cache_key = ?
+            """, [(used, count, key) for key, (used, count) in hits.items()])
+
+    def put(self, key: str, model: Optional[str], response: str, ttl_seconds: Optional[float] = None):
+        """Store a response, evicting least recently used entries over max_entries."""
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with get_connection(self.db_path, write=True) as conn:
+            self._write_hits(conn)
+            conn.execute("""
+                INSERT OR REPLACE INTO llm_response_cache
+                (cache_key, model, response, created_at, expires_at, last_used_at, hit_count)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+            """, (key, model or "default", response, now, now + ttl, now))
+
+            excess = conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute("""
+                    DELETE FROM llm_response_cache WHERE cache_key IN (
+                        SELECT cache_key FROM llm_response_cache
+                        ORDER BY last_used_at LIMIT ?
+                    )
+                """, (excess,))
+            conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired entries. Returns number removed."""
+        with get_connection(self.db_path, write=True) as conn:
+            cursor = conn.execute(
+                "DELETE FROM llm_response_cache WHERE expires_at <= ?", (time.time(),)
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def clear(self):
+        """Delete all entries."""
+        with self._hits_lock:
+            self._hits.clear()
+        with get_connection(self.db_path, write=True) as conn:
+            conn.execute("DELETE FROM llm_response_cache")
+            conn.commit()
+
+    def __len__(self) -> int:
+        with get_connection(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+
+
+# ---------------------------------------------------------------------------
+# Gateway
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SiteStats:
+    """Counters for one call site."""
+    calls: int = 0
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    backend_seconds: float = 0.0
+    max_backend_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_rate": self.hits / self.calls if self.calls else 0.0,
+            "avg_latency_ms": 1000 * self.backend_seconds / self.misses if self.misses else 0.0,
+            "max_latency_ms": 1000 * self.max_backend_seconds,
+        }
+
+
+class _InFlight:
+    """A backend call that concurrent identical requests wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class LLMGateway:
+    """
+    Cached, coalescing front for an LLM backend.
+
+    Args:
+        backend: Object with complete(prompt, model, timeout) (default: ClaudeCLIBackend)
+        cache_db_path: SQLite path for the response cache (default: intelligence.db)
+        cache: Explicit ResponseCache (overrides cache_db_path)
+        enable_cache: Whether to cache responses. None (default) caches when
+                      a cache or cache_db_path is given, otherwise follows
+                      LLM_CACHE_ENABLED (default '1').
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        cache_db_path: Optional[Union[str, Path]] = None,
+        cache: Optional[ResponseCache] = None,
+        enable_cache: Optional[bool] = None,
+    ):
+        self.backend = backend if backend is not None else ClaudeCLIBackend()
+
+        if enable_cache is None:
+            enable_cache = (
+                cache is not None
+                or cache_db_path is not None
+                or os.getenv("LLM_CACHE_ENABLED", "1") == "1"
+            )
+
+        if not enable_cache:
+            self.cache = None
+        elif cache is not None:
+            self.cache = cache
+        else:
+            if cache_db_path is None:
+                cache_db_path = Path(__file__).parent.parent / "intelligence.db"
+            self.cache = ResponseCache(cache_db_path)
+
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._stats: Dict[str, SiteStats] = {}
+
+    def complete(
+        self,
+        prompt: str,
+        site: str = "default",
+        model: Optional[str] = None,
+        timeout: float = 30,
+        ttl_seconds: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> str:
+        """
+        Get a response for prompt (cache, in-flight call, or backend).
+
+        Args:
+            prompt: Prompt text
+            site: Call site name for metrics
+            model: Backend model (None = backend default)
+            timeout: Backend timeout in seconds
+            ttl_seconds: Cache lifetime for this response (None = cache default)
+            use_cache: Read and write the response cache
+
+        Returns:
+            Response text
+
+        Raises:
+            Whatever the backend raises (also re-raised to coalesced callers)
+        """
+        key = cache_key(prompt, model)
+        cache = self.cache if use_cache else None
+
+        with self._lock:
+            stats = self._stats.setdefault(site, SiteStats())
+            stats.calls += 1
+
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                with self._lock:
+                    stats.hits += 1
+                metrics.inc("llm.cache_hits")
+                return cached
+
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _InFlight()
+                stats.misses += 1
+            else:
+                stats.coalesced += 1
+                metrics.inc("llm.coalesced")
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        start = time.perf_counter()
+        try:
+            response = self.backend.complete(prompt, model=model, timeout=timeout)
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                stats.errors += 1
+            metrics.inc("llm.errors")
+            raise
+        else:
+            flight.response = response
+            if cache is not None and response:
+                cache.put(key, model, response, ttl_seconds)
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.observe("llm.backend", elapsed)
+            with self._lock:
+                stats.backend_seconds += elapsed
+                stats.max_backend_seconds = max(stats.max_backend_seconds, elapsed)
+                del self._in_flight[key]
+            flight.done.set()
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-call-site counters and latency ({site: {...}})."""
+        with self._lock:
+            return {site: stats.to_dict() for site, stats in self._stats.items()}
+
+    def reset_metrics(self):
+        """Zero all per-site counters."""
+        with self._lock:
+            self._stats.clear()
+
+
+# ---------------------------------------------------------------------------
+# Module-level default gateway
+# ---------------------------------------------------------------------------
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_gateway() -> LLMGateway:
+    """Get the shared gateway (created on first use)."""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = LLMGateway()
+        return _gateway
+
+
+def set_gateway(gateway: Optional[LLMGateway]):
+    """Replace the shared gateway (None = recreate default on next use)."""
+    global _gateway
+    with _gateway_lock:
+        _gateway = gateway
@@ -0,0 +1,233 @@
+"""
+In-process DAG scheduler for nightly maintenance jobs
+
+Jobs declare what must finish before them (depends_on) and what they
+touch: `writes` resources are held exclusively, `reads` resources are
+shared with other readers. Everything whose dependencies are done and
+whose resources are free runs at once on a thread pool, so jobs on
+unrelated databases overlap instead of queueing behind each other, and
+no job pays interpreter/import start-up the way a subprocess does.
+
+    scheduler = MaintenanceScheduler(max_workers=4)
+    scheduler.add("decay", run_decay, writes=["memory_files"])
+    scheduler.add("embeddings", precompute, reads=["memory_files"], writes=["intelligence.db"])
+    scheduler.add("pagerank", pagerank, writes=["intelligence.db"])
+    scheduler.add("backup_intelligence", backup, depends_on=["pagerank", "embeddings"])
+    report = scheduler.run()
+    report.wall_ms, report.jobs["pagerank"].duration_ms
+
+A job fails by raising; its dependents (transitively) are skipped, all
+other jobs still run. Every duration is also recorded in the
+nightly.<job> stage histogram (metrics.py).
+
+Jobs run on threads: SQLite and file I/O release the GIL, pure-Python
+number crunching does not, so CPU-bound jobs overlap I/O-bound ones
+rather than each other.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from . import metrics
+
+
+@dataclass
+class Job:
+    """One unit of maintenance work"""
+    name: str
+    func: Callable[[], Any]
+    depends_on: Sequence[str] = ()
+    reads: Sequence[str] = ()
+    writes: Sequence[str] = ()
+
+
+@dataclass
+class JobResult:
+    """Outcome of one job (times in ms relative to the start of the run)"""
+    name: str
+    status: str                     # ok | failed | skipped
+    started_ms: float = 0.0
+    duration_ms: float = 0.0
+    result: Any = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ScheduleReport:
+    """Outcome of a scheduler run"""
+    jobs: Dict[str, JobResult] = field(default_factory=dict)
+    wall_ms: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return all(job.status == "ok" for job in self.jobs.values())
+
+    @property
+    def serial_ms(self) -> float:
+        """Sum of job durations: what a one-after-another run would take"""
+        return sum(job.duration_ms for job in self.jobs.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_ms": round(self.wall_ms, 1),
+            "serial_ms": round(self.serial_ms, 1),
+            "succeeded": self.succeeded,
+            "jobs": [
+                {**asdict(job), "result": _jsonable(job.result)}
+                for job in sorted(self.jobs.values(), key=lambda j: (j.started_ms, j.name))
+            ],
+        }
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return repr(value)
+
+
+class MaintenanceScheduler:
+    """
+    Runs declared jobs in dependency order, in parallel where resources allow
+
+    Args:
+        max_workers: Jobs running at the same time
+        on_finish: Called with each JobResult as it completes (progress output)
+    """
+
+    def __init__(self, max_workers: int = 4, on_finish: Optional[Callable[[JobResult], None]] = None):
+        self.max_workers = max_workers
+        self.on_finish = on_finish
+        self._jobs: Dict[str, Job] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        depends_on: Sequence[str] = (),
+        reads: Sequence[str] = (),
+        writes: Sequence[str] = (),
+    ) -> Job:
+        """Declare a job. Declaration order breaks ties between ready jobs."""
+        if name in self._jobs:
+            raise ValueError(f"Duplicate job: {name}")
+        job = Job(name, func, tuple(depends_on), tuple(reads), tuple(writes))
+        self._jobs[name] = job
+        return job
+
+    @property
+    def jobs(self) -> List[Job]:
+        return list(self._jobs.values())
+
+    def validate(self):
+        """
+        Check the job graph
+
+        Raises:
+            ValueError: On an unknown dependency or a dependency cycle
+        """
+        for job in self._jobs.values():
+            for dep in job.depends_on:
+                if dep not in self._jobs:
+                    raise ValueError(f"Job {job.name!r} depends on unknown job {dep!r}")
+
+        state: Dict[str, int] = {}  # 1 = on the current path, 2 = done
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                cycle = path[path.index(name):] + [name]
+                raise ValueError(f"Dependency cycle: {' -> '.join(cycle)}")
+            state[name] = 1
+            for dep in self._jobs[name].depends_on:
+                visit(dep, path + [name])
+            state[name] = 2
+
+        for name in self._jobs:
+            visit(name, [])
+
+    def run(self) -> ScheduleReport:
+        """Run every job; returns once all have finished or been skipped."""
+        self.validate()
+        report = ScheduleReport()
+        pending = list(self._jobs.values())
+        readers: Dict[str, int] = {}
+        writers: set = set()
+        running = {}
+        start = time.perf_counter()
+
+        def elapsed_ms() -> float:
+            return (time.perf_counter() - start) * 1000
+
+        def finish(result: JobResult):
+            report.jobs[result.name] = result
+            if result.status != "skipped":
+                metrics.observe(f"nightly.{result.name}", result.duration_ms / 1000)
+            if self.on_finish:
+                self.on_finish(result)
+
+        def resources_free(job: Job) -> bool:
+            return (not any(r in writers or readers.get(r) for r in job.writes)
+                    and not any(r in writers for r in job.reads))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="nightly") as pool:
+            while pending or running:
+                # Skip anything downstream of a failure
+                for job in list(pending):
+                    failed = [d for d in job.depends_on
+                              if d in report.jobs and report.jobs[d].status != "ok"]
+                    if failed:
+                        pending.remove(job)
+                        finish(JobResult(job.name, "skipped", started_ms=elapsed_ms(),
+                                         error=f"dependency {failed[0]} {report.jobs[failed[0]].status}"))
+
+                for job in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    if not all(report.jobs.get(d) and report.jobs[d].status == "ok" for d in job.depends_on):
+                        continue
+                    if not resources_free(job):
+                        continue
+                    pending.remove(job)
+                    writers.update(job.writes)
+                    for r in job.reads:
+                        readers[r] = readers.get(r, 0) + 1
+                    running[pool.submit(_timed_call, job.func)] = (job, elapsed_ms())
+
+                if not running:
+                    continue  # Everything left was just skipped
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, started_ms = running.pop(future)
+                    writers.difference_update(job.writes)
+                    for r in job.reads:
+                        readers[r] -= 1
+                    value, error, duration_ms = future.result()
+                    finish(JobResult(
+                        job.name,
+                        "ok" if error is None else "failed",
+                        started_ms=started_ms,
+                        duration_ms=duration_ms,
+                        result=value,
+                        error=error,
+                    ))
+
+        report.wall_ms = elapsed_ms()
+        return report
+
+
+def _timed_call(func: Callable[[], Any]):
+    """(value, error, duration_ms); exceptions become an error string"""
+    start = time.perf_counter()
+    try:
+        value, error = func(), None
+    except Exception as e:
+        value, error = None, f"{type(e).__name__}: {e}"
+    return value, error, (time.perf_counter() - start) * 1000
@@ -100,7 +100,7 @@ class MemoryPageRank:
 
     def _init_db(self):
         """Create memory_pagerank table if it doesn't exist."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS memory_pagerank (
                     memory_id TEXT PRIMARY KEY,
@@ -269,7 +269,7 @@ class MemoryPageRank:
 
         now = datetime.now(timezone.utc).isoformat()
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.executemany(
                 """
                 INSERT OR REPLACE INTO memory_pagerank
@@ -7,21 +7,90 @@ Memory-ts uses markdown files with YAML frontmatter stored at:
 Each memory is a file: {id}.md with YAML frontmatter + markdown content
 """
 
-import ast
 import json
 import re
 import hashlib
 import os
+import shutil
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 import time
 
+from . import metrics
+from .frontmatter import FrontmatterError, dumps, parse
+
 
 # Default memory directory
 DEFAULT_MEMORY_DIR = Path.home() / ".local/share/memory/LFI/memories"
 
+# Write counter in memory_dir: each create/update/archive batch appends one
+# byte, so its size counts writes. An O_APPEND write of a byte is a single
+# syscall with no rename or fsync, and concurrent appends never lose a count.
+GENERATION_FILE = ".generation"
+
+# Directory mtimes come from a coarse clock (one kernel tick, up to 2s on
+# FAT-style filesystems): a file renamed in by another writer in the same
+# tick as a read leaves st_mtime_ns unchanged, so stores touched more
+# recently than this aren't cached against
+GENERATION_SETTLE_NS = 2_000_000_000
+
+
+def store_generation(memory_dir: Optional[Path] = None) -> int:
+    """
+    Current generation of a memory store
+
+    The sum of the write counter (GENERATION_FILE's size) and memory_dir's
+    mtime. Every write through MemoryTSClient bumps the counter; the mtime
+    also catches files that other writers rename into or out of the store.
+    Both only grow, so any value cached against a generation is stale once
+    this changes. Reading it is two stat() calls.
+
+    Writers that rewrite a file in place, bypassing MemoryTSClient, change
+    neither; they should call bump_generation().
+
+    Args:
+        memory_dir: Store to check (defaults to DEFAULT_MEMORY_DIR)
+
+    Returns:
+        Generation number (0 for a store that doesn't exist yet)
+    """
+    directory = Path(memory_dir or DEFAULT_MEMORY_DIR)
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
+        return 0
+    try:
+        writes = (directory / GENERATION_FILE).stat().st_size
+    except OSError:
+        writes = 0
+    return mtime_ns + writes
+
+
+def bump_generation(memory_dir: Optional[Path] = None) -> None:
+    """Record a write to the store, advancing store_generation()"""
+    fd = os.open(Path(memory_dir or DEFAULT_MEMORY_DIR) / GENERATION_FILE,
+                 os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, b".")
+    finally:
+        os.close(fd)
+
+
+def generation_settled(memory_dir: Optional[Path] = None) -> bool:
+    """
+    True once a rename by another writer can no longer hide in memory_dir's mtime
+
+    Caches should only store values while the store is settled.
+    """
+    try:
+        mtime_ns = Path(memory_dir or DEFAULT_MEMORY_DIR).stat().st_mtime_ns
+    except OSError:
+        return True
+    return time.time_ns() - mtime_ns >= GENERATION_SETTLE_NS
+
 
 class MemoryTSError(Exception):
     """Base exception for memory-ts client errors"""
@@ -71,19 +140,29 @@ class MemoryTSClient:
     This client provides CRUD operations on those files.
     """
 
-    def __init__(self, memory_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        memory_dir: Optional[Path] = None,
+        enable_access_logging: Optional[bool] = None
+    ):
         """
         Initialize client
 
         Args:
             memory_dir: Path to memory storage (defaults to ~/.local/share/memory/LFI/memories)
+            enable_access_logging: Log get/search accesses to the temporal predictor.
+                None (default) follows ENABLE_TEMPORAL_LOGGING. System jobs such as
+                nightly maintenance pass False so their full scans don't look like
+                user accesses.
         """
         self.memory_dir = Path(memory_dir) if memory_dir else DEFAULT_MEMORY_DIR
         self.memory_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize temporal predictor for access logging
         self._predictor = None
-        self._enable_access_logging = os.getenv('ENABLE_TEMPORAL_LOGGING', '1') == '1'
+        if enable_access_logging is None:
+            enable_access_logging = os.getenv('ENABLE_TEMPORAL_LOGGING', '1') == '1'
+        self._enable_access_logging = enable_access_logging
 
     def _get_predictor(self):
         """Lazy-load predictor to avoid circular imports"""
@@ -115,6 +194,10 @@ class MemoryTSClient:
                 # Fail silently - logging is optional
                 pass
 
+    def generation(self) -> int:
+        """Current store generation (see store_generation)"""
+        return store_generation(self.memory_dir)
+
     def _safe_memory_path(self, memory_id: str) -> Path:
         """Build memory file path with path traversal protection"""
         # Strip path separators and traversal sequences
@@ -152,9 +235,103 @@ class MemoryTSClient:
         Returns:
             Created Memory object
         """
+        memory = self._build_memory(
+            content, project_id, tags, importance, scope, source_session_id, **kwargs
+        )
+
+        # Write to file
+        self._write_memory(memory)
+
+        return memory
+
+    def create_many(self, items: Iterable[Dict[str, Any]]) -> List[Memory]:
+        """
+        Create many memories in one batch
+
+        Each item is a dict of create() keyword arguments. All files are
+        rendered into a staging directory inside memory_dir, then renamed
+        into place one by one (each rename is still atomic), followed by a
+        single fsync of memory_dir instead of per-file syncs.
+
+        Args:
+            items: Dicts with content, project_id, tags and optional
+                   importance, scope, source_session_id and extra fields
+
+        Returns:
+            Created Memory objects, in input order
+        """
+        memories = []
+        seen_ids = set()
+        for item in items:
+            fields = dict(item)
+            memory = self._build_memory(
+                fields.pop("content"),
+                fields.pop("project_id"),
+                fields.pop("tags"),
+                fields.pop("importance", None),
+                fields.pop("scope", "project"),
+                fields.pop("source_session_id", None),
+                salt=str(len(memories)),
+                **fields
+            )
+            if memory.id in seen_ids:
+                raise MemoryTSError(f"Duplicate memory id in batch: {memory.id}")
+            seen_ids.add(memory.id)
+            memories.append(memory)
+
+        self._write_many(memories)
+        return memories
+
+    def update_many(self, updates: Dict[str, Dict[str, Any]]) -> List[Memory]:
+        """
+        Update many memories in one batch
+
+        Every memory is read and validated before anything is written, so a
+        missing id leaves the store untouched. Writes use the same staged
+        rename + single directory fsync as create_many(). Unlike update(),
+        reads here are not logged as accesses.
+
+        Args:
+            updates: Mapping of memory_id -> fields to set (any Memory field)
+
+        Returns:
+            Updated Memory objects, in input order
+
+        Raises:
+            MemoryNotFoundError: If any memory doesn't exist
+        """
+        now = datetime.now().isoformat()
+        memories = []
+        for memory_id, fields in updates.items():
+            memory_file = self._safe_memory_path(memory_id)
+            if not memory_file.exists():
+                raise MemoryNotFoundError(f"Memory {memory_id} not found")
+            memory = self._read_memory(memory_file)
+
+            for key, value in fields.items():
+                if hasattr(memory, key):
+                    setattr(memory, key, value)
+            memory.updated = now
+            memories.append(memory)
+
+        self._write_many(memories)
+        return memories
+
+    def _build_memory(
+        self,
+        content: str,
+        project_id: str,
+        tags: List[str],
+        importance: Optional[float],
+        scope: str,
+        source_session_id: Optional[str],
+        salt: str = "",
+        **kwargs
+    ) -> Memory:
+        """Assign an id and default importance, returning an unsaved Memory"""
         # Generate unique ID (timestamp-hash format)
         timestamp = str(int(time.time() * 1000))  # milliseconds
-        hash_input = f"{content}{project_id}{datetime.now().isoformat()}"
+        hash_input = f"{content}{project_id}{datetime.now().isoformat()}{salt}"
         hash_val = hashlib.md5(hash_input.encode()).hexdigest()[:6]
         memory_id = f"{timestamp}-{hash_val}"
 
@@ -163,8 +340,7 @@ class MemoryTSClient:
             from .importance_engine import calculate_importance
             importance = calculate_importance(content)
 
-        # Create memory object
-        memory = Memory(
+        return Memory(
             id=memory_id,
             content=content,
             project_id=project_id,
@@ -175,11 +351,6 @@ class MemoryTSClient:
             **kwargs
         )
 
-        # Write to file
-        self._write_memory(memory)
-
-        return memory
-
     def _archived_memory_path(self, memory_id: str) -> Path:
         """Build archived memory file path with path traversal protection"""
         safe_id = re.sub(r'[/\\]', '', memory_id).replace('..', '')
@@ -221,6 +392,7 @@ class MemoryTSClient:
 
         return memory
 
+    @metrics.timed("memory_ts.list")
     def list(self, include_archived: bool = False) -> List[Memory]:
         """
         List all memories
@@ -300,88 +472,15 @@ class MemoryTSClient:
 
         # Remove original file
         source_file.unlink()
+        bump_generation(self.memory_dir)
 
         return True
 
     def _write_memory_to(self, memory: Memory, target_path: Path) -> None:
         """Write memory to a specific path (used for archival)"""
-        import tempfile
-
-        # Build YAML frontmatter (same as _write_memory)
-        source_session_line = ""
-        if memory.source_session_id is not None:
-            source_session_line = f"\nsource_session_id: {memory.source_session_id}"
-
-        frontmatter = f"""---
-id: {memory.id}
-created: {memory.created}
-updated: {memory.updated}
-reasoning: {memory.reasoning}
-importance_weight: {memory.importance}
-confidence_score: {memory.confidence_score}
-confirmations: {memory.confirmations}
-contradictions: {memory.contradictions}
-context_type: {memory.context_type}
-temporal_relevance: {memory.temporal_relevance}
-knowledge_domain: {memory.knowledge_domain}
-emotional_resonance: null
-action_required: false
-problem_solution_pair: true
-semantic_tags: {memory.tags}
-trigger_phrases: []
-question_types: []
-session_id: {memory.session_id or "unknown"}
-project_id: {memory.project_id}
-status: {memory.status}
-scope: {memory.scope}
-temporal_class: long_term
-fade_rate: 0.03
-expires_after_sessions: 0
-domain: learnings
-feature: null
-component: null
-supersedes: null
-superseded_by: null
-related_to: []
-resolves: []
-resolved_by: null
-parent_id: null
-child_ids: []
-awaiting_implementation: false
-awaiting_decision: false
-blocked_by: null
-blocks: []
-related_files: []
-retrieval_weight: {memory.retrieval_weight or memory.importance}{source_session_line}
-exclude_from_retrieval: false
-archived: true
-schema_version: {memory.schema_version}
----
-
-{memory.content}
-"""
-        # Atomic write
-        temp_fd, temp_path = tempfile.mkstemp(
-            dir=target_path.parent,
-            prefix=f".{target_path.name}.",
-            suffix=".tmp"
-        )
-
-        try:
-            os.write(temp_fd, frontmatter.encode('utf-8'))
-            os.close(temp_fd)
-            os.replace(temp_path, target_path)
-        except Exception:
-            try:
-                os.close(temp_fd)
-            except Exception:
-                pass
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
-            raise
+        self._atomic_write(target_path, self._render_memory(memory, archived=True))
 
+    @metrics.timed("memory_ts.search")
     def search(
         self,
         tags: Optional[List[str]] = None,
@@ -427,8 +526,9 @@ schema_version: {memory.schema_version}
         if content:
             context_keywords = content.split()
 
-        for memory in results:
-            self._log_access(memory.id, 'search', context_keywords)
+        with metrics.timer("memory_ts.access_log"):
+            for memory in results:
+                self._log_access(memory.id, 'search', context_keywords)
 
         return results
 
@@ -483,83 +583,154 @@ schema_version: {memory.schema_version}
 
         return memory
 
+    def save(self, memory: Memory) -> Memory:
+        """
+        Persist an already-loaded Memory object
+
+        Unlike update(), this does not re-read the file (and so logs no
+        access). Intended for batch jobs that hold a snapshot from list()
+        and change fields in place.
+
+        Args:
+            memory: Memory to write; its updated timestamp is refreshed
+
+        Returns:
+            The same Memory object
+        """
+        memory.updated = datetime.now().isoformat()
+        self._write_memory(memory)
+        return memory
+
     def _write_memory(self, memory: Memory) -> None:
         """Write memory to disk as markdown with YAML frontmatter"""
         memory_file = self._safe_memory_path(memory.id)
-
-        # Build YAML frontmatter
+        self._atomic_write(memory_file, self._render_memory(memory))
+        bump_generation(self.memory_dir)
+
+    @staticmethod
+    def _render_memory(memory: Memory, archived: bool = False) -> str:
+        """Render memory as markdown with YAML frontmatter"""
+        meta: Dict[str, Any] = {
+            "id": memory.id,
+            "created": memory.created,
+            "updated": memory.updated,
+            "reasoning": memory.reasoning,
+            "importance_weight": memory.importance,
+            "confidence_score": memory.confidence_score,
+            "confirmations": memory.confirmations,
+            "contradictions": memory.contradictions,
+            "context_type": memory.context_type,
+            "temporal_relevance": memory.temporal_relevance,
+            "knowledge_domain": memory.knowledge_domain,
+            "emotional_resonance": None,
+            "action_required": False,
+            "problem_solution_pair": True,
+            "semantic_tags": memory.tags,
+            "trigger_phrases": [],
+            "question_types": [],
+            "session_id": memory.session_id or "unknown",
+            "project_id": memory.project_id,
+            "status": memory.status,
+            "scope": memory.scope,
+            "temporal_class": "long_term",
+            "fade_rate": 0.03,
+            "expires_after_sessions": 0,
+            "domain": "learnings",
+            "feature": None,
+            "component": None,
+            "supersedes": None,
+            "superseded_by": None,
+            "related_to": [],
+            "resolves": [],
+            "resolved_by": None,
+            "parent_id": None,
+            "child_ids": [],
+            "awaiting_implementation": False,
+            "awaiting_decision": False,
+            "blocked_by": None,
+            "blocks": [],
+            "related_files": [],
+            "retrieval_weight": memory.retrieval_weight or memory.importance,
+        }
         # Conditionally include source_session_id (omit if None)
-        source_session_line = ""
         if memory.source_session_id is not None:
-            source_session_line = f"\nsource_session_id: {memory.source_session_id}"
-
-        frontmatter = f"""---
-id: {memory.id}
-created: {memory.created}
-updated: {memory.updated}
-reasoning: {memory.reasoning}
-importance_weight: {memory.importance}
-confidence_score: {memory.confidence_score}
-confirmations: {memory.confirmations}
-contradictions: {memory.contradictions}
-context_type: {memory.context_type}
-temporal_relevance: {memory.temporal_relevance}
-knowledge_domain: {memory.knowledge_domain}
-emotional_resonance: null
-action_required: false
-problem_solution_pair: true
-semantic_tags: {memory.tags}
-trigger_phrases: []
-question_types: []
-session_id: {memory.session_id or "unknown"}
-project_id: {memory.project_id}
-status: {memory.status}
-scope: {memory.scope}
-temporal_class: long_term
-fade_rate: 0.03
-expires_after_sessions: 0
-domain: learnings
-feature: null
-component: null
-supersedes: null
-superseded_by: null
-related_to: []
-resolves: []
-resolved_by: null
-parent_id: null
-child_ids: []
-awaiting_implementation: false
-awaiting_decision: false
-blocked_by: null
-blocks: []
-related_files: []
-retrieval_weight: {memory.retrieval_weight or memory.importance}{source_session_line}
-exclude_from_retrieval: false
-schema_version: {memory.schema_version}
----
-
-{memory.content}
-"""
+            meta["source_session_id"] = memory.source_session_id
+        meta["exclude_from_retrieval"] = False
+        if archived:
+            meta["archived"] = True
+        meta["schema_version"] = memory.schema_version
 
-        # RELIABILITY FIX: Atomic write using temp file + rename pattern
-        # Prevents corruption from concurrent writes or interrupted writes
-        import tempfile
-        import os
+        return dumps(meta, memory.content)
+
+    def _write_many(self, memories: List[Memory]) -> None:
+        """
+        Write a batch of memories with one directory fsync
+
+        Files are staged in a hidden directory on the same filesystem so
+        each os.replace() into memory_dir stays an atomic rename; readers
+        never see a partially written memory. Each staged file's data is
+        fsynced before any rename, so a crash can't leave a renamed but
+        empty memory behind.
+        """
+        if not memories:
+            return
+
+        targets = [self._safe_memory_path(memory.id) for memory in memories]
+        staging_dir = Path(tempfile.mkdtemp(dir=self.memory_dir, prefix=".staging-"))
+        try:
+            staged = []
+            for memory, target in zip(memories, targets):
+                staged_path = staging_dir / target.name
+                with open(staged_path, "w", encoding="utf-8") as f:
+                    f.write(self._render_memory(memory))
+                    f.flush()
+                    os.fsync(f.fileno())
+                staged.append((staged_path, target))
+
+            for staged_path, target in staged:
+                os.replace(staged_path, target)
+
+            self._fsync_dir(self.memory_dir)
+            bump_generation(self.memory_dir)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Flush directory entries (renames) to disk where the OS supports it"""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    @metrics.timed("memory_ts.write")
+    def _atomic_write(target_path: Path, text: str) -> None:
+        """
+        Write text to target_path atomically
 
-        # Write to temp file first
+        RELIABILITY FIX: temp file + rename pattern. Prevents corruption
+        from concurrent writes or interrupted writes.
+        """
         temp_fd, temp_path = tempfile.mkstemp(
-            dir=memory_file.parent,
-            prefix=f".{memory_file.name}.",
+            dir=target_path.parent,
+            prefix=f".{target_path.name}.",
             suffix=".tmp"
         )
 
         try:
             # Write content to temp file
-            os.write(temp_fd, frontmatter.encode('utf-8'))
+            os.write(temp_fd, text.encode('utf-8'))
             os.close(temp_fd)
 
             # Atomic rename (POSIX guarantees atomicity)
-            os.replace(temp_path, memory_file)
+            os.replace(temp_path, target_path)
 
         except Exception:
             # Clean up temp file on error
@@ -575,42 +746,38 @@ schema_version: {memory.schema_version}
 
     def _read_memory(self, memory_file: Path) -> Memory:
         """Read memory from markdown file with YAML frontmatter"""
-        content = memory_file.read_text()
-
-        # Split frontmatter and content
-        parts = content.split("---", 2)
-        if len(parts) < 3:
+        with metrics.timer("memory_ts.read"):
+            text = memory_file.read_text()
+        try:
+            with metrics.timer("memory_ts.parse"):
+                metadata, memory_content = parse(text)
+        except FrontmatterError:
             raise MemoryTSError(f"Invalid memory file format: {memory_file}")
-
-        frontmatter_text = parts[1]
-        memory_content = parts[2].strip()
-
-        # Parse YAML frontmatter (simple key: value parsing)
-        metadata = {}
-        for line in frontmatter_text.split("\n"):
-            line = line.strip()
-            if not line or ":" not in line:
-                continue
-
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-
-            # Parse specific types
-            if key == "semantic_tags":
-                # Parse list format: ["tag1", "tag2"]
-                value = ast.literal_eval(value) if value.startswith("[") else []
-            elif key in ("importance_weight", "confidence_score", "retrieval_weight"):
-                value = float(value) if value != "null" else 0.0
-            elif key in ("confirmations", "contradictions"):
-                try:
-                    value = int(value)
-                except (ValueError, TypeError):
-                    value = 0
-            elif key == "schema_version":
-                value = int(value) if value.isdigit() else 2
-
-            metadata[key] = value
+        return self._memory_from_metadata(metadata, memory_content, memory_file)
+
+    @staticmethod
+    def _memory_from_metadata(metadata: Dict[str, Any], memory_content: str, memory_file: Path) -> Memory:
+        """Build a Memory from parsed frontmatter (coerces metadata in place)"""
+        # Coerce typed fields; string fields keep their defaults for null
+        tags = metadata.get("semantic_tags")
+        metadata["semantic_tags"] = tags if isinstance(tags, list) else []
+        for key in ("importance_weight", "confidence_score", "retrieval_weight"):
+            if key in metadata:
+                value = metadata[key]
+                metadata[key] = float(value) if value is not None else 0.0
+        for key in ("confirmations", "contradictions"):
+            if key in metadata:
+                value = metadata[key]
+                metadata[key] = value if isinstance(value, int) and not isinstance(value, bool) else 0
+        if "schema_version" in metadata and not isinstance(metadata["schema_version"], int):
+            metadata["schema_version"] = 2
+        for key in ("id", "project_id", "scope", "created", "updated", "reasoning",
+                    "context_type", "temporal_relevance", "knowledge_domain", "status"):
+            if key in metadata:
+                if metadata[key] is None:
+                    del metadata[key]
+                else:
+                    metadata[key] = str(metadata[key])
 
         # Parse source_session_id (None if absent — backward-compatible)
         raw_source_session = metadata.get("source_session_id")
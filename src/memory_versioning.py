@@ -3,14 +3,69 @@ Memory versioning - Track memory evolution over time.
 
 Feature 23: Store edit history for each memory.
 Enables rollback, diff view, "why did this change?" queries.
+
+Histories are stored as keyframes plus compressed deltas: the newest
+version and every KEYFRAME_INTERVAL-th version keep their full content,
+the rest store a zlib-compressed token diff against the nearest earlier
+keyframe.  make_delta / apply_delta are shared with
+intelligence.versioning.
 """
 
+import base64
 import json
+import re
 import time
+import zlib
+from difflib import SequenceMatcher
 from typing import List, Dict, Optional
 from pathlib import Path
 
 
+KEYFRAME_INTERVAL = 10  # Max versions between full copies
+
+_TOKEN_RE = re.compile(r"\s+|\S+")
+
+
+def make_delta(base: str, target: str) -> bytes:
+    """
+    Encode *target* as a compressed diff against *base*.
+
+    The diff works on word/whitespace tokens: positive ints copy that many
+    tokens from base, negative ints skip tokens, strings are inserted.
+
+    Returns:
+        zlib-compressed JSON op list (see apply_delta)
+    """
+    a = _TOKEN_RE.findall(base)
+    b = _TOKEN_RE.findall(target)
+    ops: list = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        if tag == "equal":
+            ops.append(i2 - i1)
+            continue
+        if i2 > i1:
+            ops.append(i1 - i2)
+        if j2 > j1:
+            ops.append("".join(b[j1:j2]))
+    return zlib.compress(json.dumps(ops, separators=(",", ":")).encode(), 9)
+
+
+def apply_delta(base: str, delta: bytes) -> str:
+    """Rebuild the target text from *base* and a make_delta() result."""
+    tokens = _TOKEN_RE.findall(base)
+    pos = 0
+    out: List[str] = []
+    for op in json.loads(zlib.decompress(delta)):
+        if isinstance(op, str):
+            out.append(op)
+        elif op > 0:
+            out.extend(tokens[pos:pos + op])
+            pos += op
+        else:
+            pos -= op
+    return "".join(out)
+
+
 def create_version(
     memory_id: str,
     content: str,
@@ -42,10 +97,8 @@ def create_version(
     }
 
 
-def get_version_history(memory_id: str, version_dir: Path) -> List[Dict]:
-    """Get all versions of a memory, sorted oldest to newest."""
-    version_file = version_dir / f"{memory_id}.json"
-
+def _load_versions(version_file: Path) -> List[Dict]:
+    """Stored entries, oldest first (delta entries left encoded)."""
     if not version_file.exists():
         return []
 
@@ -55,6 +108,104 @@ def get_version_history(memory_id: str, version_dir: Path) -> List[Dict]:
     return sorted(versions, key=lambda v: v['version'])
 
 
+def _compact_entry(entries: List[Dict], index: int, base_index: Optional[int]) -> bool:
+    """
+    Replace entries[index]'s content with a delta against entries[base_index]
+    if that is smaller and the base is within KEYFRAME_INTERVAL entries.
+
+    Returns:
+        True if the entry was converted
+    """
+    if base_index is None or index - base_index >= KEYFRAME_INTERVAL:
+        return False
+
+    entry, base = entries[index], entries[base_index]
+
+    delta = make_delta(base['content'], entry['content'])
+    if len(delta) >= len(entry['content'].encode()):
+        return False
+
+    del entry['content']
+    entry['base_version'] = base['version']
+    entry['delta'] = base64.b64encode(delta).decode('ascii')
+    return True
+
+
+def _nearest_full(entries: List[Dict], before: int) -> Optional[int]:
+    """Index of the last full-content entry before *before*."""
+    for index in range(before - 1, -1, -1):
+        if 'content' in entries[index]:
+            return index
+    return None
+
+
+def save_version(version: Dict, version_dir: Path) -> None:
+    """
+    Append *version* (from create_version) to its memory's history file.
+
+    The previous newest version is re-encoded as a delta unless it is due
+    to be a keyframe.
+    """
+    version_dir.mkdir(parents=True, exist_ok=True)
+    version_file = version_dir / f"{version['memory_id']}.json"
+    entries = _load_versions(version_file)
+
+    if entries and 'content' in entries[-1]:
+        _compact_entry(entries, len(entries) - 1, _nearest_full(entries, len(entries) - 1))
+    entries.append(dict(version))
+
+    tmp = version_file.with_suffix('.json.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(entries, f)
+    tmp.replace(version_file)
+
+
+def compact_version_file(memory_id: str, version_dir: Path) -> int:
+    """
+    Migrate a full-content history file to keyframes plus deltas.
+
+    Safe to re-run; entries that are already deltas, or that other deltas
+    are based on, are left alone.
+
+    Returns:
+        Number of entries converted
+    """
+    version_file = version_dir / f"{memory_id}.json"
+    entries = _load_versions(version_file)
+    bases = {e['base_version'] for e in entries if 'delta' in e}
+
+    converted = 0
+    base_index = None
+    for index, entry in enumerate(entries[:-1]):
+        if 'content' not in entry:
+            continue
+        if entry['version'] not in bases and _compact_entry(entries, index, base_index):
+            converted += 1
+        else:
+            base_index = index
+
+    if converted:
+        tmp = version_file.with_suffix('.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(entries, f)
+        tmp.replace(version_file)
+    return converted
+
+
+def get_version_history(memory_id: str, version_dir: Path) -> List[Dict]:
+    """Get all versions of a memory, sorted oldest to newest."""
+    versions = _load_versions(version_dir / f"{memory_id}.json")
+
+    contents = {v['version']: v['content'] for v in versions if 'content' in v}
+    for v in versions:
+        if 'delta' in v:
+            v['content'] = apply_delta(
+                contents[v.pop('base_version')], base64.b64decode(v.pop('delta'))
+            )
+
+    return versions
+
+
 def rollback_to_version(memory_id: str, version_number: int, version_dir: Path) -> Optional[Dict]:
     """Rollback memory to specific version."""
     history = get_version_history(memory_id, version_dir)
@@ -0,0 +1,442 @@
+"""
+Process-wide timing histograms and event counters
+
+Hot paths record how long each stage took (file scan, embedding, SQLite,
+LLM subprocess, ...) so a slow hook can be broken down after the fact:
+
+    from memory_system import metrics
+
+    with metrics.timer("memory_ts.search"):
+        ...
+
+    @metrics.timed("embedding.encode")
+    def encode(...): ...
+
+    metrics.inc("embedding.cache_hits")
+
+    metrics.snapshot()           # {"stages": {...}, "events": {...}} for get_stats
+    metrics.render_prometheus()  # text exposition for the dashboard /metrics route
+
+Stages share one histogram family (memory_system_stage_seconds{stage=...})
+and events one counter family (memory_system_events_total{event=...}).
+
+Hooks and consolidators are short-lived processes, so each process adds
+its histograms and counters to a shared SQLite store at exit (persist(),
+cfg.metrics_db_path / MEMORY_SYSTEM_METRICS_DB). combined() returns the
+stored totals plus this process's unflushed data; the dashboard /metrics
+route and get_stats report that, so a hook that blew its budget shows up
+after it has exited. MEMORY_SYSTEM_METRICS_PERSIST=0 skips the exit flush.
+
+Set MEMORY_SYSTEM_METRICS=0 to disable. Disabled, timer() returns a shared
+no-op context manager and inc()/observe() return after one attribute check,
+so instrumented code pays well under a microsecond per call.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Upper bounds in seconds: sub-ms SQLite reads up to minute-long LLM calls
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+STAGE_FAMILY = "memory_system_stage_seconds"
+EVENT_FAMILY = "memory_system_events_total"
+
+STORE_TIMEOUT = 2.0  # Seconds an exiting process waits for the store's write lock
+
+
+class Histogram:
+    """Bucketed latency distribution for one stage"""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def merge(self, counts: List[int], count: int, total: float, peak: float):
+        """Add another histogram's data (same buckets)"""
+        with self._lock:
+            self.counts = [a + b for a, b in zip(self.counts, counts)]
+            self.count += count
+            self.sum += total
+            self.max = max(self.max, peak)
+
+    def quantile(self, q: float) -> float:
+        """Estimate (seconds) by linear interpolation inside the bucket"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for upper, in_bucket in zip(self.buckets + (self.max,), self.counts):
+            if in_bucket and seen + in_bucket >= rank:
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / in_bucket
+            seen += in_bucket
+            lower = upper
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": 1000 * self.sum,
+            "avg_ms": 1000 * self.sum / self.count if self.count else 0.0,
+            "p50_ms": 1000 * self.quantile(0.5),
+            "p95_ms": 1000 * self.quantile(0.95),
+            "max_ms": 1000 * self.max,
+        }
+
+
+class _Timer:
+    """Context manager / decorator target that observes elapsed time"""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._histogram.observe(time.perf_counter() - self._start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """
+    Named stage histograms and event counters
+
+    Args:
+        enabled: Record anything at all (None = follow MEMORY_SYSTEM_METRICS, default on)
+        buckets: Histogram bucket upper bounds in seconds
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        if enabled is None:
+            enabled = os.getenv("MEMORY_SYSTEM_METRICS", "1") == "1"
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, stage: str) -> Histogram:
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(stage, Histogram(self.buckets))
+        return histogram
+
+    def timer(self, stage: str):
+        """Context manager timing one execution of stage"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self.histogram(stage))
+
+    def observe(self, stage: str, seconds: float):
+        if self.enabled:
+            self.histogram(stage).observe(seconds)
+
+    def inc(self, event: str, amount: int = 1):
+        if self.enabled:
+            with self._lock:
+                self._counters[event] = self._counters.get(event, 0) + amount
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """{"stages": {stage: {count, total_ms, avg_ms, p50_ms, p95_ms, max_ms}}, "events": {event: n}}"""
+        with self._lock:
+            histograms = dict(self._histograms)
+            counters = dict(self._counters)
+        return {
+            "stages": {stage: histograms[stage].to_dict() for stage in sorted(histograms)},
+            "events": {event: counters[event] for event in sorted(counters)},
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        lines = [
+            f"# HELP {STAGE_FAMILY} Time spent per memory system stage",
+            f"# TYPE {STAGE_FAMILY} histogram",
+        ]
+        for stage, histogram in histograms:
+            label = _escape(stage)
+            cumulative = 0
+            for upper, in_bucket in zip(self.buckets, histogram.counts):
+                cumulative += in_bucket
+                lines.append(f'{STAGE_FAMILY}_bucket{{stage="{label}",le="{upper:g}"}} {cumulative}')
+            lines.append(f'{STAGE_FAMILY}_bucket{{stage="{label}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{STAGE_FAMILY}_sum{{stage="{label}"}} {histogram.sum!r}')
+            lines.append(f'{STAGE_FAMILY}_count{{stage="{label}"}} {histogram.count}')
+
+        lines.append(f"# HELP {EVENT_FAMILY} Memory system event counts")
+        lines.append(f"# TYPE {EVENT_FAMILY} counter")
+        for event, value in counters:
+            lines.append(f'{EVENT_FAMILY}{{event="{_escape(event)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def merge(self, other: "MetricsRegistry"):
+        """Add another registry's histograms (matching buckets only) and counters"""
+        with other._lock:
+            histograms = list(other._histograms.items())
+            counters = list(other._counters.items())
+        if other.buckets == self.buckets:
+            for stage, histogram in histograms:
+                self.histogram(stage).merge(histogram.counts, histogram.count, histogram.sum, histogram.max)
+        with self._lock:
+            for event, value in counters:
+                self._counters[event] = self._counters.get(event, 0) + value
+
+    def drain(self) -> "MetricsRegistry":
+        """Move everything recorded so far into a new registry, leaving this one empty"""
+        drained = MetricsRegistry(enabled=True, buckets=self.buckets)
+        with self._lock:
+            drained._histograms, self._histograms = self._histograms, {}
+            drained._counters, self._counters = self._counters, {}
+        return drained
+
+
+def _escape(label: str) -> str:
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# ---------------------------------------------------------------------------
+# Module-level registry
+# ---------------------------------------------------------------------------
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """The process-wide registry"""
+    return _registry
+
+
+def set_enabled(enabled: bool):
+    """Turn recording on or off at runtime (recorded data is kept)"""
+    _registry.enabled = enabled
+
+
+def timer(stage: str):
+    """Time a block: `with metrics.timer("stage"): ...`"""
+    if not _registry.enabled:
+        return _NULL_TIMER
+    return _Timer(_registry.histogram(stage))
+
+
+def timed(stage: str):
+    """Decorator timing every call of the wrapped function"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _registry.enabled:
+                return func(*args, **kwargs)
+            with _Timer(_registry.histogram(stage)):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def observe(stage: str, seconds: float):
+    """Record one already-measured duration"""
+    if _registry.enabled:
+        _registry.histogram(stage).observe(seconds)
+
+
+def inc(event: str, amount: int = 1):
+    """Add to an event counter"""
+    if _registry.enabled:
+        _registry.inc(event, amount)
+
+
+def snapshot() -> Dict[str, Dict]:
+    return _registry.snapshot()
+
+
+def render_prometheus() -> str:
+    return _registry.render_prometheus()
+
+
+def reset():
+    _registry.reset()
+
+
+# ---------------------------------------------------------------------------
+# Cross-process store
+# ---------------------------------------------------------------------------
+
+_STORE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS stage_histograms (
+        stage TEXT PRIMARY KEY,
+        buckets TEXT NOT NULL,
+        counts TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        sum REAL NOT NULL,
+        max REAL NOT NULL,
+        updated_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS event_counters (
+        event TEXT PRIMARY KEY,
+        value INTEGER NOT NULL,
+        updated_at REAL NOT NULL
+    );
+"""
+
+
+def _store_path(path: Optional[Path]) -> Path:
+    if path is not None:
+        return Path(path)
+    from .config import cfg
+    return cfg.metrics_db_path
+
+
+def _connect_store(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=STORE_TIMEOUT, isolation_level=None)
+    conn.executescript(_STORE_SCHEMA)
+    return conn
+
+
+def persist(registry: Optional[MetricsRegistry] = None, path: Optional[Path] = None) -> bool:
+    """
+    Add a registry's data to the shared store and clear it from the registry
+
+    Draining first means repeated calls never count anything twice; if the
+    write fails the data is merged back.
+
+    Args:
+        registry: Registry to flush (default: the process-wide one)
+        path: Store location (default: cfg.metrics_db_path)
+
+    Returns:
+        True if anything was written
+    """
+    registry = registry or _registry
+    drained = registry.drain()
+    with drained._lock:
+        histograms = sorted(drained._histograms.items())
+        counters = sorted(drained._counters.items())
+    if not histograms and not counters:
+        return False
+
+    buckets = json.dumps(drained.buckets)
+    now = time.time()
+    try:
+        conn = _connect_store(_store_path(path))
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = []
+            for stage, histogram in histograms:
+                counts, count, total, peak = histogram.counts, histogram.count, histogram.sum, histogram.max
+                stored = conn.execute(
+                    "SELECT buckets, counts, count, sum, max FROM stage_histograms WHERE stage = ?", (stage,)
+                ).fetchone()
+                if stored and stored[0] == buckets:
+                    counts = [a + b for a, b in zip(json.loads(stored[1]), counts)]
+                    count, total, peak = count + stored[2], total + stored[3], max(peak, stored[4])
+                rows.append((stage, buckets, json.dumps(counts), count, total, peak, now))
+            conn.executemany("INSERT OR REPLACE INTO stage_histograms VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany(
+                "INSERT INTO event_counters VALUES (?, ?, ?) ON CONFLICT(event) DO UPDATE SET "
+                "value = value + excluded.value, updated_at = excluded.updated_at",
+                [(event, value, now) for event, value in counters],
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        registry.merge(drained)
+        return False
+    return True
+
+
+def load_persisted(path: Optional[Path] = None, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> MetricsRegistry:
+    """Registry holding the store's totals (histograms recorded with other buckets are skipped)"""
+    registry = MetricsRegistry(enabled=True, buckets=buckets)
+    store = _store_path(path)
+    if not store.exists():
+        return registry
+    try:
+        conn = _connect_store(store)
+        try:
+            stages = conn.execute("SELECT stage, buckets, counts, count, sum, max FROM stage_histograms").fetchall()
+            events = conn.execute("SELECT event, value FROM event_counters").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return registry
+
+    wanted = json.dumps(registry.buckets)
+    for stage, stored_buckets, counts, count, total, peak in stages:
+        if stored_buckets == wanted:
+            registry.histogram(stage).merge(json.loads(counts), count, total, peak)
+    for event, value in events:
+        registry.inc(event, value)
+    return registry
+
+
+def combined(path: Optional[Path] = None) -> MetricsRegistry:
+    """Stored totals from every process plus this process's unflushed data"""
+    registry = load_persisted(path, _registry.buckets)
+    registry.merge(_registry)
+    return registry
+
+
+def _persist_at_exit():
+    if not _registry.enabled or os.getenv("MEMORY_SYSTEM_METRICS_PERSIST", "1") == "0":
+        return
+    try:
+        persist()
+    except Exception:
+        pass  # Never fail interpreter shutdown over metrics
+
+
+atexit.register(_persist_at_exit)
@@ -8,12 +8,24 @@ Logs reinforcements to FSRS scheduler for promotion tracking.
 Reinforcement grading:
 - Same insight from same project → GOOD (3)
 - Same insight from different project → EASY (4) (stronger signal)
+
+Existing memories are held in a TokenIndex: normalized word sets cached per
+file mtime plus an inverted index. The word sets and mtimes persist in a
+SQLite sidecar (.token_index.db in the memory directory), so a fresh
+process re-reads only files changed since the last run. Candidates are
+drawn with prefix filtering (each pair above the threshold must share one
+of the rarer tokens of the shorter text), so only memories sharing rare
+tokens are scored and results are identical to scoring every pair.
 """
 
+import math
+import os
 import re
+import sqlite3
+from contextlib import closing
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
 
 from .fsrs_scheduler import FSRSScheduler, ReviewGrade
 from .memory_ts_client import MemoryTSClient, Memory
@@ -21,6 +33,9 @@ from .memory_ts_client import MemoryTSClient, Memory
 
 DEFAULT_SIMILARITY_THRESHOLD = 0.35
 
+# Token cache sidecar, kept next to the memory files it describes
+TOKEN_INDEX_FILE = ".token_index.db"
+
 
 def normalize_text(text: str) -> set:
     """
@@ -51,9 +66,11 @@ def word_overlap_score(text_a: str, text_b: str) -> float:
     Returns:
         Similarity score 0.0-1.0
     """
-    words_a = normalize_text(text_a)
-    words_b = normalize_text(text_b)
+    return _set_overlap_score(normalize_text(text_a), normalize_text(text_b))
+
 
+def _set_overlap_score(words_a: set, words_b: set) -> float:
+    """word_overlap_score on already-normalized word sets"""
     if not words_a or not words_b:
         return 0.0
 
@@ -64,6 +81,239 @@ def word_overlap_score(text_a: str, text_b: str) -> float:
     return max(score_a, score_b)
 
 
+def _required_overlap(size: int, threshold: float) -> int:
+    """Smallest shared-word count that can reach threshold for a set of this size"""
+    # Tolerance keeps float rounding from ever raising the bound (and dropping a match)
+    return max(1, math.ceil(threshold * size - 1e-9))
+
+
+@dataclass
+class _IndexedMemory:
+    """Cached tokens for one memory file"""
+    memory_id: str
+    project_id: str
+    mtime_ns: int
+    tokens: FrozenSet[str]
+    prefix: Tuple[str, ...]
+
+
+class TokenIndex:
+    """
+    Inverted word index over memory files, refreshed incrementally by mtime.
+
+    Keeps two posting maps:
+    - full: word -> every memory containing it
+    - prefix: word -> memories whose rarest words include it
+
+    Word rarity comes from a document-frequency snapshot that is frozen
+    between rebuilds (rebuilt when the store doubles). The order only
+    affects speed, never results, because queries and memories are
+    ordered by the same snapshot.
+    """
+
+    def __init__(
+        self,
+        memory_client: MemoryTSClient,
+        similarity_threshold: float,
+        cache_path: Optional[Path] = None,
+    ):
+        """
+        Args:
+            memory_client: Client whose memory_dir is indexed
+            similarity_threshold: Threshold candidates must be able to reach
+            cache_path: SQLite file persisting word sets between processes
+                        (None = in memory only)
+        """
+        self.memory_client = memory_client
+        self.similarity_threshold = similarity_threshold
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._loaded = False
+        self._entries: Dict[str, _IndexedMemory] = {}  # file name -> entry
+        self._postings: Dict[str, Set[str]] = {}
+        self._prefix_postings: Dict[str, Set[str]] = {}
+        self._rarity: Dict[str, int] = {}
+        self._size_at_rebuild = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def refresh(self) -> None:
+        """Re-read only memory files added or modified since the last refresh"""
+        if not self._loaded:
+            self._load_cache()
+        seen = set()
+        changed: List[str] = []
+        with os.scandir(self.memory_client.memory_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = self._entries.get(entry.name)
+                if cached is not None and cached.mtime_ns == mtime_ns:
+                    continue
+                if cached is not None:
+                    self._remove(entry.name)
+                try:
+                    memory = self.memory_client._read_memory(Path(entry.path))
+                except Exception:
+                    # Skip files that can't be parsed
+                    continue
+                self._add(entry.name, memory, mtime_ns)
+                changed.append(entry.name)
+
+        removed = set(self._entries) - seen
+        for name in removed:
+            self._remove(name)
+
+        if len(self._entries) > 2 * self._size_at_rebuild:
+            self._rebuild_rarity()
+
+        self._save_cache(changed, removed)
+
+    def _connect_cache(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.cache_path))
+        # No journal files in memory_dir: creating them would advance the
+        # store generation (its mtime) and invalidate search caches
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS token_cache (
+                file_name TEXT PRIMARY KEY,
+                memory_id TEXT NOT NULL,
+                project_id TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                tokens TEXT NOT NULL
+            )
+        """)
+        return conn
+
+    def _load_cache(self) -> None:
+        """Seed the index from the sidecar (entries are re-validated by mtime in refresh)"""
+        self._loaded = True
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            with closing(self._connect_cache()) as conn:
+                rows = conn.execute(
+                    "SELECT file_name, memory_id, project_id, mtime_ns, tokens FROM token_cache"
+                ).fetchall()
+        except sqlite3.Error:
+            # Unreadable cache: drop it and rebuild from the memory files
+            self.cache_path.unlink(missing_ok=True)
+            return
+        for name, memory_id, project_id, mtime_ns, tokens in rows:
+            self._insert(name, _IndexedMemory(
+                memory_id=memory_id,
+                project_id=project_id,
+                mtime_ns=mtime_ns,
+                tokens=frozenset(tokens.split()),
+                prefix=(),
+            ))
+
+    def _save_cache(self, changed: List[str], removed: Set[str]) -> None:
+        """Write back entries re-read or dropped by this refresh (one transaction)"""
+        if self.cache_path is None or not (changed or removed):
+            return
+        try:
+            with closing(self._connect_cache()) as conn, conn:
+                conn.executemany("DELETE FROM token_cache WHERE file_name = ?", [(n,) for n in removed])
+                conn.executemany(
+                    "INSERT OR REPLACE INTO token_cache VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (name, e.memory_id, e.project_id, e.mtime_ns, " ".join(sorted(e.tokens)))
+                        for name, e in ((n, self._entries[n]) for n in changed)
+                    ],
+                )
+        except sqlite3.Error:
+            # The cache is an optimization; the in-memory index is still correct
+            pass
+
+    def best_match(
+        self,
+        content: str,
+        exclude_ids: Set[str],
+    ) -> Tuple[Optional[_IndexedMemory], float]:
+        """
+        Find the highest-scoring memory at or above the threshold.
+
+        Args:
+            content: New memory text
+            exclude_ids: Memory IDs to skip (promoted, self)
+
+        Returns:
+            (entry, score), or (None, 0.0) if nothing reaches the threshold
+        """
+        tokens = normalize_text(content)
+        if not tokens:
+            return None, 0.0
+
+        best: Optional[_IndexedMemory] = None
+        best_score = 0.0
+        for name in sorted(self._candidates(tokens)):
+            entry = self._entries[name]
+            if entry.memory_id in exclude_ids:
+                continue
+            score = _set_overlap_score(tokens, entry.tokens)
+            if score >= self.similarity_threshold and score > best_score:
+                best_score = score
+                best = entry
+
+        return best, best_score
+
+    def _candidates(self, tokens: Set[str]) -> Set[str]:
+        """Files sharing at least one word that could carry a match"""
+        candidates: Set[str] = set()
+        # Matches at least as long as the query share a word in its prefix
+        for word in self._prefix_of(tokens):
+            candidates |= self._postings.get(word, set())
+        # Shorter matches share a word in their own prefix
+        for word in tokens:
+            candidates |= self._prefix_postings.get(word, set())
+        return candidates
+
+    def _prefix_of(self, tokens) -> Tuple[str, ...]:
+        """Rarest words such that any above-threshold match must share one"""
+        ordered = sorted(tokens, key=lambda word: (self._rarity.get(word, 0), word))
+        keep = len(ordered) - _required_overlap(len(ordered), self.similarity_threshold) + 1
+        return tuple(ordered[:max(0, keep)])
+
+    def _add(self, name: str, memory: Memory, mtime_ns: int) -> None:
+        tokens = frozenset(normalize_text(memory.content))
+        self._insert(name, _IndexedMemory(
+            memory_id=memory.id,
+            project_id=memory.project_id,
+            mtime_ns=mtime_ns,
+            tokens=tokens,
+            prefix=(),
+        ))
+
+    def _insert(self, name: str, entry: _IndexedMemory) -> None:
+        entry.prefix = self._prefix_of(entry.tokens)
+        self._entries[name] = entry
+        for word in entry.tokens:
+            self._postings.setdefault(word, set()).add(name)
+        for word in entry.prefix:
+            self._prefix_postings.setdefault(word, set()).add(name)
+
+    def _remove(self, name: str) -> None:
+        entry = self._entries.pop(name)
+        for word in entry.tokens:
+            self._postings[word].discard(name)
+        for word in entry.prefix:
+            self._prefix_postings[word].discard(name)
+
+    def _rebuild_rarity(self) -> None:
+        """Re-snapshot document frequencies and recompute every prefix"""
+        self._rarity = {word: len(names) for word, names in self._postings.items() if names}
+        self._postings = {word: names for word, names in self._postings.items() if names}
+        self._prefix_postings = {}
+        for name, entry in self._entries.items():
+            entry.prefix = self._prefix_of(entry.tokens)
+            for word in entry.prefix:
+                self._prefix_postings.setdefault(word, set()).add(name)
+        self._size_at_rebuild = len(self._entries)
+
+
 @dataclass
 class ReinforcementSignal:
     """A detected reinforcement between a new memory and an existing one"""
@@ -100,6 +350,11 @@ class PatternDetector:
         self.memory_client = MemoryTSClient(memory_dir=memory_dir)
         self.scheduler = scheduler or FSRSScheduler()
         self.similarity_threshold = similarity_threshold
+        self._index = TokenIndex(
+            self.memory_client,
+            similarity_threshold,
+            cache_path=self.memory_client.memory_dir / TOKEN_INDEX_FILE,
+        )
 
     def detect_reinforcements(
         self,
@@ -111,7 +366,7 @@ class PatternDetector:
 
         For each new memory, finds the best-matching existing memory above
         the similarity threshold. Grades as GOOD (same project) or EASY
-        (cross-project). Registers and records review in FSRS.
+        (cross-project). Registers and records reviews in FSRS as one batch.
 
         Args:
             new_memories: List of dicts with 'content', 'project_id', 'importance'
@@ -123,15 +378,17 @@ class PatternDetector:
         if not new_memories:
             return []
 
-        # Load all existing memories
-        existing_memories = self.memory_client.search()
-        if not existing_memories:
+        # Bring the token index up to date (re-reads changed files only)
+        self._index.refresh()
+        if not len(self._index):
             return []
 
         # Batch-load promoted IDs to avoid O(n*m) SQLite queries
         promoted_ids = self.scheduler.get_promoted_ids()
 
         signals = []
+        registrations = {}
+        reviews = []
 
         for new_mem in new_memories:
             new_content = new_mem.get("content", "")
@@ -140,25 +397,15 @@ class PatternDetector:
             if not new_content:
                 continue
 
-            # Find best match among existing memories
-            best_match: Optional[Memory] = None
-            best_score: float = 0.0
+            # Skip already-promoted memories and self-match (memory just
+            # saved to store this session)
+            exclude_ids = promoted_ids
+            new_id = new_mem.get("id")
+            if new_id:
+                exclude_ids = promoted_ids | {new_id}
 
-            for existing in existing_memories:
-                # Skip already-promoted memories (batch lookup, no DB query)
-                if existing.id in promoted_ids:
-                    continue
-
-                # Skip self-match (memory just saved to store this session)
-                new_id = new_mem.get("id")
-                if new_id and new_id == existing.id:
-                    continue
-
-                score = word_overlap_score(new_content, existing.content)
-
-                if score >= self.similarity_threshold and score > best_score:
-                    best_score = score
-                    best_match = existing
+            # Find best match among candidate memories sharing rare words
+            best_match, best_score = self._index.best_match(new_content, exclude_ids)
 
             if best_match is None:
                 continue
@@ -169,22 +416,17 @@ class PatternDetector:
             else:
                 grade = ReviewGrade.EASY
 
-            # Register memory in FSRS if not already tracked
-            self.scheduler.register_memory(
-                best_match.id,
-                project_id=best_match.project_id,
-            )
-
-            # Record the review event
-            self.scheduler.record_review(
-                memory_id=best_match.id,
-                grade=grade,
-                project_id=new_project,
-                session_id=session_id,
-            )
+            # Queue FSRS registration (if not already tracked) and review
+            registrations.setdefault(best_match.memory_id, best_match.project_id)
+            reviews.append({
+                "memory_id": best_match.memory_id,
+                "grade": grade,
+                "project_id": new_project,
+                "session_id": session_id,
+            })
 
             signals.append(ReinforcementSignal(
-                memory_id=best_match.id,
+                memory_id=best_match.memory_id,
                 matched_memory_id=new_mem.get("id", ""),
                 similarity_score=best_score,
                 grade=grade,
@@ -192,4 +434,8 @@ class PatternDetector:
                 session_id=session_id,
             ))
 
+        # One transaction each for registrations and reviews
+        self.scheduler.register_memories(registrations)
+        self.scheduler.record_reviews(reviews)
+
         return signals
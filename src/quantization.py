@@ -0,0 +1,202 @@
+"""
+Quantized embedding codes and two-stage (shortlist + rescore) search
+
+A 384-dim float32 embedding is 1536 bytes. Two compact codes can sit
+alongside it:
+
+- int8: per-vector symmetric scalar quantization, 384 bytes + one float
+  scale. Dot products against it stay within ~1% of float32.
+- binary: one sign bit per dimension, packed to 48 bytes. Hamming
+  distance between sign codes tracks angular distance.
+
+Search scans only the codes to shortlist candidates, then rescores the
+shortlist against the float32 vectors, so the float matrix never has to
+be resident or scanned in full:
+
+    index = QuantizedIndex.from_vectors(vectors, mode="binary")
+    ids, scores = index.search(query, top_k=10, fetch=lambda ids: vectors[ids])
+
+The shortlist holds max(top_k * RESCORE_FACTOR, MIN_CANDIDATES) rows;
+raise rescore_factor when recall matters more than speed. Recall and
+timings per mode are printed by tests/test_quantization.py
+(pytest -s -k recall_report).
+"""
+
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+MODES = ("int8", "binary")
+RESCORE_FACTOR = 10      # Shortlist size as a multiple of top_k
+MIN_CANDIDATES = 50      # Never rescore fewer rows than this
+_SCAN_CHUNK = 1024       # Rows converted to float32 at a time by int8 scans (stays in L2)
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:  # NumPy < 2.0
+    _POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(codes: np.ndarray) -> np.ndarray:
+        return _POPCOUNT_TABLE[codes]
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Row-wise L2 normalization (zero rows stay zero), as float32"""
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric per-vector int8 quantization
+
+    Returns:
+        (codes, scales): (n, dim) int8 and (n,) float32 with
+        vectors ~= codes * scales[:, None]
+    """
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    peak = np.abs(vectors).max(axis=1) if vectors.size else np.zeros(len(vectors), dtype=np.float32)
+    scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+    codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales
+
+
+def dequantize_int8(codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    return np.atleast_2d(codes).astype(np.float32) * np.asarray(scales, dtype=np.float32).reshape(-1, 1)
+
+
+def binarize(vectors: np.ndarray) -> np.ndarray:
+    """Sign bits packed 8 per byte: (n, ceil(dim / 8)) uint8"""
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    return np.packbits(vectors > 0, axis=1)
+
+
+def hamming_distances(codes: np.ndarray, query_code: np.ndarray) -> np.ndarray:
+    """Bits differing between each packed row and the packed query"""
+    if not len(codes):
+        return np.zeros(0, dtype=np.int64)
+    return _popcount(np.bitwise_xor(codes, query_code.reshape(1, -1))).sum(axis=1, dtype=np.int64)
+
+
+def int8_scores(codes: np.ndarray, scales: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Approximate dot products of the quantized rows with a float query"""
+    query = np.asarray(query, dtype=np.float32).reshape(-1)
+    scores = np.empty(len(codes), dtype=np.float32)
+    for start in range(0, len(codes), _SCAN_CHUNK):
+        chunk = codes[start:start + _SCAN_CHUNK].astype(np.float32)
+        scores[start:start + _SCAN_CHUNK] = chunk @ query
+    return scores * scales
+
+
+def _top_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, largest first"""
+    k = min(k, len(values))
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < len(values):
+        picked = np.argpartition(-values, k - 1)[:k]
+    else:
+        picked = np.arange(len(values))
+    return picked[np.argsort(-values[picked], kind="stable")]
+
+
+class QuantizedIndex:
+    """
+    Compact codes for a set of unit vectors, searched in two stages
+
+    Args:
+        mode: "int8" or "binary"
+        dimension: Vector dimension
+    """
+
+    def __init__(self, mode: str = "binary", dimension: int = 384):
+        if mode not in MODES:
+            raise ValueError(f"Unknown quantization mode {mode!r} (expected one of {MODES})")
+        self.mode = mode
+        self.dimension = dimension
+        self.codes = np.zeros((0, dimension if mode == "int8" else (dimension + 7) // 8),
+                              dtype=np.int8 if mode == "int8" else np.uint8)
+        self.scales = np.zeros(0, dtype=np.float32)
+
+    @classmethod
+    def from_vectors(cls, vectors: np.ndarray, mode: str = "binary") -> "QuantizedIndex":
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        index = cls(mode, vectors.shape[1])
+        index.add(vectors)
+        return index
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray, scales: Optional[np.ndarray] = None,
+                   mode: str = "binary", dimension: int = 384) -> "QuantizedIndex":
+        """Wrap codes that were stored earlier (scales required for int8)"""
+        index = cls(mode, dimension)
+        index.codes = np.ascontiguousarray(codes, dtype=index.codes.dtype).reshape(-1, index.codes.shape[1])
+        if mode == "int8":
+            index.scales = np.asarray(scales, dtype=np.float32).reshape(-1)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.scales.nbytes
+
+    def add(self, vectors: np.ndarray):
+        """Append codes for vectors (normalized here, as search assumes cosine)"""
+        vectors = normalize(vectors)
+        if self.mode == "int8":
+            codes, scales = quantize_int8(vectors)
+            self.scales = np.concatenate([self.scales, scales])
+        else:
+            codes = binarize(vectors)
+        self.codes = np.concatenate([self.codes, codes])
+
+    def approximate_scores(self, query: np.ndarray) -> np.ndarray:
+        """Stage one: higher is more similar (negated Hamming distance for binary)"""
+        query = normalize(query)[0]
+        if self.mode == "int8":
+            return int8_scores(self.codes, self.scales, query)
+        return -hamming_distances(self.codes, binarize(query)[0]).astype(np.float32)
+
+    def shortlist(self, query: np.ndarray, candidates: int) -> np.ndarray:
+        """Row indices of the best candidates by approximate score"""
+        return _top_indices(self.approximate_scores(query), candidates)
+
+    def search(
+        self,
+        query: np.ndarray,
+        top_k: int = 10,
+        fetch: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        rescore_factor: int = RESCORE_FACTOR,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Shortlist by code, then rescore the shortlist in float32
+
+        Args:
+            query: Query vector (normalized here)
+            top_k: Results to return
+            fetch: Returns float32 vectors for an array of row indices.
+                   None skips rescoring (scores are then approximate).
+            rescore_factor: Shortlist size as a multiple of top_k
+
+        Returns:
+            (row indices, cosine similarities), best first
+        """
+        if not len(self) or top_k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        if fetch is None:
+            scores = self.approximate_scores(query)
+            ids = _top_indices(scores, top_k)
+            if self.mode == "binary":
+                # Hamming distance -> cosine estimate: cos(pi * d / dim)
+                return ids, np.cos(np.pi * -scores[ids] / self.dimension).astype(np.float32)
+            return ids, scores[ids]
+
+        candidates = self.shortlist(query, max(top_k * rescore_factor, MIN_CANDIDATES))
+        exact = normalize(fetch(candidates)) @ normalize(query)[0]
+        order = _top_indices(exact, top_k)
+        return candidates[order], exact[order]
@@ -14,9 +14,11 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from . import metrics
 from .config import cfg
 from .memory_ts_client import MemoryTSClient
 from .importance_engine import calculate_importance, get_importance_score
+from .llm_executor import get_executor
 
 # Pre-compiled regex patterns for memory extraction
 _LEARNING_PATTERNS = [
@@ -421,7 +423,7 @@ Is the new memory:
 
 Answer with ONE WORD ONLY."""
 
-        decision = ask_claude(prompt, timeout=30, max_retries=2).strip().upper()
+        decision = ask_claude(prompt, timeout=30, max_retries=2, site="dedup").strip().upper()
 
         # LLM fallback: Use stricter similarity threshold when LLM fails
         if not decision:
@@ -438,6 +440,47 @@ Answer with ONE WORD ONLY."""
         else:
             return "NEW"
 
+    def _smart_dedup_decisions(self, pairs: List[tuple]) -> List[str]:
+        """
+        Batched _smart_dedup_decision for many (new, existing, similarity) pairs.
+
+        Gray-area pairs are packed into as few LLM prompts as possible via the
+        async executor; pairs without an answer use the same similarity
+        fallback as _smart_dedup_decision.
+
+        Returns:
+            "DUPLICATE" | "UPDATE" | "NEW" per pair, in input order
+        """
+        decisions: List[Optional[str]] = []
+        gray = []
+        for new_content, existing_content, similarity in pairs:
+            if similarity < 0.5:
+                decisions.append("NEW")
+            elif similarity > 0.9:
+                decisions.append("DUPLICATE")
+            else:
+                gray.append(len(decisions))
+                decisions.append(None)
+
+        answers = get_executor().judge_sync(
+            [f"New: {pairs[i][0]}\nExisting: {pairs[i][1]}" for i in gray],
+            choices=["DUPLICATE", "UPDATE", "NEW"],
+            instruction=(
+                "For each pair of memories, is the new memory a DUPLICATE "
+                "(same fact, skip it), an UPDATE (refinement or replacement of "
+                "existing) or NEW (genuinely new information)?"
+            ),
+            timeout=30,
+        )
+
+        for i, answer in zip(gray, answers):
+            if answer is None:
+                # LLM failed - use conservative similarity-based decision
+                answer = "DUPLICATE" if pairs[i][2] > 0.75 else "NEW"
+            decisions[i] = answer
+
+        return decisions
+
     def deduplicate(
         self,
         new_memories: List[SessionMemory],
@@ -447,6 +490,7 @@ Answer with ONE WORD ONLY."""
         Remove memories that duplicate existing ones
 
         Enhanced with LLM-powered decisions for gray area (50-90% similarity).
+        All gray-area decisions are made together in batched LLM calls.
 
         Args:
             new_memories: List of newly extracted memories
@@ -470,6 +514,7 @@ Answer with ONE WORD ONLY."""
                 })
 
         unique_memories = []
+        gray_area = []  # (index in unique_memories, new content, best match, similarity)
 
         for new_mem in new_memories:
             text_clean = _NORMALIZE_PATTERN.sub(' ', new_mem.content.lower())
@@ -501,22 +546,27 @@ Answer with ONE WORD ONLY."""
                     is_duplicate = True
                     break
 
-            # Gray area (50-90%) - use LLM if enabled
-            if not is_duplicate and use_llm_dedup and best_match_similarity >= 0.5:
-                decision = self._smart_dedup_decision(
-                    new_mem.content,
-                    best_match_content,
-                    best_match_similarity
-                )
+            if is_duplicate:
+                continue
 
-                if decision == "DUPLICATE":
-                    is_duplicate = True
+            # Gray area (50-90%) - queue for batched LLM decision if enabled
+            if use_llm_dedup and best_match_similarity >= 0.5:
+                gray_area.append(
+                    (len(unique_memories), new_mem.content, best_match_content, best_match_similarity)
+                )
+            unique_memories.append(new_mem)
 
-            if not is_duplicate:
-                unique_memories.append(new_mem)
+        if gray_area:
+            decisions = self._smart_dedup_decisions([pair[1:] for pair in gray_area])
+            duplicates = {
+                pair[0] for pair, decision in zip(gray_area, decisions)
+                if decision == "DUPLICATE"
+            }
+            unique_memories = [m for i, m in enumerate(unique_memories) if i not in duplicates]
 
         return unique_memories
 
+    @metrics.timed("consolidate.session")
     def consolidate_session(
         self,
         session_file: Path,
@@ -537,17 +587,20 @@ Answer with ONE WORD ONLY."""
             ConsolidationResult with stats
         """
         # Read session
-        messages = self.read_session(session_file)
-        conversation = self.extract_conversation_text(messages)
+        with metrics.timer("consolidate.read"):
+            messages = self.read_session(session_file)
+            conversation = self.extract_conversation_text(messages)
 
         # Extract memories (pattern-based)
-        pattern_memories = self.extract_memories(conversation)
+        with metrics.timer("consolidate.extract"):
+            pattern_memories = self.extract_memories(conversation)
 
         # LLM extraction (if enabled)
         if use_llm and len(conversation) > 200:
             try:
                 from .llm_extractor import extract_with_llm, combine_extractions
-                llm_memories = extract_with_llm(conversation, project_id=self.project_id)
+                with metrics.timer("consolidate.llm_extract"):
+                    llm_memories = extract_with_llm(conversation, project_id=self.project_id)
                 extracted_memories = combine_extractions(pattern_memories, llm_memories)
             except Exception:
                 # Fall back to pattern-only on any LLM failure
@@ -556,7 +609,8 @@ Answer with ONE WORD ONLY."""
             extracted_memories = pattern_memories
 
         # Deduplicate against existing memories
-        unique_memories = self.deduplicate(extracted_memories)
+        with metrics.timer("consolidate.dedup"):
+            unique_memories = self.deduplicate(extracted_memories)
 
         # Save to memory-ts (unless skip_save=True)
         session_id = session_file.stem
@@ -566,24 +620,29 @@ Answer with ONE WORD ONLY."""
 
         if not skip_save:
             # Import contradiction detector
-            from .contradiction_detector import check_contradictions
-
-            for memory in unique_memories:
-                memory.session_id = session_id
-
-                # Check for contradictions with existing memories
-                existing = self.memory_client.search(
-                    content=memory.content,
-                    project_id=self.project_id
-                )
+            from .contradiction_detector import check_contradictions_many
 
+            # Check all memories for contradictions in batched LLM calls
+            existing_per_memory = [
                 # Convert Memory objects to dicts for contradiction checker
-                existing_dicts = [
+                [
                     {'id': m.id, 'content': m.content}
-                    for m in existing
+                    for m in self.memory_client.search(
+                        content=memory.content,
+                        project_id=self.project_id
+                    )
                 ]
+                for memory in unique_memories
+            ]
+            with metrics.timer("consolidate.contradictions"):
+                contradictions = check_contradictions_many(
+                    [memory.content for memory in unique_memories],
+                    existing_per_memory
+                )
 
-                contradiction = check_contradictions(memory.content, existing_dicts)
+            to_create = []
+            for memory, contradiction in zip(unique_memories, contradictions):
+                memory.session_id = session_id
 
                 if contradiction.action == "replace":
                     # Archive old memory and save new one
@@ -598,16 +657,21 @@ Answer with ONE WORD ONLY."""
                     except Exception:
                         pass  # Continue even if archive fails
 
-                # Save new memory (whether replacing or not)
-                created_memory = self.memory_client.create(
-                    content=memory.content,
-                    project_id=memory.project_id,
-                    tags=memory.tags,
-                    importance=memory.importance,
-                    scope="project",  # New memories start as project-scope
-                    session_id=session_id,  # Track provenance (legacy field)
-                    source_session_id=session_id  # Track provenance (new field)
-                )
+                # Queue new memory (whether replacing or not)
+                to_create.append({
+                    'content': memory.content,
+                    'project_id': memory.project_id,
+                    'tags': memory.tags,
+                    'importance': memory.importance,
+                    'scope': "project",  # New memories start as project-scope
+                    'session_id': session_id,  # Track provenance (legacy field)
+                    'source_session_id': session_id,  # Track provenance (new field)
+                })
+
+            # Save all new memories in one batch write
+            with metrics.timer("consolidate.save"):
+                created_memories = self.memory_client.create_many(to_create)
+            for memory, created_memory in zip(unique_memories, created_memories):
                 memory.id = created_memory.id
                 saved_list.append(memory)
                 saved_count += 1
@@ -39,7 +39,7 @@ def init_session_db():
     """Initialize session history database."""
     os.makedirs(SESSION_DB_PATH.parent, exist_ok=True)
 
-    with get_connection(SESSION_DB_PATH) as conn:
+    with get_connection(SESSION_DB_PATH, write=True) as conn:
         conn.execute("""
         CREATE TABLE IF NOT EXISTS sessions (
             id TEXT PRIMARY KEY,
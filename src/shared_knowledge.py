@@ -29,7 +29,7 @@ def init_shared_db():
     """Initialize shared knowledge database with schema."""
     os.makedirs(SHARED_DB_PATH.parent, exist_ok=True)
 
-    with get_connection(SHARED_DB_PATH) as conn:
+    with get_connection(SHARED_DB_PATH, write=True) as conn:
     co    nn.execute("""
             CREATE TABLE IF NOT EXISTS shared_memories (
                 id TEXT PRIMARY KEY,
@@ -92,7 +92,7 @@ def share_memory(
     if expires_after_days:
         expires_at = created_at + (expires_after_days * 86400)
 
-    with get_connection(SHARED_DB_PATH) as conn:
+    with get_connection(SHARED_DB_PATH, write=True) as conn:
     co    nn.execute("""
             INSERT INTO shared_memories (id, content, source_agent, category, project_id, created_at, expires_at, importance)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -158,7 +158,7 @@ def cleanup_expired():
     """Remove expired memories from shared knowledge layer."""
     init_shared_db()
 
-    with get_connection(SHARED_DB_PATH) as conn:
+    with get_connection(SHARED_DB_PATH, write=True) as conn:
     cu    rsor = conn.execute("""
             DELETE FROM shared_memories
             WHERE expires_at IS NOT NULL AND expires_at < ?
@@ -184,7 +184,7 @@ def clear_agent_memories(source_agent: str) -> int:
     """
     init_shared_db()
 
-    with get_connection(SHARED_DB_PATH) as conn:
+    with get_connection(SHARED_DB_PATH, write=True) as conn:
     cu    rsor = conn.execute("""
             DELETE FROM shared_memories WHERE source_agent = ?
     ""    ", (source_agent,))
@@ -0,0 +1,303 @@
+"""
+Online SQLite backup and compaction for nightly maintenance
+
+Nothing here holds a lock for long, so hooks that fire during the
+maintenance window keep working:
+
+- backup_database copies with the SQLite online backup API, giving a
+  consistent snapshot unlike a file copy taken mid-write. Under WAL the
+  whole copy is one step: a single read transaction that writers never
+  wait on. In rollback-journal mode it copies a few hundred pages at a
+  time, pausing between steps so writers get in; since a write from
+  another connection restarts the copy from page 0, after
+  BACKUP_MAX_RESTARTS restarts it falls back to one step. The source is
+  opened read-only outside the pool, so its journal mode is left alone.
+  The copy is written to a .partial file and renamed into place.
+- compact_database replaces full VACUUM (which rewrites the whole file
+  under an exclusive lock) with chunked PRAGMA incremental_vacuum on
+  databases in auto_vacuum=INCREMENTAL mode, a sampled ANALYZE and a
+  PASSIVE WAL checkpoint. Databases still in auto_vacuum=NONE are only
+  reported; enable_incremental_vacuum converts one with a single, opt-in,
+  full VACUUM.
+- prune_backups applies retention: backups older than retention_days are
+  deleted, but the newest keep_last per database always survive.
+
+Usage:
+    from memory_system.sqlite_maintenance import backup_database, backup_path_for, compact_database, prune_backups
+
+    backup_database(db_path, backup_path_for(db_path, backup_dir))
+    compact_database(db_path)
+    prune_backups(backup_dir, retention_days=7)
+"""
+
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from .db_pool import get_connection
+
+
+BACKUP_PAGES_PER_STEP = 256     # ~1MB at the default 4KB page size
+BACKUP_STEP_PAUSE = 0.005       # Seconds to yield between backup steps
+BACKUP_MAX_RESTARTS = 3         # Restarts by concurrent writes before copying in one step
+VACUUM_PAGES_PER_STEP = 512     # Free pages released per incremental_vacuum call
+VACUUM_STEP_PAUSE = 0.01        # Seconds to yield between vacuum steps
+ANALYSIS_LIMIT = 1000           # Rows sampled per index by ANALYZE
+
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+_BACKUP_NAME = re.compile(r"^(?P<stem>.+)_(?P<day>\d{8})\.db$")
+
+
+class _BackupRestarted(Exception):
+    """Raised from the progress callback to abandon a stepped backup."""
+
+
+@dataclass
+class BackupResult:
+    """Result of one online backup"""
+    source: Path
+    destination: Path
+    pages: int
+    steps: int
+    restarts: int             # Copies restarted by concurrent writes
+    size_bytes: int
+    duration_ms: float
+
+
+@dataclass
+class CompactResult:
+    """Result of compacting one database"""
+    db_path: Path
+    auto_vacuum: str
+    freed_pages: int
+    free_pages: int           # Still on the freelist afterwards
+    page_size: int
+    duration_ms: float
+
+    @property
+    def freed_bytes(self) -> int:
+        return self.freed_pages * self.page_size
+
+
+def backup_path_for(db_path: Path, backup_dir: Path, day: Optional[date] = None) -> Path:
+    """Backup file name for db_path: <backup_dir>/<stem>_<YYYYMMDD>.db"""
+    day = day or date.today()
+    return Path(backup_dir) / f"{Path(db_path).stem}_{day.strftime('%Y%m%d')}.db"
+
+
+def backup_database(
+    db_path: Path,
+    backup_path: Path,
+    pages_per_step: int = BACKUP_PAGES_PER_STEP,
+    pause: float = BACKUP_STEP_PAUSE,
+    max_restarts: int = BACKUP_MAX_RESTARTS,
+) -> BackupResult:
+    """
+    Consistent copy of a live database via the online backup API
+
+    WAL databases are copied in a single step, since readers never block
+    writers there. Others are copied in steps of pages_per_step; each write
+    by another connection restarts the copy, and after max_restarts of
+    those the rest is copied in a single step so the backup always ends.
+
+    Args:
+        db_path: Database to back up (may be in use by other processes)
+        backup_path: Destination file (replaced atomically if it exists)
+        pages_per_step: Pages copied per step in rollback-journal mode
+        pause: Seconds slept between steps
+        max_restarts: Restarts tolerated before falling back to one step
+
+    Returns:
+        BackupResult
+
+    Raises:
+        FileNotFoundError: If db_path does not exist
+        sqlite3.Error: If the backup fails (no partial file is left behind)
+    """
+    db_path = Path(db_path)
+    backup_path = Path(backup_path)
+    if not db_path.exists():
+        raise FileNotFoundError(db_path)
+
+    backup_path.parent.mkdir(parents=True, exist_ok=True)
+    partial = backup_path.with_name(backup_path.name + ".partial")
+    partial.unlink(missing_ok=True)
+
+    start = time.perf_counter()
+    progress = {"steps": 0, "pages": 0, "remaining": None, "restarts": 0}
+
+    def yield_to_writers(status, remaining, total):
+        progress["steps"] += 1
+        progress["pages"] = total
+        if progress["remaining"] is not None and remaining > progress["remaining"]:
+            progress["restarts"] += 1
+            if progress["restarts"] > max_restarts:
+                raise _BackupRestarted
+        progress["remaining"] = remaining
+        if remaining and pause:
+            time.sleep(pause)
+
+    def copy(source, pages):
+        partial.unlink(missing_ok=True)
+        dest = sqlite3.connect(str(partial))
+        try:
+            source.backup(dest, pages=pages, progress=yield_to_writers)
+        finally:
+            dest.close()
+
+    try:
+        # A plain read-only connection: a pooled one would switch the source to WAL
+        with closing(sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)) as source:
+            wal = source.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+            try:
+                copy(source, -1 if wal else pages_per_step)
+            except _BackupRestarted:
+                copy(source, -1)
+        os.replace(partial, backup_path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    return BackupResult(
+        source=db_path,
+        destination=backup_path,
+        pages=progress["pages"],
+        steps=progress["steps"],
+        restarts=progress["restarts"],
+        size_bytes=backup_path.stat().st_size,
+        duration_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+def compact_database(
+    db_path: Path,
+    pages_per_step: int = VACUUM_PAGES_PER_STEP,
+    pause: float = VACUUM_STEP_PAUSE,
+    max_steps: Optional[int] = None,
+) -> CompactResult:
+    """
+    Reclaim free pages and refresh planner statistics without a full VACUUM
+
+    Each incremental_vacuum call is its own short write transaction on the
+    pool's writer connection, so other writers interleave between steps.
+
+    Args:
+        db_path: Database to compact
+        pages_per_step: Free pages released per step
+        pause: Seconds slept between steps
+        max_steps: Stop after this many steps (None = until the freelist is empty)
+
+    Returns:
+        CompactResult
+    """
+    db_path = Path(db_path)
+    start = time.perf_counter()
+    freed = 0
+
+    with get_connection(str(db_path), write=True) as conn:
+        mode = AUTO_VACUUM_MODES.get(conn.execute("PRAGMA auto_vacuum").fetchone()[0], "none")
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+
+        if mode == "incremental":
+            steps = 0
+            while max_steps is None or steps < max_steps:
+                before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if not before:
+                    break
+                # execute() steps a row-less PRAGMA once (one page); executescript runs it to completion
+                conn.executescript(f"PRAGMA incremental_vacuum({int(pages_per_step)})")
+                released = before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if released <= 0:
+                    break
+                freed += released
+                steps += 1
+                if pause:
+                    time.sleep(pause)
+
+        conn.execute(f"PRAGMA analysis_limit={ANALYSIS_LIMIT}")
+        conn.execute("ANALYZE")
+        conn.commit()
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+
+    return CompactResult(
+        db_path=db_path,
+        auto_vacuum=mode,
+        freed_pages=freed,
+        free_pages=free_pages,
+        page_size=page_size,
+        duration_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+def enable_incremental_vacuum(db_path: Path) -> bool:
+    """
+    Switch a database to auto_vacuum=INCREMENTAL
+
+    Takes one full VACUUM (exclusive lock for its duration), so run it
+    deliberately, not on every maintenance pass.
+
+    Returns:
+        True if the mode was changed, False if it was already incremental
+    """
+    with get_connection(str(db_path), write=True) as conn:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            return False
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+        return True
+
+
+def prune_backups(
+    backup_dir: Path,
+    retention_days: int = 7,
+    keep_last: int = 3,
+    today: Optional[date] = None,
+) -> List[Path]:
+    """
+    Delete backups past the retention window
+
+    Only files named <stem>_<YYYYMMDD>.db are considered. The newest
+    keep_last backups of each database are kept regardless of age, so a
+    stretch of failed runs never leaves a database without any backup.
+
+    Args:
+        backup_dir: Directory holding backups
+        retention_days: Keep backups from the last N days
+        keep_last: Minimum backups kept per database
+        today: Reference date (default: date.today())
+
+    Returns:
+        Paths that were deleted
+    """
+    backup_dir = Path(backup_dir)
+    if not backup_dir.exists():
+        return []
+
+    cutoff = (today or date.today()) - timedelta(days=retention_days)
+    by_database = {}
+    for path in backup_dir.glob("*.db"):
+        match = _BACKUP_NAME.match(path.name)
+        if not match:
+            continue
+        try:
+            day = date(int(match["day"][:4]), int(match["day"][4:6]), int(match["day"][6:]))
+        except ValueError:
+            continue
+        by_database.setdefault(match["stem"], []).append((day, path))
+
+    deleted = []
+    for backups in by_database.values():
+        backups.sort(reverse=True)
+        for day, path in backups[keep_last:]:
+            if day < cutoff:
+                path.unlink(missing_ok=True)
+                deleted.append(path)
+    return sorted(deleted)
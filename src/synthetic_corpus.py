@@ -0,0 +1,417 @@
+"""
+Seeded synthetic corpus for benchmarks and load tests
+
+Fills a directory with N memories and the SQLite state that normally grows
+around them, using fixed distributions so the same seed always produces
+the same bytes:
+
+    <root>/<project>/memories/*.md           memory-ts files (MemoryTSClient format)
+    <root>/<project>/session-history.db      sessions + session_history tables
+    <root>/intelligence.db                   memory_relationships graph
+    <root>/access.db                         memory_access_log
+    <root>/sessions/*.jsonl                  raw session transcripts
+
+Distributions:
+    - content words: Zipf over a fixed vocabulary, lengths log-normal
+    - importance: Beta(2, 3); age: exponential, mean 30 days before EPOCH
+    - tags and projects: Zipf (a few dominate, long tail)
+    - relationships and accesses: skewed towards a small set of hot memories
+
+Nothing touches the network or a real embedding model; StubEmbedder is a
+deterministic hashed bag-of-words stand-in with the sentence-transformers
+encode() signature.
+
+Usage:
+    from memory_system.synthetic_corpus import StubEmbedder, generate_corpus
+
+    corpus = generate_corpus(tmp_path, memories=10_000, seed=0)
+    client = MemoryTSClient(memory_dir=corpus.memory_dir)
+    vectors = StubEmbedder().encode([m["content"] for m in corpus.memories])
+"""
+
+import json
+import random
+import re
+import sqlite3
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .access_tracker import VALID_ACCESS_TYPES, AccessTracker
+from .intelligence.database import IntelligenceDB
+from .memory_ts_client import Memory, MemoryTSClient
+
+
+# Fixed anchor so timestamps (and therefore files) don't depend on today
+EPOCH = datetime(2025, 1, 1)
+
+DIMENSION = 384  # Same as all-MiniLM-L6-v2
+
+_BASE_WORDS = (
+    "the a to of and in is for that on with it this as be use when not are "
+    "from by should or always never can need run before after because so "
+    "memory session project test database query index cache search file "
+    "config deploy build error fix bug user client server api model token "
+    "python sqlite schema migration commit branch review release latency "
+    "batch worker queue thread lock timeout retry backup import export "
+    "embedding vector score rank filter tag prompt context budget summary "
+    "pattern insight decision preference correction workflow pipeline "
+    "dashboard report metric alert trigger cluster graph relationship "
+    "importance decay archive consolidate extract dedup version history"
+).split()
+
+_TAGS = [
+    "#learning", "#decision", "#preference", "#bug", "#workflow", "#insight",
+    "#correction", "#architecture", "#performance", "#testing", "#deploy",
+    "#client", "#tooling", "#database", "#security", "#process", "#research",
+    "#meeting", "#idea", "#todo",
+]
+
+_PROJECTS = ["LFI", "ops", "research", "personal", "client-a", "client-b"]
+_RELATIONSHIP_TYPES = (["related"] * 6) + ["supports", "supports", "contradicts", "supersedes"]
+# Weighted draw over the tracker's own types (search-heavy, like real hooks)
+_ACCESS_WEIGHTS = {"search": 5, "direct": 3, "briefing": 1, "consolidation": 1}
+_ACCESS_TYPES = [t for t in VALID_ACCESS_TYPES for _ in range(_ACCESS_WEIGHTS.get(t, 0))]
+
+_LEARNING_LEADS = ["I learned that", "We discovered that", "Key insight:", "I noticed that"]
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+@dataclass
+class Corpus:
+    """Paths and generated records of a synthetic corpus"""
+    root: Path
+    project_id: str
+    memory_dir: Path
+    session_db: Path
+    intelligence_db: Path
+    access_db: Path
+    session_dir: Path
+    seed: int
+    memories: List[Dict] = field(default_factory=list)  # id/content/importance/tags/project_id/created
+    session_ids: List[str] = field(default_factory=list)
+    relationship_count: int = 0
+    access_count: int = 0
+
+    @property
+    def session_files(self) -> List[Path]:
+        return sorted(self.session_dir.glob("*.jsonl"))
+
+
+class StubEmbedder:
+    """
+    Deterministic offline embedder (signed feature hashing of word tokens)
+
+    Texts sharing words get similar unit vectors, which is enough for
+    timing and for sanity-checking ranking code. Drop-in for the
+    SentenceTransformer objects semantic_search / EmbeddingManager hold.
+    """
+
+    def __init__(self, dimension: int = DIMENSION):
+        self.dimension = dimension
+        self._slots: Dict[str, tuple] = {}
+
+    def _slot(self, token: str) -> tuple:
+        slot = self._slots.get(token)
+        if slot is None:
+            digest = zlib.crc32(token.encode())
+            slot = self._slots[token] = (digest % self.dimension, 1.0 if digest & 1 << 31 else -1.0)
+        return slot
+
+    def _embed(self, text: str) -> np.ndarray:
+        vec = np.zeros(self.dimension, dtype=np.float32)
+        for token in _TOKEN_RE.findall(text.lower()):
+            index, sign = self._slot(token)
+            vec[index] += sign
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def encode(self, sentences: Union[str, Sequence[str]], convert_to_numpy: bool = True, **kwargs) -> np.ndarray:
+        """Embed one text (1-D result) or a list of texts (2-D result)"""
+        if isinstance(sentences, str):
+            return self._embed(sentences)
+        if not len(sentences):
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.stack([self._embed(text) for text in sentences])
+
+
+class _Zipf:
+    """Draws items with probability proportional to 1 / rank**s"""
+
+    def __init__(self, items: Sequence, s: float = 1.07):
+        self.items = list(items)
+        self.cum_weights = list(accumulate(1.0 / (rank ** s) for rank in range(1, len(self.items) + 1)))
+
+    def sample(self, rng: random.Random, k: int = 1) -> list:
+        return rng.choices(self.items, cum_weights=self.cum_weights, k=k)
+
+
+def _vocabulary(size: int) -> List[str]:
+    """Base words first (most frequent), then synthetic rare terms"""
+    return _BASE_WORDS + [f"term{i}" for i in range(max(0, size - len(_BASE_WORDS)))]
+
+
+def _sentence(rng: random.Random, words: _Zipf, count: int) -> str:
+    text = " ".join(words.sample(rng, count))
+    return text[0].upper() + text[1:] + "."
+
+
+def _content(rng: random.Random, words: _Zipf) -> str:
+    """Log-normal length (median ~33 words), split into sentences"""
+    remaining = min(400, max(5, int(rng.lognormvariate(3.5, 0.7))))
+    sentences = []
+    while remaining > 0:
+        count = min(remaining, rng.randint(6, 18))
+        sentences.append(_sentence(rng, words, count))
+        remaining -= count
+    return " ".join(sentences)
+
+
+def _skewed_index(rng: random.Random, n: int) -> int:
+    """Index in [0, n) biased towards 0 (a few hot memories get most traffic)"""
+    return min(n - 1, int(n * rng.random() ** 3))
+
+
+def _memory_id(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _write_memories(corpus: Corpus, rng: random.Random, count: int, words: _Zipf):
+    tags = _Zipf(_TAGS)
+    projects = _Zipf([corpus.project_id] + [p for p in _PROJECTS if p != corpus.project_id], s=2.0)
+
+    for _ in range(count):
+        created = EPOCH - timedelta(days=rng.expovariate(1 / 30))
+        updated = min(EPOCH, created + timedelta(days=rng.expovariate(1 / 5)))
+        memory = Memory(
+            id=_memory_id(rng),
+            content=_content(rng, words),
+            importance=round(rng.betavariate(2, 3), 3),
+            tags=sorted(set(tags.sample(rng, rng.randint(1, 4)))),
+            project_id=projects.sample(rng)[0],
+            session_id=rng.choice(corpus.session_ids) if corpus.session_ids else None,
+            created=created.isoformat(),
+            updated=updated.isoformat(),
+            confidence_score=round(rng.uniform(0.5, 1.0), 3),
+        )
+        (corpus.memory_dir / f"{memory.id}.md").write_text(MemoryTSClient._render_memory(memory))
+        corpus.memories.append({
+            "id": memory.id,
+            "content": memory.content,
+            "importance": memory.importance,
+            "tags": memory.tags,
+            "project_id": memory.project_id,
+            "created": memory.created,
+        })
+
+
+def _transcript(rng: random.Random, words: _Zipf, turns: int) -> List[Dict]:
+    """Alternating user/assistant messages; some carry extractable learnings"""
+    messages = []
+    for turn in range(turns):
+        role = "user" if turn % 2 == 0 else "assistant"
+        text = _content(rng, words)
+        if role == "assistant" and rng.random() < 0.3:
+            text += f" {rng.choice(_LEARNING_LEADS)} {_sentence(rng, words, rng.randint(12, 30))}"
+        messages.append({"role": role, "content": text})
+    return messages
+
+
+def _write_sessions(corpus: Corpus, rng: random.Random, count: int, words: _Zipf, transcripts: int):
+    """Session-history rows (both table layouts in use) and a few JSONL transcripts"""
+    corpus.session_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(corpus.session_db)
+    try:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id TEXT PRIMARY KEY,
+                timestamp INTEGER NOT NULL,
+                name TEXT,
+                full_transcript_json TEXT NOT NULL,
+                message_count INTEGER DEFAULT 0,
+                tool_call_count INTEGER DEFAULT 0,
+                memories_extracted INTEGER DEFAULT 0,
+                duration_seconds INTEGER,
+                project_id TEXT DEFAULT 'LFI',
+                session_quality REAL DEFAULT 0.0,
+                created_at INTEGER DEFAULT (strftime('%s', 'now'))
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS session_history (
+                id TEXT PRIMARY KEY,
+                timestamp INTEGER NOT NULL,
+                name TEXT,
+                full_transcript_json TEXT NOT NULL,
+                message_count INTEGER NOT NULL,
+                tool_call_count INTEGER NOT NULL,
+                memories_extracted INTEGER DEFAULT 0
+            )
+        """)
+
+        rows = []
+        for i in range(count):
+            session_id = _memory_id(rng)
+            started = EPOCH - timedelta(days=rng.expovariate(1 / 30))
+            turns = max(2, int(rng.lognormvariate(3.0, 0.8)))
+            messages = _transcript(rng, words, min(turns, 200))
+            if i < transcripts:
+                with open(corpus.session_dir / f"{session_id}.jsonl", "w") as f:
+                    f.writelines(json.dumps(message) + "\n" for message in messages)
+            rows.append((
+                session_id,
+                int(started.timestamp() * 1000),
+                f"Session {i}",
+                json.dumps(messages),
+                len(messages),
+                rng.randint(0, turns * 2),
+                rng.randint(0, 8),
+                rng.randint(60, 4 * 3600),
+                corpus.project_id,
+                round(rng.random(), 3),
+            ))
+            corpus.session_ids.append(session_id)
+
+        conn.executemany(
+            "INSERT INTO sessions (id, timestamp, name, full_transcript_json, message_count, "
+            "tool_call_count, memories_extracted, duration_seconds, project_id, session_quality) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.executemany(
+            "INSERT INTO session_history (id, timestamp, name, full_transcript_json, "
+            "message_count, tool_call_count, memories_extracted) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [row[:7] for row in rows],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _write_relationships(corpus: Corpus, rng: random.Random, per_memory: float):
+    IntelligenceDB(corpus.intelligence_db)
+    ids = [m["id"] for m in corpus.memories]
+    n = len(ids)
+    rows = []
+    for _ in range(int(n * per_memory)):
+        source, target = ids[rng.randrange(n)], ids[_skewed_index(rng, n)]
+        if source == target:
+            continue
+        created = EPOCH - timedelta(days=rng.expovariate(1 / 30))
+        rows.append((
+            source, target, rng.choice(_RELATIONSHIP_TYPES), round(rng.uniform(0.3, 1.0), 3),
+            int(created.timestamp()), rng.random() < 0.7,
+        ))
+
+    conn = sqlite3.connect(corpus.intelligence_db)
+    try:
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO memory_relationships "
+            "(from_memory_id, to_memory_id, relationship_type, weight, created_at, auto_detected) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+        corpus.relationship_count = conn.total_changes - before
+    finally:
+        conn.close()
+
+
+def _write_accesses(corpus: Corpus, rng: random.Random, per_memory: float, words: _Zipf):
+    AccessTracker(db_path=corpus.access_db, background_flush=False).close()
+    ids = [m["id"] for m in corpus.memories]
+    n = len(ids)
+    rows = []
+    for _ in range(int(n * per_memory)):
+        accessed = EPOCH - timedelta(seconds=rng.expovariate(1 / (14 * 86400)))
+        access_type = rng.choice(_ACCESS_TYPES)
+        rows.append((
+            ids[_skewed_index(rng, n)],
+            accessed.strftime("%Y-%m-%d %H:%M:%S"),
+            access_type,
+            " ".join(words.sample(rng, 3)) if access_type == "search" else None,
+        ))
+
+    conn = sqlite3.connect(corpus.access_db)
+    try:
+        conn.executemany(
+            "INSERT INTO memory_access_log (memory_id, accessed_at, access_type, query_context) "
+            "VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+        corpus.access_count = len(rows)
+    finally:
+        conn.close()
+
+
+def generate_corpus(
+    root: Path,
+    memories: int = 1000,
+    seed: int = 0,
+    project_id: str = "LFI",
+    sessions: Optional[int] = None,
+    session_files: int = 5,
+    relationships_per_memory: float = 2.0,
+    accesses_per_memory: float = 5.0,
+    vocabulary_size: int = 5000,
+) -> Corpus:
+    """
+    Generate a corpus under root (created if missing, should be empty)
+
+    Args:
+        root: Target directory
+        memories: Number of memory files
+        seed: RNG seed; same arguments + seed -> same corpus
+        project_id: Project most memories belong to (directory name)
+        sessions: Session-history rows (default: memories / 10, at least 1)
+        session_files: How many sessions also get a JSONL transcript file
+        relationships_per_memory: Mean relationship edges per memory
+        accesses_per_memory: Mean access-log rows per memory
+        vocabulary_size: Distinct content words
+
+    Returns:
+        Corpus with paths and the generated memory records
+    """
+    root = Path(root)
+    corpus = Corpus(
+        root=root,
+        project_id=project_id,
+        memory_dir=root / project_id / "memories",
+        session_db=root / project_id / "session-history.db",
+        intelligence_db=root / "intelligence.db",
+        access_db=root / "access.db",
+        session_dir=root / "sessions",
+        seed=seed,
+    )
+    corpus.memory_dir.mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(seed)
+    words = _Zipf(_vocabulary(vocabulary_size))
+    if sessions is None:
+        sessions = max(1, memories // 10)
+
+    _write_sessions(corpus, rng, sessions, words, min(session_files, sessions))
+    _write_memories(corpus, rng, memories, words)
+    if memories:
+        _write_relationships(corpus, rng, relationships_per_memory)
+        _write_accesses(corpus, rng, accesses_per_memory, words)
+    return corpus
+
+
+def sample_queries(corpus: Corpus, count: int = 20, seed: int = 0) -> List[str]:
+    """Short queries made of words that occur in the corpus (deterministic)"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        tokens = _TOKEN_RE.findall(rng.choice(corpus.memories)["content"].lower())
+        queries.append(" ".join(rng.sample(tokens, min(len(tokens), rng.randint(1, 3)))))
+    return queries
@@ -9,16 +9,49 @@ Relationship types are free-form strings (causal, supports, contradicts,
 related, requires, etc.) — no enum constraint, to stay flexible.
 
 Database: uses its own `temporal_edges` table via db_pool.
+
+Validity windows are stored twice: as the original ISO strings (returned
+to callers) and as integer epoch seconds (valid_from_epoch/valid_to_epoch)
+covered by a composite index. All point-in-time queries compare integers,
+so "graph as of date X" is an index range scan rather than a full scan
+with string comparisons. Open-ended edges store OPEN_ENDED_EPOCH instead of
+NULL so a single `valid_to_epoch >= ?` predicate covers them.
 """
 
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from memory_system.db_pool import get_connection
 
 
+# Sentinel stored in valid_to_epoch for edges that are still active
+OPEN_ENDED_EPOCH = 2**62
+
+_EDGE_COLUMNS = """
+    id, source_id, target_id, relationship_type,
+    valid_from, valid_to, confidence, created_at
+"""
+
+
+def _to_epoch(timestamp: str) -> int:
+    """
+    Convert an ISO date/datetime string to integer epoch seconds.
+
+    Naive values are treated as UTC so that date-only strings
+    ("2026-03-15") map to midnight and compare the same way they
+    did as strings.
+
+    Raises:
+        ValueError: If timestamp is not a valid ISO 8601 string.
+    """
+    dt = datetime.fromisoformat(str(timestamp))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
 class TemporalKnowledgeGraph:
     """
     Time-aware knowledge graph for memory relationships.
@@ -38,6 +71,10 @@ class TemporalKnowledgeGraph:
         # Full history
         evolution = tkg.get_relationship_evolution("mem_001")
 
+        # Whole graph as of a date, and what changed between two dates
+        edges = tkg.snapshot_at("2026-03-15")
+        delta = tkg.diff("2026-03-15", "2026-07-01")
+
         # Close an open edge
         tkg.expire_edge("mem_001", "mem_002", "causal", "2026-12-31")
     """
@@ -58,7 +95,7 @@ class TemporalKnowledgeGraph:
 
     def _init_schema(self):
         """Create temporal_edges table and indexes."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS temporal_edges (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -68,10 +105,14 @@ class TemporalKnowledgeGraph:
                     valid_from TEXT NOT NULL,
                     valid_to TEXT,
                     confidence REAL DEFAULT 1.0,
-                    created_at TEXT NOT NULL
+                    created_at TEXT NOT NULL,
+                    valid_from_epoch INTEGER,
+                    valid_to_epoch INTEGER
                 )
             """)
 
+            self._migrate_epoch_columns(conn)
+
             # Index for querying by source
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_temporal_source_id
@@ -96,8 +137,43 @@ class TemporalKnowledgeGraph:
                 ON temporal_edges(valid_from, valid_to)
             """)
 
+            # Interval index used by point-in-time queries
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_temporal_valid_epoch
+                ON temporal_edges(valid_from_epoch, valid_to_epoch)
+            """)
+
             conn.commit()
 
+    @staticmethod
+    def _migrate_epoch_columns(conn):
+        """Add and backfill epoch columns on databases created before they existed."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(temporal_edges)")}
+        missing = [c for c in ("valid_from_epoch", "valid_to_epoch") if c not in columns]
+        if not missing:
+            return
+        for column in missing:
+            conn.execute(f"ALTER TABLE temporal_edges ADD COLUMN {column} INTEGER")
+
+        rows = conn.execute(
+            "SELECT id, valid_from, valid_to FROM temporal_edges"
+        ).fetchall()
+
+        updates = []
+        for edge_id, valid_from, valid_to in rows:
+            try:
+                from_epoch = _to_epoch(valid_from)
+                to_epoch = OPEN_ENDED_EPOCH if valid_to is None else _to_epoch(valid_to)
+            except ValueError:
+                # Unparseable legacy value: leave it out of point-in-time queries
+                continue
+            updates.append((from_epoch, to_epoch, edge_id))
+
+        conn.executemany(
+            "UPDATE temporal_edges SET valid_from_epoch = ?, valid_to_epoch = ? WHERE id = ?",
+            updates,
+        )
+
     def add_edge(
         self,
         source_id: str,
@@ -120,17 +196,24 @@ class TemporalKnowledgeGraph:
 
         Returns:
             Dict with edge_id key.
+
+        Raises:
+            ValueError: If valid_from or valid_to is not an ISO 8601 string.
         """
         created_at = datetime.now().isoformat()
+        from_epoch = _to_epoch(valid_from)
+        to_epoch = OPEN_ENDED_EPOCH if valid_to is None else _to_epoch(valid_to)
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute(
                 """
                 INSERT INTO temporal_edges
-                (source_id, target_id, relationship_type, valid_from, valid_to, confidence, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                (source_id, target_id, relationship_type, valid_from, valid_to,
+                 confidence, created_at, valid_from_epoch, valid_to_epoch)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (source_id, target_id, relationship_type, valid_from, valid_to, confidence, created_at),
+                (source_id, target_id, relationship_type, valid_from, valid_to,
+                 confidence, created_at, from_epoch, to_epoch),
             )
             conn.commit()
             edge_id = cursor.lastrowid
@@ -153,21 +236,94 @@ class TemporalKnowledgeGraph:
         Returns:
             List of edge dicts.
         """
+        epoch = _to_epoch(timestamp)
         with get_connection(self.db_path) as conn:
             cursor = conn.execute(
-                """
-                SELECT id, source_id, target_id, relationship_type,
-                       valid_from, valid_to, confidence, created_at
+                f"""
+                SELECT {_EDGE_COLUMNS}
                 FROM temporal_edges
                 WHERE (source_id = ? OR target_id = ?)
-                  AND valid_from <= ?
-                  AND (valid_to IS NULL OR valid_to >= ?)
-                ORDER BY valid_from
+                  AND valid_from_epoch <= ?
+                  AND valid_to_epoch >= ?
+                ORDER BY valid_from_epoch
                 """,
-                (memory_id, memory_id, timestamp, timestamp),
+                (memory_id, memory_id, epoch, epoch),
             )
             return [self._row_to_dict(row) for row in cursor.fetchall()]
 
+    def snapshot_at(
+        self,
+        timestamp: str,
+        relationship_type: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Get the full set of edges active at timestamp, in one query.
+
+        Uses the same validity rule as get_edges_at, but across the whole
+        graph, so callers rendering "the graph as of date X" don't need a
+        query per node.
+
+        Args:
+            timestamp: ISO date string to take the snapshot at.
+            relationship_type: Optional filter on relationship type.
+
+        Returns:
+            List of edge dicts sorted by valid_from, then id.
+        """
+        epoch = _to_epoch(timestamp)
+        sql = f"""
+            SELECT {_EDGE_COLUMNS}
+            FROM temporal_edges
+            WHERE valid_from_epoch <= ?
+              AND valid_to_epoch >= ?
+        """
+        params = [epoch, epoch]
+        if relationship_type is not None:
+            sql += " AND relationship_type = ?"
+            params.append(relationship_type)
+        sql += " ORDER BY valid_from_epoch, id"
+
+        with get_connection(self.db_path) as conn:
+            cursor = conn.execute(sql, params)
+            return [self._row_to_dict(row) for row in cursor.fetchall()]
+
+    def diff(self, from_timestamp: str, to_timestamp: str) -> Dict[str, List[Dict]]:
+        """
+        Get the edges that changed between two snapshots.
+
+        Equivalent to comparing snapshot_at(from_timestamp) with
+        snapshot_at(to_timestamp), but evaluated in SQL so only the changed
+        edges are read. Works in either direction: if to_timestamp is
+        earlier, "added" holds edges that existed then but not at
+        from_timestamp.
+
+        Args:
+            from_timestamp: ISO date string of the starting snapshot.
+            to_timestamp: ISO date string of the ending snapshot.
+
+        Returns:
+            Dict with "added" (active at to_timestamp only) and "removed"
+            (active at from_timestamp only) lists of edge dicts.
+        """
+        from_epoch = _to_epoch(from_timestamp)
+        to_epoch = _to_epoch(to_timestamp)
+        sql = f"""
+            SELECT {_EDGE_COLUMNS}
+            FROM temporal_edges
+            WHERE valid_from_epoch <= ? AND valid_to_epoch >= ?
+              AND NOT (valid_from_epoch <= ? AND valid_to_epoch >= ?)
+            ORDER BY valid_from_epoch, id
+        """
+
+        with get_connection(self.db_path) as conn:
+            added = conn.execute(sql, (to_epoch, to_epoch, from_epoch, from_epoch)).fetchall()
+            removed = conn.execute(sql, (from_epoch, from_epoch, to_epoch, to_epoch)).fetchall()
+
+        return {
+            "added": [self._row_to_dict(row) for row in added],
+            "removed": [self._row_to_dict(row) for row in removed],
+        }
+
     def get_relationship_evolution(self, memory_id: str) -> List[Dict]:
         """
         Get all edges for a memory, sorted chronologically by valid_from.
@@ -241,17 +397,18 @@ class TemporalKnowledgeGraph:
         Returns:
             True if an edge was expired, False if no matching open-ended edge found.
         """
-        with get_connection(self.db_path) as conn:
+        to_epoch = _to_epoch(valid_to)
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute(
                 """
                 UPDATE temporal_edges
-                SET valid_to = ?
+                SET valid_to = ?, valid_to_epoch = ?
                 WHERE source_id = ?
                   AND target_id = ?
                   AND relationship_type = ?
                   AND valid_to IS NULL
                 """,
-                (valid_to, source_id, target_id, relationship_type),
+                (valid_to, to_epoch, source_id, target_id, relationship_type),
             )
             conn.commit()
             return cursor.rowcount > 0
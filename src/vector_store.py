@@ -19,15 +19,33 @@ Usage:
 
 Migration from SQLite:
     store.import_from_sqlite("path/to/intelligence.db")
+
+Quantized search:
+    store = VectorStore(quantization="binary")  # or "int8"
+
+    Only compact codes are held in memory (48 bytes per vector for binary,
+    388 for int8, against 1536 for float32). The float32 rows live in
+    <collection>.f32, a headerless row-major file that is memory-mapped
+    rather than loaded, so only the shortlist find_similar rescores is read
+    from disk. There is no FAISS index in this mode. Rows and codes
+    (<collection>.<mode>.codes, plus .scales for int8) are appended on each
+    store. Deletes rewrite them.
+
+    find_similar shortlists by Hamming distance / int8 dot product and
+    rescores the shortlist in float32. See quantization.py. A store
+    written in one mode is converted on load when opened in the other.
 """
 
 import json
+import os
 import sqlite3
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 
+from .quantization import MODES, QuantizedIndex
+
 try:
     import faiss
 except ImportError:
@@ -36,6 +54,7 @@ except ImportError:
 DEFAULT_PERSIST_DIR = str(Path.home() / ".local/share/memory/vector_store")
 DEFAULT_COLLECTION = "memory_embeddings"
 DIMENSION = 384  # all-MiniLM-L6-v2 output dimension
+REWRITE_CHUNK_ROWS = 10_000  # Rows copied at a time when converting or rewriting the .f32 file
 
 
 class VectorStoreError(Exception):
@@ -52,6 +71,7 @@ class VectorStore:
         - Metadata storage alongside vectors (JSON sidecar)
         - Batch operations for bulk import
         - Migration from SQLite embeddings table
+        - Optional int8 / binary codes for two-stage search
     """
 
     def __init__(
@@ -59,6 +79,7 @@ class VectorStore:
         persist_dir: Optional[str] = None,
         collection_name: str = DEFAULT_COLLECTION,
         dimension: int = DIMENSION,
+        quantization: Optional[str] = None,
     ):
         if faiss is None:
             raise ImportError(
@@ -68,19 +89,30 @@ class VectorStore:
         self.persist_dir = persist_dir or DEFAULT_PERSIST_DIR
         self.collection_name = collection_name
         self.dimension = dimension
+        if quantization is not None and quantization not in MODES:
+            raise VectorStoreError(f"Unknown quantization {quantization!r} (expected one of {MODES})")
+        self.quantization = quantization
 
         Path(self.persist_dir).mkdir(parents=True, exist_ok=True)
 
         self._index_path = Path(self.persist_dir) / f"{collection_name}.index"
         self._meta_path = Path(self.persist_dir) / f"{collection_name}.meta.json"
+        self._rows_path = Path(self.persist_dir) / f"{collection_name}.f32"
+        self._codes_path = Path(self.persist_dir) / f"{collection_name}.{quantization}.codes" if quantization else None
+        self._scales_path = Path(self.persist_dir) / f"{collection_name}.int8.scales"
 
-        # Maps: position in FAISS index ↔ content_hash
+        # Maps: position in FAISS index (or row in the .f32 file) ↔ content_hash
         self._hash_to_pos: dict[str, int] = {}
         self._pos_to_hash: dict[int, str] = {}
         self._metadata: dict[str, dict] = {}
 
         # FAISS index — inner product on L2-normalized vectors = cosine similarity
-        self._index = faiss.IndexFlatIP(dimension)
+        # (None when quantized: float rows are memory-mapped from disk instead)
+        self._index = None if quantization else faiss.IndexFlatIP(dimension)
+
+        # Compact codes in row order, and the memory map of the float rows
+        self._quantized: Optional[QuantizedIndex] = QuantizedIndex(quantization, dimension) if quantization else None
+        self._rows: Optional[np.ndarray] = None
 
         # Load existing data if available
         self._load()
@@ -96,20 +128,7 @@ class VectorStore:
         metadata: Optional[dict] = None,
     ) -> None:
         """Store an embedding vector with optional metadata."""
-        vec = self._normalize(embedding)
-
-        if content_hash in self._hash_to_pos:
-            # Update: remove old, add new
-            self._remove_from_index(content_hash)
-
-        pos = self._index.ntotal
-        self._index.add(vec.reshape(1, -1))
-        self._hash_to_pos[content_hash] = pos
-        self._pos_to_hash[pos] = content_hash
-        if metadata:
-            self._metadata[content_hash] = metadata
-
-        self._save()
+        self.batch_store([(content_hash, embedding, metadata)])
 
     def get_embedding(self, content_hash: str) -> Optional[np.ndarray]:
         """Retrieve an embedding by content hash."""
@@ -117,8 +136,7 @@ class VectorStore:
             return None
 
         pos = self._hash_to_pos[content_hash]
-        vec = self._index.reconstruct(pos)
-        return np.array(vec, dtype=np.float32)
+        return np.array(self._reconstruct([pos])[0], dtype=np.float32)
 
     def find_similar(
         self,
@@ -127,13 +145,17 @@ class VectorStore:
         threshold: float = 0.0,
     ) -> list[dict]:
         """Find similar embeddings by vector similarity."""
-        if self._index.ntotal == 0:
+        if self._ntotal() == 0:
             return []
 
         query = self._normalize(query_embedding).reshape(1, -1)
-        n_results = min(top_k, self._index.ntotal)
+        n_results = min(top_k, self._ntotal())
 
-        scores, indices = self._index.search(query, n_results)
+        if self.quantization:
+            indices, scores = self._quantized.search(query[0], n_results, fetch=self._reconstruct)
+            scores, indices = scores.reshape(1, -1), indices.reshape(1, -1)
+        else:
+            scores, indices = self._index.search(query, n_results)
 
         items = []
         for score, idx in zip(scores[0], indices[0]):
@@ -177,18 +199,25 @@ class VectorStore:
         if not items:
             return
 
+        pending = []
         for content_hash, embedding, metadata in items:
-            vec = self._normalize(embedding)
             if content_hash in self._hash_to_pos:
+                # Removal renumbers rows, so add what is queued first
+                self._add(pending)
+                pending = []
                 self._remove_from_index(content_hash)
 
-            pos = self._index.ntotal
-            self._index.add(vec.reshape(1, -1))
+            pos = self._ntotal() + len(pending)
+            pending.append(self._normalize(embedding))
             self._hash_to_pos[content_hash] = pos
             self._pos_to_hash[pos] = content_hash
             if metadata:
                 self._metadata[content_hash] = metadata
+            if len(pending) >= batch_size:
+                self._add(pending)
+                pending = []
 
+        self._add(pending)
         self._save()
 
     def import_from_sqlite(self, sqlite_db_path: str) -> int:
@@ -217,6 +246,47 @@ class VectorStore:
     # Internal
     # ------------------------------------------------------------------
 
+    def _ntotal(self) -> int:
+        """Rows in the FAISS index, or in the .f32 file when quantized."""
+        return len(self._quantized) if self.quantization else self._index.ntotal
+
+    def _add(self, vectors: list[np.ndarray]) -> None:
+        """Append normalized vectors (and their codes when quantized)."""
+        if not vectors:
+            return
+        block = np.vstack(vectors).astype(np.float32)
+        if not self.quantization:
+            self._index.add(block)
+            return
+
+        start = len(self._quantized)
+        with open(self._rows_path, "ab") as f:
+            f.write(block.tobytes())
+        self._quantized.add(block)
+        self._append_codes(start)
+
+    def _append_codes(self, start: int) -> None:
+        """Append codes from row start onward to the code files."""
+        with open(self._codes_path, "ab") as f:
+            f.write(self._quantized.codes[start:].tobytes())
+        if self.quantization == "int8":
+            with open(self._scales_path, "ab") as f:
+                f.write(self._quantized.scales[start:].tobytes())
+
+    def _float_rows(self) -> np.ndarray:
+        """Memory map of the .f32 file, remapped when rows were appended."""
+        n = len(self._quantized)
+        if self._rows is None or len(self._rows) != n:
+            self._rows = np.memmap(self._rows_path, dtype=np.float32, mode="r", shape=(n, self.dimension))
+        return self._rows
+
+    def _reconstruct(self, positions) -> np.ndarray:
+        """Float32 vectors at the given index positions."""
+        positions = np.asarray(positions, dtype=np.int64)
+        if self.quantization:
+            return np.array(self._float_rows()[positions])
+        return self._index.reconstruct_batch(positions)
+
     def _normalize(self, vec: np.ndarray) -> np.ndarray:
         """L2-normalize a vector for cosine similarity via inner product."""
         v = vec.astype(np.float32)
@@ -230,6 +300,11 @@ class VectorStore:
         if content_hash not in self._hash_to_pos:
             return
 
+        if self.quantization:
+            self._remove_row(self._hash_to_pos[content_hash])
+            self._metadata.pop(content_hash, None)
+            return
+
         # Collect all vectors except the one to remove
         remaining = []
         for h, pos in sorted(self._hash_to_pos.items(), key=lambda x: x[1]):
@@ -250,27 +325,123 @@ class VectorStore:
 
         self._metadata.pop(content_hash, None)
 
+    def _remove_row(self, pos: int) -> None:
+        """Drop one row from the .f32 and code files, renumbering later rows."""
+        rows = self._float_rows()
+        partial = self._rows_path.with_name(self._rows_path.name + ".partial")
+        with open(partial, "wb") as f:
+            for start in range(0, len(rows), REWRITE_CHUNK_ROWS):
+                chunk = np.arange(start, min(start + REWRITE_CHUNK_ROWS, len(rows)))
+                f.write(np.ascontiguousarray(rows[chunk[chunk != pos]]).tobytes())
+        self._rows = None
+        os.replace(partial, self._rows_path)
+
+        self._quantized.codes = np.delete(self._quantized.codes, pos, axis=0)
+        if self.quantization == "int8":
+            self._quantized.scales = np.delete(self._quantized.scales, pos)
+        self._codes_path.unlink(missing_ok=True)
+        self._scales_path.unlink(missing_ok=True)
+        self._append_codes(0)
+
+        self._hash_to_pos = {h: p - (p > pos) for h, p in self._hash_to_pos.items() if p != pos}
+        self._pos_to_hash = {p: h for h, p in self._hash_to_pos.items()}
+
     def _save(self) -> None:
-        """Persist index and metadata to disk."""
-        faiss.write_index(self._index, str(self._index_path))
+        """Persist index (rows and codes are already appended) and metadata to disk."""
+        if not self.quantization:
+            faiss.write_index(self._index, str(self._index_path))
         meta = {
             "hash_to_pos": self._hash_to_pos,
             "metadata": self._metadata,
+            "layout": "rows" if self.quantization else "faiss",
+            "quantization": self.quantization,
         }
         self._meta_path.write_text(json.dumps(meta))
 
     def _load(self) -> None:
         """Load index and metadata from disk."""
-        if self._index_path.exists() and self._meta_path.exists():
-            try:
-                self._index = faiss.read_index(str(self._index_path))
-                data = json.loads(self._meta_path.read_text())
-                self._hash_to_pos = {k: int(v) for k, v in data.get("hash_to_pos", {}).items()}
-                self._pos_to_hash = {int(v): k for k, v in self._hash_to_pos.items()}
-                self._metadata = data.get("metadata", {})
-            except Exception:
-                # Corrupted — start fresh
+        if not self._meta_path.exists():
+            return
+        try:
+            data = json.loads(self._meta_path.read_text())
+            self._hash_to_pos = {k: int(v) for k, v in data.get("hash_to_pos", {}).items()}
+            self._pos_to_hash = {int(v): k for k, v in self._hash_to_pos.items()}
+            self._metadata = data.get("metadata", {})
+            rows_layout = data.get("layout") == "rows"
+
+            if not self.quantization:
                 self._index = faiss.IndexFlatIP(self.dimension)
-                self._hash_to_pos.clear()
-                self._pos_to_hash.clear()
-                self._metadata.clear()
+                if rows_layout:
+                    self._index_from_rows()
+                else:
+                    self._index = faiss.read_index(str(self._index_path))
+                return
+
+            if not rows_layout:
+                self._rows_from_index()
+            n = self._rows_path.stat().st_size // (4 * self.dimension) if self._rows_path.exists() else 0
+            if data.get("quantization") == self.quantization and self._codes_fit(n):
+                codes = np.fromfile(self._codes_path, dtype=self._quantized.codes.dtype)
+                scales = np.fromfile(self._scales_path, dtype=np.float32) if self.quantization == "int8" else None
+                self._quantized = QuantizedIndex.from_codes(
+                    codes, scales, mode=self.quantization, dimension=self.dimension
+                )
+            else:
+                self._rebuild_codes(n)
+            if len(self._hash_to_pos) != n:
+                raise VectorStoreError(f"{self._rows_path} holds {n} rows, metadata {len(self._hash_to_pos)}")
+        except Exception:
+            # Corrupted — start fresh
+            self._index = None if self.quantization else faiss.IndexFlatIP(self.dimension)
+            self._hash_to_pos.clear()
+            self._pos_to_hash.clear()
+            self._metadata.clear()
+            if self.quantization:
+                self._quantized = QuantizedIndex(self.quantization, self.dimension)
+                self._rows = None
+                for path in (self._rows_path, self._codes_path, self._scales_path):
+                    path.unlink(missing_ok=True)
+
+    def _codes_fit(self, n: int) -> bool:
+        """Whether the code files on disk hold exactly n rows."""
+        if not self._codes_path.exists():
+            return False
+        row_bytes = self._quantized.codes.shape[1] * self._quantized.codes.itemsize
+        if self._codes_path.stat().st_size != n * row_bytes:
+            return False
+        return self.quantization != "int8" or (
+            self._scales_path.exists() and self._scales_path.stat().st_size == 4 * n
+        )
+
+    def _rebuild_codes(self, n: int) -> None:
+        """Recompute codes from the .f32 file, chunk by chunk."""
+        self._quantized = QuantizedIndex(self.quantization, self.dimension)
+        self._codes_path.unlink(missing_ok=True)
+        self._scales_path.unlink(missing_ok=True)
+        if n:
+            rows = np.memmap(self._rows_path, dtype=np.float32, mode="r", shape=(n, self.dimension))
+            for start in range(0, n, REWRITE_CHUNK_ROWS):
+                self._quantized.add(np.array(rows[start:start + REWRITE_CHUNK_ROWS]))
+        self._append_codes(0)
+
+    def _rows_from_index(self) -> None:
+        """Convert a store written without quantization: FAISS index -> .f32 file."""
+        index = faiss.read_index(str(self._index_path))
+        partial = self._rows_path.with_name(self._rows_path.name + ".partial")
+        with open(partial, "wb") as f:
+            for start in range(0, index.ntotal, REWRITE_CHUNK_ROWS):
+                count = min(REWRITE_CHUNK_ROWS, index.ntotal - start)
+                f.write(index.reconstruct_n(start, count).astype(np.float32).tobytes())
+        os.replace(partial, self._rows_path)
+        self._codes_path.with_suffix(".npz").unlink(missing_ok=True)  # Codes as earlier versions saved them
+        self._index_path.unlink(missing_ok=True)
+
+    def _index_from_rows(self) -> None:
+        """Convert a store written with quantization: .f32 file -> FAISS index."""
+        n = self._rows_path.stat().st_size // (4 * self.dimension)
+        if n:
+            rows = np.memmap(self._rows_path, dtype=np.float32, mode="r", shape=(n, self.dimension))
+            for start in range(0, n, REWRITE_CHUNK_ROWS):
+                self._index.add(np.array(rows[start:start + REWRITE_CHUNK_ROWS]))
+        faiss.write_index(self._index, str(self._index_path))
+        self._rows_path.unlink(missing_ok=True)
@@ -21,6 +21,12 @@ Process:
 5. Present as morning briefing: "While you slept, I connected these dots..."
 
 Integration: Runs nightly (3am), outputs to synthesis queue for review
+
+Performance: pairwise discovery runs on a sparse memory x keyword matrix.
+Shared-keyword counts for every pair come from blocked sparse products
+(rows of BLOCK_SIZE memories against the whole store), so only pairs that
+actually share keywords are ever materialized and the full store can be
+processed instead of a top-N sample.
 """
 
 import sqlite3
@@ -28,10 +34,13 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from memory_system.db_pool import get_connection
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from collections import defaultdict, Counter
+import json
 import re
 
+import numpy as np
+
 
 @dataclass
 class MemoryNode:
@@ -83,10 +92,33 @@ class DreamSynthesizer:
 
     # Discovery thresholds
     SEMANTIC_THRESHOLD = 0.6  # Minimum similarity for connection
+    CONTRADICTION_THRESHOLD = 0.2  # Minimum topic similarity (stance words excluded) for a contradiction
+    MAX_CONNECTIONS_PER_MEMORY = 5  # Strongest causal / contradiction partners kept per memory
     TEMPORAL_WINDOW = timedelta(days=7)  # Co-occurrence window
     MIN_SUPPORT = 3  # Minimum memories to form synthesis
     NOVELTY_THRESHOLD = 0.5  # Minimum novelty to surface
-    MAX_MEMORIES = 1000  # PERFORMANCE FIX: Limit to top N memories (prevents O(n²) explosion)
+    # Cap on memories loaded. Pairwise passes are sparse blocked products with
+    # a similarity threshold, and causal / contradiction output is capped per
+    # memory, so connections grow linearly with the store.
+    MAX_MEMORIES = 50_000
+    BLOCK_SIZE = 512  # Memories per row block in sparse pair products
+
+    # Common stop words dropped by _extract_keywords
+    STOP_WORDS = frozenset({
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+        'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
+        'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has', 'had', 'do',
+        'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+        'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it',
+        'we', 'they', 'what', 'which', 'who', 'when', 'where', 'why', 'how'
+    })
+
+    # Contradiction indicators (positive stance words, negative stance words)
+    CONTRADICTION_PAIRS = [
+        (['always', 'must', 'should'], ['never', 'avoid', 'don\'t']),
+        (['works', 'effective', 'good'], ['fails', 'broken', 'bad']),
+        (['increase', 'more', 'higher'], ['decrease', 'less', 'lower']),
+    ]
 
     def __init__(self, db_path: str = None, memory_db_path: str = None):
         """Initialize synthesizer with database"""
@@ -101,7 +133,7 @@ class DreamSynthesizer:
 
     def _init_db(self):
         """Create tables for synthesis tracking"""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS dream_connections (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -170,8 +202,7 @@ class DreamSynthesizer:
         connections.extend(self._discover_contradictions(memories))
 
         # Save connections
-        for conn in connections:
-            self._save_connection(conn)
+        self._save_connections(connections)
 
         # Generate syntheses from connections
         syntheses = self._generate_syntheses(connections, memories)
@@ -185,59 +216,52 @@ class DreamSynthesizer:
 
     def _load_memories(self) -> List[MemoryNode]:
         """
-        Load memories from memory-ts database.
+        Load memories from memory-ts.
 
-        PERFORMANCE FIX: Limits to top MAX_MEMORIES (default 1000) by importance + recency.
-
-        Prevents O(n²) explosion:
-        - Before: 10K memories = 100M comparisons = mathematically infeasible
-        - After: 1K memories = 1M comparisons = ~30s processing
-
-        Selection strategy:
-        - Top 70% by importance (high-value memories)
-        - Top 30% by recency (recent context)
+        Memories whose created timestamp can't be parsed are skipped (they
+        can't be placed in a time window). Above MAX_MEMORIES, keeps the
+        top N by a composite score:
+        - Importance (70%) - high-value memories
+        - Recency (30%) - memories from the last 30 days score highest
         """
         try:
-            # Try to load from memory-ts client
             from memory_system.memory_ts_client import MemoryTSClient
 
-            client = MemoryTSClient(project_id="LFI")
-            all_memories = client.search()  # Get all
+            # list() rather than search(): a nightly scan isn't a user access
+            client = MemoryTSClient(enable_access_logging=False)
+            all_memories = client.list()
 
             if not all_memories:
                 return []
 
-            # Sort by composite score: importance (70%) + recency (30%)
-            now = datetime.now().timestamp()
-
-            def score_memory(mem):
-                # Importance component (0.0-1.0)
-                importance_score = mem.importance
-
-                # Recency component (0.0-1.0) - memories from last 30 days score highest
-                days_old = (now - mem.created.timestamp()) / 86400
-                recency_score = max(0.0, 1.0 - (days_old / 30))
-
-                # Composite
-                return (importance_score * 0.7) + (recency_score * 0.3)
-
-            scored_memories = [(mem, score_memory(mem)) for mem in all_memories]
-            scored_memories.sort(key=lambda x: x[1], reverse=True)
-
-            # Take top MAX_MEMORIES
-            top_memories = [mem for mem, score in scored_memories[:self.MAX_MEMORIES]]
-
-            # Convert to MemoryNode
             nodes = []
-            for mem in top_memories:
+            skipped = 0
+            for mem in all_memories:
+                created_at = self._parse_created(mem.created)
+                if created_at is None:
+                    skipped += 1
+                    continue
                 nodes.append(MemoryNode(
                     id=mem.id,
                     content=mem.content,
                     project=mem.project_id or "global",
                     tags=mem.tags or [],
                     importance=mem.importance,
-                    created_at=mem.created
+                    created_at=created_at
                 ))
+            if skipped:
+                print(f"⚠️  Skipped {skipped} memories with a missing or malformed created date")
+
+            if self.MAX_MEMORIES is not None and len(nodes) > self.MAX_MEMORIES:
+                now = datetime.now().timestamp()
+
+                def score_memory(node):
+                    days_old = (now - node.created_at.timestamp()) / 86400
+                    recency_score = max(0.0, 1.0 - (days_old / 30))
+                    return (node.importance * 0.7) + (recency_score * 0.3)
+
+                nodes.sort(key=score_memory, reverse=True)
+                nodes = nodes[:self.MAX_MEMORIES]
 
             print(f"📊 Dream Mode: Selected {len(nodes)} memories (from {len(all_memories)} total)")
             return nodes
@@ -246,42 +270,90 @@ class DreamSynthesizer:
             print(f"⚠️  Failed to load memories: {e}")
             return []
 
-    def _discover_semantic_connections(self, memories: List[MemoryNode]) -> List[Connection]:
-        """Find semantically similar memories with different surface keywords"""
-        connections = []
-
-        # Build word vectors (simplified - real version would use embeddings)
-        vectors = {}
-        for memory in memories:
-            words = set(self._extract_keywords(memory.content))
-            vectors[memory.id] = words
-
-        # Compare all pairs
-        for i, mem1 in enumerate(memories):
-            for mem2 in memories[i+1:]:
-                # Skip if same project (looking for cross-project insights)
-                if mem1.project == mem2.project:
-                    continue
-
-                # Calculate semantic similarity (Jaccard for simplicity)
-                words1 = vectors[mem1.id]
-                words2 = vectors[mem2.id]
+    @staticmethod
+    def _parse_created(value) -> Optional[datetime]:
+        """Created timestamp as naive local time (aware values converted), or None"""
+        if isinstance(value, datetime):
+            created = value
+        else:
+            try:
+                created = datetime.fromisoformat(str(value).strip())
+            except (TypeError, ValueError):
+                return None
+        if created.tzinfo is not None:
+            created = created.astimezone().replace(tzinfo=None)
+        return created
+
+    def _keyword_matrix(self, keyword_sets: List[Set[str]]):
+        """
+        Build a binary sparse memory x keyword matrix (CSR).
 
-                if not words1 or not words2:
-                    continue
+        Returns:
+            (matrix, vocabulary) where vocabulary maps keyword -> column
+        """
+        from scipy import sparse
+
+        vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+        for words in keyword_sets:
+            indices.extend(vocabulary.setdefault(w, len(vocabulary)) for w in words)
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(keyword_sets), max(1, len(vocabulary)))
+        )
+        return matrix, vocabulary
+
+    def _iter_overlapping_pairs(self, matrix) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Yield (rows, cols, shared_counts) for every pair i < j sharing a keyword.
 
-                intersection = words1 & words2
-                union = words1 | words2
-                similarity = len(intersection) / len(union)
+        Each block multiplies BLOCK_SIZE rows against the whole matrix, so
+        memory stays bounded by the number of overlapping pairs per block.
+        Pairs come out ordered by (i, j), matching a nested loop.
+        """
+        transposed = matrix.T.tocsr()
+        for start in range(0, matrix.shape[0], self.BLOCK_SIZE):
+            block = (matrix[start:start + self.BLOCK_SIZE] @ transposed).tocoo()
+            rows = block.row + start
+            keep = block.col > rows
+            rows, cols, counts = rows[keep], block.col[keep], block.data[keep]
+            order = np.lexsort((cols, rows))
+            yield rows[order], cols[order], counts[order]
 
-                if similarity >= self.SEMANTIC_THRESHOLD:
-                    connections.append(Connection(
-                        memory_ids=[mem1.id, mem2.id],
-                        connection_type='semantic',
-                        strength=similarity,
-                        evidence=f"Shared concepts: {', '.join(list(intersection)[:5])}",
-                        insight=f"Similar pattern in {mem1.project} and {mem2.project}"
-                    ))
+    def _discover_semantic_connections(self, memories: List[MemoryNode]) -> List[Connection]:
+        """Find semantically similar memories with different surface keywords"""
+        connections = []
+        if len(memories) < 2:
+            return connections
+
+        # Keyword sets (simplified - real version would use embeddings)
+        keyword_sets = [set(self._extract_keywords(m.content)) for m in memories]
+        matrix, _ = self._keyword_matrix(keyword_sets)
+        sizes = np.array([len(words) for words in keyword_sets])
+        project_codes = self._project_codes(memories)
+
+        for rows, cols, shared in self._iter_overlapping_pairs(matrix):
+            # Skip same project (looking for cross-project insights)
+            cross = project_codes[rows] != project_codes[cols]
+            rows, cols, shared = rows[cross], cols[cross], shared[cross]
+
+            # Jaccard similarity from shared counts and set sizes
+            similarity = shared / (sizes[rows] + sizes[cols] - shared)
+            hits = similarity >= self.SEMANTIC_THRESHOLD
+
+            for i, j, sim in zip(rows[hits], cols[hits], similarity[hits]):
+                mem1, mem2 = memories[i], memories[j]
+                intersection = keyword_sets[i] & keyword_sets[j]
+                connections.append(Connection(
+                    memory_ids=[mem1.id, mem2.id],
+                    connection_type='semantic',
+                    strength=float(sim),
+                    evidence=f"Shared concepts: {', '.join(sorted(intersection)[:5])}",
+                    insight=f"Similar pattern in {mem1.project} and {mem2.project}"
+                ))
 
         return connections
 
@@ -339,28 +411,34 @@ class DreamSynthesizer:
             r'therefore (.+)',
         ]
 
-        for memory in memories:
+        keyword_sets = [set(self._extract_keywords(m.content)) for m in memories]
+        matrix, vocabulary = self._keyword_matrix(keyword_sets)
+        by_keyword = matrix.tocsc()  # Cheap column slices
+
+        for idx, memory in enumerate(memories):
             for pattern in causal_patterns:
                 match = re.search(pattern, memory.content, re.IGNORECASE)
                 if match:
                     effect = match.group(1)
 
-                    # Find memories about the effect
-                    effect_keywords = set(self._extract_keywords(effect))
-
-                    for other in memories:
-                        if other.id == memory.id:
-                            continue
-
-                        other_keywords = set(self._extract_keywords(other.content))
-                        if effect_keywords & other_keywords:
-                            connections.append(Connection(
-                                memory_ids=[memory.id, other.id],
-                                connection_type='causal',
-                                strength=0.6,
-                                evidence=f"Causal language: '{match.group(0)[:50]}...'",
-                                insight=f"Causal chain detected: {memory.project} → {other.project}"
-                            ))
+                    # Memories about the effect, strongest keyword overlap first
+                    columns = sorted({vocabulary[w] for w in self._extract_keywords(effect) if w in vocabulary})
+                    if not columns:
+                        continue
+                    shared = np.asarray(by_keyword[:, columns].sum(axis=1)).ravel()
+                    shared[idx] = 0
+                    candidates = np.flatnonzero(shared)
+                    strongest = candidates[np.lexsort((candidates, -shared[candidates]))]
+
+                    for other_idx in strongest[:self.MAX_CONNECTIONS_PER_MEMORY]:
+                        other = memories[other_idx]
+                        connections.append(Connection(
+                            memory_ids=[memory.id, other.id],
+                            connection_type='causal',
+                            strength=0.6,
+                            evidence=f"Causal language: '{match.group(0)[:50]}...'",
+                            insight=f"Causal chain detected: {memory.project} → {other.project}"
+                        ))
 
         return connections
 
@@ -368,45 +446,80 @@ class DreamSynthesizer:
         """Find contradictory memories that need synthesis"""
         connections = []
 
-        # Contradiction indicators
-        contradiction_pairs = [
-            (['always', 'must', 'should'], ['never', 'avoid', 'don\'t']),
-            (['works', 'effective', 'good'], ['fails', 'broken', 'bad']),
-            (['increase', 'more', 'higher'], ['decrease', 'less', 'lower']),
-        ]
-
-        for i, mem1 in enumerate(memories):
-            for mem2 in memories[i+1:]:
-                # Check for contradictory language about similar topics
-                words1 = set(self._extract_keywords(mem1.content))
-                words2 = set(self._extract_keywords(mem2.content))
-
-                # Must have topic overlap
-                if not (words1 & words2):
-                    continue
-
-                # Check for contradictory language
-                mem1_lower = mem1.content.lower()
-                mem2_lower = mem2.content.lower()
+        # Stance flags per memory, whole words only: (n, pairs) booleans
+        stance_words = set()
+        for pos, neg in self.CONTRADICTION_PAIRS:
+            stance_words.update(pos, neg)
+        words = [set(re.findall(r"[a-z']+", m.content.lower())) for m in memories]
+        positive = np.array([
+            [not words_i.isdisjoint(pos) for pos, _ in self.CONTRADICTION_PAIRS]
+            for words_i in words
+        ], dtype=bool).reshape(len(memories), len(self.CONTRADICTION_PAIRS))
+        negative = np.array([
+            [not words_i.isdisjoint(neg) for _, neg in self.CONTRADICTION_PAIRS]
+            for words_i in words
+        ], dtype=bool).reshape(len(memories), len(self.CONTRADICTION_PAIRS))
+
+        # Only memories taking some stance can contradict another
+        flagged = np.flatnonzero(positive.any(axis=1) | negative.any(axis=1))
+        if len(flagged) < 2:
+            return connections
+
+        # Topic = keywords other than the stance words themselves
+        keyword_sets = [set(self._extract_keywords(memories[i].content)) - stance_words for i in flagged]
+        matrix, _ = self._keyword_matrix(keyword_sets)
+        sizes = np.array([len(topic) for topic in keyword_sets])
+        positive, negative = positive[flagged], negative[flagged]
+
+        # Pairs on the same topic, then opposite stances on any indicator pair
+        pairs = ([], [], [])
+        for rows, cols, shared in self._iter_overlapping_pairs(matrix):
+            similarity = shared / (sizes[rows] + sizes[cols] - shared)
+            opposed = (similarity >= self.CONTRADICTION_THRESHOLD) & (
+                (positive[rows] & negative[cols]) | (negative[rows] & positive[cols])
+            ).any(axis=1)
+            for found, values in zip(pairs, (rows[opposed], cols[opposed], similarity[opposed])):
+                found.append(values)
+
+        rows, cols, similarity = (np.concatenate(found) for found in pairs)
+        keep = self._strongest_per_memory(rows, cols, similarity, self.MAX_CONNECTIONS_PER_MEMORY)
+
+        for i, j in zip(rows[keep], cols[keep]):
+            mem1, mem2 = memories[flagged[i]], memories[flagged[j]]
+            shared = sorted(keyword_sets[i] & keyword_sets[j])
+            connections.append(Connection(
+                memory_ids=[mem1.id, mem2.id],
+                connection_type='contradiction',
+                strength=0.8,
+                evidence=f"Contradictory stances on: {', '.join(shared[:3])}",
+                insight=f"Context difference between {mem1.project} and {mem2.project}?"
+            ))
 
-                for positive_words, negative_words in contradiction_pairs:
-                    has_positive_1 = any(w in mem1_lower for w in positive_words)
-                    has_negative_1 = any(w in mem1_lower for w in negative_words)
-                    has_positive_2 = any(w in mem2_lower for w in positive_words)
-                    has_negative_2 = any(w in mem2_lower for w in negative_words)
+        return connections
 
-                    # Contradiction if opposite patterns
-                    if (has_positive_1 and has_negative_2) or (has_negative_1 and has_positive_2):
-                        connections.append(Connection(
-                            memory_ids=[mem1.id, mem2.id],
-                            connection_type='contradiction',
-                            strength=0.8,
-                            evidence=f"Contradictory stances on: {', '.join(list(words1 & words2)[:3])}",
-                            insight=f"Context difference between {mem1.project} and {mem2.project}?"
-                        ))
-                        break
+    @staticmethod
+    def _strongest_per_memory(rows: np.ndarray, cols: np.ndarray, scores: np.ndarray, k: int) -> np.ndarray:
+        """
+        Mask of pairs among the k highest-scoring pairs of either endpoint.
 
-        return connections
+        Ties go to the earlier pair, so at most k pairs are kept per memory
+        from its own side and the result is deterministic.
+        """
+        count = len(rows)
+        ends = np.concatenate([rows, cols])
+        pair = np.tile(np.arange(count), 2)
+        order = np.lexsort((pair, -np.tile(scores, 2), ends))
+        ranked_ends = ends[order]
+        rank = np.arange(len(order)) - np.searchsorted(ranked_ends, ranked_ends, side='left')
+        keep = np.zeros(count, dtype=bool)
+        keep[pair[order][rank < k]] = True
+        return keep
+
+    @staticmethod
+    def _project_codes(memories: List[MemoryNode]) -> np.ndarray:
+        """Integer code per memory's project (for vectorized same-project checks)"""
+        codes: Dict[str, int] = {}
+        return np.array([codes.setdefault(m.project, len(codes)) for m in memories])
 
     def _generate_syntheses(self, connections: List[Connection], memories: List[MemoryNode]) -> List[Synthesis]:
         """Generate higher-level syntheses from connections"""
@@ -474,18 +587,8 @@ class DreamSynthesizer:
 
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract meaningful keywords from text"""
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
-            'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has', 'had', 'do',
-            'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
-            'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it',
-            'we', 'they', 'what', 'which', 'who', 'when', 'where', 'why', 'how'
-        }
-
         words = re.findall(r'\b[a-z]{3,}\b', text.lower())
-        return [w for w in words if w not in stop_words]
+        return [w for w in words if w not in self.STOP_WORDS]
 
     def get_morning_briefing(self, limit: int = 5) -> List[Synthesis]:
         """Get top syntheses for morning review"""
@@ -518,7 +621,7 @@ class DreamSynthesizer:
 
     def mark_presented(self, synthesis_id: str):
         """Mark synthesis as presented to user"""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 UPDATE synthesis_queue
                 SET presented = 1, presented_at = ?
@@ -529,7 +632,7 @@ class DreamSynthesizer:
         """Save connection to database"""
         import json
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 INSERT INTO dream_connections
                 (memory_ids, connection_type, strength, evidence, insight, discovered_at)
@@ -543,11 +646,34 @@ class DreamSynthesizer:
                 datetime.now().isoformat()
             ))
 
+    def _save_connections(self, connections: List[Connection]):
+        """Save many connections in one transaction"""
+        if not connections:
+            return
+        discovered_at = datetime.now().isoformat()
+
+        with get_connection(self.db_path, write=True) as conn:
+            conn.executemany("""
+                INSERT INTO dream_connections
+                (memory_ids, connection_type, strength, evidence, insight, discovered_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    json.dumps(c.memory_ids),
+                    c.connection_type,
+                    c.strength,
+                    c.evidence,
+                    c.insight,
+                    discovered_at
+                )
+                for c in connections
+            ])
+
     def _save_synthesis(self, synthesis: Synthesis):
         """Save synthesis to database"""
         import json
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 INSERT INTO dream_syntheses
                 (id, title, insight, supporting_memories, connection_ids,
@@ -567,7 +693,7 @@ class DreamSynthesizer:
         """Add synthesis to morning review queue"""
         priority = synthesis.novelty_score * synthesis.confidence
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 INSERT INTO synthesis_queue
                 (synthesis_id, priority, queued_at)
@@ -71,7 +71,7 @@ class TemporalPatternPredictor:
 
     def _init_schema(self):
         """Create tables if not exist."""
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             # Temporal patterns table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS temporal_patterns (
@@ -167,7 +167,7 @@ class TemporalPatternPredictor:
         now = int(datetime.now().timestamp())
         dt = datetime.now()
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             cursor = conn.execute("""
                 INSERT INTO memory_access_log
                 (memory_id, accessed_at, access_type, day_of_week,
@@ -201,7 +201,7 @@ class TemporalPatternPredictor:
         if min_occurrences is None:
             min_occurrences = self.MIN_OCCURRENCES
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             # Query access logs grouped by memory_id + day_of_week + hour_of_day
             cursor = conn.execute("""
                 SELECT
@@ -348,7 +348,7 @@ class TemporalPatternPredictor:
         """
         now = int(datetime.now().timestamp())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 UPDATE temporal_patterns
                 SET
@@ -367,7 +367,7 @@ class TemporalPatternPredictor:
         """
         now = int(datetime.now().timestamp())
 
-        with get_connection(self.db_path) as conn:
+        with get_connection(self.db_path, write=True) as conn:
             conn.execute("""
                 UPDATE temporal_patterns
                 SET
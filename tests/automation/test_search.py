@@ -2,12 +2,16 @@
 Tests for Feature 30: Memory-Aware Search
 """
 
+import os
+import time
 import pytest
 import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
 
-from memory_system.automation.search import MemoryAwareSearch, SearchQuery, SearchResult
+from memory_system.automation.search import (
+    MemoryAwareSearch, MemoryFilterIndex, SearchQuery, SearchResult
+)
 from memory_system.memory_ts_client import MemoryTSClient, Memory
 
 
@@ -242,3 +246,110 @@ def test_calculate_relevance_combined(search, mock_memories):
 
     # Should be weighted combination
     assert 0 < score <= 1
+
+
+@pytest.fixture
+def store_search(search, tmp_path):
+    """Search over a real temporary store."""
+    search.client = MemoryTSClient(memory_dir=tmp_path, enable_access_logging=False)
+    now = datetime.now()
+    specs = [
+        ("Client design review", 0.8, ["client", "design"], "ProjectA", now - timedelta(days=2)),
+        ("API deadline Friday", 0.9, ["deadline", "urgent"], "ProjectB", now - timedelta(days=5)),
+        ("Button styling fix", 0.3, ["fix", "ui"], "ProjectA", now - timedelta(days=1)),
+        ("January meeting notes", 0.7, ["meeting"], "ProjectC", now - timedelta(days=40)),
+        ("Design system tokens", 0.6, ["design", "ui"], "ProjectA", now - timedelta(days=10)),
+    ]
+    for content, importance, tags, project, created in specs:
+        search.client.create(content, project, tags, importance=importance, created=created.isoformat())
+    return search
+
+
+def test_search_advanced_filters_match_brute_force(store_search):
+    """Index masks agree with filtering every memory in Python."""
+    now = datetime.now()
+    memories = store_search.client.list()
+    cases = [
+        dict(project_id="ProjectA"),
+        dict(tags=["design"]),
+        dict(tags=["ui"], exclude_tags=["fix"]),
+        dict(min_importance=0.5, max_importance=0.85),
+        dict(date_start=now - timedelta(days=7)),
+        dict(date_start=now - timedelta(days=30), date_end=now - timedelta(days=3), project_id="ProjectA"),
+        dict(project_id="Unknown"),
+        dict(tags=["nope"]),
+    ]
+    for filters in cases:
+        expected = {
+            m.id for m in memories
+            if (not filters.get("project_id") or m.project_id == filters["project_id"])
+            and (not filters.get("tags") or any(t in m.tags for t in filters["tags"]))
+            and not any(t in m.tags for t in filters.get("exclude_tags") or [])
+            and m.importance >= filters.get("min_importance", 0)
+            and m.importance <= filters.get("max_importance", 1)
+            and datetime.fromisoformat(m.created) >= filters.get("date_start", datetime.min)
+            and datetime.fromisoformat(m.created) <= filters.get("date_end", datetime.max)
+        }
+        results = store_search.search_advanced(limit=50, **filters)
+        assert {r.memory.id for r in results} == expected, filters
+
+
+def test_search_advanced_sorts_on_columns(store_search):
+    """importance and recency orders sort descending on their column."""
+    by_importance = store_search.search_advanced(order_by="importance")
+    assert [r.memory.importance for r in by_importance] == [0.9, 0.8, 0.7, 0.6, 0.3]
+
+    by_recency = store_search.search_advanced(order_by="recency", limit=2)
+    assert [r.memory.content for r in by_recency] == ["Button styling fix", "Client design review"]
+    assert by_recency[0].relevance_score > by_recency[1].relevance_score
+
+
+def test_search_advanced_hydrates_only_returned_rows(store_search, monkeypatch):
+    """Only the rows that survive filtering and the limit are parsed in full."""
+    store_search.search_advanced(limit=1)  # build the index
+
+    reads = []
+    original = store_search.client._read_memory
+
+    def counting_read(path):
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(store_search.client, "_read_memory", counting_read)
+    results = store_search.search_advanced(project_id="ProjectA", limit=2)
+
+    assert len(results) == 2
+    assert len(reads) == 2
+
+
+def _settle(memory_dir):
+    """Age the store's mtime past the settle window."""
+    past = time.time_ns() - 10 * 1_000_000_000
+    os.utime(memory_dir, ns=(past, past))
+
+
+def test_store_index_rebuilds_on_store_write(store_search):
+    """The index is reused until the store generation changes."""
+    _settle(store_search.client.memory_dir)
+    index = store_search._store_index()
+    assert store_search._store_index() is index
+    assert len(index) == 5
+
+    store_search.client.create("Fresh note", "ProjectD", ["new"], importance=0.5)
+    rebuilt = store_search._store_index()
+    assert rebuilt is not index
+    assert len(rebuilt) == 6
+    # A write may still share this generation's timestamp: rebuild until settled
+    assert store_search._store_index() is not rebuilt
+    _settle(store_search.client.memory_dir)
+    settled = store_search._store_index()
+    assert store_search._store_index() is settled
+    assert [r.memory.content for r in store_search.search_advanced(project_id="ProjectD")] == ["Fresh note"]
+
+
+def test_filter_index_from_memories(mock_memories):
+    """Loaded memories (datetime created) index and hydrate as-is."""
+    index = MemoryFilterIndex.from_memories(mock_memories)
+    keep = index.mask(project_id="ProjectA", min_importance=0.5)
+    rows = index.order(keep, "importance")
+    assert index.hydrate(rows, client=None) == [mock_memories[0]]
@@ -20,3 +20,13 @@ _src = str(Path(__file__).resolve().parent.parent / "src")
 import memory_system
 if _src not in memory_system.__path__:
     memory_system.__path__.insert(0, _src)
+
+
+# Run LLM call sites without the persistent response cache so answers don't
+# leak between tests (an env var, so stale module copies see it too)
+import os
+os.environ.setdefault("LLM_CACHE_ENABLED", "0")
+
+# Keep this process's exit-time metrics flush out of the user's metrics store
+import tempfile
+os.environ.setdefault("MEMORY_SYSTEM_METRICS_DB", str(Path(tempfile.mkdtemp(prefix="metrics-")) / "metrics.db"))
@@ -290,3 +290,96 @@ def test_generate_topic_label_fallback(clustering):
     assert isinstance(keywords, list)
     assert len(topic) > 0
     assert len(keywords) > 0
+
+
+class _FakeEmbeddings:
+    """Embedding manager stand-in mapping content to fixed vectors."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def get_embeddings(self, contents):
+        return np.vstack([self.vectors[c] for c in contents]).astype(np.float32)
+
+
+def _blob_corpus(per_blob=10, seed=0):
+    """Three well-separated blobs of {id, content} memories with vectors."""
+    rng = np.random.default_rng(seed)
+    centers = np.eye(3, 8) * 10
+    memories, vectors = [], {}
+    for b, center in enumerate(centers):
+        for i in range(per_blob):
+            content = f"blob{b}-{i}"
+            memories.append({"id": f"mem_{b}_{i}", "content": content})
+            vectors[content] = center + rng.normal(scale=0.1, size=8)
+    return memories, vectors
+
+
+@pytest.fixture
+def blob_clustering(temp_db, monkeypatch):
+    """Clustering over a synthetic corpus with labels stubbed (no LLM)."""
+    memories, vectors = _blob_corpus()
+    clustering = MemoryClustering(db_path=temp_db, embedding_manager=_FakeEmbeddings(vectors))
+    monkeypatch.setattr(clustering, "_list_memories", lambda: list(memories))
+    monkeypatch.setattr(clustering, "_generate_topic_label", lambda contents: (contents[0], ["k"]))
+    clustering.test_memories = memories
+    clustering.test_vectors = vectors
+    return clustering
+
+
+def test_full_run_stores_centroids_and_memberships(blob_clustering):
+    """Full clustering persists centroids and bulk-inserts every membership."""
+    clusters = blob_clustering.cluster_memories(min_clusters=2, max_clusters=5, min_memories=5)
+
+    assert len(clusters) == 3
+    assert sum(c.member_count for c in clusters) == 30
+    centroids = blob_clustering._load_centroids()
+    assert set(centroids) == {c.cluster_id for c in clusters}
+    assert all(vec.shape == (8,) for vec, _ in centroids.values())
+
+    # Each blob lands in one cluster
+    for b in range(3):
+        assert len({blob_clustering.get_memory_cluster(f"mem_{b}_{i}").cluster_id
+                    for i in range(10)}) == 1
+
+
+def test_incremental_assigns_new_memories_to_nearest_centroid(blob_clustering):
+    """Incremental run keeps clusters and only assigns unclustered memories."""
+    clusters = blob_clustering.cluster_memories(min_clusters=2, max_clusters=5, min_memories=5)
+    ids_before = {c.cluster_id for c in clusters}
+    target = blob_clustering.get_memory_cluster("mem_1_0").cluster_id
+    old_centroid, old_count = blob_clustering._load_centroids()[target]
+
+    new_vector = np.eye(3, 8)[1] * 10 + 0.5
+    blob_clustering.test_vectors["new blob1 memory"] = new_vector
+    blob_clustering.test_memories.append({"id": "mem_new", "content": "new blob1 memory"})
+
+    clusters = blob_clustering.cluster_memories(min_clusters=2, max_clusters=5, incremental=True)
+
+    assert {c.cluster_id for c in clusters} == ids_before
+    assert blob_clustering.get_memory_cluster("mem_new").cluster_id == target
+    new_centroid, new_count = blob_clustering._load_centroids()[target]
+    assert new_count == old_count + 1
+    expected = old_centroid + (new_vector - old_centroid) / (old_count + 1)
+    np.testing.assert_allclose(new_centroid, expected, rtol=1e-5)
+
+
+def test_incremental_drops_deleted_memories(blob_clustering):
+    """Memberships of memories that no longer exist are removed."""
+    blob_clustering.cluster_memories(min_clusters=2, max_clusters=5, min_memories=5)
+    target = blob_clustering.get_memory_cluster("mem_2_0").cluster_id
+    del blob_clustering.test_memories[20]
+
+    blob_clustering.cluster_memories(incremental=True)
+
+    assert blob_clustering.get_memory_cluster("mem_2_0") is None
+    assert blob_clustering.get_cluster(target).member_count == 9
+
+
+def test_incremental_without_centroids_runs_full(blob_clustering):
+    """With nothing stored yet, incremental mode falls back to a full run."""
+    assert blob_clustering.add_memories([{"id": "x", "content": "blob0-0"}]) is None
+    clusters = blob_clustering.cluster_memories(
+        min_clusters=2, max_clusters=5, min_memories=5, incremental=True
+    )
+    assert len(clusters) == 3
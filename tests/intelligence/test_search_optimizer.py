@@ -97,6 +97,9 @@ def test_cache_hit_second_search(optimizer, monkeypatch):
 
     # Mock the MemoryTSClient to return our stored memories
     class MockClient:
+        def __init__(self, memory_dir=None, enable_access_logging=True):
+            pass
+
         def get(self, memory_id):
             for m in stored_memories:
                 if m.id == memory_id:
@@ -126,7 +129,8 @@ def test_cache_hit_second_search(optimizer, monkeypatch):
     assert call_count[0] == 1  # Still 1 - search function NOT called again
     assert len(results2) == 3  # Should get 3 results from cache
 
-    # Verify cache hit count increased
+    # Verify cache hit count increased (hit counts are written in batches)
+    optimizer.flush_hits()
     with sqlite3.connect(optimizer.db_path) as conn:
         row = conn.execute("SELECT hits FROM search_cache").fetchone()
         assert row[0] == 2  # Second hit
@@ -211,14 +215,14 @@ def test_cache_expiry(optimizer):
         conn.execute("UPDATE search_cache SET expires_at = ?", (past,))
         conn.commit()
 
-    # Should not use expired cache
+    # Should not use expired cache (fresh optimizer: nothing in the in-process tier)
     call_count = [0]
 
     def counting_search(query):
         call_count[0] += 1
         return mock_search(query)
 
-    optimizer.search_with_cache("test", counting_search)
+    SearchOptimizer(db_path=optimizer.db_path).search_with_cache("test", counting_search)
     assert call_count[0] == 1  # Search function called (cache expired)
 
 
@@ -258,6 +262,9 @@ def test_cache_efficiency(optimizer):
 
     # Mock the MemoryTSClient to return our stored memories
     class MockClient:
+        def __init__(self, memory_dir=None, enable_access_logging=True):
+            pass
+
         def get(self, memory_id):
             for m in stored_memories:
                 if m.id == memory_id:
@@ -281,7 +288,8 @@ def test_cache_efficiency(optimizer):
     # Verify search_fn only called once (cache working)
     assert call_count[0] == 1
 
-    # Verify cache hit count
+    # Verify cache hit count (hit counts are written in batches)
+    optimizer.flush_hits()
     with sqlite3.connect(optimizer.db_path) as conn:
         row = conn.execute("SELECT hits FROM search_cache").fetchone()
         assert row[0] == 11  # 1 initial + 10 cache hits
@@ -291,6 +299,171 @@ def test_cache_efficiency(optimizer):
         sys.modules['memory_system.memory_ts_client'] = _orig_module
 
 
+def _settle(memory_dir):
+    """Age the store's mtime past the settle window (as if the last write were old)"""
+    import os
+    import time
+    past = time.time_ns() - 10 * 1_000_000_000
+    os.utime(memory_dir, ns=(past, past))
+
+
+def test_store_write_invalidates_cache(temp_db, tmp_path):
+    """Creating, updating or archiving a memory makes cached results misses"""
+    from memory_system.memory_ts_client import MemoryTSClient
+
+    client = MemoryTSClient(memory_dir=tmp_path, enable_access_logging=False)
+    for i in range(3):
+        client.create(f"cache note {i}", "LFI", ["#test"], importance=0.5)
+    _settle(tmp_path)
+    optimizer = SearchOptimizer(db_path=temp_db, memory_dir=tmp_path)
+
+    call_count = [0]
+
+    def search(query):
+        call_count[0] += 1
+        return client.search(content=query)
+
+    assert len(optimizer.search_with_cache("cache note", search)) == 3
+    optimizer.search_with_cache("cache note", search)
+    assert call_count[0] == 1
+
+    new = client.create("cache note 3", "LFI", ["#test"], importance=0.5)
+    assert len(optimizer.search_with_cache("cache note", search)) == 4
+    assert call_count[0] == 2
+
+    # Unsettled generation: results are not cached yet
+    optimizer.search_with_cache("cache note", search)
+    assert call_count[0] == 3
+    _settle(tmp_path)
+    optimizer.search_with_cache("cache note", search)
+    optimizer.search_with_cache("cache note", search)
+    assert call_count[0] == 4
+
+    client.update(new.id, content="cache note changed")
+    _settle(tmp_path)
+    updated = optimizer.search_with_cache("cache note", search)
+    assert call_count[0] == 5
+    assert "cache note changed" in [m.content for m in updated]
+
+    client.archive(new.id)
+    _settle(tmp_path)
+    optimizer.search_with_cache("cache note", search)
+    assert call_count[0] == 6
+
+
+def test_sqlite_tier_hydrates_for_new_process(temp_db, tmp_path):
+    """A fresh optimizer serves the SQLite tier while the generation matches"""
+    from memory_system.memory_ts_client import MemoryTSClient
+
+    client = MemoryTSClient(memory_dir=tmp_path, enable_access_logging=False)
+    created = [client.create(f"shared note {i}", "LFI", ["#test"], importance=0.5) for i in range(3)]
+    _settle(tmp_path)
+
+    def search(query):
+        return client.search(content=query)
+
+    SearchOptimizer(db_path=temp_db, memory_dir=tmp_path).search_with_cache("shared note", search)
+
+    def failing_search(query):
+        raise AssertionError("search_fn should not run on a cache hit")
+
+    second = SearchOptimizer(db_path=temp_db, memory_dir=tmp_path)
+    results = second.search_with_cache("shared note", failing_search)
+    assert sorted(m.id for m in results) == sorted(m.id for m in created)
+
+    # Served from the in-process tier now; hit counts land on flush
+    second.search_with_cache("shared note", failing_search)
+    second.flush_hits()
+    with sqlite3.connect(temp_db) as conn:
+        assert conn.execute("SELECT hits FROM search_cache").fetchone()[0] == 3
+
+
+def test_memory_cache_is_bounded(optimizer, monkeypatch):
+    """The in-process tier evicts least recently used entries"""
+    # Patch the globals the class actually reads (other tests re-import memory_system)
+    monkeypatch.setitem(SearchOptimizer.search_with_cache.__globals__, "MEMORY_CACHE_SIZE", 2)
+
+    def mock_search(query):
+        return [MockMemory(f"{query}{i}", "test", datetime.now().isoformat()) for i in range(3)]
+
+    for query in ("a", "b", "c"):
+        optimizer.search_with_cache(query, mock_search)
+
+    assert len(optimizer._memory_cache) == 2
+
+
+def test_write_in_same_mtime_tick_invalidates_cache(temp_db, tmp_path):
+    """The write counter catches updates the directory mtime misses"""
+    import os
+    from memory_system.memory_ts_client import MemoryTSClient
+
+    client = MemoryTSClient(memory_dir=tmp_path, enable_access_logging=False)
+    created = [client.create(f"tick note {i}", "LFI", ["#test"], importance=0.5) for i in range(3)]
+    _settle(tmp_path)
+    optimizer = SearchOptimizer(db_path=temp_db, memory_dir=tmp_path)
+
+    call_count = [0]
+
+    def search(query):
+        call_count[0] += 1
+        return client.search(content=query)
+
+    optimizer.search_with_cache("tick note", search)
+    mtime = tmp_path.stat().st_mtime_ns
+    client.update(created[0].id, content="tick note changed")
+    os.utime(tmp_path, ns=(mtime, mtime))
+
+    results = optimizer.search_with_cache("tick note", search)
+    assert call_count[0] == 2
+    assert "tick note changed" in [m.content for m in results]
+
+
+def test_cached_results_are_copies(temp_db, tmp_path):
+    """Mutating returned results never changes what later hits return"""
+    from memory_system.memory_ts_client import MemoryTSClient
+
+    client = MemoryTSClient(memory_dir=tmp_path, enable_access_logging=False)
+    for i in range(3):
+        client.create(f"copy note {i}", "LFI", ["#test"], importance=0.5)
+    _settle(tmp_path)
+
+    def search(query):
+        return client.search(content=query)
+
+    def mutate(results):
+        for memory in results:
+            memory.importance = 0.0
+            memory.tags.append("#mutated")
+
+    # Miss, then SQLite-tier hit in a fresh process, then in-process hit
+    mutate(SearchOptimizer(db_path=temp_db, memory_dir=tmp_path).search_with_cache("copy note", search))
+    optimizer = SearchOptimizer(db_path=temp_db, memory_dir=tmp_path)
+    mutate(optimizer.search_with_cache("copy note", search))
+    mutate(optimizer.search_with_cache("copy note", search))
+
+    results = optimizer.search_with_cache("copy note", search)
+    assert [m.importance for m in results] == [0.5] * 3
+    assert all(m.tags == ["#test"] for m in results)
+
+
+def test_pending_hits_flushed_at_exit(optimizer):
+    """Buffered hit counts are written by the atexit hook"""
+    import weakref
+
+    def mock_search(query):
+        return [MockMemory(f"exit{i}", "test", datetime.now().isoformat()) for i in range(3)]
+
+    optimizer.search_with_cache("exit query", mock_search)
+    optimizer.search_with_cache("exit query", mock_search)
+    assert optimizer._pending_hits
+
+    SearchOptimizer.search_with_cache.__globals__["_flush_at_exit"](weakref.ref(optimizer))
+
+    assert not optimizer._pending_hits
+    with sqlite3.connect(optimizer.db_path) as conn:
+        assert conn.execute("SELECT hits FROM search_cache").fetchone()[0] == 2
+
+
 # === Ranking Tests ===
 
 def test_rank_results_basic(optimizer):
@@ -377,6 +550,9 @@ def test_get_cache_stats(optimizer):
 
     # Mock the MemoryTSClient to return our stored memories
     class MockClient:
+        def __init__(self, memory_dir=None, enable_access_logging=True):
+            pass
+
         def get(self, memory_id):
             for m in stored_memories:
                 if m.id == memory_id:
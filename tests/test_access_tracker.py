@@ -245,6 +245,136 @@ class TestGetStats:
         assert stats["by_type"]["maintenance"] == 0
 
 
+# ── Write coalescing ──────────────────────────────────────────────────────
+
+
+def _stored_count(db) -> int:
+    """Rows visible to a separate connection (i.e. flushed)."""
+    conn = sqlite3.connect(str(db))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM memory_access_log").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestWriteCoalescing:
+    def test_buffered_until_flush(self, tmp_path):
+        db = tmp_path / "buf.db"
+        t = AccessTracker(db_path=db, flush_size=10, flush_interval=60, background_flush=False)
+        for _ in range(3):
+            t.log_access("mem-b", "search")
+        assert _stored_count(db) == 0
+        assert t.flush() == 3
+        assert _stored_count(db) == 3
+        t.close()
+
+    def test_reads_include_buffered_events(self, tmp_path):
+        db = tmp_path / "merge.db"
+        t = AccessTracker(db_path=db, flush_size=100, flush_interval=60, background_flush=False)
+        t.log_access("mem-m", "search", query_context="q1")
+        t.flush()
+        t.log_access("mem-m", "direct", query_context="q2")
+        t.log_access("mem-n", "briefing")
+
+        assert t.get_access_frequency("mem-m")["total_accesses"] == 2
+        assert t.get_access_history("mem-m")[0]["query_context"] == "q2"
+        assert t.get_most_accessed()[0] == {
+            "memory_id": "mem-m",
+            "total_accesses": 2,
+            "last_accessed": t.get_access_frequency("mem-m")["last_accessed"],
+        }
+        stats = t.get_stats()
+        assert stats["total_accesses"] == 3
+        assert stats["unique_memories_accessed"] == 2
+        assert "mem-m" not in t.get_never_accessed(days=1)
+        assert _stored_count(db) == 1
+        t.close()
+
+    def test_size_trigger_flushes_inline(self, tmp_path):
+        db = tmp_path / "size.db"
+        t = AccessTracker(db_path=db, flush_size=5, flush_interval=60, background_flush=False)
+        for _ in range(5):
+            t.log_access("mem-s", "search")
+        assert _stored_count(db) == 5
+        t.close()
+
+    def test_age_trigger_flushes_in_background(self, tmp_path):
+        db = tmp_path / "age.db"
+        t = AccessTracker(db_path=db, flush_size=100, flush_interval=0.05)
+        t.log_access("mem-a", "search")
+        deadline = time.monotonic() + 5
+        while _stored_count(db) == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert _stored_count(db) == 1
+        t.close()
+
+    def test_close_flushes(self, tmp_path):
+        db = tmp_path / "close.db"
+        with AccessTracker(db_path=db, flush_size=100, flush_interval=60) as t:
+            t.log_access("mem-c", "search")
+        assert _stored_count(db) == 1
+
+    def test_returned_ids_are_row_ids(self, tmp_path):
+        """Ids handed out before the flush are the ids that get stored."""
+        db = tmp_path / "ids.db"
+        t1 = AccessTracker(db_path=db, flush_size=4, flush_interval=60, background_flush=False)
+        t2 = AccessTracker(db_path=db, flush_size=4, flush_interval=60, background_flush=False)
+        ids = {}
+        for i in range(6):
+            ids[t1.log_access(f"mem-1-{i}", "search")] = f"mem-1-{i}"
+            ids[t2.log_access(f"mem-2-{i}", "search")] = f"mem-2-{i}"
+        direct = AccessTracker(db_path=db, flush_size=1)
+        ids[direct.log_access("mem-direct", "direct")] = "mem-direct"
+        for t in (t1, t2, direct):
+            t.close()
+
+        assert len(ids) == 13
+        conn = sqlite3.connect(str(db))
+        stored = dict(conn.execute("SELECT id, memory_id FROM memory_access_log"))
+        conn.close()
+        assert stored == ids
+
+    def test_log_access_never_touches_disk(self, tmp_path):
+        """Id blocks are claimed at construction and then by the flusher, not by log_access."""
+        import threading
+
+        db = tmp_path / "hot.db"
+        t = AccessTracker(db_path=db, flush_size=4, flush_interval=60)
+        on_caller = []
+        t.conn.set_trace_callback(
+            lambda sql: on_caller.append(sql) if threading.current_thread() is threading.main_thread() else None
+        )
+        for i in range(12):
+            t.log_access(f"mem-{i}", "search")
+        t.conn.set_trace_callback(None)
+        t.close()
+
+        assert on_caller == []
+        assert _stored_count(db) == 12
+
+    def test_burst_past_reserved_ids_gets_ids_at_flush(self, tmp_path):
+        db = tmp_path / "burst.db"
+        t = AccessTracker(db_path=db, flush_size=2, flush_interval=60)
+        with t._io_lock:  # Hold the flusher off, as a slow disk would
+            ids = [t.log_access(f"mem-{i}", "search") for i in range(6)]
+        t.close()
+
+        assert ids[:4] == [1, 2, 3, 4]
+        assert ids[4:] == [None, None]
+        conn = sqlite3.connect(str(db))
+        stored = dict(conn.execute("SELECT memory_id, id FROM memory_access_log"))
+        conn.close()
+        assert len(stored) == 6 and len(set(stored.values())) == 6
+        assert [stored[f"mem-{i}"] for i in range(4)] == [1, 2, 3, 4]
+
+    def test_write_through(self, tmp_path):
+        db = tmp_path / "wt.db"
+        t = AccessTracker(db_path=db, flush_size=1)
+        t.log_access("mem-w", "search")
+        assert _stored_count(db) == 1
+        t.close()
+
+
 # ── Context manager ───────────────────────────────────────────────────────
 
 
@@ -259,6 +259,39 @@ class TestPersistence:
         cb.record_failure()
         assert cb.failure_count == 1
 
+    def test_success_while_closed_does_not_write(self, tmp_db, monkeypatch):
+        """The hot path (success with nothing to reset) stays off SQLite."""
+        cb = CircuitBreaker(name="hot_path", db_path=tmp_db)
+        writes = []
+        monkeypatch.setattr(cb, "_persist_state", lambda: writes.append(1))
+        for _ in range(100):
+            cb.call(lambda: "ok")
+        assert writes == []
+
+    def test_connection_reused(self, tmp_db):
+        cb = CircuitBreaker(name="reuse", db_path=tmp_db, failure_threshold=3)
+        conn = cb._get_conn()
+        cb.record_failure()
+        cb.record_success()
+        assert cb._get_conn() is conn
+        cb.close()
+
+    def test_picks_up_other_process_transition(self, tmp_db):
+        """A breaker opened elsewhere is seen after sync_interval."""
+        watcher = CircuitBreaker(name="shared", db_path=tmp_db, failure_threshold=2, sync_interval=0)
+        writer = CircuitBreaker(name="shared", db_path=tmp_db, failure_threshold=2)
+        assert watcher.get_state() == "closed"
+
+        writer.record_failure()
+        writer.record_failure()
+
+        assert watcher.get_state() == "open"
+
+    def test_sync_interval_none_ignores_db(self, tmp_db):
+        watcher = CircuitBreaker(name="isolated", db_path=tmp_db, failure_threshold=1, sync_interval=None)
+        CircuitBreaker(name="isolated", db_path=tmp_db, failure_threshold=1).record_failure()
+        assert watcher.get_state() == "closed"
+
     def test_db_table_schema(self, tmp_db):
         """Verify the schema is created correctly."""
         CircuitBreaker(name="schema_test", db_path=tmp_db)
@@ -283,3 +283,101 @@ class TestWeights:
     def test_weights_sum_to_one(self):
         total = sum(SCORE_WEIGHTS.values())
         assert total == pytest.approx(1.0)
+
+
+# ---------------------------------------------------------------------------
+# 8. Column-based strategies
+# ---------------------------------------------------------------------------
+
+def _random_memories(n: int, seed: int, dated: bool = True) -> list:
+    import random
+    rng = random.Random(seed)
+    now = datetime.now()
+    mems = []
+    for i in range(n):
+        mem = _make_memory(
+            content="word " * rng.randint(0, 60),
+            importance=round(rng.random(), 2),
+            confidence=rng.choice([None, round(rng.random(), 2)]),
+            access_count=rng.choice([None, rng.randint(0, 20)]),
+            updated=rng.choice([None, (now - timedelta(days=rng.randint(-5, 200))).isoformat()])
+            if dated else None,
+            id=i,
+        )
+        mems.append(mem)
+    return mems
+
+
+def _total_score(result: dict) -> float:
+    return sum(m["score"] for m in result["selected"])
+
+
+class TestStrategies:
+    def test_unknown_strategy_raises(self, optimizer):
+        with pytest.raises(ValueError, match="Unknown strategy"):
+            optimizer.optimize([_make_memory()], 100, strategy="magic")
+
+    def test_vectorized_scores_match_scalar(self, optimizer):
+        mems = _random_memories(200, seed=1) + [
+            {"content": "x", "importance": "0.7", "access_count": "bad"},
+            {"content": "y", "importance_score": 0.9, "confidence_score": 0.2},
+            {"content": "z", "created": "not a date"},
+        ]
+        vectorized = optimizer.score_memories(mems)
+        for mem, score in zip(mems, vectorized):
+            assert score == pytest.approx(optimizer.score_memory(mem), abs=1e-6)
+
+    @pytest.mark.parametrize("seed,budget", [(2, 50), (3, 400), (4, 2000), (5, 100000)])
+    def test_fast_matches_greedy(self, optimizer, seed, budget):
+        # Undated, so both paths see bit-identical scores (recency reads the clock)
+        mems = _random_memories(500, seed=seed, dated=False)
+        greedy = optimizer.optimize(mems, budget, strategy="greedy")
+        fast = optimizer.optimize(mems, budget, strategy="fast")
+        assert [m["id"] for m in fast["selected"]] == [m["id"] for m in greedy["selected"]]
+        assert [m["id"] for m in fast["excluded"]] == [m["id"] for m in greedy["excluded"]]
+        assert fast["total_tokens"] == greedy["total_tokens"]
+
+    def test_exact_matches_brute_force(self, optimizer):
+        from itertools import combinations
+        mems = _random_memories(12, seed=6)
+        budget = 80
+        scores = optimizer.score_memories(mems)
+        tokens = [optimizer.estimate_tokens(m["content"]) for m in mems]
+
+        best = 0.0
+        for r in range(len(mems) + 1):
+            for combo in combinations(range(len(mems)), r):
+                if sum(tokens[i] for i in combo) <= budget:
+                    best = max(best, sum(scores[i] for i in combo))
+
+        result = optimizer.optimize(mems, budget, strategy="exact")
+        assert result["total_tokens"] <= budget
+        assert _total_score(result) == pytest.approx(best)
+
+    @pytest.mark.parametrize("budget", [60, 300, 1500])
+    def test_knapsack_quality_bounds(self, optimizer, budget):
+        mems = _random_memories(300, seed=budget)
+        greedy = optimizer.optimize(mems, budget, strategy="greedy")
+        exact = optimizer.optimize(mems, budget, strategy="exact")
+        fptas = optimizer.optimize(mems, budget, strategy="fptas", epsilon=0.1)
+
+        for result in (exact, fptas):
+            assert result["total_tokens"] <= budget
+            assert len(result["selected"]) + len(result["excluded"]) == len(mems)
+        assert _total_score(exact) >= _total_score(greedy) - 1e-9
+        assert _total_score(fptas) >= 0.9 * _total_score(exact)
+
+    def test_strategy_results_keep_score_order_and_types(self, optimizer):
+        mems = _random_memories(50, seed=7)
+        result = optimizer.optimize(mems, 300, strategy="exact")
+        scores = [m["score"] for m in result["selected"]]
+        assert scores == sorted(scores, reverse=True)
+        assert all(isinstance(m["score"], float) for m in result["selected"])
+        assert all(isinstance(m["tokens"], int) for m in result["excluded"])
+
+    @pytest.mark.parametrize("strategy", ["greedy", "fast"])
+    def test_include_excluded_false_skips_copies(self, optimizer, strategy):
+        mems = _random_memories(100, seed=8)
+        result = optimizer.optimize(mems, 200, strategy=strategy, include_excluded=False)
+        assert result["excluded"] == []
+        assert optimizer.get_stats()["total_excluded"] == 100 - len(result["selected"])
@@ -274,6 +274,29 @@ class TestHealthCheck:
         assert "corrupted_files" in health
         assert health["corrupted_files"] >= 1
 
+    def test_health_check_reads_each_file_once(self, runner, monkeypatch):
+        """Each memory file is opened once; missing required fields still count as corrupt"""
+        from memory_system.memory_ts_client import MemoryTSClient
+
+        client = MemoryTSClient(memory_dir=runner.memory_dir)
+        for i in range(3):
+            client.create(content=f"Test {i}", project_id="LFI", tags=["#test"])
+        (Path(runner.memory_dir) / "no-project.md").write_text("---\nid: no-project\ncreated: 2026-01-01\n---\nBody")
+
+        reads = []
+        original = Path.read_text
+
+        def counting_read(self, *args, **kwargs):
+            reads.append(self.name)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read)
+        health = health_check(runner.memory_dir)
+
+        assert health["memory_file_count"] == 4
+        assert health["corrupted_files"] == 1
+        assert len(reads) == len(set(reads)) == 4
+
 
 class TestMaintenanceRunner:
     """Test complete maintenance runner"""
@@ -340,3 +363,62 @@ class TestMaintenanceFunction:
         assert "archived_count" in result
         assert "stats" in result
         assert "health" in result
+
+
+class TestSnapshotMaintenance:
+    """Decay and archival work from one snapshot without extra reads"""
+
+    def test_unchanged_memories_not_rewritten(self, runner):
+        """Recent memories are not rewritten by decay"""
+        from memory_system.memory_ts_client import MemoryTSClient
+
+        client = MemoryTSClient(memory_dir=runner.memory_dir)
+        memory = client.create(
+            content="Recent memory",
+            project_id="LFI",
+            tags=["#learning"],
+            importance=0.8
+        )
+        path = Path(runner.memory_dir) / f"{memory.id}.md"
+        before = path.read_text()
+
+        assert apply_decay_to_all(runner.memory_dir) == 0
+        assert path.read_text() == before
+
+    def test_decay_does_not_log_access(self, runner, monkeypatch):
+        """Maintenance scans bypass temporal access logging"""
+        from memory_system.memory_ts_client import MemoryTSClient
+
+        client = MemoryTSClient(memory_dir=runner.memory_dir)
+        memory = client.create(
+            content="Old memory",
+            project_id="LFI",
+            tags=["#learning"],
+            importance=0.8
+        )
+        created = (datetime.now() - timedelta(days=10)).isoformat()
+        client.update(memory.id, created=created)
+
+        logged = []
+        monkeypatch.setattr(
+            MemoryTSClient, "_log_access",
+            lambda self, *args, **kwargs: logged.append(args) if self._enable_access_logging else None
+        )
+
+        runner.run()
+
+        assert logged == []
+
+    def test_runner_stats_exclude_archived(self, runner):
+        """Stats from the shared snapshot don't count memories archived in the same run"""
+        from memory_system.memory_ts_client import MemoryTSClient
+
+        client = MemoryTSClient(memory_dir=runner.memory_dir)
+        client.create(content="Keep", project_id="LFI", tags=["#a"], importance=0.9)
+        client.create(content="Drop", project_id="LFI", tags=["#b"], importance=0.1)
+
+        result = runner.run()
+
+        assert result["archived_count"] == 1
+        assert result["stats"]["total_memories"] == 1
+        assert result["stats"]["tag_distribution"] == {"#a": 1}
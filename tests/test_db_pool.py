@@ -628,11 +628,11 @@ class TestReturnConnection:
     """Test return_connection behavior in detail."""
 
     def test_return_puts_back_in_queue(self, pool):
-        """Returned connection goes back into the internal queue."""
+        """Returned connection goes back into the idle reader list."""
         conn = pool.get_connection()
-        assert pool._pool.qsize() == 0  # Connection is checked out
+        assert len(pool._pool) == 0  # Connection is checked out
         conn.close()
-        assert pool._pool.qsize() == 1  # Connection is back in queue
+        assert len(pool._pool) == 1  # Connection is back in the idle list
 
     def test_return_rollback_on_error(self, pool):
         """Return handles rollback errors gracefully."""
@@ -647,3 +647,148 @@ class TestReturnConnection:
         result = conn2.execute("SELECT 1").fetchone()
         assert result[0] == 1
         conn2.close()
+
+
+# ---------------------------------------------------------------------------
+# 9. Reader/writer lanes, wakeups and statistics
+# ---------------------------------------------------------------------------
+
+class TestLanes:
+    """Test the writer lane, condition-variable waits and get_stats()."""
+
+    def test_writer_is_single_connection(self, pool):
+        """Write checkouts share one connection, separate from the readers."""
+        writer = pool.get_connection(write=True)
+        real = writer._conn
+        writer.close()
+
+        writer = pool.get_connection(write=True)
+        assert writer._conn is real
+        reader = pool.get_connection()
+        assert reader._conn is not real
+        assert pool._created == 1  # Writer does not count against readers
+        writer.close()
+        reader.close()
+
+    def test_writer_serializes_while_readers_proceed(self, temp_db):
+        """A held writer blocks other writers but not readers."""
+        pool = ConnectionPool(db_path=temp_db, pool_size=3, timeout=0.2)
+        writer = pool.get_connection(write=True)
+        readers = [pool.get_connection() for _ in range(3)]
+
+        with pytest.raises(TimeoutError, match="1 connections in use"):
+            pool.get_connection(write=True)
+
+        for conn in readers:
+            conn.close()
+        writer.close()
+        pool.close_all()
+
+    def test_waiter_wakes_on_return(self, temp_db):
+        """A blocked get returns as soon as a connection comes back."""
+        pool = ConnectionPool(db_path=temp_db, pool_size=1, timeout=5.0)
+        conn = pool.get_connection()
+        got = []
+
+        def waiter():
+            got.append(pool.get_connection())
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        released = time.monotonic()
+        conn.close()
+        thread.join(timeout=5)
+
+        assert got and time.monotonic() - released < 0.05
+        got[0].close()
+        stats = pool.get_stats()["read"]
+        assert stats["waits"] == 1
+        assert stats["max_wait_ms"] >= 40
+        pool.close_all()
+
+    def test_stats_count_timeouts(self, temp_db):
+        """Timeouts and in-use counts are reported per lane."""
+        pool = ConnectionPool(db_path=temp_db, pool_size=1, timeout=0.1)
+        conn = pool.get_connection(write=True)
+        with pytest.raises(TimeoutError):
+            pool.get_connection(write=True)
+
+        stats = pool.get_stats()
+        assert stats["write"]["in_use"] == 1
+        assert stats["write"]["timeouts"] == 1
+        assert stats["read"]["acquired"] == 0
+        conn.close()
+        assert pool.get_stats()["write"]["idle"] == 1
+        pool.close_all()
+
+    def test_statement_cache_size(self, temp_db):
+        """Connections are opened with the configured statement cache."""
+        pool = ConnectionPool(db_path=temp_db, statement_cache_size=16)
+        assert pool.statement_cache_size == 16
+        conn = pool.get_connection()
+        for i in range(32):
+            assert conn.execute(f"SELECT {i}").fetchone()[0] == i
+        conn.close()
+        pool.close_all()
+
+    def test_module_get_connection_write(self, temp_db):
+        """Module-level get_connection(write=True) uses the writer lane."""
+        with get_connection(temp_db, write=True) as conn:
+            conn.execute("CREATE TABLE t (id INTEGER)")
+            conn.commit()
+        stats = get_pool(temp_db).get_stats()
+        assert stats["write"]["acquired"] == 1
+        assert stats["read"]["acquired"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Pooled writers use the writer lane
+# ---------------------------------------------------------------------------
+
+class TestPooledWriters:
+    """Modules that write through the pool ask for the writer lane."""
+
+    @pytest.fixture(autouse=True)
+    def read_only_readers(self, monkeypatch):
+        """Make reader-lane connections query_only, so a write through one fails loudly."""
+        real_get = ConnectionPool.get_connection
+
+        def get_connection(self, write=False):
+            conn = real_get(self, write=write)
+            conn.execute(f"PRAGMA query_only={'OFF' if write else 'ON'}")
+            return conn
+
+        monkeypatch.setattr(ConnectionPool, "get_connection", get_connection)
+
+    def test_fsrs_scheduler(self, temp_db):
+        from memory_system.fsrs_scheduler import FSRSScheduler
+        scheduler = FSRSScheduler(db_path=temp_db)
+        scheduler.register_memory("m1")
+        scheduler.register_memories({"m2": "LFI"})
+        scheduler.record_reviews([{"memory_id": "m1", "grade": 3}])
+        scheduler.mark_promoted("m2")
+        assert scheduler.get_promoted_ids() == {"m2"}
+
+    def test_relationships(self, temp_db):
+        from memory_system.intelligence.relationships import MemoryRelationships
+        relationships = MemoryRelationships(db_path=temp_db)
+        rel = relationships.add_relationship("a", "b", "led_to")
+        assert relationships.remove_relationship(rel.id)
+
+    def test_relationship_mapper(self, temp_db):
+        from memory_system.intelligence.relationship_mapper import RelationshipMapper
+        mapper = RelationshipMapper(db_path=temp_db)
+        rel_id = mapper.link_memories("a", "b", "causal", "a caused b")
+        mapper.update_strength(rel_id, 0.9)
+        assert mapper.remove_relationship(rel_id)
+
+    def test_search_optimizer(self, temp_db):
+        from memory_system.intelligence.search_optimizer import SearchOptimizer
+        optimizer = SearchOptimizer(db_path=temp_db)
+        results = [type("M", (), {"id": f"m{i}"})() for i in range(3)]
+        optimizer.search_with_cache("query", lambda q: results)
+        optimizer.search_with_cache("query", lambda q: results)
+        optimizer.flush_hits()
+        optimizer.record_selection("query", "m1", 0, 3)
+        optimizer.invalidate_cache()
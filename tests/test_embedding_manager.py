@@ -417,6 +417,24 @@ class TestBatchComputeEmbeddings:
         # All 0 already exist -> returns empty dict
         assert result == {}
 
+    def test_get_embeddings_matches_get_embedding(self, manager):
+        """get_embeddings returns rows in input order, equal to get_embedding."""
+        manager.get_embedding("stored")
+        matrix = manager.get_embeddings(["fresh", "stored", "fresh"])
+        assert matrix.shape == (3, EMBEDDING_DIM)
+        assert matrix.dtype == np.float32
+        np.testing.assert_array_equal(matrix[1], manager.get_embedding("stored"))
+        np.testing.assert_array_equal(matrix[0], matrix[2])
+        np.testing.assert_array_equal(matrix[0], manager.get_embedding("fresh"))
+
+    def test_get_embeddings_encodes_only_missing(self, manager):
+        """Stored embeddings are loaded; only missing contents hit the model."""
+        manager.get_embeddings(["a", "b"])
+        manager.clear_session_cache()
+        manager._model.encode.reset_mock()
+        manager.get_embeddings(["a", "b"])
+        assert not manager._model.encode.called
+
 
 # ===========================================================================
 # 6. DB persistence
@@ -732,3 +750,88 @@ class TestLRUCacheBoundary:
             manager.get_embedding(f"db-lru-{i}")
 
         assert len(manager._session_cache) <= 3
+
+
+# ===========================================================================
+# Quantized codes and two-stage search
+# ===========================================================================
+
+class TestQuantization:
+
+    @pytest.fixture
+    def quantized(self, temp_db):
+        mgr = EmbeddingManager(db_path=temp_db, quantization="binary")
+        mgr._model = _make_model_mock()
+        mgr._vector_store = None  # Exercise the SQLite code path
+        yield mgr
+
+    def test_codes_stored_with_embedding(self, quantized, temp_db):
+        quantized.get_embedding("hello world")
+        with sqlite3.connect(temp_db) as conn:
+            int8_codes, scale, bits = conn.execute(
+                "SELECT embedding_int8, int8_scale, embedding_bits FROM embeddings"
+            ).fetchone()
+        assert len(int8_codes) == EMBEDDING_DIM
+        assert scale > 0
+        assert len(bits) == EMBEDDING_DIM // 8
+
+    def test_no_codes_when_disabled(self, manager, temp_db):
+        manager.get_embedding("hello world")
+        with sqlite3.connect(temp_db) as conn:
+            assert conn.execute("SELECT embedding_bits FROM embeddings").fetchone()[0] is None
+        assert manager.get_stats()['quantized_embeddings'] == 0
+
+    def test_search_finds_identical_content(self, quantized):
+        memories = [{'content': f"memory number {i}"} for i in range(100)]
+        quantized.get_embeddings([m['content'] for m in memories])
+
+        results = quantized.semantic_search("memory number 42", memories, top_k=3, threshold=-1.0)
+
+        assert results[0][0]['content'] == "memory number 42"
+        assert results[0][1] > 0.99
+        assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+
+    def test_search_matches_brute_force(self, quantized, temp_db):
+        memories = [{'content': f"memory number {i}"} for i in range(60)]
+        exact = EmbeddingManager(db_path=temp_db)
+        exact._model = _make_model_mock()
+        exact._vector_store = None
+
+        expected = exact.semantic_search("memory number 7", memories, top_k=5, threshold=-1.0)
+        results = quantized.semantic_search("memory number 7", memories, top_k=5, threshold=-1.0)
+
+        assert [m['content'] for m, _ in results] == [m['content'] for m, _ in expected]
+
+    def test_backfill_existing_rows(self, temp_db):
+        plain = EmbeddingManager(db_path=temp_db)
+        plain._model = _make_model_mock()
+        plain._vector_store = None
+        plain.get_embeddings(["alpha", "beta", "gamma"])
+
+        quantized = EmbeddingManager(db_path=temp_db, quantization="int8")
+        assert quantized.get_stats()['quantized_embeddings'] == 0
+        assert quantized.quantize_stored_embeddings(batch_size=2) == 3
+        assert quantized.quantize_stored_embeddings() == 0
+        assert quantized.get_stats()['quantized_embeddings'] == 3
+
+    def test_backfill_with_quantization_off(self, manager):
+        manager.get_embeddings(["alpha", "beta", "gamma"])
+        assert manager.quantize_stored_embeddings(batch_size=2) == 3
+        assert manager.get_stats()['quantized_embeddings'] == 3
+
+    def test_search_codes_only_its_own_rows(self, quantized, temp_db):
+        plain = EmbeddingManager(db_path=temp_db)
+        plain._model = _make_model_mock()
+        plain._vector_store = None
+        plain.get_embeddings([f"memory number {i}" for i in range(20)])
+
+        memories = [{'content': f"memory number {i}"} for i in range(5)]
+        quantized.semantic_search("memory number 3", memories, top_k=3, threshold=-1.0)
+
+        assert quantized.get_stats()['quantized_embeddings'] == 5
+
+    def test_env_toggle_and_validation(self, temp_db, monkeypatch):
+        monkeypatch.setenv("MEMORY_EMBEDDING_QUANTIZATION", "int8")
+        assert EmbeddingManager(db_path=temp_db).quantization == "int8"
+        with pytest.raises(ValueError, match="Unknown quantization"):
+            EmbeddingManager(db_path=temp_db, quantization="int4")
@@ -22,7 +22,7 @@ _src = str(Path(__file__).resolve().parent.parent / "src")
 if _src not in sys.path:
     sys.path.insert(0, _src)
 
-from entity_extractor import EntityExtractor
+from entity_extractor import EntityExtractor, EntityMatcher, _SpanIndex
 
 
 @pytest.fixture
@@ -188,6 +188,86 @@ class TestLinkMemory:
         assert e2["last_seen"] >= first_seen
 
 
+class TestLinkMemories:
+    """Test batch linking."""
+
+    def test_batch_matches_single_links(self, db_path, extractor):
+        """link_memories stores the same rows as repeated link_memory."""
+        batch = [
+            ("mem-001", "Russell Hamilton used Python and React."),
+            ("mem-002", "python scripts for Total Rekall"),
+            ("mem-003", "nothing to see here"),
+        ]
+        counts = extractor.link_memories(batch)
+
+        other = EntityExtractor(db_path=str(Path(db_path).with_name("single.db")))
+        single = {mid: other.link_memory(mid, text) for mid, text in batch}
+        assert counts == single
+
+        def rows(ex):
+            return sorted(
+                (r["memory_id"], r["name"], r["mention_text"], r["position"])
+                for r in ex.conn.execute(
+                    "SELECT me.memory_id, e.name, me.mention_text, me.position "
+                    "FROM memory_entities me JOIN entities e ON e.id = me.entity_id"
+                )
+            )
+        assert rows(extractor) == rows(other)
+        other.close()
+
+    def test_batch_is_idempotent(self, extractor):
+        """Re-linking a batch adds no entities or links."""
+        batch = [("mem-001", "Python and React"), ("mem-002", "React again")]
+        extractor.link_memories(batch)
+        before = extractor.get_stats()
+        extractor.link_memories(batch)
+        assert extractor.get_stats() == before
+
+    def test_empty_batch(self, extractor):
+        """Empty batch links nothing."""
+        assert extractor.link_memories([]) == {}
+
+
+class TestMatcher:
+    """Test the precompiled matcher and overlap index."""
+
+    def test_matcher_is_reused(self, extractor):
+        """Extraction does not rebuild the matcher per call."""
+        extractor.extract_entities("Python")
+        matcher = extractor._get_matcher()
+        extractor.extract_entities("React")
+        assert extractor._get_matcher() is matcher
+
+    def test_alias_mentions_resolve_to_canonical_name(self, extractor):
+        """Stored aliases are matched in text and reported under the canonical name."""
+        extractor.link_memory("mem-001", "Russell Hamilton wrote this.")
+        extractor.add_alias("Russell Hamilton", "Russ")
+        entities = extractor.extract_entities("Ask russ about it.")
+        assert {"name": "Russell Hamilton", "type": "person",
+                "mention_text": "russ", "position": 4} in entities
+
+    def test_longest_name_wins(self):
+        """Overlapping names at one position resolve to the longest."""
+        matcher = EntityMatcher(projects=[], tools=["Docker", "Docker Compose"])
+        found = list(matcher.finditer("use docker compose or docker"))
+        assert found == [
+            ("Docker Compose", "tool", "docker compose", 4),
+            ("Docker", "tool", "docker", 22),
+        ]
+
+    def test_span_index_overlaps(self):
+        """Spans touching at the boundary do not overlap."""
+        spans = _SpanIndex()
+        spans.add(10, 20)
+        spans.add(30, 40)
+        assert spans.overlaps(15, 16)
+        assert spans.overlaps(5, 11)
+        assert spans.overlaps(19, 31)
+        assert not spans.overlaps(20, 30)
+        assert not spans.overlaps(0, 10)
+        assert not spans.overlaps(40, 50)
+
+
 class TestGetMemoriesByEntity:
     """Test querying memories by entity name."""
 
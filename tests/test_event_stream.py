@@ -1,7 +1,10 @@
 """Tests for memory event stream (pub/sub)."""
 
 import json
+import sqlite3
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -58,6 +61,7 @@ class TestPublish:
 
     def test_publish_persists_to_db(self, stream):
         stream.publish("MEMORY_CREATED", {"title": "hello"})
+        stream.flush()
         rows = stream.conn.execute("SELECT * FROM memory_events").fetchall()
         assert len(rows) == 1
         assert rows[0]["event_type"] == "MEMORY_CREATED"
@@ -66,6 +70,7 @@ class TestPublish:
 
     def test_publish_none_payload_becomes_empty_dict(self, stream):
         stream.publish("SEARCH_PERFORMED")
+        stream.flush()
         rows = stream.conn.execute("SELECT payload_json FROM memory_events").fetchall()
         assert json.loads(rows[0]["payload_json"]) == {}
 
@@ -78,8 +83,35 @@ class TestPublish:
         id2 = stream.publish("MEMORY_UPDATED")
         assert id2 == id1 + 1
 
+    def test_publish_holds_no_write_transaction(self, stream):
+        """Buffered events leave the database free for other writers."""
+        stream.publish("MEMORY_CREATED")
+        assert not stream.conn.in_transaction
+        other = sqlite3.connect(stream.db_path, timeout=0)
+        other.execute("BEGIN IMMEDIATE")
+        other.rollback()
+        other.close()
+
+    def test_committed_id_wins_over_provisional(self, stream):
+        """Another writer can take a provisional id; subscribers get the real one."""
+        received = []
+        stream.subscribe("MEMORY_CREATED", received.append)
+        provisional = stream.publish("MEMORY_CREATED")
+        other = sqlite3.connect(stream.db_path)
+        other.execute(
+            "INSERT INTO memory_events (event_type, created_at) VALUES ('MAINTENANCE_RUN', 'now')"
+        )
+        other.commit()
+        other.close()
+
+        stream.flush()
+        assert received[0]["id"] == provisional + 1
+        assert [e["id"] for e in stream.read_since(0, event_type="MEMORY_CREATED")] == [provisional + 1]
+        assert stream.publish("MEMORY_CREATED") == provisional + 2
+
     def test_publish_stores_created_at(self, stream):
         stream.publish("MAINTENANCE_RUN")
+        stream.flush()
         row = stream.conn.execute("SELECT created_at FROM memory_events").fetchone()
         assert row["created_at"] is not None
         # Should be an ISO timestamp containing 'T'
@@ -90,10 +122,13 @@ class TestPublish:
 
 
 class TestSubscriptions:
+    """Delivery is asynchronous; flush() waits for subscribers to catch up."""
+
     def test_subscribe_receives_event(self, stream):
         received = []
         stream.subscribe("MEMORY_CREATED", lambda e: received.append(e))
         stream.publish("MEMORY_CREATED", {"x": 1})
+        stream.flush()
         assert len(received) == 1
         assert received[0]["event_type"] == "MEMORY_CREATED"
         assert received[0]["payload"] == {"x": 1}
@@ -103,6 +138,7 @@ class TestSubscriptions:
         stream.subscribe("*", lambda e: received.append(e))
         stream.publish("MEMORY_CREATED")
         stream.publish("MEMORY_ARCHIVED")
+        stream.flush()
         assert len(received) == 2
         assert received[0]["event_type"] == "MEMORY_CREATED"
         assert received[1]["event_type"] == "MEMORY_ARCHIVED"
@@ -111,6 +147,7 @@ class TestSubscriptions:
         received = []
         stream.subscribe("MEMORY_UPDATED", lambda e: received.append(e))
         stream.publish("MEMORY_CREATED")
+        stream.flush()
         assert len(received) == 0
 
     def test_unsubscribe_stops_delivery(self, stream):
@@ -118,10 +155,12 @@ class TestSubscriptions:
         cb = lambda e: received.append(e)
         stream.subscribe("MEMORY_CREATED", cb)
         stream.publish("MEMORY_CREATED")
+        stream.flush()
         assert len(received) == 1
 
         stream.unsubscribe("MEMORY_CREATED", cb)
         stream.publish("MEMORY_CREATED")
+        stream.flush()
         assert len(received) == 1  # no new delivery
 
     def test_unsubscribe_nonexistent_is_noop(self, stream):
@@ -142,6 +181,7 @@ class TestSubscriptions:
         stream.subscribe("MEMORY_CREATED", good_cb)
 
         eid = stream.publish("MEMORY_CREATED")
+        stream.flush()
         assert eid >= 1
         assert results == ["MEMORY_CREATED"]
 
@@ -153,9 +193,143 @@ class TestSubscriptions:
         stream.subscribe("*", lambda e: results.append(e["id"]))
 
         eid = stream.publish("MEMORY_UPDATED")
+        stream.flush()
         assert results == [eid]
 
 
+# ── Asynchronous delivery ─────────────────────────────────────────────
+
+
+class TestAsyncDelivery:
+    def test_slow_subscriber_does_not_block_publish(self, stream):
+        """publish() returns while a callback is still busy."""
+        release = threading.Event()
+        received = []
+
+        def slow(e):
+            release.wait(5)
+            received.append(e["id"])
+
+        stream.subscribe("MEMORY_CREATED", slow)
+        start = time.monotonic()
+        ids = [stream.publish("MEMORY_CREATED") for _ in range(5)]
+        assert time.monotonic() - start < 1.0
+
+        release.set()
+        stream.flush()
+        assert received == ids
+
+    def test_commit_interval_delivers_without_flush(self, stream):
+        received = threading.Event()
+        stream.subscribe("*", lambda e: received.set())
+        stream.publish("MAINTENANCE_RUN")
+        assert received.wait(2)
+
+    def test_batch_size_triggers_commit(self, tmp_path):
+        """A full batch commits inline, visible to other connections."""
+        db = tmp_path / "batch.db"
+        s = EventStream(db_path=db, batch_size=3, commit_interval=60)
+        try:
+            for _ in range(3):
+                s.publish("MEMORY_CREATED")
+            other = sqlite3.connect(str(db))
+            assert other.execute("SELECT COUNT(*) FROM memory_events").fetchone()[0] == 3
+            other.close()
+        finally:
+            s.close()
+
+    def test_backpressure_drops_for_full_queue(self, tmp_path):
+        s = EventStream(db_path=tmp_path / "bp.db", max_queue=1, backpressure_timeout=0.01)
+        release = threading.Event()
+        s.subscribe("MEMORY_CREATED", lambda e: release.wait(5))
+        try:
+            for _ in range(5):
+                s.publish("MEMORY_CREATED")
+                s.flush(wait=False)
+            deadline = time.monotonic() + 2
+            while s.get_delivery_stats()[0]["dropped"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert s.get_delivery_stats()[0]["dropped"] >= 1
+        finally:
+            release.set()
+            s.close()
+
+    def test_full_subscriber_does_not_block_publish(self, tmp_path):
+        """Backpressure waits happen on the dispatcher, never in publish()."""
+        s = EventStream(db_path=tmp_path / "bp.db", batch_size=1, max_queue=1, backpressure_timeout=5)
+        release = threading.Event()
+        s.subscribe("MEMORY_CREATED", lambda e: release.wait(10))
+        try:
+            start = time.monotonic()
+            for _ in range(10):
+                s.publish("MEMORY_CREATED")
+            assert time.monotonic() - start < 1.0
+        finally:
+            release.set()
+            s.close()
+
+    def test_spaced_publishes_share_commits(self, tmp_path):
+        """Events arriving faster than commit_interval are group-committed."""
+        s = EventStream(db_path=tmp_path / "group.db", batch_size=64, commit_interval=0.05)
+        commits = []
+        s.conn.set_trace_callback(lambda sql: commits.append(sql) if sql.strip().upper() == "COMMIT" else None)
+        try:
+            for _ in range(200):
+                s.publish("MEMORY_CREATED")
+                time.sleep(0.001)
+            s.flush()
+        finally:
+            s.close()
+        assert 0 < len(commits) <= 20
+
+    def test_close_commits_pending_events(self, tmp_path):
+        db = tmp_path / "close.db"
+        s = EventStream(db_path=db, commit_interval=60)
+        s.publish("MEMORY_CREATED")
+        s.close()
+        other = sqlite3.connect(str(db))
+        assert other.execute("SELECT COUNT(*) FROM memory_events").fetchone()[0] == 1
+        other.close()
+
+
+# ── Durable cursors ───────────────────────────────────────────────────
+
+
+class TestCursors:
+    def test_read_since_returns_events_after_id(self, stream):
+        ids = [stream.publish("MEMORY_CREATED", {"i": i}) for i in range(5)]
+        events = stream.read_since(ids[1])
+        assert [e["id"] for e in events] == ids[2:]
+        assert events[0]["payload"] == {"i": 2}
+
+    def test_read_since_filters_and_limits(self, stream):
+        stream.publish("MEMORY_CREATED")
+        updated = stream.publish("MEMORY_UPDATED")
+        stream.publish("MEMORY_CREATED")
+        assert [e["id"] for e in stream.read_since(0, event_type="MEMORY_UPDATED")] == [updated]
+        assert len(stream.read_since(0, limit=2)) == 2
+
+    def test_cursor_defaults_to_zero(self, stream):
+        assert stream.get_cursor("indexer") == 0
+
+    def test_cursor_survives_restart(self, tmp_path):
+        """A consumer resumes from its committed cursor in a new process."""
+        db = tmp_path / "cursor.db"
+        producer = EventStream(db_path=db)
+        ids = [producer.publish("MEMORY_CREATED", {"i": i}) for i in range(4)]
+        producer.close()
+
+        consumer = EventStream(db_path=db)
+        first = consumer.read_since(consumer.get_cursor("indexer"), limit=2)
+        consumer.commit_cursor("indexer", first[-1]["id"])
+        consumer.close()
+
+        resumed = EventStream(db_path=db)
+        rest = resumed.read_since(resumed.get_cursor("indexer"))
+        resumed.close()
+        assert [e["id"] for e in first + rest] == ids
+
+
 # ── Query helpers ──────────────────────────────────────────────────────
 
 
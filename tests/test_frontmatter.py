@@ -0,0 +1,144 @@
+"""
+Tests for frontmatter.py - shared memory file codec
+
+Covers value decoding, round trips through dumps/parse, header-only reads
+and malformed input.
+"""
+
+import random
+import string
+
+import pytest
+
+from memory_system.frontmatter import (
+    FrontmatterError,
+    decode_value,
+    dumps,
+    encode_value,
+    parse,
+    read_header,
+    strip_frontmatter,
+)
+
+
+LEGACY_FILE = """---
+id: mem-1
+created: 1700000000000
+importance_weight: 0.8
+confidence_score: 0.9
+context_type: learning
+semantic_tags: ['#learning', "it's", 'a, b']
+project_id: LFI
+session_id: null
+---
+
+Body with --- inside
+and more text
+"""
+
+
+class TestDecodeValue:
+    def test_scalars(self):
+        assert decode_value("null") is None
+        assert decode_value("true") is True
+        assert decode_value("False") is False
+        assert decode_value("42") == 42
+        assert decode_value("-0.5") == -0.5
+        assert decode_value("1e3") == 1000.0
+        assert decode_value("hello world") == "hello world"
+        assert decode_value("") == ""
+
+    def test_numbers_like_strings_stay_strings(self):
+        assert decode_value("007") == "007"
+        assert decode_value("1.2.3") == "1.2.3"
+        assert decode_value("2024-01-01") == "2024-01-01"
+
+    def test_quoted_strings(self):
+        assert decode_value('"null"') == "null"
+        assert decode_value("'it''s'") == "it's"
+        assert decode_value('"a\\nb"') == "a\nb"
+
+    def test_python_repr_and_json_lists(self):
+        assert decode_value("['#a', \"it's\", 'x, y']") == ["#a", "it's", "x, y"]
+        assert decode_value('["a", 1, null, true]') == ["a", 1, None, True]
+        assert decode_value("[]") == []
+        assert decode_value("[bare, words]") == ["bare", "words"]
+
+    def test_malformed_list_is_left_as_text(self):
+        assert decode_value("['unterminated") == "['unterminated"
+        assert decode_value("[a] trailing") == "[a] trailing"
+
+
+class TestRoundTrip:
+    def test_ambiguous_strings_are_quoted(self):
+        for text in ["null", "true", "42", "1.5", "[x]", " padded ", "two\nlines", '"quoted"']:
+            assert decode_value(encode_value(text)) == text
+
+    def test_plain_strings_written_bare(self):
+        assert encode_value("LFI") == "LFI"
+        assert encode_value("2024-01-01T00:00:00") == "2024-01-01T00:00:00"
+        assert encode_value(["#a", "b"]) == "['#a', 'b']"
+
+    def test_dumps_parse(self):
+        meta = {
+            "id": "mem-1",
+            "created": 1700000000000,
+            "importance_weight": 0.25,
+            "semantic_tags": ["#x", "it's", 'say "hi"', "back\\slash"],
+            "session_id": None,
+            "flag": True,
+            "note": "false",
+        }
+        text = dumps(meta, "Body\n\n--- not a delimiter\n")
+        assert parse(text) == (meta, "Body\n\n--- not a delimiter")
+
+    def test_random_round_trip(self):
+        rng = random.Random(0)
+        alphabet = string.ascii_letters + string.digits + " -_.,:'\"[]#\\"
+        for _ in range(500):
+            value = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            tags = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6))) for _ in range(3)]
+            meta = {"note": value, "tags": tags}
+            assert parse(dumps(meta, "body"))[0] == meta
+
+
+class TestParse:
+    def test_legacy_file(self):
+        meta, body = parse(LEGACY_FILE)
+        assert meta["id"] == "mem-1"
+        assert meta["created"] == 1700000000000
+        assert meta["semantic_tags"] == ["#learning", "it's", "a, b"]
+        assert meta["session_id"] is None
+        assert body == "Body with --- inside\nand more text"
+
+    def test_missing_delimiters(self):
+        with pytest.raises(FrontmatterError):
+            parse("no header here")
+        with pytest.raises(FrontmatterError):
+            parse("---\nid: x\nbody without close")
+
+    def test_strip_frontmatter(self):
+        assert strip_frontmatter(LEGACY_FILE) == "Body with --- inside\nand more text"
+        assert strip_frontmatter("  plain text  ") == "plain text"
+
+
+class TestReadHeader:
+    def test_reads_header(self, tmp_path):
+        path = tmp_path / "mem.md"
+        path.write_text(LEGACY_FILE)
+        assert read_header(path) == parse(LEGACY_FILE)[0]
+
+    def test_stops_at_closing_delimiter(self, tmp_path):
+        path = tmp_path / "mem.md"
+        # Invalid UTF-8 in the body would fail a full read
+        path.write_bytes(b"---\nid: mem-2\n---\n\n\xff\xfe body")
+        assert read_header(path) == {"id": "mem-2"}
+
+    def test_missing_delimiters(self, tmp_path):
+        path = tmp_path / "mem.md"
+        path.write_text("---\nid: x\n")
+        with pytest.raises(FrontmatterError):
+            read_header(path)
+        path.write_text("id: x\n")
+        with pytest.raises(FrontmatterError):
+            read_header(path)
@@ -440,3 +440,81 @@ class TestDualPathPromotion:
         candidates = scheduler.get_promotion_candidates()
         candidate_ids = [c.memory_id for c in candidates]
         assert "mem-deep" in candidate_ids
+
+
+class TestBatchReviews:
+    """Test register_memories/record_reviews batch APIs"""
+
+    def test_register_memories_batch(self, scheduler):
+        """Registers every memory with its project, idempotently"""
+        scheduler.register_memories({"mem-001": "LFI", "mem-002": "other"})
+        scheduler.register_memories({"mem-001": "changed"})
+
+        assert json.loads(scheduler.get_state("mem-001").projects_validated) == ["LFI"]
+        assert json.loads(scheduler.get_state("mem-002").projects_validated) == ["other"]
+
+    def test_record_reviews_matches_sequential(self, tmp_path):
+        """Batch result equals the same reviews recorded one at a time"""
+        reviews = [
+            {"memory_id": "mem-001", "grade": ReviewGrade.GOOD, "project_id": "LFI"},
+            {"memory_id": "mem-002", "grade": ReviewGrade.EASY, "project_id": "other"},
+            {"memory_id": "mem-001", "grade": ReviewGrade.EASY, "project_id": "other"},
+            {"memory_id": "mem-001", "grade": ReviewGrade.HARD, "project_id": "LFI"},
+        ]
+
+        batch = FSRSScheduler(db_path=tmp_path / "batch.db")
+        single = FSRSScheduler(db_path=tmp_path / "single.db")
+        for s in (batch, single):
+            s.register_memories({"mem-001": "LFI", "mem-002": "LFI"})
+
+        assert batch.record_reviews(reviews) == 4
+        for review in reviews:
+            single.record_review(**review)
+
+        for memory_id in ("mem-001", "mem-002"):
+            a, b = batch.get_state(memory_id), single.get_state(memory_id)
+            assert a.stability == pytest.approx(b.stability)
+            assert a.difficulty == pytest.approx(b.difficulty)
+            assert a.review_count == b.review_count
+            assert json.loads(a.projects_validated) == json.loads(b.projects_validated)
+
+    def test_record_reviews_logs_each_event(self, scheduler, db_path):
+        """Every review in the batch gets a review_log row"""
+        scheduler.register_memory("mem-001")
+        scheduler.record_reviews([
+            {"memory_id": "mem-001", "grade": ReviewGrade.GOOD, "session_id": "s1"},
+            {"memory_id": "mem-001", "grade": ReviewGrade.GOOD, "session_id": "s2"},
+        ])
+
+        conn = sqlite3.connect(db_path)
+        sessions = [r[0] for r in conn.execute(
+            "SELECT source_session FROM review_log ORDER BY id"
+        )]
+        conn.close()
+        assert sessions == ["s1", "s2"]
+
+    def test_record_reviews_skips_unregistered(self, scheduler):
+        """Unknown memories are ignored, like record_review"""
+        scheduler.register_memory("mem-001")
+        recorded = scheduler.record_reviews([
+            {"memory_id": "mem-001", "grade": ReviewGrade.GOOD},
+            {"memory_id": "unknown", "grade": ReviewGrade.GOOD},
+        ])
+        assert recorded == 1
+        assert scheduler.get_state("unknown") is None
+
+    def test_due_reviews_ordered_and_limited(self, scheduler):
+        """Due reviews come back most overdue first, honouring limit"""
+        scheduler.register_memories({f"mem-{i}": "LFI" for i in range(3)})
+        conn = sqlite3.connect(scheduler.db_path)
+        for i, days in enumerate((2, 5, 1)):
+            conn.execute(
+                "UPDATE memory_reviews SET due_date = ? WHERE memory_id = ?",
+                ((datetime.now() - timedelta(days=days)).isoformat(), f"mem-{i}")
+            )
+        conn.commit()
+        conn.close()
+        scheduler.mark_promoted("mem-1")
+
+        assert [s.memory_id for s in scheduler.get_due_reviews()] == ["mem-0", "mem-2"]
+        assert [s.memory_id for s in scheduler.get_due_reviews(limit=1)] == ["mem-0"]
@@ -203,6 +203,41 @@ class TestAssignGeneration:
         assert cur.fetchone()[0] == 2
 
 
+class TestAssignGenerations:
+    def test_returns_per_generation_counts(self, gc):
+        """Bulk assignment reports how many memories landed in each generation."""
+        now = _now()
+        counts = gc.assign_generations([
+            ("mem-a", now),
+            ("mem-b", now - timedelta(days=3)),
+            ("mem-c", now - timedelta(days=30)),
+            ("mem-d", now - timedelta(days=400)),
+        ])
+        assert counts == {"gen_0": 2, "gen_1": 1, "gen_2": 1}
+        assert gc.get_generation_stats()["total"] == 4
+
+    def test_moves_existing_memories(self, gc):
+        """Re-assigning in bulk promotes and demotes tracked memories."""
+        gc.assign_generation("mem-up", _now())
+        gc.assign_generation("mem-down", _now() - timedelta(days=200))
+        gc.assign_generations([
+            ("mem-up", _now() - timedelta(days=100)),
+            ("mem-down", _now() - timedelta(days=1)),
+        ])
+        rows = dict(gc.conn.execute("SELECT memory_id, generation FROM memory_generations"))
+        assert rows == {"mem-up": 2, "mem-down": 0}
+
+    def test_empty_iterable(self, gc):
+        """No memories yields zero counts."""
+        assert gc.assign_generations(iter([])) == {"gen_0": 0, "gen_1": 0, "gen_2": 0}
+
+    def test_invalid_entry_assigns_nothing(self, gc):
+        """A bad entry aborts the whole batch."""
+        with pytest.raises(TypeError):
+            gc.assign_generations([("mem-ok", _now()), ("mem-bad", None)])
+        assert gc.get_generation_stats()["total"] == 0
+
+
 # ── promote ───────────────────────────────────────────────────────────────────
 
 
@@ -523,6 +558,20 @@ class TestEdgeCases:
         collected = gc.collect_generation(2)
         assert "mem-edge" not in collected
 
+    def test_member_without_metadata_kept(self, gc):
+        """Memories with no mock_memories row are never collected."""
+        gc.assign_generation("mem-orphan", _now() - timedelta(days=1))
+        assert gc.collect_generation(0) == []
+        assert gc.get_gc_history(limit=1)[0]["promoted_count"] == 1
+
+    def test_unparseable_last_accessed_kept(self, gc):
+        """Tenured memories with a malformed last_accessed are kept."""
+        _seed_memory(gc, "mem-odd", _now() - timedelta(days=200), importance=0.05)
+        gc.conn.execute(
+            "UPDATE mock_memories SET last_accessed = 'not a date' WHERE memory_id = 'mem-odd'"
+        )
+        assert gc.collect_generation(2) == []
+
     def test_close_method(self, tmp_path):
         """Close method closes the database connection gracefully."""
         db = tmp_path / "close_test.db"
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 from memory_system.importance_engine import (
     calculate_importance,
     apply_decay,
+    apply_decay_array,
     apply_reinforcement,
     detect_trigger_words,
     get_importance_score
@@ -89,6 +90,14 @@ class TestApplyDecay:
         decayed = apply_decay(original, days_since)
         assert decayed >= 0
 
+    def test_array_matches_scalar(self):
+        """Vectorized decay matches apply_decay element-wise"""
+        importances = [0.8, 0.5, 0.2, 0.9]
+        days = [0, 7, 365, -3]
+        decayed = apply_decay_array(importances, days)
+        for value, imp, d in zip(decayed, importances, days):
+            assert abs(value - apply_decay(imp, d)) < 1e-12
+
 
 class TestApplyReinforcement:
     """Test reinforcement: +15% with headroom (cap at 0.95)"""
@@ -0,0 +1,207 @@
+"""
+Tests for the async LLM executor.
+
+Covers:
+- Bounded concurrency
+- Circuit breaker integration (failures recorded, open breaker fails fast)
+- Packed judgment prompts and answer parsing
+- JudgmentBatcher fan-in/fan-out
+- Batched consolidation dedup and contradiction checks
+"""
+
+import asyncio
+import re
+
+import pytest
+
+from memory_system.circuit_breaker import reset_all
+from memory_system.contradiction_detector import check_contradictions_many
+from memory_system.llm_executor import (
+    AsyncLLMExecutor,
+    JudgmentBatcher,
+    build_judgment_prompt,
+    parse_judgments,
+    set_executor,
+)
+from memory_system.llm_gateway import LLMCallError
+from memory_system.memory_ts_client import MemoryTSClient
+from memory_system.session_consolidator import SessionConsolidator, SessionMemory
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breakers_and_executor():
+    reset_all()
+    yield
+    reset_all()
+    set_executor(None)
+
+
+def _answer_all(answer_for):
+    """Fake runner answering every [n] item of a packed prompt via answer_for(item)."""
+    calls = []
+
+    async def runner(prompt, timeout):
+        calls.append(prompt)
+        items = re.findall(r'^\[(\d+)\]\n(.*?)(?=\n\n\[\d+\]|\n\nReturn ONLY)', prompt, re.M | re.S)
+        return "{" + ", ".join(f'"{n}": "{answer_for(text)}"' for n, text in items) + "}"
+
+    return runner, calls
+
+
+class TestRun:
+    def test_concurrency_is_bounded(self):
+        active = 0
+        peak = 0
+
+        async def runner(prompt, timeout):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return prompt.upper()
+
+        executor = AsyncLLMExecutor(max_concurrency=3, runner=runner, use_gateway_cache=False)
+        results = executor.run_many_sync([f"p{i}" for i in range(10)])
+
+        assert results == [f"P{i}" for i in range(10)]
+        assert peak == 3
+
+    def test_failures_trip_breaker_and_fail_fast(self):
+        calls = []
+
+        async def runner(prompt, timeout):
+            calls.append(prompt)
+            raise LLMCallError("exit 1")
+
+        executor = AsyncLLMExecutor(max_concurrency=1, breaker_name="t_exec", runner=runner,
+                                    use_gateway_cache=False)
+        assert executor.run_many_sync(["a", "b", "c", "d", "e"]) == [""] * 5
+        assert executor.breaker.is_open
+        assert len(calls) == 3  # breaker opened after 3 failures
+
+    def test_missing_cli_does_not_trip_breaker(self):
+        async def runner(prompt, timeout):
+            raise FileNotFoundError("claude")
+
+        executor = AsyncLLMExecutor(breaker_name="t_missing", runner=runner, use_gateway_cache=False)
+        executor.run_many_sync(["a"] * 5)
+        assert not executor.breaker.is_open
+
+    def test_sync_wrapper_works_inside_running_loop(self):
+        async def runner(prompt, timeout):
+            return "ok"
+
+        executor = AsyncLLMExecutor(runner=runner, use_gateway_cache=False)
+
+        async def caller():
+            return executor.run_many_sync(["x"])
+
+        assert asyncio.run(caller()) == ["ok"]
+
+
+class TestJudgments:
+    def test_prompt_numbers_items(self):
+        prompt = build_judgment_prompt("Decide.", ["a\nb", "c"], ["YES", "NO"])
+        assert "[1]\na\nb" in prompt
+        assert "[2]\nc" in prompt
+        assert "YES, NO" in prompt
+
+    def test_parse_json_object(self):
+        assert parse_judgments('{"1": "yes", "2": "NO"}', 2, ["YES", "NO"]) == ["YES", "NO"]
+
+    def test_parse_fenced_json(self):
+        response = '```json\n{"2": "UPDATE"}\n```'
+        assert parse_judgments(response, 3, ["DUPLICATE", "UPDATE", "NEW"]) == [None, "UPDATE", None]
+
+    def test_parse_lines(self):
+        response = "1: CONTRADICTS\n[2] compatible\n9. CONTRADICTS"
+        assert parse_judgments(response, 2, ["CONTRADICTS", "COMPATIBLE"]) == ["CONTRADICTS", "COMPATIBLE"]
+
+    def test_parse_whole_words_only(self):
+        response = '{"1": "INCOMPATIBLE", "2": "NEW, not a DUPLICATE", "3": "either DUPLICATE or UPDATE", "4": "It is an UPDATE."}'
+        assert parse_judgments(response, 4, ["DUPLICATE", "UPDATE", "NEW"]) == [None, "NEW", None, "UPDATE"]
+        assert parse_judgments('{"1": "INCOMPATIBLE"}', 1, ["CONTRADICTS", "COMPATIBLE"]) == [None]
+
+    def test_parse_garbage(self):
+        assert parse_judgments("no idea", 2, ["YES", "NO"]) == [None, None]
+
+    def test_judge_packs_and_fans_out(self):
+        runner, calls = _answer_all(lambda item: "YES" if "even" in item else "NO")
+        executor = AsyncLLMExecutor(runner=runner, use_gateway_cache=False)
+        items = [f"item {'even' if i % 2 == 0 else 'odd'} {i}" for i in range(45)]
+
+        answers = executor.judge_sync(items, ["YES", "NO"], "Is it even?", batch_size=20)
+
+        assert answers == ["YES" if i % 2 == 0 else "NO" for i in range(45)]
+        assert len(calls) == 3
+
+    def test_batcher_groups_concurrent_asks(self):
+        runner, calls = _answer_all(lambda item: "NO" if "7" in item else "YES")
+        executor = AsyncLLMExecutor(runner=runner, use_gateway_cache=False)
+
+        async def main():
+            batcher = JudgmentBatcher(executor, "Decide.", ["YES", "NO"], max_batch=50, max_wait=0.01)
+            return await asyncio.gather(*(batcher.ask(f"item {i}") for i in range(10)))
+
+        answers = asyncio.run(main())
+        assert answers == ["NO" if i == 7 else "YES" for i in range(10)]
+        assert len(calls) == 1
+
+    def test_batcher_holds_in_flight_batches(self):
+        runner, _ = _answer_all(lambda item: "YES")
+        executor = AsyncLLMExecutor(runner=runner, use_gateway_cache=False)
+
+        async def main():
+            batcher = JudgmentBatcher(executor, "Decide.", ["YES", "NO"], max_batch=2, max_wait=1)
+            asks = [asyncio.ensure_future(batcher.ask(f"item {i}")) for i in range(2)]
+            await asyncio.sleep(0)
+            in_flight = len(batcher._tasks)
+            answers = await asyncio.gather(*asks)
+            await asyncio.sleep(0)
+            return in_flight, answers, len(batcher._tasks)
+
+        in_flight, answers, remaining = asyncio.run(main())
+        assert in_flight == 1
+        assert answers == ["YES", "YES"]
+        assert remaining == 0
+
+
+class TestBatchedCallSites:
+    def test_contradictions_many_one_call(self):
+        runner, calls = _answer_all(
+            lambda item: "CONTRADICTS" if "afternoon" in item and "morning" in item else "COMPATIBLE"
+        )
+        set_executor(AsyncLLMExecutor(runner=runner, use_gateway_cache=False))
+        existing = [{"id": "m1", "content": "I prefer morning meetings with clients"}]
+
+        results = check_contradictions_many(
+            ["I prefer afternoon meetings with clients", "Client meetings prefer short agendas"],
+            [existing, existing],
+        )
+
+        assert results[0].action == "replace"
+        assert results[0].contradicted_memory["id"] == "m1"
+        assert results[1].action == "save"
+        assert len(calls) == 1
+
+    def test_dedup_decisions_batched(self, tmp_path):
+        runner, calls = _answer_all(lambda item: "DUPLICATE" if "pricing" in item else "NEW")
+        set_executor(AsyncLLMExecutor(runner=runner, use_gateway_cache=False))
+
+        client = MemoryTSClient(memory_dir=tmp_path)
+        client.create(content="clients object to pricing reframe value", project_id="LFI", tags=[])
+        client.create(content="timeline objections hide scope confusion", project_id="LFI", tags=[])
+        consolidator = SessionConsolidator(memory_dir=tmp_path)
+
+        unique = consolidator.deduplicate([
+            SessionMemory(content="clients object to pricing so stress value", importance=0.7, project_id="LFI"),
+            SessionMemory(content="timeline objections hide budget problems", importance=0.7, project_id="LFI"),
+            SessionMemory(content="completely unrelated fact", importance=0.7, project_id="LFI"),
+        ])
+
+        assert [m.content for m in unique] == [
+            "timeline objections hide budget problems",
+            "completely unrelated fact",
+        ]
+        assert len(calls) == 1
@@ -0,0 +1,212 @@
+"""
+Tests for the shared LLM gateway.
+
+Covers:
+- Response cache (hit/miss, TTL expiry, LRU size bound, model in key)
+- Failures and empty responses are not cached
+- In-flight coalescing of identical concurrent prompts
+- Per-call-site metrics
+- Call sites (ask_claude, ask_claude_quick, extract_with_llm) routed through the gateway
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from memory_system.circuit_breaker import reset_all
+from memory_system.db_pool import get_pool
+from memory_system.contradiction_detector import ask_claude_quick
+from memory_system.llm_extractor import ask_claude, extract_with_llm
+from memory_system.llm_gateway import (
+    FakeBackend,
+    LLMCallError,
+    LLMGateway,
+    ResponseCache,
+    cache_key,
+    set_gateway,
+)
+
+
+@pytest.fixture
+def cache_db(tmp_path):
+    return str(tmp_path / "llm_cache.db")
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend({"hello": "world"}, default="fallback")
+
+
+@pytest.fixture
+def gateway(backend, cache_db):
+    return LLMGateway(backend=backend, cache_db_path=cache_db)
+
+
+class TestResponseCache:
+    def test_second_call_served_from_cache(self, gateway, backend):
+        assert gateway.complete("hello", site="test") == "world"
+        assert gateway.complete("hello", site="test") == "world"
+        assert backend.calls == ["hello"]
+
+    def test_cache_persists_across_gateways(self, backend, cache_db):
+        LLMGateway(backend=backend, cache_db_path=cache_db).complete("hello")
+        LLMGateway(backend=backend, cache_db_path=cache_db).complete("hello")
+        assert len(backend.calls) == 1
+
+    def test_model_is_part_of_key(self, gateway, backend):
+        gateway.complete("hello", model="haiku")
+        gateway.complete("hello", model="sonnet")
+        assert len(backend.calls) == 2
+        assert cache_key("hello", "haiku") != cache_key("hello", "sonnet")
+
+    def test_use_cache_false_bypasses(self, gateway, backend):
+        gateway.complete("hello")
+        gateway.complete("hello", use_cache=False)
+        assert len(backend.calls) == 2
+
+    def test_expired_entry_is_refetched(self, gateway, backend):
+        gateway.complete("hello", ttl_seconds=0)
+        gateway.complete("hello")
+        assert len(backend.calls) == 2
+
+    def test_size_bound_evicts_least_recently_used(self, cache_db):
+        cache = ResponseCache(cache_db, max_entries=2)
+        cache.put("a", None, "1")
+        time.sleep(0.01)
+        cache.put("b", None, "2")
+        time.sleep(0.01)
+        assert cache.get("a") == "1"  # a is now more recent than b
+        time.sleep(0.01)
+        cache.put("c", None, "3")
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+
+    def test_hits_do_not_write_until_flushed(self, cache_db):
+        cache = ResponseCache(cache_db)
+        cache.put("a", None, "1")
+        writes = get_pool(cache_db).get_stats()["write"]["acquired"]
+        for _ in range(3):
+            assert cache.get("a") == "1"
+        assert get_pool(cache_db).get_stats()["write"]["acquired"] == writes
+
+        def hit_count():
+            with sqlite3.connect(cache_db) as conn:
+                return conn.execute("SELECT hit_count FROM llm_response_cache").fetchone()[0]
+
+        assert hit_count() == 0
+        cache.flush_hits()
+        assert hit_count() == 3
+
+    def test_failures_not_cached(self, cache_db):
+        backend = FakeBackend({"boom": LLMCallError("exit 1")})
+        gateway = LLMGateway(backend=backend, cache_db_path=cache_db)
+        for _ in range(2):
+            with pytest.raises(LLMCallError):
+                gateway.complete("boom")
+        assert len(backend.calls) == 2
+
+    def test_empty_response_not_cached(self, cache_db):
+        backend = FakeBackend(default="")
+        gateway = LLMGateway(backend=backend, cache_db_path=cache_db)
+        gateway.complete("anything")
+        gateway.complete("anything")
+        assert len(backend.calls) == 2
+
+
+class TestCoalescing:
+    def test_identical_concurrent_prompts_share_one_call(self, cache_db):
+        backend = FakeBackend({"slow": "answer"}, delay=0.2)
+        gateway = LLMGateway(backend=backend, enable_cache=False)
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(gateway.complete("slow", site="t")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["answer"] * 5
+        assert backend.calls == ["slow"]
+        metrics = gateway.get_metrics()["t"]
+        assert metrics["misses"] == 1
+        assert metrics["coalesced"] == 4
+
+    def test_errors_propagate_to_waiters(self):
+        backend = FakeBackend({"slow": LLMCallError("down")}, delay=0.2)
+        gateway = LLMGateway(backend=backend, enable_cache=False)
+        errors = []
+
+        def call():
+            try:
+                gateway.complete("slow")
+            except LLMCallError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(errors) == 3
+        assert len(backend.calls) == 1
+
+
+class TestMetrics:
+    def test_per_site_counters(self, gateway):
+        gateway.complete("hello", site="a")
+        gateway.complete("hello", site="a")
+        gateway.complete("other", site="b")
+
+        metrics = gateway.get_metrics()
+        assert metrics["a"]["calls"] == 2
+        assert metrics["a"]["hits"] == 1
+        assert metrics["a"]["misses"] == 1
+        assert metrics["a"]["hit_rate"] == 0.5
+        assert metrics["b"]["misses"] == 1
+
+    def test_errors_counted(self):
+        gateway = LLMGateway(backend=FakeBackend(default=LLMCallError("x")), enable_cache=False)
+        with pytest.raises(LLMCallError):
+            gateway.complete("p", site="s")
+        assert gateway.get_metrics()["s"]["errors"] == 1
+
+    def test_reset_metrics(self, gateway):
+        gateway.complete("hello")
+        gateway.reset_metrics()
+        assert gateway.get_metrics() == {}
+
+
+class TestCallSites:
+    @pytest.fixture(autouse=True)
+    def _fresh_breakers_and_gateway(self):
+        reset_all()
+        yield
+        reset_all()
+        set_gateway(None)
+
+    def test_ask_claude_uses_gateway_cache(self, gateway, backend):
+        set_gateway(gateway)
+        assert ask_claude("hello", site="summary") == "world"
+        assert ask_claude("hello", site="summary") == "world"
+        assert backend.calls == ["hello"]
+        assert gateway.get_metrics()["summary"]["hits"] == 1
+
+    def test_ask_claude_quick_routes_through_gateway(self, cache_db):
+        gateway = LLMGateway(backend=FakeBackend(default="yes"), cache_db_path=cache_db)
+        set_gateway(gateway)
+        assert ask_claude_quick("contradicts?") == "yes"
+        assert "contradiction" in gateway.get_metrics()
+
+    def test_extract_with_llm_routes_through_gateway(self, cache_db):
+        backend = FakeBackend(default='[{"content": "Use WAL", "importance": 0.7}]')
+        set_gateway(LLMGateway(backend=backend, cache_db_path=cache_db))
+        assert extract_with_llm("conversation")[0].content == "Use WAL"
+        assert extract_with_llm("conversation")[0].content == "Use WAL"
+        assert len(backend.calls) == 1
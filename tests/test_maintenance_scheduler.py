@@ -0,0 +1,153 @@
+"""
+Tests for maintenance_scheduler.py - DAG scheduler for nightly jobs
+"""
+
+import threading
+import time
+
+import pytest
+
+from memory_system.maintenance_scheduler import MaintenanceScheduler
+
+
+def _sleeper(log, name, seconds=0.05):
+    def job():
+        log.append(("start", name))
+        time.sleep(seconds)
+        log.append(("end", name))
+        return name
+    return job
+
+
+def _order(log, event, name):
+    return log.index((event, name))
+
+
+class TestOrdering:
+    def test_dependencies_run_first(self):
+        log = []
+        scheduler = MaintenanceScheduler(max_workers=4)
+        scheduler.add("backup", _sleeper(log, "backup"))
+        scheduler.add("vacuum", _sleeper(log, "vacuum"), depends_on=["backup"])
+        scheduler.add("health", _sleeper(log, "health"), depends_on=["vacuum"])
+
+        report = scheduler.run()
+
+        assert report.succeeded
+        assert _order(log, "end", "backup") < _order(log, "start", "vacuum")
+        assert _order(log, "end", "vacuum") < _order(log, "start", "health")
+        assert report.jobs["health"].result == "health"
+
+    def test_independent_jobs_overlap(self):
+        log = []
+        scheduler = MaintenanceScheduler(max_workers=4)
+        for name in ("a", "b", "c"):
+            scheduler.add(name, _sleeper(log, name, 0.1), writes=[f"{name}.db"])
+
+        report = scheduler.run()
+
+        assert report.wall_ms < 0.8 * report.serial_ms
+        assert [event for event, _ in log[:3]] == ["start"] * 3
+
+    def test_shared_write_resource_serializes(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def job():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+        scheduler = MaintenanceScheduler(max_workers=4)
+        for name in ("pagerank", "clustering", "embeddings"):
+            scheduler.add(name, job, writes=["intelligence.db"])
+        scheduler.run()
+
+        assert max(peak) == 1
+
+    def test_readers_share_but_exclude_writer(self):
+        log = []
+        scheduler = MaintenanceScheduler(max_workers=4)
+        scheduler.add("read1", _sleeper(log, "read1"), reads=["memory_files"])
+        scheduler.add("read2", _sleeper(log, "read2"), reads=["memory_files"])
+        scheduler.add("decay", _sleeper(log, "decay"), writes=["memory_files"])
+        scheduler.run()
+
+        assert _order(log, "start", "read2") < _order(log, "end", "read1")
+        assert _order(log, "start", "decay") > max(_order(log, "end", "read1"), _order(log, "end", "read2"))
+
+    def test_max_workers_respected(self):
+        log = []
+        scheduler = MaintenanceScheduler(max_workers=1)
+        for name in ("a", "b"):
+            scheduler.add(name, _sleeper(log, name, 0.01))
+        scheduler.run()
+        assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+
+class TestFailures:
+    def test_failure_skips_dependents_only(self):
+        def boom():
+            raise RuntimeError("disk full")
+
+        scheduler = MaintenanceScheduler()
+        scheduler.add("backup", boom)
+        scheduler.add("vacuum", lambda: "v", depends_on=["backup"])
+        scheduler.add("health", lambda: "h", depends_on=["vacuum"])
+        scheduler.add("pagerank", lambda: "p")
+
+        finished = []
+        scheduler.on_finish = finished.append
+        report = scheduler.run()
+
+        assert not report.succeeded
+        assert report.jobs["backup"].status == "failed"
+        assert report.jobs["backup"].error == "RuntimeError: disk full"
+        assert report.jobs["vacuum"].status == "skipped"
+        assert report.jobs["health"].status == "skipped"
+        assert report.jobs["pagerank"].status == "ok"
+        assert sorted(r.name for r in finished) == ["backup", "health", "pagerank", "vacuum"]
+
+    def test_unknown_dependency(self):
+        scheduler = MaintenanceScheduler()
+        scheduler.add("vacuum", lambda: None, depends_on=["backup"])
+        with pytest.raises(ValueError, match="unknown job 'backup'"):
+            scheduler.run()
+
+    def test_cycle(self):
+        scheduler = MaintenanceScheduler()
+        scheduler.add("a", lambda: None, depends_on=["b"])
+        scheduler.add("b", lambda: None, depends_on=["a"])
+        with pytest.raises(ValueError, match="cycle"):
+            scheduler.validate()
+
+    def test_duplicate_name(self):
+        scheduler = MaintenanceScheduler()
+        scheduler.add("a", lambda: None)
+        with pytest.raises(ValueError, match="Duplicate"):
+            scheduler.add("a", lambda: None)
+
+
+class TestReport:
+    def test_durations_recorded(self):
+        # The metrics module run() records into (test_memory_system_api re-imports packages)
+        registry = MaintenanceScheduler.run.__globals__["metrics"].get_registry()
+        registry.reset()
+        scheduler = MaintenanceScheduler()
+        scheduler.add("gc", lambda: {"collected": [1, 2]})
+        scheduler.add("noop", lambda: object())
+
+        report = scheduler.run()
+        data = report.to_dict()
+
+        assert data["succeeded"] is True
+        assert data["wall_ms"] >= 0
+        results = {job["name"]: job["result"] for job in data["jobs"]}
+        assert results["gc"] == {"collected": [1, 2]}
+        assert isinstance(results["noop"], str)  # repr() of non-JSON values
+        if registry.enabled:
+            assert registry.snapshot()["stages"]["nightly.gc"]["count"] == 1
@@ -8,6 +8,7 @@ Testing memory-ts API wrapper for:
 - Getting specific memories
 """
 
+import os
 import pytest
 import tempfile
 import shutil
@@ -17,7 +18,11 @@ from memory_system.memory_ts_client import (
     MemoryTSClient,
     Memory,
     MemoryNotFoundError,
-    MemoryTSError
+    MemoryTSError,
+    GENERATION_FILE,
+    bump_generation,
+    generation_settled,
+    store_generation,
 )
 
 
@@ -512,3 +517,127 @@ This is a legacy memory without source_session_id.
         # session_id is a runtime/creation field, not persisted in YAML
         # so after reload it won't be the same — this is expected behavior
         assert memory.session_id == "legacy-session-1"  # exists at creation time
+
+
+class TestBulkWrites:
+    """Test create_many/update_many batch APIs"""
+
+    def test_create_many_writes_all(self, client, temp_memory_dir):
+        """create_many persists every item with a unique id"""
+        items = [
+            {"content": f"Bulk memory {i}", "project_id": "LFI", "tags": ["#bulk"], "importance": 0.6}
+            for i in range(50)
+        ]
+        created = client.create_many(items)
+
+        assert len(created) == 50
+        assert len({m.id for m in created}) == 50
+        assert len(client.list()) == 50
+        assert client.get(created[7].id).content == "Bulk memory 7"
+
+    def test_create_many_identical_content_unique_ids(self, client):
+        """Identical items in one batch still get distinct ids"""
+        items = [{"content": "Same", "project_id": "LFI", "tags": []}] * 20
+        created = client.create_many(items)
+        assert len({m.id for m in created}) == 20
+
+    def test_create_many_syncs_files_before_renaming(self, client, temp_memory_dir, monkeypatch):
+        """Every staged file is fsynced before the first rename, then the directory"""
+        events = []
+        real_fsync, real_replace = os.fsync, os.replace
+        monkeypatch.setattr(os, "fsync", lambda fd: (events.append("fsync"), real_fsync(fd))[1])
+        monkeypatch.setattr(os, "replace", lambda *a: (events.append("replace"), real_replace(*a))[1])
+
+        client.create_many([{"content": f"Durable {i}", "project_id": "LFI", "tags": []} for i in range(3)])
+
+        assert events == ["fsync"] * 3 + ["replace"] * 3 + ["fsync"]
+
+    def test_create_many_leaves_no_staging_files(self, client, temp_memory_dir):
+        """Staging directory is removed after the batch"""
+        client.create_many([{"content": "One", "project_id": "LFI", "tags": []}])
+        leftovers = [
+            p.name for p in Path(temp_memory_dir).iterdir()
+            if p.name.startswith(".") and p.name != GENERATION_FILE
+        ]
+        assert leftovers == []
+
+    def test_create_many_auto_importance(self, client):
+        """Importance is calculated when omitted, as in create()"""
+        created = client.create_many([{"content": "Critical production failure", "project_id": "LFI", "tags": []}])
+        assert 0.0 < created[0].importance <= 1.0
+
+    def test_update_many_applies_fields(self, client):
+        """update_many sets fields on every memory"""
+        created = client.create_many(
+            [{"content": f"M{i}", "project_id": "LFI", "tags": [], "importance": 0.5} for i in range(5)]
+        )
+        client.update_many({m.id: {"importance": 0.9, "tags": ["#x"]} for m in created})
+
+        for memory in created:
+            reloaded = client.get(memory.id)
+            assert reloaded.importance == 0.9
+            assert reloaded.tags == ["#x"]
+
+    def test_update_many_missing_id_writes_nothing(self, client):
+        """A missing id aborts the batch before any write"""
+        memory = client.create(content="Original", project_id="LFI", tags=[], importance=0.5)
+        with pytest.raises(MemoryNotFoundError):
+            client.update_many({memory.id: {"content": "Changed"}, "nonexistent": {"content": "x"}})
+        assert client.get(memory.id).content == "Original"
+
+
+def _age(directory: Path) -> None:
+    """Set a directory's mtime to the epoch so any later write visibly advances it"""
+    os.utime(directory, ns=(0, 0))
+
+
+class TestStoreGeneration:
+    """Store generation (write counter + memory_dir mtime) changes on every write"""
+
+    def test_missing_store_is_generation_zero(self, tmp_path):
+        assert store_generation(tmp_path / "missing") == 0
+
+    def test_writes_bump_generation(self, client, temp_memory_dir):
+        """create, update, save, create_many, update_many and archive all advance it"""
+        directory = Path(temp_memory_dir)
+        memory = client.create(content="Gen", project_id="LFI", tags=[], importance=0.5)
+        batch = client.create_many([{"content": "Batch", "project_id": "LFI", "tags": []}])
+        writes = [
+            lambda: client.create(content="Gen 2", project_id="LFI", tags=[], importance=0.5),
+            lambda: client.update(memory.id, content="Gen 3"),
+            lambda: client.save(client.get(memory.id)),
+            lambda: client.create_many([{"content": "Batch 2", "project_id": "LFI", "tags": []}]),
+            lambda: client.update_many({batch[0].id: {"importance": 0.9}}),
+            lambda: client.archive(memory.id),
+        ]
+        for write in writes:
+            before = client.generation()
+            mtime = directory.stat().st_mtime_ns
+            write()
+            os.utime(directory, ns=(mtime, mtime))  # As if the write fell in the same clock tick
+            assert client.generation() > before
+
+    def test_counter_is_one_byte_per_batch(self, client, temp_memory_dir):
+        client.create_many([{"content": f"Batch {i}", "project_id": "LFI", "tags": []} for i in range(5)])
+        client.create(content="Single", project_id="LFI", tags=[], importance=0.5)
+        assert (Path(temp_memory_dir) / GENERATION_FILE).stat().st_size == 2
+
+    def test_bump_generation_for_outside_writers(self, client, temp_memory_dir):
+        client.create(content="Existing", project_id="LFI", tags=[], importance=0.5)
+        before = client.generation()
+        bump_generation(temp_memory_dir)
+        assert client.generation() == before + 1
+
+    def test_fresh_store_is_unsettled(self, client, temp_memory_dir):
+        client.create(content="Fresh", project_id="LFI", tags=[], importance=0.5)
+        assert not generation_settled(temp_memory_dir)
+        _age(Path(temp_memory_dir))
+        assert generation_settled(temp_memory_dir)
+
+    def test_reads_do_not_bump_generation(self, client):
+        memory = client.create(content="Read me", project_id="LFI", tags=[], importance=0.5)
+        before = client.generation()
+        client.get(memory.id)
+        client.list()
+        client.search(content="Read")
+        assert client.generation() == before
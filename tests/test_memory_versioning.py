@@ -4,12 +4,23 @@ Tests for memory versioning (Feature 23)
 Tests version creation, history tracking, diffs, and rollback functionality.
 """
 
+import json
 import pytest
 import tempfile
 import time
 
 from memory_system.intelligence.database import IntelligenceDB
 from memory_system.intelligence.versioning import MemoryVersioning, MemoryVersion
+from memory_system.memory_versioning import (
+    KEYFRAME_INTERVAL,
+    apply_delta,
+    compact_version_file,
+    create_version,
+    get_version_history,
+    make_delta,
+    rollback_to_version,
+    save_version,
+)
 
 
 @pytest.fixture
@@ -268,3 +279,114 @@ class TestUtilityMethods:
         recent = versioning.get_recent_changes(limit=5)
 
         assert len(recent) == 5
+
+
+class TestDeltaStorage:
+    """Test keyframe + delta encoding of history"""
+
+    def _rows(self, db, memory_id):
+        conn = db._connect()
+        rows = conn.execute(
+            "SELECT version, content, delta, base_version FROM memory_versions "
+            "WHERE memory_id = ? ORDER BY version",
+            (memory_id,)
+        ).fetchall()
+        conn.close()
+        return rows
+
+    def _edits(self, count):
+        text = "Always verify work before claiming completion. " * 20
+        contents = []
+        for i in range(count):
+            text = text.replace("verify", f"verify (edit {i})", 1)
+            contents.append(text)
+        return contents
+
+    def test_delta_round_trip(self):
+        """apply_delta rebuilds the target exactly, whitespace included"""
+        base = "line one\n  line two\tend\n\nfinal"
+        target = "line one changed\n  line two\tend\n\n\nfinal words "
+        assert apply_delta(base, make_delta(base, target)) == target
+        assert apply_delta("", make_delta("", target)) == target
+        assert apply_delta(base, make_delta(base, "")) == ""
+
+    def test_history_stored_as_keyframes_and_deltas(self, db, versioning):
+        """Only keyframes and the head keep full content"""
+        contents = self._edits(KEYFRAME_INTERVAL + 5)
+        for content in contents:
+            versioning.create_version("mem_001", content, 0.5)
+
+        rows = self._rows(db, "mem_001")
+        full = [version for version, _, delta, _ in rows if delta is None]
+        assert full == [1, KEYFRAME_INTERVAL + 1, KEYFRAME_INTERVAL + 5]
+        for version, content, delta, base in rows:
+            if delta is not None:
+                assert content == ""
+                assert base in full and base < version
+
+        history = versioning.get_version_history("mem_001")
+        assert [v.content for v in history] == contents
+        for n in (2, KEYFRAME_INTERVAL, KEYFRAME_INTERVAL + 3):
+            assert versioning.get_version("mem_001", n).content == contents[n - 1]
+        assert versioning.get_latest_version("mem_001").content == contents[-1]
+
+    def test_recent_changes_decodes_deltas(self, versioning):
+        """Recent changes return full content for delta rows"""
+        contents = self._edits(3)
+        for content in contents:
+            versioning.create_version("mem_001", content, 0.5)
+        recent = versioning.get_recent_changes(limit=10)
+        assert sorted(v.content for v in recent) == sorted(contents)
+
+    def test_compact_history_migrates_full_rows(self, db, versioning):
+        """Histories written in full are converted in place"""
+        contents = self._edits(12)
+        conn = db._connect()
+        conn.executemany(
+            """INSERT INTO memory_versions
+               (memory_id, version, content, importance, changed_by, timestamp)
+               VALUES ('mem_old', ?, ?, 0.5, 'user', 0)""",
+            list(enumerate(contents, 1))
+        )
+        conn.commit()
+        conn.close()
+
+        preview = versioning.compact_history(dry_run=True)
+        assert preview['converted'] > 0
+        assert all(delta is None for _, _, delta, _ in self._rows(db, "mem_old"))
+
+        stats = versioning.compact_history()
+        assert stats == preview
+        assert stats['bytes_after'] < stats['bytes_before']
+        assert [v.content for v in versioning.get_version_history("mem_old")] == contents
+        assert versioning.compact_history()['converted'] == 0
+
+
+class TestFileVersionHistory:
+    """Test delta encoding in JSON version files"""
+
+    def test_save_and_read_history(self, tmp_path):
+        contents = [f"Deploy with docker compose, attempt {i}. " * 10 for i in range(15)]
+        for i, content in enumerate(contents):
+            version = create_version("mem_001", content, 0.5)
+            version['version'] = i + 1
+            save_version(version, tmp_path)
+
+        history = get_version_history("mem_001", tmp_path)
+        assert [v['content'] for v in history] == contents
+        assert rollback_to_version("mem_001", 3, tmp_path)['content'] == contents[2]
+
+        with open(tmp_path / "mem_001.json") as f:
+            stored = json.load(f)
+        assert sum('delta' in v for v in stored) > 0
+        assert 'content' in stored[-1]
+
+    def test_compact_version_file(self, tmp_path):
+        contents = [f"Note {i}: the quick brown fox jumps over the lazy dog. " * 8 for i in range(6)]
+        entries = [dict(create_version("mem_002", c, 0.5), version=i) for i, c in enumerate(contents)]
+        with open(tmp_path / "mem_002.json", "w") as f:
+            json.dump(entries, f)
+
+        assert compact_version_file("mem_002", tmp_path) == 4
+        assert compact_version_file("mem_002", tmp_path) == 0
+        assert [v['content'] for v in get_version_history("mem_002", tmp_path)] == contents
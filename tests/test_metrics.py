@@ -0,0 +1,173 @@
+"""
+Tests for metrics.py - stage timing histograms and event counters
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from memory_system import metrics
+from memory_system.metrics import Histogram, MetricsRegistry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    metrics.reset()
+    metrics.set_enabled(True)
+    yield
+    metrics.reset()
+    metrics.set_enabled(True)
+
+
+class TestHistogram:
+    def test_observe_and_quantiles(self):
+        histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+        for value in [0.005] * 90 + [0.5] * 10:
+            histogram.observe(value)
+        assert histogram.count == 100
+        assert histogram.counts == [90, 0, 10, 0]
+        assert histogram.quantile(0.5) <= 0.01
+        assert 0.1 < histogram.quantile(0.95) <= 0.5
+        assert histogram.max == 0.5
+
+    def test_empty(self):
+        assert Histogram().to_dict()["p95_ms"] == 0.0
+
+
+class TestRegistry:
+    def test_timer_records_stage(self):
+        registry = MetricsRegistry(enabled=True)
+        with registry.timer("stage.a"):
+            time.sleep(0.002)
+        stats = registry.snapshot()["stages"]["stage.a"]
+        assert stats["count"] == 1
+        assert stats["total_ms"] >= 2
+
+    def test_timer_records_on_exception(self):
+        registry = MetricsRegistry(enabled=True)
+        with pytest.raises(ValueError):
+            with registry.timer("stage.fail"):
+                raise ValueError
+        assert registry.snapshot()["stages"]["stage.fail"]["count"] == 1
+
+    def test_disabled_records_nothing(self):
+        registry = MetricsRegistry(enabled=False)
+        with registry.timer("stage.a"):
+            pass
+        registry.inc("event")
+        registry.observe("stage.b", 1.0)
+        assert registry.snapshot() == {"stages": {}, "events": {}}
+
+    def test_env_toggle(self, monkeypatch):
+        monkeypatch.setenv("MEMORY_SYSTEM_METRICS", "0")
+        assert MetricsRegistry().enabled is False
+        monkeypatch.setenv("MEMORY_SYSTEM_METRICS", "1")
+        assert MetricsRegistry().enabled is True
+
+    def test_prometheus_text(self):
+        registry = MetricsRegistry(enabled=True, buckets=(0.1, 1.0))
+        registry.observe("db.read", 0.05)
+        registry.observe("db.read", 0.5)
+        registry.inc("cache_hits", 3)
+        text = registry.render_prometheus()
+        assert "# TYPE memory_system_stage_seconds histogram" in text
+        assert 'memory_system_stage_seconds_bucket{stage="db.read",le="0.1"} 1' in text
+        assert 'memory_system_stage_seconds_bucket{stage="db.read",le="1"} 2' in text
+        assert 'memory_system_stage_seconds_bucket{stage="db.read",le="+Inf"} 2' in text
+        assert 'memory_system_stage_seconds_count{stage="db.read"} 2' in text
+        assert 'memory_system_events_total{event="cache_hits"} 3' in text
+
+
+class TestModuleHelpers:
+    def test_timed_decorator(self):
+        @metrics.timed("helper.call")
+        def work(x):
+            return x * 2
+
+        assert work(21) == 42
+        assert metrics.snapshot()["stages"]["helper.call"]["count"] == 1
+
+        metrics.set_enabled(False)
+        assert work(1) == 2
+        assert metrics.snapshot()["stages"]["helper.call"]["count"] == 1
+
+    def test_memory_ts_client_instrumented(self, tmp_path):
+        from memory_system import memory_ts_client
+
+        # Other test modules may re-import memory_system; use the client's registry
+        registry = memory_ts_client.metrics.get_registry()
+        registry.reset()
+        client = memory_ts_client.MemoryTSClient(memory_dir=tmp_path, enable_access_logging=False)
+        client.create(content="timed memory", project_id="LFI", tags=["#t"], importance=0.5)
+        client.search(content="timed")
+
+        stages = registry.snapshot()["stages"]
+        assert stages["memory_ts.write"]["count"] >= 1
+        assert stages["memory_ts.search"]["count"] == 1
+        assert stages["memory_ts.read"]["count"] >= 1
+
+    def test_dashboard_metrics_route(self):
+        pytest.importorskip("flask")
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        from dashboard import server
+
+        server.metrics.inc("dashboard.test_event")
+        response = server.app.test_client().get("/metrics")
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        assert 'memory_system_events_total{event="dashboard.test_event"}' in response.get_data(as_text=True)
+
+
+class TestPersistence:
+    def test_persist_accumulates_without_double_counting(self, tmp_path):
+        store = tmp_path / "metrics.db"
+        registry = MetricsRegistry(enabled=True)
+        registry.observe("hook.total", 0.2)
+        registry.inc("hook.runs")
+        assert metrics.persist(registry, store)
+        assert registry.snapshot() == {"stages": {}, "events": {}}
+        assert not metrics.persist(registry, store)
+
+        registry.observe("hook.total", 3.0)
+        registry.inc("hook.runs")
+        metrics.persist(registry, store)
+
+        loaded = metrics.load_persisted(store).snapshot()
+        assert loaded["stages"]["hook.total"]["count"] == 2
+        assert loaded["stages"]["hook.total"]["max_ms"] == pytest.approx(3000)
+        assert loaded["events"]["hook.runs"] == 2
+
+    def test_failed_write_keeps_data(self, tmp_path):
+        registry = MetricsRegistry(enabled=True)
+        registry.inc("hook.runs")
+        (tmp_path / "not_a_db").mkdir()
+        assert not metrics.persist(registry, tmp_path / "not_a_db")
+        assert registry.snapshot()["events"] == {"hook.runs": 1}
+
+    def test_combined_adds_live_data(self, tmp_path):
+        store = tmp_path / "metrics.db"
+        other = MetricsRegistry(enabled=True)
+        other.observe("hook.total", 0.5)
+        metrics.persist(other, store)
+        metrics.observe("hook.total", 0.1)
+
+        combined = metrics.combined(store).snapshot()
+        assert combined["stages"]["hook.total"]["count"] == 2
+
+    def test_exiting_process_is_visible(self, tmp_path):
+        """A short-lived process's timings reach the store when it exits"""
+        import os
+        import subprocess
+
+        store = tmp_path / "metrics.db"
+        env = dict(os.environ, MEMORY_SYSTEM_METRICS_DB=str(store), MEMORY_SYSTEM_METRICS="1")
+        env.pop("MEMORY_SYSTEM_METRICS_PERSIST", None)
+        script = "from memory_system import metrics; metrics.observe('hook.slow', 7.5); metrics.inc('hook.runs')"
+        subprocess.run([sys.executable, "-c", script], env=env, check=True, timeout=60)
+
+        text = metrics.load_persisted(store).render_prometheus()
+        assert 'memory_system_stage_seconds_count{stage="hook.slow"} 1' in text
+        assert 'memory_system_stage_seconds_bucket{stage="hook.slow",le="5"} 0' in text
+        assert 'memory_system_events_total{event="hook.runs"} 1' in text
@@ -581,3 +581,105 @@ class TestConsolidationToFSRSPipeline:
                 state = scheduler.get_state("existing-001")
                 assert state is not None
                 assert state.review_count >= 1
+
+
+class TestTokenIndex:
+    """Indexed candidate retrieval must match brute-force scoring"""
+
+    def test_index_matches_brute_force(self, memory_dir, scheduler):
+        """Best match and score equal an exhaustive word_overlap_score scan"""
+        import random
+        from memory_system.memory_ts_client import MemoryTSClient
+        from memory_system.pattern_detector import TokenIndex
+
+        rng = random.Random(7)
+        vocab = [f"w{i}" for i in range(60)] + ["the", "a", "and", "of"]
+        texts = {}
+        for i in range(150):
+            words = rng.sample(vocab, rng.randint(1, 12)) + ["the"] * rng.randint(0, 2)
+            texts[f"mem-{i:03d}"] = " ".join(words)
+            create_memory_file(memory_dir, f"mem-{i:03d}", texts[f"mem-{i:03d}"])
+
+        for threshold in (0.2, 0.35, 0.6, 1.0):
+            index = TokenIndex(MemoryTSClient(memory_dir=memory_dir), threshold)
+            index.refresh()
+            for _ in range(40):
+                query = " ".join(rng.sample(vocab, rng.randint(1, 10)))
+                expected = max(
+                    (word_overlap_score(query, text) for text in texts.values()),
+                    default=0.0,
+                )
+                entry, score = index.best_match(query, exclude_ids=set())
+                if expected >= threshold and expected > 0:
+                    assert entry is not None
+                    assert score == pytest.approx(expected)
+                    assert word_overlap_score(query, texts[entry.memory_id]) == pytest.approx(expected)
+                else:
+                    assert entry is None
+
+    def test_refresh_picks_up_changes(self, memory_dir):
+        """Modified and deleted files are re-read or dropped on refresh"""
+        import os
+        from memory_system.memory_ts_client import MemoryTSClient
+        from memory_system.pattern_detector import TokenIndex
+
+        create_memory_file(memory_dir, "existing-001", "Use structured logging everywhere")
+        index = TokenIndex(MemoryTSClient(memory_dir=memory_dir), 0.5)
+        index.refresh()
+        assert index.best_match("structured logging", set())[0] is not None
+
+        path = memory_dir / "existing-001.md"
+        create_memory_file(memory_dir, "existing-001", "Prefer composition over inheritance")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        index.refresh()
+        assert index.best_match("structured logging", set())[0] is None
+        assert index.best_match("composition over inheritance", set())[0] is not None
+
+        path.unlink()
+        index.refresh()
+        assert len(index) == 0
+
+    def test_cache_persists_between_instances(self, memory_dir):
+        """A new index re-reads only files changed since the cache was written"""
+        from memory_system.memory_ts_client import MemoryTSClient
+        from memory_system.pattern_detector import TokenIndex
+
+        for i in range(5):
+            create_memory_file(memory_dir, f"mem-{i}", f"shared topic number{i} detail{i}")
+        cache = memory_dir / ".token_index.db"
+        TokenIndex(MemoryTSClient(memory_dir=memory_dir), 0.5, cache_path=cache).refresh()
+        assert cache.exists()
+
+        create_memory_file(memory_dir, "mem-new", "brand new insight about caching")
+        client = MemoryTSClient(memory_dir=memory_dir)
+        index = TokenIndex(client, 0.5, cache_path=cache)
+        with patch.object(client, "_read_memory", wraps=client._read_memory) as reads:
+            index.refresh()
+
+        assert reads.call_count == 1
+        assert len(index) == 6
+        assert index.best_match("shared topic number3 detail3", set())[0].memory_id == "mem-3"
+        assert index.best_match("new insight about caching", set())[0].memory_id == "mem-new"
+
+    def test_detector_uses_sidecar_cache(self, memory_dir, scheduler):
+        """PatternDetector keeps its token cache next to the memory files"""
+        create_memory_file(memory_dir, "existing-001", "Use structured logging everywhere")
+        detector = PatternDetector(memory_dir=memory_dir, scheduler=scheduler)
+        detector.detect_reinforcements([{"content": "structured logging everywhere"}], "s1")
+        assert (memory_dir / ".token_index.db").exists()
+
+    def test_corrupt_cache_is_rebuilt(self, memory_dir):
+        """An unreadable sidecar is replaced instead of failing the refresh"""
+        from memory_system.memory_ts_client import MemoryTSClient
+        from memory_system.pattern_detector import TokenIndex
+
+        create_memory_file(memory_dir, "existing-001", "Use structured logging everywhere")
+        cache = memory_dir / ".token_index.db"
+        cache.write_bytes(b"not a database" * 100)
+
+        index = TokenIndex(MemoryTSClient(memory_dir=memory_dir), 0.5, cache_path=cache)
+        index.refresh()
+
+        assert index.best_match("structured logging", set())[0] is not None
+        assert [p.name for p in memory_dir.iterdir() if p.name.startswith(".token_index")] == [".token_index.db"]
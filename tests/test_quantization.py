@@ -0,0 +1,128 @@
+"""
+Tests for quantization.py - int8 / binary codes and two-stage search
+
+test_recall_report prints recall@10 and per-query latency for each mode
+against an exact float32 scan (run with -s to see it).
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from memory_system.quantization import (
+    MODES,
+    QuantizedIndex,
+    binarize,
+    dequantize_int8,
+    hamming_distances,
+    normalize,
+    quantize_int8,
+)
+
+
+def _clustered(n, dim=384, clusters=500, spread=0.8, seed=0):
+    """Unit vectors scattered around random cluster centres (embedding-like neighbourhoods)"""
+    rng = np.random.default_rng(seed)
+    centres = normalize(rng.standard_normal((clusters, dim)))
+    noise = normalize(rng.standard_normal((n, dim)))
+    return normalize(centres[rng.integers(0, clusters, n)] + spread * noise), rng
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    vectors, rng = _clustered(20000)
+    picks = rng.integers(0, len(vectors), 40)
+    queries = normalize(vectors[picks] + 0.5 * normalize(rng.standard_normal((40, vectors.shape[1]))))
+    return vectors, queries
+
+
+def _exact_top(vectors, query, k):
+    scores = vectors @ query
+    top = np.argpartition(-scores, k)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+class TestCodes:
+    def test_int8_roundtrip(self):
+        vectors, _ = _clustered(100, clusters=10)
+        codes, scales = quantize_int8(vectors)
+        assert codes.dtype == np.int8 and codes.shape == (100, 384)
+        assert np.abs(dequantize_int8(codes, scales) - vectors).max() <= scales.max() / 2 + 1e-7
+
+    def test_int8_zero_vector(self):
+        codes, scales = quantize_int8(np.zeros((1, 8)))
+        assert not codes.any() and scales[0] == 1.0
+
+    def test_binary_packing_and_hamming(self):
+        a = np.array([[1, -1, 1, -1, 1, -1, 1, -1, 1]], dtype=np.float32)
+        b = -a
+        codes = binarize(np.vstack([a, b]))
+        assert codes.shape == (2, 2)
+        assert list(hamming_distances(codes, codes[0])) == [0, 9]
+
+    def test_code_sizes(self, corpus):
+        vectors, _ = corpus
+        assert QuantizedIndex.from_vectors(vectors[:1000], "binary").nbytes == 1000 * 48
+        assert QuantizedIndex.from_vectors(vectors[:1000], "int8").nbytes == 1000 * (384 + 4)
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown quantization"):
+            QuantizedIndex("int4")
+
+
+class TestSearch:
+    @pytest.mark.parametrize("mode", MODES)
+    def test_rescored_scores_are_exact(self, corpus, mode):
+        vectors, queries = corpus
+        index = QuantizedIndex.from_vectors(vectors, mode)
+        ids, scores = index.search(queries[0], top_k=10, fetch=lambda rows: vectors[rows])
+        assert np.allclose(scores, vectors[ids] @ queries[0], atol=1e-5)
+        assert list(scores) == sorted(scores, reverse=True)
+
+    def test_without_fetch_scores_approximate(self, corpus):
+        vectors, queries = corpus
+        ids, scores = QuantizedIndex.from_vectors(vectors, "binary").search(queries[0], top_k=5)
+        assert len(ids) == 5
+        assert np.all(np.abs(scores - vectors[ids] @ queries[0]) < 0.25)
+
+    def test_small_index_is_exact(self):
+        vectors, rng = _clustered(30, clusters=3)
+        query = normalize(rng.standard_normal(384))[0]
+        ids, _ = QuantizedIndex.from_vectors(vectors, "binary").search(query, top_k=5, fetch=lambda r: vectors[r])
+        assert list(ids) == list(_exact_top(vectors, query, 5))
+
+    def test_from_codes_matches_from_vectors(self, corpus):
+        vectors, queries = corpus
+        built = QuantizedIndex.from_vectors(vectors[:500], "int8")
+        loaded = QuantizedIndex.from_codes(built.codes.copy(), built.scales, mode="int8")
+        assert np.array_equal(built.approximate_scores(queries[0]), loaded.approximate_scores(queries[0]))
+
+    def test_empty_index(self):
+        ids, scores = QuantizedIndex("binary").search(np.ones(384), top_k=3)
+        assert len(ids) == 0 and len(scores) == 0
+
+    def test_recall_report(self, corpus):
+        """Recall@10 vs exact float32, and per-query time, per mode and shortlist size"""
+        vectors, queries = corpus
+        k = 10
+        start = time.perf_counter()
+        truth = [set(_exact_top(vectors, q, k)) for q in queries]
+        float_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        print(f"\n{len(vectors)} x {vectors.shape[1]} vectors, {len(queries)} queries, recall@{k}")
+        print(f"  {'float32 scan':<22} recall 1.000  {float_ms:7.2f} ms/query  {vectors.nbytes / 1e6:6.1f} MB")
+        recall = {}
+        for mode in MODES:
+            index = QuantizedIndex.from_vectors(vectors, mode)
+            for factor in (2, 10):
+                start = time.perf_counter()
+                found = [set(index.search(q, k, fetch=lambda rows: vectors[rows], rescore_factor=factor)[0])
+                         for q in queries]
+                elapsed = (time.perf_counter() - start) * 1000 / len(queries)
+                recall[mode, factor] = np.mean([len(f & t) / k for f, t in zip(found, truth)])
+                print(f"  {mode + ' x' + str(factor) + ' rescore':<22} recall {recall[mode, factor]:.3f}"
+                      f"  {elapsed:7.2f} ms/query  {index.nbytes / 1e6:6.1f} MB")
+
+        assert recall["int8", 10] >= 0.98
+        assert recall["binary", 10] >= 0.9
@@ -0,0 +1,185 @@
+"""
+Tests for sqlite_maintenance.py - online backups, incremental vacuum, retention
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from memory_system.db_pool import close_all_pools
+from memory_system.sqlite_maintenance import (
+    backup_database,
+    backup_path_for,
+    compact_database,
+    enable_incremental_vacuum,
+    prune_backups,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_pools():
+    yield
+    close_all_pools()
+
+
+def _make_db(path, rows=2000, incremental=False):
+    conn = sqlite3.connect(path)
+    if incremental:
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)")
+    conn.executemany("INSERT INTO notes (body) VALUES (?)", [("x" * 500,) for _ in range(rows)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+class TestBackup:
+    def test_backup_is_complete_copy(self, tmp_path):
+        db = _make_db(tmp_path / "source.db")
+        target = backup_path_for(db, tmp_path / "backups", day=date(2026, 3, 1))
+        assert target.name == "source_20260301.db"
+
+        result = backup_database(db, target, pages_per_step=16, pause=0)
+
+        assert result.steps == 1  # WAL: one read transaction, no restarts
+        assert result.restarts == 0
+        assert result.size_bytes == target.stat().st_size
+        assert not target.with_name(target.name + ".partial").exists()
+        conn = sqlite3.connect(target)
+        assert conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0] == 2000
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        conn.close()
+
+    def test_writer_not_blocked_during_backup(self, tmp_path):
+        db = _make_db(tmp_path / "source.db")
+        writes = []
+
+        def write_between_steps():
+            conn = sqlite3.connect(db, timeout=0.1)
+            for i in range(20):
+                conn.execute("INSERT INTO notes (body) VALUES (?)", (f"during {i}",))
+                conn.commit()
+                writes.append(i)
+            conn.close()
+
+        writer = threading.Thread(target=write_between_steps)
+        writer.start()
+        backup_database(db, tmp_path / "backup.db", pages_per_step=8, pause=0.001)
+        writer.join()
+
+        assert len(writes) == 20
+        conn = sqlite3.connect(tmp_path / "backup.db")
+        assert conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0] >= 2000
+        conn.close()
+
+    def test_rollback_journal_falls_back_after_restarts(self, tmp_path, monkeypatch):
+        db = tmp_path / "rollback.db"
+        conn = sqlite3.connect(db)
+        conn.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)")
+        conn.executemany("INSERT INTO notes (body) VALUES (?)", [("x" * 500,) for _ in range(2000)])
+        conn.commit()
+        conn.close()
+
+        writer = sqlite3.connect(db)
+
+        def write_instead_of_sleeping(seconds):
+            writer.execute("INSERT INTO notes (body) VALUES ('during')")
+            writer.commit()
+
+        # Every pause lets a write in, which restarts a stepped copy from page 0
+        monkeypatch.setitem(backup_database.__globals__, "time", SimpleNamespace(
+            sleep=write_instead_of_sleeping, perf_counter=time.perf_counter))
+
+        result = backup_database(db, tmp_path / "backup.db", pages_per_step=16, pause=0.001, max_restarts=2)
+        written = writer.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+        writer.close()
+
+        assert result.restarts == 3
+        check = sqlite3.connect(db)
+        assert check.execute("PRAGMA journal_mode").fetchone()[0] == "delete"  # Source left as it was
+        check.close()
+        copy = sqlite3.connect(tmp_path / "backup.db")
+        assert copy.execute("SELECT COUNT(*) FROM notes").fetchone()[0] == written
+        assert copy.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        copy.close()
+
+    def test_missing_source(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            backup_database(tmp_path / "missing.db", tmp_path / "backup.db")
+
+
+class TestCompact:
+    def test_incremental_vacuum_reclaims_pages(self, tmp_path):
+        db = _make_db(tmp_path / "inc.db", incremental=True)
+        conn = sqlite3.connect(db)
+        conn.execute("DELETE FROM notes")
+        conn.commit()
+        conn.close()
+
+        result = compact_database(db, pages_per_step=32, pause=0)
+
+        assert result.auto_vacuum == "incremental"
+        assert result.freed_pages > 0
+        assert result.free_pages == 0
+        conn = sqlite3.connect(db)
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] >= 0
+        conn.close()
+
+    def test_max_steps_bounds_work(self, tmp_path):
+        db = _make_db(tmp_path / "inc.db", incremental=True)
+        conn = sqlite3.connect(db)
+        conn.execute("DELETE FROM notes")
+        conn.commit()
+        conn.close()
+
+        result = compact_database(db, pages_per_step=4, pause=0, max_steps=2)
+        assert result.freed_pages == 8
+        assert result.free_pages > 0
+
+    def test_none_mode_is_reported_not_vacuumed(self, tmp_path):
+        db = _make_db(tmp_path / "plain.db")
+        conn = sqlite3.connect(db)
+        conn.execute("DELETE FROM notes")
+        conn.commit()
+        conn.close()
+
+        result = compact_database(db)
+        assert result.auto_vacuum == "none"
+        assert result.freed_pages == 0
+        assert result.free_pages > 0
+
+    def test_enable_incremental_vacuum(self, tmp_path):
+        db = _make_db(tmp_path / "plain.db", rows=10)
+        assert enable_incremental_vacuum(db) is True
+        assert enable_incremental_vacuum(db) is False
+        assert compact_database(db).auto_vacuum == "incremental"
+
+
+class TestPrune:
+    def test_retention_keeps_recent_and_minimum(self, tmp_path):
+        for day in ["20260301", "20260305", "20260309", "20260310"]:
+            (tmp_path / f"fsrs_{day}.db").touch()
+        for day in ["20260101", "20260102"]:
+            (tmp_path / f"intelligence_{day}.db").touch()
+        (tmp_path / "notes.db").touch()
+
+        deleted = prune_backups(tmp_path, retention_days=7, keep_last=2, today=date(2026, 3, 10))
+
+        assert [p.name for p in deleted] == ["fsrs_20260301.db"]
+        # Old but among the newest two for its database
+        assert (tmp_path / "fsrs_20260305.db").exists()
+        assert (tmp_path / "intelligence_20260101.db").exists()
+        assert (tmp_path / "notes.db").exists()
+
+    def test_month_boundary(self, tmp_path):
+        (tmp_path / "fsrs_20260228.db").touch()
+        deleted = prune_backups(tmp_path, retention_days=7, keep_last=0, today=date(2026, 3, 2))
+        assert deleted == []
+
+    def test_missing_dir(self, tmp_path):
+        assert prune_backups(tmp_path / "nope") == []
@@ -0,0 +1,88 @@
+"""
+Tests for synthetic_corpus.py - seeded benchmark corpus generator
+"""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from memory_system.memory_ts_client import MemoryTSClient
+from memory_system.synthetic_corpus import StubEmbedder, generate_corpus, sample_queries
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    return generate_corpus(tmp_path / "corpus", memories=200, seed=7)
+
+
+def _count(db_path, table):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestGenerateCorpus:
+    def test_memory_files_readable_by_client(self, corpus):
+        client = MemoryTSClient(memory_dir=corpus.memory_dir, enable_access_logging=False)
+        memories = client.list()
+        assert len(memories) == 200
+        by_id = {m["id"]: m for m in corpus.memories}
+        for memory in memories[:20]:
+            assert memory.content == by_id[memory.id]["content"]
+            assert memory.tags == by_id[memory.id]["tags"]
+
+    def test_databases_populated(self, corpus):
+        assert _count(corpus.session_db, "sessions") == 20
+        assert _count(corpus.session_db, "session_history") == 20
+        assert _count(corpus.intelligence_db, "memory_relationships") == corpus.relationship_count > 0
+        assert _count(corpus.access_db, "memory_access_log") == corpus.access_count == 1000
+        assert len(corpus.session_files) == 5
+
+    def test_same_seed_same_corpus(self, corpus, tmp_path):
+        again = generate_corpus(tmp_path / "again", memories=200, seed=7)
+        assert again.memories == corpus.memories
+        for path in corpus.memory_dir.glob("*.md"):
+            assert (again.memory_dir / path.name).read_text() == path.read_text()
+        assert sample_queries(again) == sample_queries(corpus)
+
+    def test_different_seed_differs(self, corpus, tmp_path):
+        other = generate_corpus(tmp_path / "other", memories=200, seed=8)
+        assert other.memories != corpus.memories
+
+    def test_access_types_are_tracker_types(self, corpus):
+        from memory_system.access_tracker import VALID_ACCESS_TYPES
+
+        conn = sqlite3.connect(corpus.access_db)
+        types = {row[0] for row in conn.execute("SELECT DISTINCT access_type FROM memory_access_log")}
+        conn.close()
+        assert types and types <= set(VALID_ACCESS_TYPES)
+
+    def test_access_skewed_to_hot_memories(self, corpus):
+        conn = sqlite3.connect(corpus.access_db)
+        counts = [row[0] for row in conn.execute(
+            "SELECT COUNT(*) FROM memory_access_log GROUP BY memory_id ORDER BY 1 DESC"
+        )]
+        conn.close()
+        # Top 10% of memories take well over 10% of accesses
+        assert sum(counts[:20]) > 0.3 * sum(counts)
+
+
+class TestStubEmbedder:
+    def test_deterministic_unit_vectors(self):
+        a = StubEmbedder().encode(["sqlite index tuning", "sqlite index tuning"])
+        b = StubEmbedder().encode("sqlite index tuning")
+        assert a.shape == (2, 384)
+        assert np.allclose(a[0], b)
+        assert np.isclose(np.linalg.norm(b), 1.0)
+
+    def test_shared_words_are_closer(self):
+        vectors = StubEmbedder().encode(["sqlite index tuning", "sqlite index rebuild", "weekend hiking trip"])
+        assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+
+    def test_empty_inputs(self):
+        embedder = StubEmbedder()
+        assert embedder.encode([]).shape == (0, 384)
+        assert not embedder.encode("").any()
@@ -322,3 +322,109 @@ class TestGetStats:
         stats = tkg.get_stats()
         assert stats["by_type"]["causal"] == 2
         assert stats["by_type"]["supports"] == 1
+
+
+# --- snapshot_at / diff ---
+
+class TestSnapshotAt:
+    def test_snapshot_returns_all_active_edges(self, tkg):
+        """snapshot_at returns every edge active at the timestamp, across nodes."""
+        tkg.add_edge("mem_001", "mem_002", "causal", "2026-01-01")
+        tkg.add_edge("mem_003", "mem_004", "supports", "2026-01-01", "2026-03-01")
+        tkg.add_edge("mem_005", "mem_006", "related", "2026-05-01")
+
+        snapshot = tkg.snapshot_at("2026-02-15")
+        pairs = {(e["source_id"], e["target_id"]) for e in snapshot}
+        assert pairs == {("mem_001", "mem_002"), ("mem_003", "mem_004")}
+
+    def test_snapshot_filters_by_type(self, tkg):
+        """relationship_type narrows the snapshot."""
+        tkg.add_edge("mem_001", "mem_002", "causal", "2026-01-01")
+        tkg.add_edge("mem_001", "mem_003", "supports", "2026-01-01")
+
+        snapshot = tkg.snapshot_at("2026-02-01", relationship_type="supports")
+        assert [e["target_id"] for e in snapshot] == ["mem_003"]
+
+    def test_snapshot_includes_boundaries(self, tkg):
+        """Edges are active on both their valid_from and valid_to dates."""
+        tkg.add_edge("mem_001", "mem_002", "causal", "2026-01-01", "2026-01-31")
+        assert len(tkg.snapshot_at("2026-01-01")) == 1
+        assert len(tkg.snapshot_at("2026-01-31")) == 1
+        assert len(tkg.snapshot_at("2026-02-01")) == 0
+
+    def test_snapshot_sees_expired_edge(self, tkg):
+        """expire_edge is reflected in later snapshots."""
+        tkg.add_edge("mem_001", "mem_002", "causal", "2026-01-01")
+        tkg.expire_edge("mem_001", "mem_002", "causal", "2026-03-01")
+        assert len(tkg.snapshot_at("2026-02-01")) == 1
+        assert len(tkg.snapshot_at("2026-04-01")) == 0
+
+    def test_invalid_timestamp_raises(self, tkg):
+        """Non-ISO timestamps are rejected."""
+        with pytest.raises(ValueError):
+            tkg.snapshot_at("not a date")
+
+
+class TestDiff:
+    def test_diff_added_and_removed(self, tkg):
+        """diff reports edges that appeared and disappeared between two dates."""
+        tkg.add_edge("mem_001", "mem_002", "causal", "2026-01-01")
+        tkg.add_edge("mem_001", "mem_003", "supports", "2026-01-01", "2026-02-28")
+        tkg.add_edge("mem_002", "mem_003", "related", "2026-03-15")
+
+        delta = tkg.diff("2026-02-01", "2026-04-01")
+        assert [e["target_id"] for e in delta["added"]] == ["mem_003"]
+        assert delta["added"][0]["source_id"] == "mem_002"
+        assert [e["target_id"] for e in delta["removed"]] == ["mem_003"]
+        assert delta["removed"][0]["source_id"] == "mem_001"
+
+    def test_diff_matches_snapshots(self, tkg):
+        """diff equals the set difference of the two snapshots, in both directions."""
+        tkg.add_edge("a", "b", "causal", "2026-01-01", "2026-05-01")
+        tkg.add_edge("b", "c", "causal", "2026-02-01")
+        tkg.add_edge("c", "d", "causal", "2026-03-01", "2026-03-20")
+        tkg.add_edge("d", "e", "causal", "2026-04-01")
+
+        for t1, t2 in [("2026-02-15", "2026-04-15"), ("2026-04-15", "2026-02-15")]:
+            before = {e["id"] for e in tkg.snapshot_at(t1)}
+            after = {e["id"] for e in tkg.snapshot_at(t2)}
+            delta = tkg.diff(t1, t2)
+            assert {e["id"] for e in delta["added"]} == after - before
+            assert {e["id"] for e in delta["removed"]} == before - after
+
+    def test_diff_same_timestamp_is_empty(self, tkg):
+        """No changes between a timestamp and itself."""
+        tkg.add_edge("mem_001", "mem_002", "causal", "2026-01-01")
+        assert tkg.diff("2026-02-01", "2026-02-01") == {"added": [], "removed": []}
+
+
+class TestEpochMigration:
+    def test_backfills_legacy_table(self, tmp_db):
+        """Tables created without epoch columns are migrated and queryable."""
+        conn = sqlite3.connect(tmp_db)
+        conn.execute("""
+            CREATE TABLE temporal_edges (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source_id TEXT NOT NULL,
+                target_id TEXT NOT NULL,
+                relationship_type TEXT NOT NULL,
+                valid_from TEXT NOT NULL,
+                valid_to TEXT,
+                confidence REAL DEFAULT 1.0,
+                created_at TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO temporal_edges (source_id, target_id, relationship_type, "
+            "valid_from, valid_to, created_at) VALUES ('a', 'b', 'causal', '2026-01-01', NULL, '2026-01-01')"
+        )
+        conn.execute(
+            "INSERT INTO temporal_edges (source_id, target_id, relationship_type, "
+            "valid_from, valid_to, created_at) VALUES ('a', 'c', 'causal', '2026-01-01', '2026-02-01', '2026-01-01')"
+        )
+        conn.commit()
+        conn.close()
+
+        tkg = TemporalKnowledgeGraph(db_path=tmp_db)
+        assert [e["target_id"] for e in tkg.snapshot_at("2026-03-01")] == ["b"]
+        assert len(tkg.get_edges_at("a", "2026-01-15")) == 2
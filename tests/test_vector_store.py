@@ -259,3 +259,113 @@ class TestMigrationHelper:
         assert imported == 3
         assert store.count() == 3
         assert store.has_embedding("sqlite_hash_0")
+
+
+# ---------------------------------------------------------------------------
+# Quantized search
+# ---------------------------------------------------------------------------
+
+class TestQuantization:
+    @staticmethod
+    def _fill(store, n=200):
+        rng = np.random.default_rng(7)
+        vectors = rng.standard_normal((n, 384)).astype(np.float32)
+        store.batch_store([(f"hash_{i}", v, {"content": f"Memory {i}"}) for i, v in enumerate(vectors)])
+        return vectors
+
+    @pytest.mark.parametrize("mode", ["int8", "binary"])
+    def test_matches_unquantized_results(self, tmp_path, mode):
+        exact = VectorStore(persist_dir=str(tmp_path / "exact"))
+        quantized = VectorStore(persist_dir=str(tmp_path / mode), quantization=mode)
+        vectors = self._fill(exact)
+        self._fill(quantized)
+
+        query = vectors[3] + 0.3 * np.random.default_rng(1).standard_normal(384).astype(np.float32)
+        expected = exact.find_similar(query, top_k=5, threshold=-1.0)
+        results = quantized.find_similar(query, top_k=5, threshold=-1.0)
+
+        assert [r["content_hash"] for r in results] == [r["content_hash"] for r in expected]
+        assert results[0]["similarity"] == pytest.approx(expected[0]["similarity"], abs=1e-5)
+        assert results[0]["metadata"] == {"content": "Memory 3"}
+
+    def test_codes_persist_and_reload(self, tmp_path):
+        persist = Path(tmp_path / "q")
+        vectors = self._fill(VectorStore(persist_dir=str(persist), quantization="binary"))
+        assert (persist / "memory_embeddings.binary.codes").stat().st_size == 200 * 48
+        assert (persist / "memory_embeddings.f32").stat().st_size == 200 * 384 * 4
+        assert not (persist / "memory_embeddings.index").exists()
+
+        reloaded = VectorStore(persist_dir=str(persist), quantization="binary")
+        assert len(reloaded._quantized) == 200
+        assert reloaded.find_similar(vectors[10], top_k=1)[0]["content_hash"] == "hash_10"
+
+    def test_float_rows_are_memory_mapped(self, tmp_path):
+        persist = str(tmp_path / "q")
+        vectors = self._fill(VectorStore(persist_dir=persist, quantization="int8"))
+
+        reloaded = VectorStore(persist_dir=persist, quantization="int8")
+        assert reloaded._index is None
+        assert isinstance(reloaded._float_rows(), np.memmap)
+        assert reloaded._quantized.nbytes == 200 * (384 + 4)
+        np.testing.assert_allclose(
+            reloaded.get_embedding("hash_5"), vectors[5] / np.linalg.norm(vectors[5]), atol=1e-6
+        )
+
+    def test_store_appends_rows_and_codes(self, tmp_path):
+        persist = Path(tmp_path / "q")
+        store = VectorStore(persist_dir=str(persist), quantization="int8")
+        self._fill(store, n=10)
+        store.store_embedding("extra", np.ones(384, dtype=np.float32))
+
+        assert (persist / "memory_embeddings.f32").stat().st_size == 11 * 384 * 4
+        assert (persist / "memory_embeddings.int8.codes").stat().st_size == 11 * 384
+        assert (persist / "memory_embeddings.int8.scales").stat().st_size == 11 * 4
+        assert store.find_similar(np.ones(384), top_k=1)[0]["content_hash"] == "extra"
+
+    def test_update_replaces_row(self, tmp_path):
+        store = VectorStore(persist_dir=str(tmp_path / "q"), quantization="binary")
+        vectors = self._fill(store, n=10)
+        store.store_embedding("hash_2", vectors[7])
+
+        assert store.count() == 10
+        np.testing.assert_allclose(
+            store.get_embedding("hash_2"), vectors[7] / np.linalg.norm(vectors[7]), atol=1e-6
+        )
+
+    def test_delete_drops_row(self, tmp_path):
+        persist = str(tmp_path / "q")
+        store = VectorStore(persist_dir=persist, quantization="int8")
+        vectors = self._fill(store, n=20)
+        store.delete_embedding("hash_0")
+        results = store.find_similar(vectors[0], top_k=20, threshold=-1.0)
+        assert "hash_0" not in {r["content_hash"] for r in results}
+        assert len(store._quantized) == 19
+
+        reloaded = VectorStore(persist_dir=persist, quantization="int8")
+        assert reloaded.count() == 19
+        assert reloaded.find_similar(vectors[9], top_k=1)[0]["content_hash"] == "hash_9"
+
+    def test_converts_between_modes(self, tmp_path):
+        persist = str(tmp_path / "q")
+        vectors = self._fill(VectorStore(persist_dir=persist))
+
+        quantized = VectorStore(persist_dir=persist, quantization="binary")
+        assert quantized.count() == 200
+        assert quantized.find_similar(vectors[42], top_k=1)[0]["content_hash"] == "hash_42"
+        quantized.store_embedding("extra", vectors[0])
+
+        exact = VectorStore(persist_dir=persist)
+        assert exact.count() == 201
+        assert exact.find_similar(vectors[42], top_k=1)[0]["content_hash"] == "hash_42"
+
+    def test_rows_and_metadata_disagree_starts_fresh(self, tmp_path):
+        persist = Path(tmp_path / "q")
+        self._fill(VectorStore(persist_dir=str(persist), quantization="binary"), n=10)
+        with open(persist / "memory_embeddings.f32", "r+b") as f:
+            f.truncate(5 * 384 * 4)
+
+        assert VectorStore(persist_dir=str(persist), quantization="binary").count() == 0
+
+    def test_unknown_mode_rejected(self, tmp_path):
+        with pytest.raises(VectorStoreError, match="Unknown quantization"):
+            VectorStore(persist_dir=str(tmp_path / "q"), quantization="pq")
@@ -48,14 +48,14 @@ def test_synthesizer_initialization(synthesizer):
     assert synthesizer.memory_db_path is not None
     assert synthesizer.SEMANTIC_THRESHOLD == 0.6
     assert synthesizer.MIN_SUPPORT == 3
-    assert synthesizer.MAX_MEMORIES == 1000
+    assert synthesizer.MAX_MEMORIES == 50_000
 
 
 def test_constants(synthesizer):
     """Test discovery thresholds are set correctly"""
     assert synthesizer.SEMANTIC_THRESHOLD == 0.6
     assert synthesizer.MIN_SUPPORT == 3
-    assert synthesizer.MAX_MEMORIES == 1000
+    assert synthesizer.MAX_MEMORIES == 50_000
     assert synthesizer.NOVELTY_THRESHOLD == 0.5
     assert synthesizer.TEMPORAL_WINDOW == timedelta(days=7)
 
@@ -508,3 +508,153 @@ def test_insufficient_memories_for_synthesis(synthesizer):
 
     # Should return early if < MIN_SUPPORT
     assert len(memories) < synthesizer.MIN_SUPPORT
+
+
+def _random_memories(count, seed=0):
+    """Random memories over a small vocabulary so many pairs overlap"""
+    import random
+
+    rng = random.Random(seed)
+    vocab = ['testing', 'deploy', 'cache', 'latency', 'python', 'schema',
+             'always', 'never', 'works', 'fails', 'more', 'less', 'queue']
+    return [
+        MemoryNode(
+            id=f'mem{i}',
+            content=' '.join(rng.sample(vocab, rng.randint(1, 5))),
+            project=f'Project{rng.randint(0, 2)}',
+            tags=[],
+            importance=0.5,
+            created_at=datetime.now()
+        )
+        for i in range(count)
+    ]
+
+
+def test_semantic_matrix_matches_all_pairs(synthesizer):
+    """Blocked sparse products find exactly the all-pairs Jaccard matches"""
+    memories = _random_memories(150)
+    synthesizer.BLOCK_SIZE = 16
+
+    expected = []
+    for i, mem1 in enumerate(memories):
+        for mem2 in memories[i+1:]:
+            words1 = set(synthesizer._extract_keywords(mem1.content))
+            words2 = set(synthesizer._extract_keywords(mem2.content))
+            if mem1.project == mem2.project or not words1 or not words2:
+                continue
+            similarity = len(words1 & words2) / len(words1 | words2)
+            if similarity >= synthesizer.SEMANTIC_THRESHOLD:
+                expected.append((mem1.id, mem2.id, similarity))
+
+    connections = synthesizer._discover_semantic_connections(memories)
+
+    assert [(c.memory_ids[0], c.memory_ids[1], c.strength) for c in connections] == expected
+
+
+def test_contradictions_match_all_pairs(synthesizer):
+    """Matrix contradiction detection finds exactly the all-pairs matches"""
+    import re
+
+    memories = _random_memories(150, seed=1)
+    synthesizer.BLOCK_SIZE = 16
+    stance = {w for pair in synthesizer.CONTRADICTION_PAIRS for side in pair for w in side}
+
+    candidates = []
+    for i, mem1 in enumerate(memories):
+        for j in range(i + 1, len(memories)):
+            mem2 = memories[j]
+            topic1 = set(synthesizer._extract_keywords(mem1.content)) - stance
+            topic2 = set(synthesizer._extract_keywords(mem2.content)) - stance
+            if not (topic1 & topic2):
+                continue
+            similarity = len(topic1 & topic2) / len(topic1 | topic2)
+            if similarity < synthesizer.CONTRADICTION_THRESHOLD:
+                continue
+            words1 = set(re.findall(r"[a-z']+", mem1.content.lower()))
+            words2 = set(re.findall(r"[a-z']+", mem2.content.lower()))
+            for positive, negative in synthesizer.CONTRADICTION_PAIRS:
+                p1, n1 = bool(words1 & set(positive)), bool(words1 & set(negative))
+                p2, n2 = bool(words2 & set(positive)), bool(words2 & set(negative))
+                if (p1 and n2) or (n1 and p2):
+                    candidates.append((i, j, similarity))
+                    break
+
+    # Keep a pair if it is among the strongest MAX_CONNECTIONS_PER_MEMORY of either memory
+    kept = set()
+    for memory in range(len(memories)):
+        ranked = sorted(
+            (n for n, (i, j, _) in enumerate(candidates) if memory in (i, j)),
+            key=lambda n: (-candidates[n][2], n)
+        )
+        kept.update(ranked[:synthesizer.MAX_CONNECTIONS_PER_MEMORY])
+    expected = [(memories[i].id, memories[j].id) for n, (i, j, _) in enumerate(candidates) if n in kept]
+
+    connections = synthesizer._discover_contradictions(memories)
+
+    assert expected
+    assert len(expected) < len(candidates)  # The cap applied
+    assert [tuple(c.memory_ids) for c in connections] == expected
+
+
+def test_stance_words_match_whole_words(synthesizer):
+    """'goodbye' and 'furthermore' take no stance"""
+    memories = [
+        MemoryNode(id='a', content='Said goodbye to the cache furthermore', project='A',
+                   tags=[], importance=0.5, created_at=datetime.now()),
+        MemoryNode(id='b', content='The cache fails under load', project='B',
+                   tags=[], importance=0.5, created_at=datetime.now()),
+    ]
+    assert synthesizer._discover_contradictions(memories) == []
+
+
+def test_causal_links_capped_per_memory(synthesizer):
+    """One causal memory links to at most MAX_CONNECTIONS_PER_MEMORY effects, most overlap first"""
+    cause = MemoryNode(id='cause', content='Retry storm led to queue latency spikes', project='A',
+                       tags=[], importance=0.5, created_at=datetime.now())
+    others = [
+        MemoryNode(id=f'other{i}', content='queue latency spikes' if i == 7 else 'queue depth',
+                   project='B', tags=[], importance=0.5, created_at=datetime.now())
+        for i in range(20)
+    ]
+
+    connections = synthesizer._discover_causal_chains([cause] + others)
+
+    assert len(connections) == synthesizer.MAX_CONNECTIONS_PER_MEMORY
+    assert connections[0].memory_ids == ['cause', 'other7']
+
+
+def test_load_memories_reads_whole_store(synthesizer, tmp_path, monkeypatch):
+    """Memories load from memory-ts, capped at MAX_MEMORIES"""
+    from memory_system import memory_ts_client
+    from memory_system.memory_ts_client import MemoryTSClient
+
+    monkeypatch.setattr(memory_ts_client, 'DEFAULT_MEMORY_DIR', tmp_path)
+    MemoryTSClient(memory_dir=tmp_path).create_many(
+        {'content': f'memory number {i}', 'project_id': f'P{i % 2}', 'tags': []} for i in range(12)
+    )
+
+    nodes = synthesizer._load_memories()
+    assert len(nodes) == 12
+    assert {n.project for n in nodes} == {'P0', 'P1'}
+
+    synthesizer.MAX_MEMORIES = 5
+    assert len(synthesizer._load_memories()) == 5
+
+
+def test_load_memories_skips_bad_created_dates(synthesizer, tmp_path, monkeypatch):
+    """One malformed date skips that memory, not the whole load; aware dates become naive"""
+    from memory_system import memory_ts_client
+    from memory_system.memory_ts_client import MemoryTSClient
+
+    monkeypatch.setattr(memory_ts_client, 'DEFAULT_MEMORY_DIR', tmp_path)
+    client = MemoryTSClient(memory_dir=tmp_path)
+    good, bad, aware = client.create_many(
+        {'content': f'memory number {i}', 'project_id': 'P', 'tags': []} for i in range(3)
+    )
+    client.update(bad.id, created='not a date')
+    client.update(aware.id, created='2026-01-02T03:04:05+00:00')
+
+    nodes = {n.id: n for n in synthesizer._load_memories()}
+
+    assert set(nodes) == {good.id, aware.id}
+    assert all(n.created_at.tzinfo is None for n in nodes.values())